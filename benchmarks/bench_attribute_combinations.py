@@ -0,0 +1,73 @@
+import numpy as np
+
+from functools import partial
+
+from igraph_ctypes._internal.attributes.combinations import (
+    apply_attribute_combinations,
+)
+from igraph_ctypes._internal.attributes.value_list import AttributeValueList
+from igraph_ctypes._internal.enums import AttributeCombinationType
+
+rng = np.random.default_rng(42)
+
+n, num_groups = 500_000, 200_000
+
+values = AttributeValueList(rng.random(n))
+group_of = rng.integers(0, num_groups, n)
+
+# Flat mapping as received by the new attribute combination handlers
+indices = np.argsort(group_of, kind="stable")
+offsets = np.zeros(num_groups + 1, dtype=np.int64)
+np.cumsum(np.bincount(group_of, minlength=num_groups), out=offsets[1:])
+
+# List of arrays as received by the old attribute combination handlers
+mapping = np.split(indices, offsets[1:-1])
+
+reducers = {
+    AttributeCombinationType.SUM: np.sum,
+    AttributeCombinationType.PROD: np.prod,
+    AttributeCombinationType.MIN: np.min,
+    AttributeCombinationType.MAX: np.max,
+    AttributeCombinationType.MEAN: np.mean,
+    AttributeCombinationType.MEDIAN: np.median,
+}
+
+
+def combine_per_group(comb_type: AttributeCombinationType):
+    reducer = reducers[comb_type]
+    # Sums and products of empty groups are well-defined, the rest are NaN
+    has_identity = comb_type in (
+        AttributeCombinationType.SUM,
+        AttributeCombinationType.PROD,
+    )
+    return np.fromiter(
+        (
+            reducer(values[item]) if len(item) or has_identity else np.nan
+            for item in mapping
+        ),
+        dtype=np.float64,
+        count=num_groups,
+    )
+
+
+def combine_segments(comb_type: AttributeCombinationType):
+    return np.asarray(
+        apply_attribute_combinations(values, (indices, offsets), comb_type, None)
+    )
+
+
+# Make sure that the two approaches agree before comparing their speed
+for comb_type in reducers:
+    np.testing.assert_allclose(
+        combine_segments(comb_type), combine_per_group(comb_type), equal_nan=True
+    )
+
+
+__benchmarks__ = [
+    (
+        partial(combine_per_group, comb_type),
+        partial(combine_segments, comb_type),
+        f"Combining {n} attribute values into {num_groups} groups, {comb_type.name}",
+    )
+    for comb_type in reducers
+]
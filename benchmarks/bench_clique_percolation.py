@@ -1,4 +1,4 @@
-from itertools import combinations
+from itertools import combinations, pairwise
 from random import seed
 
 from igraph import Graph as LegacyGraph
@@ -46,7 +46,9 @@ def clique_percolation_with_old_igraph():
 
 
 def clique_percolation_with_new_igraph():
-    cliques = [set(cl) for cl in maximal_cliques(new_g, min_size=4)]
+    values, offsets = maximal_cliques(new_g, min_size=4, flat=True)
+    values = values.tolist()
+    cliques = [set(values[start:end]) for start, end in pairwise(offsets.tolist())]
     el = _find_edgelist(cliques, k - 1)
     clique_g = create_graph_from_edge_list(el, directed=False)
     components(clique_g)
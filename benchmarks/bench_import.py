@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+
+def _import_in_subprocess(statement: str) -> None:
+    # Modules are cached in sys.modules so each import needs a fresh interpreter
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+def import_old_igraph():
+    _import_in_subprocess("import igraph")
+
+
+def import_new_igraph():
+    _import_in_subprocess("import igraph_ctypes")
+
+
+def import_old_igraph_and_create_graph():
+    _import_in_subprocess("import igraph; igraph.Graph.Lattice([10, 10])")
+
+
+def import_new_igraph_and_create_graph():
+    _import_in_subprocess(
+        "from igraph_ctypes.constructors import create_square_lattice; "
+        "create_square_lattice([10, 10])"
+    )
+
+
+__benchmarks__ = [
+    (import_old_igraph, import_new_igraph, "Importing the package"),
+    (
+        import_old_igraph_and_create_graph,
+        import_new_igraph_and_create_graph,
+        "Importing the package and creating a lattice",
+    ),
+]
@@ -0,0 +1,58 @@
+from functools import partial
+from os import cpu_count
+
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.parallel import betweenness_subset, community_leiden, distances
+from igraph_ctypes.paths import distances as sequential_distances
+
+from igraph_ctypes._internal.functions import (
+    betweenness_subset as sequential_betweenness_subset,
+    community_leiden as sequential_community_leiden,
+)
+
+n = 200
+g = create_square_lattice([n, n], directed=False, periodic=False)
+sources = list(range(0, n * n, 50))
+seeds = list(range(16))
+
+worker_counts = sorted({2, 4, cpu_count() or 1} - {1})
+
+
+def distances_sequentially():
+    sequential_distances(g, sources)
+
+
+def distances_in_parallel(max_workers: int):
+    distances(g, sources, max_workers=max_workers)
+
+
+def betweenness_sequentially():
+    sequential_betweenness_subset(g, sources=sources)
+
+
+def betweenness_in_parallel(max_workers: int):
+    betweenness_subset(g, sources=sources, max_workers=max_workers)
+
+
+def leiden_sequentially():
+    for _ in seeds:
+        sequential_community_leiden(g, 0.05)
+
+
+def leiden_in_parallel(max_workers: int):
+    community_leiden(g, 0.05, seeds, max_workers=max_workers)
+
+
+__benchmarks__ = [
+    (
+        sequential,
+        partial(parallel, max_workers=workers),
+        f"{title} in grid graph, {workers} threads",
+    )
+    for sequential, parallel, title in [
+        (distances_sequentially, distances_in_parallel, "Distances"),
+        (betweenness_sequentially, betweenness_in_parallel, "Subset betweenness"),
+        (leiden_sequentially, leiden_in_parallel, "Leiden with multiple seeds"),
+    ]
+    for workers in worker_counts
+]
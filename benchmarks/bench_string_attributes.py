@@ -0,0 +1,76 @@
+import gc
+import numpy as np
+import tracemalloc
+
+from igraph_ctypes.enums import AttributeType
+from igraph_ctypes._internal.attributes.value_list import AttributeValueList
+from igraph_ctypes._internal.conversion import iterable_to_igraph_strvector_t_view
+
+n = 2_000_000
+
+
+def _create_list(type: AttributeType) -> AttributeValueList:
+    # The strings are generated on the fly so they are owned by the list only,
+    # just like when they are read from a file
+    return AttributeValueList((f"vertex-{i}" for i in range(n)), type=type)
+
+
+def _measure_memory_usage(type: AttributeType) -> float:
+    """Returns the memory used by a string attribute with n values stored with
+    the given attribute type, in megabytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = _create_list(type)
+        usage = tracemalloc.get_traced_memory()[0]
+        del items
+        return usage / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+object_memory = _measure_memory_usage(AttributeType.OBJECT)
+string_memory = _measure_memory_usage(AttributeType.STRING)
+
+object_items = _create_list(AttributeType.OBJECT)
+string_items = _create_list(AttributeType.STRING)
+
+# Make sure that the two storage modes are equivalent before comparing them
+assert object_items == string_items
+
+
+def create_object_list_and_collect_garbage():
+    items = _create_list(AttributeType.OBJECT)
+    gc.collect()
+    return items
+
+
+def create_string_list_and_collect_garbage():
+    items = _create_list(AttributeType.STRING)
+    gc.collect()
+    return items
+
+
+def encode_object_list():
+    # Same as what the attribute handler does when igraph asks for all the values
+    iterable_to_igraph_strvector_t_view(np.asarray(object_items))
+
+
+def encode_string_list():
+    iterable_to_igraph_strvector_t_view(np.asarray(string_items))
+
+
+__benchmarks__ = [
+    (
+        create_object_list_and_collect_garbage,
+        create_string_list_and_collect_garbage,
+        f"Storing {n} strings as an attribute and collecting garbage "
+        f"(memory: {object_memory:.0f} MB vs {string_memory:.0f} MB)",
+    ),
+    (
+        encode_object_list,
+        encode_string_list,
+        f"Converting {n} string attribute values to an igraph string vector",
+    ),
+]
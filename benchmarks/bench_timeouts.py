@@ -0,0 +1,40 @@
+from igraph_ctypes.timeouts import time_limit
+
+from igraph_ctypes._internal.functions import full, get_all_simple_paths
+from igraph_ctypes._internal.setup import _interruption_handler
+
+num_checks = 100_000
+g = full(9)
+
+
+def check_for_interruptions():
+    for _ in range(num_checks):
+        _interruption_handler()
+
+
+def check_for_interruptions_with_time_limit():
+    with time_limit(3600):
+        check_for_interruptions()
+
+
+def find_simple_paths():
+    get_all_simple_paths(g, 0, 8)
+
+
+def find_simple_paths_with_time_limit():
+    with time_limit(3600):
+        find_simple_paths()
+
+
+__benchmarks__ = [
+    (
+        check_for_interruptions,
+        check_for_interruptions_with_time_limit,
+        f"{num_checks} calls to the interruption handler",
+    ),
+    (
+        find_simple_paths,
+        find_simple_paths_with_time_limit,
+        "All simple paths in a full graph",
+    ),
+]
@@ -0,0 +1,38 @@
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.traversal import bfs, dfs
+
+g = create_square_lattice([300, 300])
+
+
+def nop_visitor(*args):
+    pass
+
+
+def bfs_without_visitor():
+    bfs(g, 0)
+
+
+def bfs_with_visitor():
+    bfs(g, 0, visitor=nop_visitor)
+
+
+def dfs_without_visitor():
+    dfs(g, 0)
+
+
+def dfs_with_visitor():
+    dfs(g, 0, visitor=nop_visitor)
+
+
+__benchmarks__ = [
+    (
+        bfs_without_visitor,
+        bfs_with_visitor,
+        "Breadth-first search on a 300x300 lattice, without and with a visitor",
+    ),
+    (
+        dfs_without_visitor,
+        dfs_with_visitor,
+        "Depth-first search on a 300x300 lattice, without and with a visitor",
+    ),
+]
@@ -99,6 +99,238 @@ def reexport(
         outfp.write(")\n")
 
 
+FLAT_LIST_CONVERTERS = {
+    "igraph_vector_int_list_t_to_list_of_numpy_array": (
+        "igraph_vector_int_list_t_to_flat_numpy_arrays",
+        "list[IntArray]",
+        "FlatIntArrayList",
+    ),
+    "igraph_vector_list_t_to_list_of_numpy_array": (
+        "igraph_vector_list_t_to_flat_numpy_arrays",
+        "list[RealArray]",
+        "FlatRealArrayList",
+    ),
+}
+"""Converter functions of list-of-vector outputs that also have a flat
+counterpart, mapped to the name of the flat converter, the return type of the
+original converter and the return type of the flat converter. The flat return
+types must be imported in ``internal_functions.py.in`` once a generated
+function makes use of them.
+"""
+
+
+RETURNED_INOUT_ARGUMENTS = {
+    "community_leiden": ("membership", "IntArray"),
+}
+"""Generated functions whose input-output argument should also be returned,
+mapped to the name of the argument and its return type. The argument is
+prepended to the values returned by the function. Stimulus returns only the
+pure output arguments.
+"""
+
+
+def return_inout_arguments(path: Path) -> None:
+    """Post-processes the generated ``functions.py`` module such that the
+    functions listed in `RETURNED_INOUT_ARGUMENTS` also return the updated
+    value of their input-output argument.
+    """
+    func_re = re.compile(r"^def (\w+)\((.*)\) -> (.*):$")
+    return_re = re.compile(r"^    return (.*)$")
+
+    with path.open() as fp:
+        lines = fp.read().split("\n")
+
+    current: Optional[tuple[str, str]] = None
+    for index, line in enumerate(lines):
+        match = func_re.match(line)
+        if match:
+            name, params, return_type = match.groups()
+            current = RETURNED_INOUT_ARGUMENTS.get(name)
+            if current is not None:
+                arg_type = current[1]
+                if return_type.startswith("tuple["):
+                    return_type = f"tuple[{arg_type}, {return_type[6:]}"
+                elif return_type == "None":
+                    return_type = arg_type
+                else:
+                    return_type = f"tuple[{arg_type}, {return_type}]"
+                lines[index] = f"def {name}({params}) -> {return_type}:"
+            continue
+
+        match = return_re.match(line)
+        if match and current is not None:
+            lines[index] = f"    return {current[0]}, {match.group(1)}"
+            current = None
+
+    with path.open("w") as fp:
+        fp.write("\n".join(lines))
+
+
+def add_flat_output_mode(path: Path) -> None:
+    """Post-processes the generated ``functions.py`` module such that all
+    functions that return a list of vectors get an extra ``flat`` keyword
+    argument. When ``flat`` is ``True``, lists of vectors are returned in flat
+    form, i.e. as a concatenated array of values and an array of offsets.
+    """
+    func_re = re.compile(r"^def (\w+)\((.*)\) -> (.*):$")
+    conv_re = re.compile(
+        r"^(\s+\w+ = )(" + "|".join(FLAT_LIST_CONVERTERS) + r")\((\w+)\)$"
+    )
+
+    with path.open() as fp:
+        lines = fp.read().split("\n")
+
+    def_index: Optional[int] = None
+    has_flat_outputs = False
+    result: list[str] = []
+
+    def finish_function() -> None:
+        if def_index is None or not has_flat_outputs:
+            return
+
+        match = func_re.match(result[def_index])
+        assert match is not None
+
+        name, params, return_type = match.groups()
+        for _, list_type, flat_type in FLAT_LIST_CONVERTERS.values():
+            return_type = return_type.replace(list_type, f"{list_type} | {flat_type}")
+        params = f"{params}, flat: bool = False" if params else "flat: bool = False"
+        result[def_index] = f"def {name}({params}) -> {return_type}:"
+
+    for line in lines:
+        if line.startswith("def "):
+            finish_function()
+            def_index, has_flat_outputs = len(result), False
+
+        match = conv_re.match(line)
+        if match and def_index is not None:
+            prefix, converter, arg = match.groups()
+            flat_converter = FLAT_LIST_CONVERTERS[converter][0]
+            line = f"{prefix}{flat_converter}({arg}) if flat else {converter}({arg})"
+            has_flat_outputs = True
+
+        result.append(line)
+
+    finish_function()
+
+    with path.open("w") as fp:
+        fp.write("\n".join(result))
+
+
+def make_library_functions_lazy(path: Path) -> None:
+    """Post-processes the generated ``lib.py`` module such that the functions
+    of the igraph C library are not bound eagerly when the module is imported.
+
+    The generated code looks up each function in the igraph C library and sets
+    up its return type and argument types right away. This step replaces the
+    generated code with entries in the ``_lazy_symbols`` dictionary of the
+    module so the lookup happens only when the function is accessed for the
+    first time.
+    """
+    marker = "# Add argument and return types for functions imported from igraph"
+    bind_re = re.compile(r"^(\w+) = _lib\.\1$")
+    restype_re = re.compile(r"^(\w+)\.restype = (.*)$")
+    argtypes_re = re.compile(r"^(\w+)\.argtypes = (.*)$")
+
+    with path.open() as fp:
+        lines = fp.read().split("\n")
+
+    index = lines.index(marker) + 1
+    result = lines[:index]
+    restypes: dict[str, str] = {}
+
+    for line in lines[index:]:
+        if bind_re.match(line):
+            continue
+
+        match = restype_re.match(line)
+        if match:
+            name, restype = match.groups()
+            restypes[name] = restype
+            continue
+
+        match = argtypes_re.match(line)
+        if match:
+            name, argtypes = match.groups()
+            restype = restypes.pop(name)
+            line = f'_lazy_symbols["{name}"] = lambda: ({restype}, {argtypes})'
+
+        result.append(line)
+
+    assert not restypes, f"missing argument types for: {', '.join(restypes)}"
+
+    with path.open("w") as fp:
+        fp.write("\n".join(result))
+
+
+def call_library_functions_lazily(path: Path) -> None:
+    """Post-processes the generated ``functions.py`` module such that the
+    functions of the igraph C library are accessed as attributes of the
+    ``lib`` module instead of being imported from there with a star import.
+
+    A star import would bind all the functions of the igraph C library when
+    ``functions.py`` is imported; accessing them via the module defers the
+    binding until the corresponding wrapper is called for the first time.
+    """
+    marker = "# Call wrapped function"
+    call_re = re.compile(r"^(\s+(?:\w+ = )?)(igraph_\w+\()")
+
+    with path.open() as fp:
+        lines = fp.read().split("\n")
+
+    for index, line in enumerate(lines[:-1]):
+        if line.strip() == marker:
+            lines[index + 1] = call_re.sub(r"\1_lib.\2", lines[index + 1])
+
+    with path.open("w") as fp:
+        fp.write("\n".join(lines))
+
+
+def add_thread_setup(path: Path) -> None:
+    """Post-processes the generated ``functions.py`` module such that all
+    functions ensure that the thread-local facilities of the igraph library
+    (error handlers, interruption handler, random number generator) are set up
+    in the calling thread before doing anything else.
+    """
+    result: list[str] = []
+    in_docstring = False
+    after_def = False
+
+    with path.open() as fp:
+        lines = fp.read().split("\n")
+
+    for line in lines:
+        result.append(line)
+
+        if line.startswith("def "):
+            after_def = True
+            continue
+
+        if not after_def:
+            continue
+
+        if not in_docstring and line.startswith('    """'):
+            in_docstring = not (len(line) > 10 and line.endswith('"""'))
+            if in_docstring:
+                continue
+        elif in_docstring:
+            in_docstring = not line.endswith('"""')
+            if in_docstring:
+                continue
+        else:
+            # No docstring; insert before the first statement
+            result.pop()
+            result.extend(("    ensure_thread_is_set_up()", "", line))
+            after_def = False
+            continue
+
+        result.extend(("    ensure_thread_is_set_up()", ""))
+        after_def = False
+
+    with path.open("w") as fp:
+        fp.write("\n".join(result))
+
+
 def generate_enums(  # noqa: C901
     template: Path, output: Path, headers: Iterable[Path]
 ) -> None:
@@ -332,6 +564,10 @@ def main():
     ]
     subprocess.run(args, check=True)
 
+    make_library_functions_lazy(
+        SOURCE_FOLDER / "igraph_ctypes" / "_internal" / "lib.py"
+    )
+
     args = [
         expanduser(x)
         for x in common_args
@@ -346,6 +582,17 @@ def main():
     ]
     subprocess.run(args, check=True)
 
+    return_inout_arguments(
+        SOURCE_FOLDER / "igraph_ctypes" / "_internal" / "functions.py"
+    )
+    add_flat_output_mode(
+        SOURCE_FOLDER / "igraph_ctypes" / "_internal" / "functions.py"
+    )
+    call_library_functions_lazily(
+        SOURCE_FOLDER / "igraph_ctypes" / "_internal" / "functions.py"
+    )
+    add_thread_setup(SOURCE_FOLDER / "igraph_ctypes" / "_internal" / "functions.py")
+
     generate_enums(
         SOURCE_FOLDER / "codegen" / "internal_enums.py.in",
         SOURCE_FOLDER / "igraph_ctypes" / "_internal" / "enums.py",
@@ -363,14 +610,18 @@ def main():
         SOURCE_FOLDER / "igraph_ctypes" / "types.py",
         "._internal.types",
         match=(
+            "AttributeCombinationFunction",
             "AttributeCombinationSpecification",
             "AttributeCombinationSpecificationEntry",
             "BoolArray",
             "EdgeLike",
             "EdgeSelector",
             "FileLike",
+            "FlatIntArrayList",
+            "FlatRealArrayList",
             "IntArray",
             "RealArray",
+            "SparseMatrix",
             "VertexLike",
             "VertexPair",
             "VertexSelector",
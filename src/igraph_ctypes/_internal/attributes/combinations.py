@@ -1,40 +1,52 @@
-from ctypes import c_void_p
-from numpy import mean, median
+import numpy as np
+
+from ctypes import c_void_p, cast, py_object
+from numpy.random import Generator
 from typing import Any, Callable, Iterable
 
 from igraph_ctypes._internal.enums import AttributeCombinationType, AttributeType
-from igraph_ctypes._internal.types import IntArray
+from igraph_ctypes._internal.rng import get_default_generator
+from igraph_ctypes._internal.types import BoolArray, FlatIntArrayList, IntArray
 
-from .value_list import AttributeValueList
+from .value_list import AttributeValueList, _default_value_for_type
 
 
-Handler = Callable[[AttributeValueList, list[IntArray], c_void_p], Iterable[Any] | None]
+Handler = Callable[
+    [AttributeValueList, FlatIntArrayList, c_void_p], Iterable[Any] | int | None
+]
 
 
 def apply_attribute_combinations(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_type: int,
     comb_func: c_void_p,
-) -> Iterable[Any] | None:
+) -> Iterable[Any] | int | None:
     """Applies an igraph attribute combination specification entry to a
     vector of attributes.
 
     Args:
         values: an attribute value list from the old graph where the entries have
             to be combined into a new atribute value list
-        mapping: list of integer arrays where the i-th entry lists the indices
-            from the values array that are to be merged into the i-th entry of
-            the returned value list
+        mapping: the indices from the values array that are to be merged, in
+            flat representation; the i-th segment of the index array lists the
+            indices to be merged into the i-th entry of the returned value list.
+            See `FlatIntArrayList` for more details.
         comb_type: type of attribute combination to apply; one of the constants
             from the AttributeCombinationType_ enum
         comb_func: pointer to a Python function to invoke for custom, user-defined
             attribute combinations (i.e. when comb_type is equal to
-            `AttributeCombinationType.FUNCTION`)
+            `AttributeCombinationType.FUNCTION`). The function is called once
+            with the reordered values and the offsets of the segments; see
+            `AttributeCombinationFunction` for details.
 
     Returns:
         an iterable of the combined values or `None` if the values should be ignored
-        (i.e. when `comb_type` is `AttributeCombinationType.IGNORE`)
+        (i.e. when `comb_type` is `AttributeCombinationType.IGNORE`). When a
+        user-defined combination function raises an exception, the exception is
+        registered to be raised when the igraph function that invoked the
+        attribute handler returns, and the igraph error code to return to the
+        C core is returned instead.
     """
     if comb_type == AttributeCombinationType.IGNORE:
         return None
@@ -47,9 +59,152 @@ def apply_attribute_combinations(
     return handler(values, mapping, comb_func)
 
 
+class _Segments:
+    """Values of an attribute, reordered such that the values to be merged into
+    the same new item form contiguous segments of a single NumPy array.
+
+    All the combination methods are implemented on top of this representation
+    with a constant number of NumPy calls, independently of the number of
+    segments.
+    """
+
+    type: AttributeType
+    """The igraph attribute type of the values."""
+
+    values: np.ndarray
+    """The reordered values."""
+
+    offsets: IntArray
+    """The offsets where the segments start in the array of values, followed
+    by the length of the array.
+    """
+
+    counts: IntArray
+    """The number of values in each segment."""
+
+    nonempty: BoolArray
+    """Boolean mask that selects the segments that are not empty."""
+
+    starts: IntArray
+    """The offsets where the non-empty segments start."""
+
+    ends: IntArray
+    """The offsets where the non-empty segments end."""
+
+    def __init__(self, values: AttributeValueList, mapping: FlatIntArrayList):
+        indices, offsets = mapping
+        offsets = offsets.astype(np.intp, copy=False)
+
+        self.type = values.type
+        self.values = values[indices.astype(np.intp, copy=False)]
+        self.offsets = offsets
+        self.counts = np.diff(offsets)
+        self.nonempty = self.counts > 0
+        self.starts = offsets[:-1][self.nonempty]
+        self.ends = offsets[1:][self.nonempty]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def first(self) -> np.ndarray:
+        """Returns the first value from each segment."""
+        return self._scatter(self.values[self.starts], self.empty_value())
+
+    def last(self) -> np.ndarray:
+        """Returns the last value from each segment."""
+        return self._scatter(self.values[self.ends - 1], self.empty_value())
+
+    def mean(self) -> np.ndarray:
+        """Returns the mean of the values in each segment."""
+        values = self._numeric_values()
+        if len(self.starts) > 0:
+            means = np.add.reduceat(values, self.starts) / self.counts[self.nonempty]
+        else:
+            means = values[:0]
+        return self._scatter(means, self.empty_value(np.nan))
+
+    def median(self) -> np.ndarray:
+        """Returns the median of the values in each segment."""
+        if self.type not in (AttributeType.NUMERIC, AttributeType.BOOLEAN):
+            raise TypeError(
+                f"cannot calculate the median of attributes of type {self.type}"
+            )
+
+        # Sort the values within each segment; the segment IDs are the primary
+        # sort key so the segments themselves stay in place
+        values = self._numeric_values()
+        segment_ids = np.repeat(np.arange(len(self)), self.counts)
+        values = values[np.lexsort((values, segment_ids))]
+
+        counts = self.counts[self.nonempty]
+        lower = values[self.starts + (counts - 1) // 2]
+        upper = values[self.starts + counts // 2]
+        return self._scatter((lower + upper) / 2, self.empty_value(np.nan))
+
+    def random(self, generator: Generator) -> np.ndarray:
+        """Returns a uniformly selected random value from each segment.
+
+        Args:
+            generator: the NumPy random number generator to use
+        """
+        positions = generator.integers(self.counts[self.nonempty]) + self.starts
+        return self._scatter(self.values[positions], self.empty_value())
+
+    def reduce(self, func: np.ufunc, empty: Any) -> np.ndarray:
+        """Reduces the values in each segment with a binary NumPy ufunc.
+
+        Args:
+            func: the ufunc to reduce the segments with
+            empty: the result for empty segments
+        """
+        values = self.values
+        if len(self.starts) == 0:
+            result = values[:0]
+        elif values.dtype.kind == "T":
+            # reduceat() does not support variable-width strings yet
+            result = func.reduceat(values.astype(object), self.starts)
+            result = result.astype(values.dtype)
+        else:
+            result = func.reduceat(values, self.starts)
+        return self._scatter(result, empty)
+
+    def empty_value(self, numeric: Any = None) -> Any:
+        """Returns the result of a combination for empty segments.
+
+        Args:
+            numeric: the result to use for numeric attributes; `None` means
+                the default value of the attribute type
+        """
+        if numeric is not None and self.type is AttributeType.NUMERIC:
+            return numeric
+        return _default_value_for_type(self.type)
+
+    def _numeric_values(self) -> np.ndarray:
+        """Returns the values in a form that supports arithmetic, converting
+        Boolean values to floats.
+        """
+        if self.type is AttributeType.BOOLEAN:
+            return self.values.astype(np.float64)
+        return self.values
+
+    def _scatter(self, result: np.ndarray, empty: Any) -> np.ndarray:
+        """Expands the per-segment results of the non-empty segments to all
+        the segments, using the given value for the empty ones.
+        """
+        if len(result) == len(self):
+            return result
+
+        dtype = result.dtype
+        if dtype.kind not in "ObT" and not isinstance(empty, (int, float)):
+            dtype = np.dtype(object)
+        expanded = np.full(len(self), empty, dtype=dtype)
+        expanded[self.nonempty] = result
+        return expanded
+
+
 def _combine_ignore(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> None:
     return None
@@ -57,94 +212,119 @@ def _combine_ignore(
 
 def _combine_with_function(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
-) -> None:
-    raise NotImplementedError  # TODO(ntamas)
+) -> Iterable[Any] | int:
+    if not comb_func:
+        raise ValueError("no function given for attribute combination")
+
+    func = cast(comb_func, py_object).value
+    segments = _Segments(values, mapping)
+
+    try:
+        result = func(segments.values, segments.offsets)
+        if not isinstance(result, np.ndarray):
+            result = list(result)
+
+        if len(result) != len(segments):
+            raise ValueError(
+                f"attribute combination function returned {len(result)} values, "
+                f"expected {len(segments)}"
+            )
+    except Exception as ex:
+        # Imported here to avoid a circular import; exceptions cannot
+        # propagate through the C core so we let igraph re-raise it
+        from igraph_ctypes._internal.setup import _interrupt_with
+
+        return _interrupt_with(ex)
+
+    return result
 
 
 def _combine_sum(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    return (values[item].sum() for item in mapping)
+    segments = _Segments(values, mapping)
+    return segments.reduce(np.add, segments.empty_value(0))
 
 
 def _combine_prod(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    return (values[item].prod() for item in mapping)
+    segments = _Segments(values, mapping)
+    return segments.reduce(np.multiply, segments.empty_value(1))
 
 
 def _combine_min(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    return (values[item].min() for item in mapping)
+    segments = _Segments(values, mapping)
+    return segments.reduce(np.minimum, segments.empty_value(np.nan))
 
 
 def _combine_max(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    return (values[item].min() for item in mapping)
+    segments = _Segments(values, mapping)
+    return segments.reduce(np.maximum, segments.empty_value(np.nan))
 
 
 def _combine_random(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    raise NotImplementedError  # TODO(ntamas)
+    return _Segments(values, mapping).random(get_default_generator())
 
 
 def _combine_first(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    indices = [item[0] for item in mapping]
-    return values[indices]
+    return _Segments(values, mapping).first()
 
 
 def _combine_last(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    indices = [item[-1] for item in mapping]
-    return values[indices]
+    return _Segments(values, mapping).last()
 
 
 def _combine_mean(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    return (mean(values[item]) for item in mapping)
+    return _Segments(values, mapping).mean()
 
 
 def _combine_median(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
-    return (median(values[item]) for item in mapping)
+    return _Segments(values, mapping).median()
 
 
 def _combine_concat(
     values: AttributeValueList,
-    mapping: list[IntArray],
+    mapping: FlatIntArrayList,
     comb_func: c_void_p,
 ) -> Iterable[Any]:
     if values.type != AttributeType.STRING:
         raise TypeError(f"cannot concatenate attributes of type {values.type}")
-    return ("".join(values[item]) for item in mapping)
+    return _Segments(values, mapping).reduce(np.add, "")
 
 
 _handlers: list[Handler] = [
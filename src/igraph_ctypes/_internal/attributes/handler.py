@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+import numpy as np
+
 from ctypes import cast, c_int, pointer, c_void_p
 from math import nan
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from threading import local
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
 
 from igraph_ctypes._internal.conversion import (
+    igraph_strvector_t_to_numpy_array,
+    igraph_vector_t_to_numpy_array,
+    igraph_vector_bool_t_to_numpy_array,
     igraph_vector_int_t_to_numpy_array_view,
-    igraph_vector_int_list_t_to_list_of_numpy_array_view,
+    igraph_vector_int_list_t_to_flat_numpy_arrays,
+    iterable_to_igraph_strvector_t_view,
     numpy_array_to_igraph_vector_bool_t_view,
     numpy_array_to_igraph_vector_t_view,
 )
-from igraph_ctypes._internal.enums import AttributeElementType, AttributeType
-from igraph_ctypes._internal.functions import igraph_ecount, igraph_vcount
+from igraph_ctypes._internal.enums import (
+    AttributeCombinationType,
+    AttributeElementType,
+    AttributeType,
+)
 from igraph_ctypes._internal.lib import (
     igraph_attribute_combination_query,
     igraph_attribute_record_list_size,
+    igraph_ecount,
     igraph_error,
     igraph_es_as_vector,
     igraph_vector_resize,
@@ -30,14 +41,22 @@ from igraph_ctypes._internal.lib import (
     igraph_strvector_resize,
     igraph_strvector_push_back,
     igraph_strvector_set,
+    igraph_strvector_update,
+    igraph_vcount,
 )
 from igraph_ctypes._internal.types import (
     igraph_attribute_table_t,
     igraph_bool_t,
 )
-from igraph_ctypes._internal.utils import nop, protect_with, protect_with_default
+from igraph_ctypes._internal.utils import (
+    bytes_to_str,
+    nop,
+    protect_with,
+    protect_with_default,
+)
 
 from .combinations import apply_attribute_combinations
+from .map import AttributeMap
 from .storage import (
     DictAttributeStorage,
     assign_storage_to_graph,
@@ -48,6 +67,8 @@ from .utils import python_object_to_igraph_attribute_type
 from .value_list import AttributeValueList
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from igraph_ctypes._internal.wrappers import _VectorInt
 
 __all__ = (
@@ -71,6 +92,70 @@ def _are_pointers_equal(foo, bar):
     return cast(foo, c_void_p).value == cast(bar, c_void_p).value
 
 
+def _iter_attribute_records(attr) -> Iterator[tuple[str, AttributeType, NDArray]]:
+    """Iterates over the records of an igraph attribute record list, yielding
+    the name, the type and the values of each attribute.
+
+    The values of each record are copied out of the underlying igraph vector
+    into a NumPy array in one step. Records of unknown types are skipped.
+    """
+    from igraph_ctypes._internal.wrappers import _StrVector
+
+    if not attr:
+        return
+
+    records = attr.contents.stor_begin
+    for i in range(igraph_attribute_record_list_size(attr)):
+        record = records[i]
+        name = bytes_to_str(record.name or b"")
+        values: NDArray
+        if record.type == AttributeType.NUMERIC:
+            values = igraph_vector_t_to_numpy_array(record.value.as_vector)
+        elif record.type == AttributeType.BOOLEAN:
+            values = igraph_vector_bool_t_to_numpy_array(record.value.as_vector_bool)
+        elif record.type == AttributeType.STRING:
+            # The string vector is owned by igraph so it must not be destroyed
+            vector = _StrVector(record.value.as_strvector.contents)
+            vector.release()
+            values = igraph_strvector_t_to_numpy_array(vector)
+        else:
+            continue
+
+        yield name, AttributeType(record.type), values
+
+
+def _add_attribute_records(map: AttributeMap, n: int, attr) -> None:
+    """Fills the values of the last ``n`` items of the given vertex or edge
+    attribute map from an igraph attribute record list.
+
+    The attribute containers in the map must already have been extended to
+    include the new items.
+    """
+    for name, type, values in _iter_attribute_records(attr):
+        if len(values) != n:
+            raise ValueError(
+                f"attribute {name!r} has {len(values)} values, expected {n}"
+            )
+        map._assign_to_last_items(name, values, type)
+
+
+class _ScratchSpace(local):
+    """Thread-local scratch storage of the attribute handler.
+
+    The attribute handler is shared by all graphs, and igraph may invoke it
+    from multiple threads at the same time, so the temporary objects that it
+    needs are kept separately for each thread.
+    """
+
+    indices: _VectorInt
+    """Vector used to resolve vertex and edge selectors into indices."""
+
+    def __init__(self):
+        from igraph_ctypes._internal.wrappers import _VectorInt
+
+        self.indices = _VectorInt.create(0)
+
+
 class AttributeHandlerBase:
     """Base class for igraph attribute handlers."""
 
@@ -110,16 +195,18 @@ class AttributeHandler(AttributeHandlerBase):
     as its storage backend.
     """
 
-    _indices: _VectorInt
+    _scratch: _ScratchSpace
 
-    def init(self, graph, attr):
-        from igraph_ctypes._internal.wrappers import _VectorInt
+    def __init__(self):
+        self._scratch = _ScratchSpace()
 
-        assign_storage_to_graph(graph, DictAttributeStorage())
-        self._indices = _VectorInt.create(0)
+    def init(self, graph, attr):
+        storage = DictAttributeStorage()
+        assign_storage_to_graph(graph, storage)
 
-        if attr and igraph_attribute_record_list_size(attr) != 0:
-            raise RuntimeError("attribute initialization not implemented yet")
+        graph_attrs = storage.get_graph_attribute_map()
+        for name, _, values in _iter_attribute_records(attr):
+            graph_attrs[name] = values.tolist()[0] if len(values) > 0 else None
 
     def destroy(self, graph) -> None:
         storage = get_storage_from_graph(graph)
@@ -152,11 +239,13 @@ class AttributeHandler(AttributeHandlerBase):
         assign_storage_to_graph(to, new_storage)
 
     def add_vertices(self, graph, n: int, attr) -> None:
-        if attr and igraph_attribute_record_list_size(attr) != 0:
-            raise RuntimeError("attribute initialization not implemented yet")
+        storage = get_storage_from_graph(graph)
 
         # Extend the existing attribute containers
-        get_storage_from_graph(graph).add_vertices(graph, n)
+        storage.add_vertices(graph, n)
+
+        # Fill the values of the new vertices from the attribute records
+        _add_attribute_records(storage.get_vertex_attribute_map(), n, attr)
 
     def permute_vertices(self, graph, to, mapping):
         mapping_array = igraph_vector_int_t_to_numpy_array_view(mapping)
@@ -171,13 +260,21 @@ class AttributeHandler(AttributeHandlerBase):
     def combine_vertices(self, graph, to, mapping, combinations):
         assert not _are_pointers_equal(graph, to)
 
+        old_attrs = get_storage_from_graph(graph).get_vertex_attribute_map()
+        new_attrs = get_storage_from_graph(to).get_vertex_attribute_map()
+        return self._combine_attributes(old_attrs, new_attrs, mapping, combinations)
+
     def add_edges(self, graph, edges, attr) -> None:
-        if attr and igraph_attribute_record_list_size(attr) != 0:
-            raise RuntimeError("attribute initialization not implemented yet")
+        storage = get_storage_from_graph(graph)
 
         # Extend the existing attribute containers
         edge_array = igraph_vector_int_t_to_numpy_array_view(edges).reshape((-1, 2))
-        get_storage_from_graph(graph).add_edges(graph, edge_array)
+        storage.add_edges(graph, edge_array)
+
+        # Fill the values of the new edges from the attribute records
+        _add_attribute_records(
+            storage.get_edge_attribute_map(), edge_array.shape[0], attr
+        )
 
     def permute_edges(self, graph, to, mapping):
         mapping_array = igraph_vector_int_t_to_numpy_array_view(mapping)
@@ -192,10 +289,32 @@ class AttributeHandler(AttributeHandlerBase):
     def combine_edges(self, graph, to, mapping, combinations):
         assert not _are_pointers_equal(graph, to)
 
-        mapping_arrays = igraph_vector_int_list_t_to_list_of_numpy_array_view(mapping)
-
         old_attrs = get_storage_from_graph(graph).get_edge_attribute_map()
         new_attrs = get_storage_from_graph(to).get_edge_attribute_map()
+        return self._combine_attributes(old_attrs, new_attrs, mapping, combinations)
+
+    @staticmethod
+    def _combine_attributes(
+        old_attrs: AttributeMap, new_attrs: AttributeMap, mapping, combinations
+    ) -> Optional[int]:
+        """Merges the vertex or edge attributes of a graph into the attributes
+        of a new graph, according to the attribute combination specification
+        received from igraph.
+
+        Args:
+            old_attrs: the vertex or edge attributes of the old graph
+            new_attrs: the vertex or edge attributes of the new graph
+            mapping: igraph list of integer vectors where the i-th vector lists
+                the old vertices or edges merged into the i-th new one
+            combinations: the igraph attribute combination specification
+
+        Returns:
+            `None` if the attributes were combined successfully, or the igraph
+            error code to return to the C core if a user-defined combination
+            function raised an exception
+        """
+        # Convert the mapping only once; it is shared by all the attributes
+        flat_mapping = igraph_vector_int_list_t_to_flat_numpy_arrays(mapping)
 
         for name, values in old_attrs.items():
             comb_type = c_int()
@@ -209,10 +328,20 @@ class AttributeHandler(AttributeHandlerBase):
             )
 
             new_values = apply_attribute_combinations(
-                values, mapping_arrays, comb_type.value, comb_func
+                values, flat_mapping, comb_type.value, comb_func
             )
-            if new_values is not None:
-                new_attrs.set(name, new_values, type=values.type, _check_length=False)
+            if isinstance(new_values, int):
+                return new_values
+            elif new_values is not None:
+                # Custom functions may change the type of the attribute
+                new_type = (
+                    None
+                    if comb_type.value == AttributeCombinationType.FUNCTION
+                    else values.type
+                )
+                new_attrs.set(name, new_values, type=new_type, _check_length=False)
+
+        return None
 
     def get_info(self, graph, gnames, gtypes, vnames, vtypes, enames, etypes):
         storage = get_storage_from_graph(graph)
@@ -296,25 +425,26 @@ class AttributeHandler(AttributeHandlerBase):
     def get_numeric_vertex_attr(self, graph, name: bytes, vs, value):
         map = get_storage_from_graph(graph).get_vertex_attribute_map()
 
-        igraph_vs_as_vector(graph, vs, self._indices)
-        values = self._get_values_by_index(map[name.decode("utf-8")], self._indices)
+        indices = self._scratch.indices
+        igraph_vs_as_vector(graph, vs, indices)
+        values = self._get_values_by_index(map[name.decode("utf-8")], indices)
         igraph_vector_update(value, numpy_array_to_igraph_vector_t_view(values))
 
     def get_string_vertex_attr(self, graph, name: bytes, vs, value):
         map = get_storage_from_graph(graph).get_vertex_attribute_map()
 
-        igraph_vs_as_vector(graph, vs, self._indices)
-        values = self._get_values_by_index(map[name.decode("utf-8")], self._indices)
+        indices = self._scratch.indices
+        igraph_vs_as_vector(graph, vs, indices)
+        values = self._get_values_by_index(map[name.decode("utf-8")], indices)
 
-        igraph_strvector_resize(value, len(values))
-        for i, v in enumerate(values):
-            igraph_strvector_set(value, i, self._to_bytes(v))
+        igraph_strvector_update(value, iterable_to_igraph_strvector_t_view(values))
 
     def get_bool_vertex_attr(self, graph, name: bytes, vs, value):
         map = get_storage_from_graph(graph).get_vertex_attribute_map()
 
-        igraph_vs_as_vector(graph, vs, self._indices)
-        values = self._get_values_by_index(map[name.decode("utf-8")], self._indices)
+        indices = self._scratch.indices
+        igraph_vs_as_vector(graph, vs, indices)
+        values = self._get_values_by_index(map[name.decode("utf-8")], indices)
         igraph_vector_bool_update(
             value, numpy_array_to_igraph_vector_bool_t_view(values)
         )
@@ -322,25 +452,26 @@ class AttributeHandler(AttributeHandlerBase):
     def get_numeric_edge_attr(self, graph, name: bytes, es, value):
         map = get_storage_from_graph(graph).get_edge_attribute_map()
 
-        igraph_es_as_vector(graph, es, self._indices)
-        values = self._get_values_by_index(map[name.decode("utf-8")], self._indices)
+        indices = self._scratch.indices
+        igraph_es_as_vector(graph, es, indices)
+        values = self._get_values_by_index(map[name.decode("utf-8")], indices)
         igraph_vector_update(value, numpy_array_to_igraph_vector_t_view(values))
 
     def get_string_edge_attr(self, graph, name: bytes, es, value):
         map = get_storage_from_graph(graph).get_edge_attribute_map()
 
-        igraph_es_as_vector(graph, es, self._indices)
-        values = self._get_values_by_index(map[name.decode("utf-8")], self._indices)
+        indices = self._scratch.indices
+        igraph_es_as_vector(graph, es, indices)
+        values = self._get_values_by_index(map[name.decode("utf-8")], indices)
 
-        igraph_strvector_resize(value, len(values))
-        for i, v in enumerate(values):
-            igraph_strvector_set(value, i, self._to_bytes(v))
+        igraph_strvector_update(value, iterable_to_igraph_strvector_t_view(values))
 
     def get_bool_edge_attr(self, graph, name: bytes, es, value):
         map = get_storage_from_graph(graph).get_edge_attribute_map()
 
-        igraph_es_as_vector(graph, es, self._indices)
-        values = self._get_values_by_index(map[name.decode("utf-8")], self._indices)
+        indices = self._scratch.indices
+        igraph_es_as_vector(graph, es, indices)
+        values = self._get_values_by_index(map[name.decode("utf-8")], indices)
         igraph_vector_bool_update(
             value, numpy_array_to_igraph_vector_bool_t_view(values)
         )
@@ -348,6 +479,16 @@ class AttributeHandler(AttributeHandlerBase):
     @staticmethod
     def _get_values_by_index(values: AttributeValueList, indices: _VectorInt):
         index_array = igraph_vector_int_t_to_numpy_array_view(indices)
+        n = len(values)
+        if (
+            len(index_array) == n
+            and n > 0
+            and index_array[0] == 0
+            and (np.diff(index_array) == 1).all()
+        ):
+            # All the values were requested in order (e.g., when saving a graph),
+            # no need to copy them. Copying is expensive for strings.
+            return np.asarray(values)
         return values[index_array]
 
     @staticmethod
@@ -1,8 +1,12 @@
+import numpy as np
+
 from collections.abc import MutableMapping
+from numpy.typing import NDArray
 from typing import Iterable, Iterator, TypeVar
 
 from .enums import AttributeType
-from .value_list import AttributeValueList
+from .utils import igraph_to_numpy_attribute_type
+from .value_list import AttributeValueList, _default_value_for_type
 
 __all__ = ("AttributeMap",)
 
@@ -106,6 +110,32 @@ class AttributeMap(MutableMapping[str, AttributeValueList[T]]):
 
         self._items[key] = avl
 
+    def _assign_to_last_items(
+        self, key: str, values: NDArray, type: AttributeType
+    ) -> None:
+        """Assigns the given values to the last items of the given attribute in
+        bulk.
+
+        When the attribute does not exist yet, it is created with the default
+        value of its type for the other items. When it exists with a different
+        type, it is converted to a generic Python object attribute first.
+        """
+        length = self._common_length_of_values
+        avl = self._items.get(key)
+
+        if avl is None:
+            array = np.full(
+                length,
+                _default_value_for_type(type),
+                dtype=igraph_to_numpy_attribute_type(type),
+            )
+            avl = AttributeValueList(array, type=type, fixed_length=True, _wrap=True)
+            self._items[key] = avl
+        elif avl.type is not type and avl.type is not AttributeType.OBJECT:
+            avl.cast(AttributeType.OBJECT)
+
+        avl[length - len(values) :] = values
+
     def _extend_common_length(self, n: int) -> None:
         self._common_length_of_values += n
         for value_list in self._items.values():
@@ -1,5 +1,6 @@
 import numpy as np
 
+from numpy.dtypes import StringDType
 from numpy.typing import DTypeLike
 from typing import Any, Iterable, Type
 
@@ -18,11 +19,18 @@ __all__ = (
 
 
 def igraph_to_numpy_attribute_type(type: AttributeType) -> DTypeLike:
-    """Converts an igraph attribute type to an equivalent NumPy data type."""
+    """Converts an igraph attribute type to an equivalent NumPy data type.
+
+    Strings are stored with NumPy's variable-width string data type, which
+    keeps the UTF-8 encoded strings in compact storage owned by the array
+    instead of allocating a separate Python object for each string.
+    """
     if type is AttributeType.BOOLEAN:
         return np_type_of_igraph_bool_t
     elif type is AttributeType.NUMERIC:
         return np_type_of_igraph_real_t
+    elif type is AttributeType.STRING:
+        return StringDType()
     else:
         return np.object_
 
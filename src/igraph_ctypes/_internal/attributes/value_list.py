@@ -149,7 +149,13 @@ class AttributeValueList(Sequence[T]):
                 )
 
             dtype = igraph_to_numpy_attribute_type(type)
-            array = np.fromiter(items if items is not None else (), dtype=dtype)
+            if isinstance(items, AttributeValueList) or (
+                isinstance(items, np.ndarray) and items.ndim == 1
+            ):
+                # Copy in bulk instead of iterating over the items one by one
+                array = np.array(items, dtype=dtype)
+            else:
+                array = np.fromiter(items if items is not None else (), dtype=dtype)
 
         self._fixed_length = bool(fixed_length)
 
@@ -174,13 +180,8 @@ class AttributeValueList(Sequence[T]):
         if not isinstance(new_type, AttributeType):
             new_type = python_type_to_igraph_attribute_type(new_type)
 
-        numpy_type = igraph_to_numpy_attribute_type(new_type)
-        if new_type is AttributeType.STRING and self._type is not AttributeType.STRING:
-            # Requires special treatment because AttributeType.STRING is
-            # np.object_ so no conversion would happen by default
-            new_array = np.array([str(x) for x in self._items], dtype=numpy_type)
-        else:
-            new_array = self._items.astype(numpy_type)
+        # Conversion to strings calls str() on the items
+        new_array = self._items.astype(igraph_to_numpy_attribute_type(new_type))
         self._init_with_array(new_array, new_type)
 
     def compact(self) -> None:
@@ -214,6 +215,19 @@ class AttributeValueList(Sequence[T]):
         """Returns the igraph attribute type of this list."""
         return self._type
 
+    def __array__(
+        self, dtype: DTypeLike | None = None, copy: bool | None = None
+    ) -> NDArray:
+        """Returns the items of the list as a NumPy array.
+
+        The returned array is a view into the internal storage of the list
+        unless a copy is requested or needed for a type conversion.
+        """
+        if copy:
+            return np.array(self._items, dtype=dtype)
+        else:
+            return np.asarray(self._items, dtype=dtype)
+
     def __eq__(self, other: Any) -> bool:
         """Returns whether the list is equal to some other sequence of items.
 
@@ -399,17 +413,16 @@ class AttributeValueList(Sequence[T]):
             # We do not have enough space pre-allocated, find the nearest
             # power of two that will suffice
             new_length = 2 ** int(np.ceil(np.log2(target_length)))
-            default_value: Any
-            if self._type is AttributeType.BOOLEAN:
-                default_value = False
-            elif self._type is AttributeType.NUMERIC:
-                default_value = 0.0
-            elif self._type is AttributeType.STRING:
-                default_value = ""
-            else:
-                default_value = None
+            default_value = _default_value_for_type(self._type)
 
-            self._buffer.resize((new_length,), refcheck=False)
+            if self._buffer.flags.owndata:
+                self._buffer.resize((new_length,), refcheck=False)
+            else:
+                # Buffer is a view into memory that we do not own (e.g., an
+                # unpickled out-of-band buffer) so it cannot be resized
+                buffer = np.empty(new_length, dtype=self._buffer.dtype)
+                buffer[:current_length] = self._buffer[:current_length]
+                self._buffer = buffer
             self._buffer[current_length:new_length] = default_value
 
         self._items = self._buffer[:target_length]
@@ -422,6 +435,20 @@ class AttributeValueList(Sequence[T]):
         )
 
 
+def _default_value_for_type(type: AttributeType) -> Any:
+    """Returns the value that is used for new items of attribute value lists
+    of the given type when no value was specified for them.
+    """
+    if type is AttributeType.BOOLEAN:
+        return False
+    elif type is AttributeType.NUMERIC:
+        return 0.0
+    elif type is AttributeType.STRING:
+        return ""
+    else:
+        return None
+
+
 def _slice_length(s: slice, length: int) -> int:
     """Helper function to determine the number of items in a slice, given the
     slice itself and the length of the container it is applied on.
@@ -5,7 +5,19 @@ from __future__ import annotations
 import numpy as np
 
 from contextlib import contextmanager
-from ctypes import addressof, get_errno, memmove, POINTER
+from ctypes import (
+    addressof,
+    cast,
+    c_char,
+    c_char_p,
+    c_void_p,
+    get_errno,
+    memmove,
+    pointer,
+    POINTER,
+    sizeof,
+)
+from numpy.dtypes import StringDType
 from os import strerror
 from typing import (
     Any,
@@ -17,6 +29,7 @@ from typing import (
     Optional,
     Sequence,
     TYPE_CHECKING,
+    TypeVar,
 )
 
 from .attributes.utils import python_type_to_igraph_attribute_type
@@ -25,38 +38,48 @@ from .lib import (
     fdopen,
     fflush,
     igraph_attribute_combination_add,
+    igraph_free,
     igraph_es_all,
     igraph_es_none,
     igraph_es_vector_copy,
     igraph_es_1,
+    igraph_matrix_init,
+    igraph_matrix_int_init,
     igraph_matrix_int_init_array,
     igraph_matrix_int_ncol,
     igraph_matrix_int_nrow,
+    igraph_matrix_int_view,
     igraph_matrix_init_array,
     igraph_matrix_ncol,
     igraph_matrix_nrow,
+    igraph_matrix_view,
+    igraph_strvector_size,
     igraph_vector_bool_get,
     igraph_vector_bool_get_ptr,
+    igraph_vector_bool_init,
     igraph_vector_bool_init_array,
-    igraph_vector_bool_push_back,
+    igraph_vector_bool_resize_min,
     igraph_vector_bool_size,
     igraph_vector_bool_view,
     igraph_vector_get,
     igraph_vector_get_ptr,
+    igraph_vector_init,
     igraph_vector_init_array,
     igraph_vector_int_get,
     igraph_vector_int_get_ptr,
+    igraph_vector_int_init,
     igraph_vector_int_init_array,
     igraph_vector_int_list_get_ptr,
     igraph_vector_int_list_push_back,
     igraph_vector_int_list_size,
-    igraph_vector_int_push_back,
+    igraph_vector_int_resize_min,
     igraph_vector_int_size,
     igraph_vector_int_view,
     igraph_vector_list_get_ptr,
     igraph_vector_list_push_back,
     igraph_vector_list_size,
-    igraph_vector_push_back,
+    igraph_vector_ptr_set,
+    igraph_vector_resize_min,
     igraph_vector_size,
     igraph_vector_view,
     igraph_vs_all,
@@ -65,9 +88,14 @@ from .lib import (
     igraph_vs_1,
 )
 from .types import (
+    cs_igraph,
     igraph_bool_t,
     igraph_int_t,
     igraph_real_t,
+    igraph_sparsemat_t,
+    igraph_strvector_t,
+    igraph_vector_int_t,
+    igraph_vector_t,
     np_type_of_igraph_bool_t,
     np_type_of_igraph_int_t,
     np_type_of_igraph_real_t,
@@ -77,31 +105,43 @@ from .types import (
     EdgeLike,
     EdgeSelector,
     FilePtr,
+    FlatIntArrayList,
+    FlatRealArrayList,
     IntArray,
     MatrixLike,
     MatrixIntLike,
     RealArray,
+    SparseMatrix,
     VertexLike,
     VertexPair,
     VertexSelector,
 )
+from .metamagic import Boxed
 from .utils import bytes_to_str
 from .wrappers import (
     _AttributeCombination,
     _EdgeSelector,
+    _GraphList,
     _Matrix,
     _MatrixInt,
+    _SparseMat,
+    _StrVector,
     _Vector,
     _VectorBool,
     _VectorInt,
     _VectorIntList,
     _VectorList,
+    _VectorPtr,
     _VertexSelector,
 )
 
 if TYPE_CHECKING:
     from igraph_ctypes.graph import Graph
+    from igraph_ctypes.graph_list import GraphList
+
 
+B = TypeVar("B", bound=Boxed)
+T = TypeVar("T")
 
 __all__ = (
     "any_to_file_ptr",
@@ -117,24 +157,39 @@ __all__ = (
     "edge_selector_to_igraph_es_t",
     "edge_weights_to_igraph_vector_t",
     "edge_weights_to_igraph_vector_t_view",
+    "igraph_graph_list_t_to_graph_list",
     "igraph_matrix_t_to_numpy_array",
+    "igraph_matrix_t_to_numpy_array_in_place",
+    "igraph_matrix_t_to_numpy_array_transfer",
     "igraph_matrix_int_t_to_numpy_array",
+    "igraph_matrix_int_t_to_numpy_array_in_place",
+    "igraph_matrix_int_t_to_numpy_array_transfer",
+    "igraph_sparsemat_t_to_scipy_sparse_transfer",
+    "igraph_strvector_t_to_list",
+    "igraph_strvector_t_to_numpy_array",
     "igraph_vector_t_to_list",
     "igraph_vector_bool_t_to_list",
     "igraph_vector_int_t_to_list",
     "igraph_vector_t_to_numpy_array",
+    "igraph_vector_t_to_numpy_array_transfer",
     "igraph_vector_t_to_numpy_array_view",
     "igraph_vector_bool_t_to_numpy_array",
+    "igraph_vector_bool_t_to_numpy_array_transfer",
     "igraph_vector_bool_t_to_numpy_array_view",
     "igraph_vector_int_t_to_numpy_array",
+    "igraph_vector_int_t_to_numpy_array_transfer",
     "igraph_vector_int_t_to_numpy_array_view",
+    "igraph_vector_int_list_t_to_flat_numpy_arrays",
     "igraph_vector_int_list_t_to_list_of_numpy_array",
+    "igraph_vector_list_t_to_flat_numpy_arrays",
     "igraph_vector_list_t_to_list_of_numpy_array",
     "iterable_edge_indices_to_igraph_vector_int_t",
+    "iterable_of_graphs_to_igraph_vector_ptr_t",
     "iterable_of_edge_index_iterable_to_igraph_vector_int_list_t",
     "iterable_of_iterable_to_igraph_vector_int_list_t",
     "iterable_of_iterable_to_igraph_vector_list_t",
     "iterable_of_vertex_index_iterable_to_igraph_vector_int_list_t",
+    "iterable_to_igraph_strvector_t_view",
     "iterable_to_igraph_vector_bool_t",
     "iterable_to_igraph_vector_bool_t_view",
     "iterable_to_igraph_vector_int_t",
@@ -143,11 +198,13 @@ __all__ = (
     "iterable_to_igraph_vector_t_view",
     "iterable_vertex_indices_to_igraph_vector_int_t",
     "mapping_to_attribute_combination_t",
+    "mutable_graph_to_igraph_t",
     "python_type_to_igraph_attribute_type",
     "sequence_to_igraph_matrix_int_t",
     "sequence_to_igraph_matrix_int_t_view",
     "sequence_to_igraph_matrix_t",
     "sequence_to_igraph_matrix_t_view",
+    "sparse_matrix_to_igraph_sparsemat_t_view",
     "vertexlike_to_igraph_int_t",
     "vertex_pairs_to_igraph_vector_int_t",
     "vertex_selector_to_igraph_vs_t",
@@ -242,7 +299,7 @@ def edge_selector_to_igraph_es_t(selector: EdgeSelector, graph: Graph) -> _EdgeS
     """
     if selector is None:
         return _EdgeSelector.create_with(igraph_es_none)
-    elif selector == "all":
+    elif isinstance(selector, str) and selector == "all":
         return _EdgeSelector.create_with(igraph_es_all)
     elif isinstance(selector, str):
         # TODO(ntamas): implement name lookup?
@@ -312,10 +369,128 @@ def iterable_edge_indices_to_igraph_vector_int_t(
     if isinstance(indices, np.ndarray):
         return numpy_array_to_igraph_vector_int_t(indices, flatten=True)
 
-    result = _VectorInt.create(0)
-    for index in indices:
-        igraph_vector_int_push_back(result, edgelike_to_igraph_int_t(index))
-    return result
+    items = _ensure_sequence(indices)
+    arr = _sequence_to_numpy_array(items, np_type_of_igraph_int_t)
+    _validate_index_array(arr, items, edgelike_to_igraph_int_t)
+    return numpy_array_to_igraph_vector_int_t(arr)
+
+
+def iterable_to_igraph_strvector_t_view(items: Iterable[Any]) -> _StrVector:
+    """Provides an igraph string vector view into the strings of the given
+    iterable.
+
+    All the strings are encoded into a single NUL-separated UTF-8 buffer in
+    one pass and the string vector points into this buffer, so no igraph
+    function needs to be called for the individual strings. Items that are
+    not strings are converted to strings first. NumPy arrays of byte strings
+    are used as they are, without decoding and re-encoding them.
+
+    The view must be treated as read-only by igraph; use
+    ``igraph_strvector_update()`` to copy it into a string vector owned by
+    igraph.
+    """
+    buffer, offsets = _encode_strings(items)
+
+    pointers = offsets + buffer.ctypes.data
+    start = pointers.ctypes.data
+    end = start + pointers.nbytes
+
+    result = _StrVector(
+        igraph_strvector_t(
+            stor_begin=cast(start, POINTER(c_char_p)),
+            stor_end=cast(end, POINTER(c_char_p)),
+            end=cast(end, POINTER(c_char_p)),
+        )
+    )
+
+    # Destructor must not be called so we need to call .release()
+    result.release()
+
+    return _attach_view_source(result, (buffer, pointers))
+
+
+def _encode_strings(items: Iterable[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Encodes the given items into a single buffer of NUL-terminated UTF-8
+    strings.
+
+    Returns:
+        the buffer as a NumPy array of bytes and the offsets of the strings
+        in the buffer
+    """
+    if isinstance(items, np.ndarray) and items.dtype.kind == "T":
+        return _encode_variable_width_strings(items.reshape(-1))
+
+    if isinstance(items, np.ndarray) and items.dtype.kind in "SU":
+        if items.dtype.kind == "U":
+            items = np.char.encode(items, "utf-8", "replace")
+
+        # Fixed-width byte strings are padded with NUL bytes so we only need
+        # to make room for the terminator of the longest string
+        arr = np.ascontiguousarray(items).reshape(-1)
+        count, width = len(arr), arr.dtype.itemsize
+        buffer = np.zeros((count, width + 1), dtype=np.uint8)
+        buffer[:, :width] = arr.view(np.uint8).reshape(count, width)
+        offsets = np.arange(count, dtype=np.uintp) * (width + 1)
+        return buffer.reshape(-1), offsets
+
+    strings = list(map(str, items))
+    if not strings:
+        return np.zeros(1, dtype=np.uint8), np.zeros(0, dtype=np.uintp)
+
+    encoded = "\0".join(strings).encode("utf-8", errors="replace") + b"\0"
+    buffer = np.frombuffer(encoded, dtype=np.uint8)
+    ends = np.flatnonzero(buffer == 0)
+    if len(ends) != len(strings):
+        # Some strings contain NUL characters. C strings end at the first
+        # one so we cut the strings there
+        return _encode_strings(string.partition("\0")[0] for string in strings)
+
+    offsets = np.zeros(len(ends), dtype=np.uintp)
+    offsets[1:] = ends[:-1] + 1
+    return buffer, offsets
+
+
+def _encode_variable_width_strings(
+    items: np.ndarray, chunk_size: int = 65536
+) -> tuple[np.ndarray, np.ndarray]:
+    """Encodes a NumPy array of variable-width strings into a single buffer of
+    NUL-terminated UTF-8 strings without creating Python strings.
+
+    The strings are converted in chunks into fixed-width byte strings, so a
+    single long string affects the size of the padded intermediate arrays
+    of its own chunk only. Chunks where the padding would take more space
+    than the strings themselves are encoded by Python instead, and so are
+    chunks with non-ASCII characters as NumPy can convert only ASCII strings
+    into byte strings.
+
+    Returns:
+        the buffer as a NumPy array of bytes and the offsets of the strings
+        in the buffer
+    """
+    buffers: list[np.ndarray] = []
+    offsets: list[np.ndarray] = []
+    base = 0
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start : start + chunk_size]
+        lengths = np.strings.str_len(chunk)
+        width = max(int(lengths.max()), 1)
+        if width * len(chunk) > 2 * (int(lengths.sum()) + len(chunk)):
+            encoded = chunk.tolist()
+        else:
+            try:
+                encoded = chunk.astype(f"S{width}")
+            except UnicodeEncodeError:
+                encoded = chunk.tolist()
+
+        buffer, chunk_offsets = _encode_strings(encoded)
+        buffers.append(buffer)
+        offsets.append(chunk_offsets + base)
+        base += len(buffer)
+
+    if not buffers:
+        return np.zeros(1, dtype=np.uint8), np.zeros(0, dtype=np.uintp)
+
+    return np.concatenate(buffers), np.concatenate(offsets)
 
 
 def iterable_to_igraph_vector_bool_t(items: Iterable[Any]) -> _VectorBool:
@@ -324,11 +499,18 @@ def iterable_to_igraph_vector_bool_t(items: Iterable[Any]) -> _VectorBool:
     """
     if isinstance(items, np.ndarray):
         return numpy_array_to_igraph_vector_bool_t(items)
-    else:
-        result: _VectorBool = _VectorBool.create(0)
-        for item in items:
-            igraph_vector_bool_push_back(result, bool(item))
-        return result
+
+    seq = _ensure_sequence(items)
+    arr = _sequence_to_numpy_array(seq, np_type_of_igraph_bool_t)
+    if arr.ndim != 1 or arr.dtype.kind not in "biuf":
+        # Strings, mixed types or arbitrary objects; we need to fall back to
+        # the truth values of the individual items
+        arr = np.fromiter(
+            map(bool, seq), dtype=np_type_of_igraph_bool_t, count=len(seq)
+        )
+    elif arr.dtype.kind != "b":
+        arr = arr != 0
+    return numpy_array_to_igraph_vector_bool_t(arr)
 
 
 def iterable_to_igraph_vector_bool_t_view(items: Iterable[Any]) -> _VectorBool:
@@ -349,10 +531,9 @@ def iterable_to_igraph_vector_int_t(items: Iterable[int]) -> _VectorInt:
     if isinstance(items, np.ndarray):
         return numpy_array_to_igraph_vector_int_t(items, flatten=True)
     else:
-        result = _VectorInt.create(0)
-        for item in items:
-            igraph_vector_int_push_back(result, item)
-        return result
+        seq = _ensure_sequence(items)
+        arr = _sequence_to_numpy_array(seq, np_type_of_igraph_int_t)
+        return numpy_array_to_igraph_vector_int_t(arr, flatten=True)
 
 
 def iterable_to_igraph_vector_int_t_view(items: Iterable[Any]) -> _VectorInt:
@@ -373,10 +554,9 @@ def iterable_to_igraph_vector_t(items: Iterable[float]) -> _Vector:
     if isinstance(items, np.ndarray):
         return numpy_array_to_igraph_vector_t(items)
     else:
-        result: _Vector = _Vector.create(0)
-        for item in items:
-            igraph_vector_push_back(result, item)
-        return result
+        seq = _ensure_sequence(items)
+        arr = _sequence_to_numpy_array(seq, np_type_of_igraph_real_t)
+        return numpy_array_to_igraph_vector_t(arr)
 
 
 def iterable_to_igraph_vector_t_view(items: Iterable[float]) -> _Vector:
@@ -399,10 +579,24 @@ def iterable_vertex_indices_to_igraph_vector_int_t(
     if isinstance(indices, np.ndarray):
         return numpy_array_to_igraph_vector_int_t(indices, flatten=True)
 
-    result: _VectorInt = _VectorInt.create(0)
-    for index in indices:
-        igraph_vector_int_push_back(result, vertexlike_to_igraph_int_t(index))
-    return result
+    items = _ensure_sequence(indices)
+    arr = _sequence_to_numpy_array(items, np_type_of_igraph_int_t)
+    _validate_index_array(arr, items, vertexlike_to_igraph_int_t)
+    return numpy_array_to_igraph_vector_int_t(arr)
+
+
+def iterable_of_graphs_to_igraph_vector_ptr_t(graphs: Iterable[Graph]) -> _VectorPtr:
+    """Converts an iterable of graphs to an igraph pointer vector that refers
+    to the low-level igraph objects of the graphs.
+
+    The graphs are attached to the vector to ensure that they are not
+    garbage-collected while the vector is still in use.
+    """
+    items = list(graphs)
+    result = _VectorPtr.create(len(items))
+    for index, graph in enumerate(items):
+        igraph_vector_ptr_set(result, index, addressof(graph._instance.unwrap()))
+    return _attach_view_source(result, items)
 
 
 def iterable_of_iterable_to_igraph_vector_int_list_t(
@@ -463,7 +657,6 @@ def _any_to_attribute_combination_type_and_func(
     value: AttributeCombinationSpecificationEntry,
 ) -> tuple[AttributeCombinationType, Callable | None]:
     if callable(value):
-        # TODO(ntamas): need a Python-to-C wrapper around value!
         return AttributeCombinationType.FUNCTION, value
     else:
         return AttributeCombinationType.from_(value), None
@@ -484,16 +677,39 @@ def mapping_to_attribute_combination_t(
         return mapping_to_attribute_combination_t({None: mapping})  # type: ignore
 
     result = _AttributeCombination.create()
+    functions: list[Callable] = []
 
     for key, value in (mapping or {}).items():
         combination_type, func = _any_to_attribute_combination_type_and_func(value)
+        if func is not None:
+            functions.append(func)
         igraph_attribute_combination_add(
-            result, key.encode("utf-8") if key else None, combination_type.value, func
+            result,
+            key.encode("utf-8") if key else None,
+            combination_type.value,
+            id(func) if func is not None else None,
         )
 
+    # igraph stores only the addresses of the Python functions so they must
+    # not be garbage-collected while the combination object is in use
+    result._functions = functions  # type: ignore
+
     return result
 
 
+def mutable_graph_to_igraph_t(graph: Graph) -> Graph:
+    """Checks whether the given graph may be modified in-place by an igraph
+    function and returns it as is if it can.
+
+    Raises:
+        ValueError: if the graph is read-only, e.g. because it is attached to
+            memory that is shared with other processes
+    """
+    if graph._instance.read_only:
+        raise ValueError("graph is read-only")
+    return graph
+
+
 def sequence_to_igraph_matrix_int_t(items: MatrixIntLike) -> _MatrixInt:
     """Converts a sequence of sequences of Python integers to an igraph matrix
     of integers. Each sequence in the top-level sequence must have the same
@@ -514,8 +730,10 @@ def sequence_to_igraph_matrix_int_t_view(items: MatrixIntLike) -> _MatrixInt:
     appropriate NumPy matrix. Each sequence in the top-level sequence must have
     the same length.
     """
-    # TODO(ntamas)
-    return sequence_to_igraph_matrix_int_t(items)
+    if isinstance(items, np.ndarray):
+        return numpy_array_to_igraph_matrix_int_t_view(items)
+    else:
+        return sequence_to_igraph_matrix_int_t(items)
 
 
 def sequence_to_igraph_matrix_t(items: MatrixLike) -> _Matrix:
@@ -538,8 +756,10 @@ def sequence_to_igraph_matrix_t_view(items: MatrixLike) -> _Matrix:
     appropriate NumPy matrix. Each sequence in the top-level sequence must have
     the same length.
     """
-    # TODO(ntamas)
-    return sequence_to_igraph_matrix_t(items)
+    if isinstance(items, np.ndarray):
+        return numpy_array_to_igraph_matrix_t_view(items)
+    else:
+        return sequence_to_igraph_matrix_t(items)
 
 
 def _ensure_matrix(items: Sequence[Sequence[Any]]) -> None:
@@ -556,6 +776,72 @@ def _ensure_matrix(items: Sequence[Sequence[Any]]) -> None:
             raise ValueError("rows of a matrix must have the same length")
 
 
+def _attach_view_source(view: B, source: Any) -> B:
+    """Attaches the NumPy array (or arrays) that the given boxed igraph vector
+    or matrix view refers to to the boxed object itself.
+
+    This is needed because the source array may be a temporary copy of the
+    array that the user passed in, and it must not be garbage-collected while
+    the view is still in use.
+    """
+    view._view_source = source  # type: ignore
+    return view
+
+
+def _ensure_sequence(items: Iterable[T]) -> Sequence[T]:
+    """Ensures that the given iterable is a sequence, materializing it into a
+    list if needed. Sequences are returned intact.
+    """
+    return items if isinstance(items, Sequence) else list(items)
+
+
+def _sequence_to_numpy_array(items: Sequence[Any], np_type) -> np.ndarray:
+    """Converts a Python sequence into a NumPy array in a single step, letting
+    NumPy infer the data type from the items themselves.
+
+    Empty sequences are converted into an empty array of the given NumPy type
+    because NumPy would infer a floating-point type for them otherwise.
+    """
+    if len(items) == 0:
+        return np.zeros(0, dtype=np_type)
+    else:
+        return np.asarray(items)
+
+
+def _is_valid_index_array(arr: np.ndarray) -> bool:
+    """Returns whether the given NumPy array contains non-negative integers
+    only, i.e. whether it can be used as an array of vertex or edge indices.
+    """
+    if arr.size == 0 or arr.dtype.kind == "b":
+        return True
+    elif arr.dtype.kind in "iu":
+        return bool(arr.min() >= 0)
+    else:
+        return False
+
+
+def _validate_index_array(
+    arr: np.ndarray, items: Sequence[Any], converter: Callable[[Any], Any]
+) -> None:
+    """Validates a NumPy array that was constructed from the given sequence of
+    vertex or edge indices.
+
+    When the array is not valid, the original items are fed through the given
+    scalar converter function one by one so we raise exactly the same error for
+    the first invalid item as the scalar conversion would.
+
+    Raises:
+        ValueError: if the array contains an invalid index
+    """
+    if arr.ndim == 1 and _is_valid_index_array(arr):
+        return
+
+    for item in items:
+        converter(item)
+
+    raise ValueError("items cannot be converted to igraph vertex or edge indices")
+
+
 def _force_into_1d_numpy_array(arr: np.ndarray, np_type, flatten: bool) -> np.ndarray:
     """Ensures that the given NumPy array is one-dimensional and matches the
     given NumPy type, avoiding copies during the conversion if possible.
@@ -574,7 +860,7 @@ def _force_into_2d_numpy_array(arr: np.ndarray, np_type) -> np.ndarray:
     """
     if len(arr.shape) != 2:
         raise TypeError("NumPy array must be two-dimensional")
-    return arr.astype(np_type, order="C", casting="safe", copy=False)
+    return arr.astype(np_type, order="F", casting="safe", copy=False)
 
 
 def numpy_array_to_igraph_matrix_t(arr: np.ndarray) -> _Matrix:
@@ -589,6 +875,24 @@ def numpy_array_to_igraph_matrix_t(arr: np.ndarray) -> _Matrix:
     )
 
 
+def numpy_array_to_igraph_matrix_t_view(arr: np.ndarray) -> _Matrix:
+    """Provides a view into an existing two-dimensional NumPy array with an
+    igraph matrix view if the data type and the layout of the NumPy array is
+    suitable, i.e. it is a Fortran-contiguous array of igraph reals. If the
+    NumPy array is not suitable, it will be copied into the appropriate layout
+    and data type first and then a view will be provided into the copy.
+    """
+    arr = _force_into_2d_numpy_array(arr, np_type_of_igraph_real_t)
+    arr_ptr = arr.ctypes.data_as(POINTER(igraph_real_t))
+
+    result = _Matrix(igraph_matrix_view(arr_ptr, arr.shape[0], arr.shape[1]))
+
+    # Destructor must not be called so we need to call .release()
+    result.release()
+
+    return _attach_view_source(result, arr)
+
+
 def numpy_array_to_igraph_matrix_int_t(arr: np.ndarray) -> _MatrixInt:
     """Converts a two-dimensional NumPy array to an igraph matrix of integers."""
     arr = _force_into_2d_numpy_array(arr, np_type_of_igraph_int_t)
@@ -601,6 +905,25 @@ def numpy_array_to_igraph_matrix_int_t(arr: np.ndarray) -> _MatrixInt:
     )
 
 
+def numpy_array_to_igraph_matrix_int_t_view(arr: np.ndarray) -> _MatrixInt:
+    """Provides a view into an existing two-dimensional NumPy array with an
+    igraph integer matrix view if the data type and the layout of the NumPy
+    array is suitable, i.e. it is a Fortran-contiguous array of igraph
+    integers. If the NumPy array is not suitable, it will be copied into the
+    appropriate layout and data type first and then a view will be provided
+    into the copy.
+    """
+    arr = _force_into_2d_numpy_array(arr, np_type_of_igraph_int_t)
+    arr_ptr = arr.ctypes.data_as(POINTER(igraph_int_t))
+
+    result = _MatrixInt(igraph_matrix_int_view(arr_ptr, arr.shape[0], arr.shape[1]))
+
+    # Destructor must not be called so we need to call .release()
+    result.release()
+
+    return _attach_view_source(result, arr)
+
+
 def numpy_array_to_igraph_vector_bool_t(
     arr: np.ndarray, flatten: bool = False
 ) -> _VectorBool:
@@ -630,7 +953,7 @@ def numpy_array_to_igraph_vector_bool_t_view(
     # Destructor must not be called so we never mark result as initialized;
     result.release()
 
-    return result
+    return _attach_view_source(result, arr)
 
 
 def numpy_array_to_igraph_vector_int_t(
@@ -662,7 +985,7 @@ def numpy_array_to_igraph_vector_int_t_view(
     # Destructor must not be called so we need to call .release()
     result.release()
 
-    return result
+    return _attach_view_source(result, arr)
 
 
 def numpy_array_to_igraph_vector_t(arr: np.ndarray, flatten: bool = False) -> _Vector:
@@ -692,7 +1015,48 @@ def numpy_array_to_igraph_vector_t_view(
     # Destructor must not be called so we need to call .release()
     result.release()
 
-    return result
+    return _attach_view_source(result, arr)
+
+
+def sparse_matrix_to_igraph_sparsemat_t_view(matrix: SparseMatrix) -> _SparseMat:
+    """Provides a view into a SciPy sparse matrix or array with an igraph
+    sparse matrix in column-compressed form.
+
+    The index and data arrays of the SciPy object are used directly if it is
+    in CSC format and its arrays are contiguous and have the data types that
+    igraph uses. Otherwise the object is converted to CSC format with the
+    appropriate data types first and the view refers to the converted copy.
+    The view must be treated as read-only by igraph.
+    """
+    if getattr(matrix, "format", None) != "csc":
+        if hasattr(matrix, "tocsc"):
+            matrix = matrix.tocsc()
+        else:
+            from scipy.sparse import csc_array
+
+            matrix = csc_array(matrix)
+
+    nrow, ncol = matrix.shape
+    indptr = np.ascontiguousarray(matrix.indptr, dtype=np_type_of_igraph_int_t)
+    indices = np.ascontiguousarray(matrix.indices, dtype=np_type_of_igraph_int_t)
+    data = np.ascontiguousarray(matrix.data, dtype=np_type_of_igraph_real_t)
+
+    cs = cs_igraph(
+        nzmax=len(data),
+        m=nrow,
+        n=ncol,
+        p=indptr.ctypes.data_as(POINTER(igraph_int_t)),
+        i=indices.ctypes.data_as(POINTER(igraph_int_t)),
+        x=data.ctypes.data_as(POINTER(igraph_real_t)),
+        nz=-1,
+    )
+
+    result = _SparseMat(igraph_sparsemat_t(cs=pointer(cs)))
+
+    # Destructor must not be called so we need to call .release()
+    result.release()
+
+    return _attach_view_source(result, (cs, indptr, indices, data))
 
 
 def vertexlike_to_igraph_int_t(vertex: VertexLike) -> igraph_int_t:
@@ -710,11 +1074,20 @@ def vertex_pairs_to_igraph_vector_int_t(pairs: Iterable[VertexPair]) -> _VectorI
     if isinstance(pairs, np.ndarray):
         return numpy_array_to_igraph_vector_int_t(pairs, flatten=True)
 
-    result: _VectorInt = _VectorInt.create(0)
-    for u, v in pairs:
-        igraph_vector_int_push_back(result, vertexlike_to_igraph_int_t(u))
-        igraph_vector_int_push_back(result, vertexlike_to_igraph_int_t(v))
-    return result
+    items = _ensure_sequence(pairs)
+    arr = _sequence_to_numpy_array(items, np_type_of_igraph_int_t)
+    if arr.size > 0 and (arr.ndim != 2 or arr.shape[1] != 2):
+        raise ValueError("vertex pairs must contain exactly two vertices each")
+
+    if not _is_valid_index_array(arr):
+        # Find the first offending pair and report it the same way as we
+        # would do for a single vertex
+        for u, v in items:
+            vertexlike_to_igraph_int_t(u)
+            vertexlike_to_igraph_int_t(v)
+        raise ValueError("vertex pairs cannot be converted to igraph vertex indices")
+
+    return numpy_array_to_igraph_vector_int_t(arr, flatten=True)
 
 
 def vertex_selector_to_igraph_vs_t(
@@ -725,7 +1098,7 @@ def vertex_selector_to_igraph_vs_t(
     """
     if selector is None:
         return _VertexSelector.create_with(igraph_vs_none)
-    elif selector == "all":
+    elif isinstance(selector, str) and selector == "all":
         return _VertexSelector.create_with(igraph_vs_all)
     elif isinstance(selector, str):
         # TODO(ntamas): implement name lookup?
@@ -803,6 +1176,38 @@ def vertex_weights_to_igraph_vector_t_view(
 ################################################################################
 
 
+def igraph_matrix_int_t_to_numpy_array_in_place(
+    matrix: _MatrixInt, target: Any
+) -> IntArray:
+    """Converts an igraph integer matrix that was passed to igraph as an
+    input-output argument back to a NumPy array, updating the original input in
+    place if possible.
+
+    See `igraph_matrix_t_to_numpy_array_in_place()` for more details.
+    """
+    result = igraph_matrix_int_t_to_numpy_array_transfer(matrix)
+    return _copy_into_numpy_array(result, target)
+
+
+def _copy_into_numpy_array(arr: np.ndarray, target: Any) -> np.ndarray:
+    """Copies the given NumPy array into the target object if the target is a
+    writable NumPy array with the same shape and a compatible data type.
+
+    Returns:
+        the target if the array was copied into it, the array itself otherwise
+    """
+    if (
+        isinstance(target, np.ndarray)
+        and target.shape == arr.shape
+        and target.flags.writeable
+        and np.can_cast(arr.dtype, target.dtype, casting="same_kind")
+    ):
+        np.copyto(target, arr, casting="same_kind")
+        return target
+    else:
+        return arr
+
+
 def igraph_vector_t_to_list(vector: _Vector) -> list[float]:
     n = igraph_vector_size(vector)
     return [float(igraph_vector_get(vector, i)) for i in range(n)]
@@ -818,22 +1223,252 @@ def igraph_vector_int_t_to_list(vector: _VectorInt) -> list[int]:
     return [int(igraph_vector_int_get(vector, i)) for i in range(n)]
 
 
+def igraph_strvector_t_to_list(vector: _StrVector) -> list[str]:
+    """Converts an igraph string vector to a list of Python strings.
+
+    The strings are copied out of the vector and decoded in one pass instead
+    of retrieving them one by one from igraph.
+    """
+    n = igraph_strvector_size(vector)
+    if n == 0:
+        return []
+
+    items = cast(vector.unwrap().stor_begin, POINTER(c_char_p))[:n]
+    if None in items:
+        # igraph represents empty strings with null pointers
+        items = [item or b"" for item in items]
+
+    # C strings cannot contain NUL characters so it is safe to use them as
+    # separators
+    return b"\0".join(items).decode("utf-8", errors="replace").split("\0")
+
+
+def igraph_strvector_t_to_numpy_array(vector: _StrVector) -> np.ndarray:
+    """Converts an igraph string vector to a NumPy array of variable-width
+    strings.
+    """
+    return np.array(igraph_strvector_t_to_list(vector), dtype=StringDType())
+
+
+MIN_TRANSFER_SIZE_IN_BYTES = 65536
+"""Minimum size of the memory area of an igraph vector or matrix, in bytes, for
+the ``*_to_numpy_array_transfer()`` conversion functions to take over the
+memory area instead of copying it.
+"""
+
+
+class _IgraphMemoryOwner:
+    """Object that takes over the ownership of a memory area allocated by
+    igraph's C core and exposes it to NumPy via the array interface protocol.
+
+    NumPy arrays created from this object keep a reference to it in their
+    ``base`` attribute. The memory area is freed with ``igraph_free()`` when
+    the last array referring to it is garbage-collected.
+    """
+
+    _address: int
+    """The address of the memory area."""
+
+    __array_interface__: dict[str, Any]
+    """The NumPy array interface description of the memory area."""
+
+    def __init__(
+        self, address: int, shape: tuple[int, ...], np_type, order: str = "C"
+    ):
+        """Constructor.
+
+        Args:
+            address: the address of the memory area
+            shape: the shape of the array stored in the memory area
+            np_type: the NumPy type of the items in the memory area
+            order: the memory layout of the array; ``"C"`` for row-major and
+                ``"F"`` for column-major order
+        """
+        dtype = np.dtype(np_type)
+        strides: tuple[int, ...] | None = None
+        if order == "F" and len(shape) > 1:
+            strides = tuple(
+                dtype.itemsize * int(np.prod(shape[:i])) for i in range(len(shape))
+            )
+
+        self._address = address
+        self.__array_interface__ = {
+            "data": (address, False),
+            "shape": shape,
+            "strides": strides,
+            "typestr": dtype.str,
+            "version": 3,
+        }
+
+    def __del__(self):
+        igraph_free(self._address)
+
+
+def _transfer_storage_to_numpy_array(
+    storage, shape: tuple[int, ...], np_type, order: str = "C"
+) -> np.ndarray:
+    """Creates a NumPy array that takes over the ownership of the memory area
+    of the given low-level igraph vector struct.
+
+    The caller is responsible for ensuring that the vector struct does not
+    refer to the memory area any more after this function returns.
+    """
+    address = cast(storage.stor_begin, c_void_p).value
+    if address is None:
+        raise ValueError("vector or matrix has no memory area to take over")
+    return np.asarray(_IgraphMemoryOwner(address, shape, np_type, order))
+
+
+def _should_transfer(boxed: Any, nbytes: int) -> bool:
+    """Returns whether the memory area of the given boxed igraph vector or
+    matrix should be taken over by NumPy instead of being copied.
+
+    Transfers are allowed only if the boxed object owns its memory area (i.e.
+    it is not a view) and the memory area is large enough so the overhead of
+    the transfer is smaller than the cost of a copy.
+    """
+    return boxed.initialized and nbytes >= MIN_TRANSFER_SIZE_IN_BYTES
+
+
+def igraph_graph_list_t_to_graph_list(graphs: _GraphList) -> GraphList:
+    """Converts an igraph graph list to a lazy sequence of graphs that takes
+    over the ownership of the list.
+    """
+    from igraph_ctypes.graph_list import GraphList
+
+    return GraphList(graphs)
+
+
 def igraph_matrix_t_to_numpy_array(matrix: _Matrix) -> RealArray:
     shape = igraph_matrix_nrow(matrix), igraph_matrix_ncol(matrix)
-    result = np.zeros(shape, dtype=np_type_of_igraph_real_t)
+    result = np.zeros(shape, dtype=np_type_of_igraph_real_t, order="F")
     if result.size > 0:
         memmove(result.ctypes.data, matrix.unwrap().data.stor_begin, result.nbytes)
     return result
 
 
+def igraph_matrix_t_to_numpy_array_transfer(matrix: _Matrix) -> RealArray:
+    """Converts an igraph matrix to a NumPy array, taking over the ownership
+    of the memory area of the matrix instead of copying it when the matrix is
+    large enough. The matrix is re-initialized to an empty matrix in this case.
+    """
+    shape = igraph_matrix_nrow(matrix), igraph_matrix_ncol(matrix)
+    nbytes = shape[0] * shape[1] * np.dtype(np_type_of_igraph_real_t).itemsize
+    if not _should_transfer(matrix, nbytes):
+        return igraph_matrix_t_to_numpy_array(matrix)
+
+    storage = matrix.unwrap().data
+    igraph_vector_resize_min(storage)
+    result = _transfer_storage_to_numpy_array(
+        storage, shape, np_type_of_igraph_real_t, order="F"
+    )
+    igraph_matrix_init(matrix, 0, 0)
+    return result
+
+
+def igraph_matrix_t_to_numpy_array_in_place(
+    matrix: _Matrix, target: Any
+) -> RealArray:
+    """Converts an igraph matrix that was passed to igraph as an input-output
+    argument back to a NumPy array, updating the original input in place if
+    possible.
+
+    The original input is updated if it is a writable NumPy array with the
+    same shape as the matrix and a data type that igraph reals can be cast
+    into. The original input is returned in this case; otherwise a new NumPy
+    array is returned.
+    """
+    result = igraph_matrix_t_to_numpy_array_transfer(matrix)
+    return _copy_into_numpy_array(result, target)
+
+
 def igraph_matrix_int_t_to_numpy_array(matrix: _MatrixInt) -> IntArray:
     shape = igraph_matrix_int_nrow(matrix), igraph_matrix_int_ncol(matrix)
-    result = np.zeros(shape, dtype=np_type_of_igraph_int_t)
+    result = np.zeros(shape, dtype=np_type_of_igraph_int_t, order="F")
     if result.size > 0:
         memmove(result.ctypes.data, matrix.unwrap().data.stor_begin, result.nbytes)
     return result
 
 
+def igraph_matrix_int_t_to_numpy_array_transfer(matrix: _MatrixInt) -> IntArray:
+    """Converts an igraph integer matrix to a NumPy array, taking over the
+    ownership of the memory area of the matrix instead of copying it when the
+    matrix is large enough. The matrix is re-initialized to an empty matrix in
+    this case.
+    """
+    shape = igraph_matrix_int_nrow(matrix), igraph_matrix_int_ncol(matrix)
+    nbytes = shape[0] * shape[1] * np.dtype(np_type_of_igraph_int_t).itemsize
+    if not _should_transfer(matrix, nbytes):
+        return igraph_matrix_int_t_to_numpy_array(matrix)
+
+    storage = matrix.unwrap().data
+    igraph_vector_int_resize_min(storage)
+    result = _transfer_storage_to_numpy_array(
+        storage, shape, np_type_of_igraph_int_t, order="F"
+    )
+    igraph_matrix_int_init(matrix, 0, 0)
+    return result
+
+
+def igraph_sparsemat_t_to_scipy_sparse_transfer(matrix: _SparseMat) -> SparseMatrix:
+    """Converts an igraph sparse matrix to a SciPy sparse array, taking over
+    the ownership of the index and data arrays of the matrix instead of
+    copying them when they are large enough.
+
+    Matrices in column-compressed form are converted to CSC arrays and
+    matrices in triplet form are converted to COO arrays.
+    """
+    from scipy.sparse import coo_array, csc_array
+
+    cs = matrix.unwrap().cs.contents
+    shape = cs.m, cs.n
+    is_triplet = cs.nz >= 0
+    nnz = cs.nz if is_triplet else cs.p[cs.n]
+
+    nbytes = cs.nzmax * (
+        2 * np.dtype(np_type_of_igraph_int_t).itemsize
+        + np.dtype(np_type_of_igraph_real_t).itemsize
+    )
+    transfer = _should_transfer(matrix, nbytes)
+
+    p = _take_sparsemat_storage(
+        cs, "p", cs.nzmax if is_triplet else cs.n + 1, np_type_of_igraph_int_t, transfer
+    )
+    i = _take_sparsemat_storage(cs, "i", cs.nzmax, np_type_of_igraph_int_t, transfer)
+    x = _take_sparsemat_storage(cs, "x", cs.nzmax, np_type_of_igraph_real_t, transfer)
+
+    if is_triplet:
+        return coo_array((x[:nnz], (i[:nnz], p[:nnz])), shape=shape, copy=False)
+    else:
+        return csc_array((x[:nnz], i[:nnz], p), shape=shape, copy=False)
+
+
+def _take_sparsemat_storage(
+    cs: cs_igraph, field: str, size: int, np_type, transfer: bool
+) -> np.ndarray:
+    """Returns the contents of one of the arrays of a CXSparse matrix struct as
+    a NumPy array.
+
+    When ``transfer`` is ``True``, the NumPy array takes over the ownership of
+    the memory area and the pointer in the struct is cleared so the memory
+    area is not freed when the sparse matrix is destroyed.
+    """
+    address = cast(getattr(cs, field), c_void_p).value
+    if address is None:
+        if size > 0:
+            raise ValueError(f"sparse matrix has no {field!r} array")
+        return np.zeros(0, dtype=np_type)
+
+    if not transfer:
+        result = np.zeros(size, dtype=np_type)
+        if size > 0:
+            memmove(result.ctypes.data, address, result.nbytes)
+        return result
+
+    setattr(cs, field, None)
+    return np.asarray(_IgraphMemoryOwner(address, (size,), np_type))
+
+
 def igraph_vector_t_to_numpy_array(vector: _Vector) -> RealArray:
     n = igraph_vector_size(vector)
     result = np.zeros(n, dtype=np_type_of_igraph_real_t)
@@ -842,6 +1477,23 @@ def igraph_vector_t_to_numpy_array(vector: _Vector) -> RealArray:
     return result
 
 
+def igraph_vector_t_to_numpy_array_transfer(vector: _Vector) -> RealArray:
+    """Converts an igraph vector to a NumPy array, taking over the ownership
+    of the memory area of the vector instead of copying it when the vector is
+    large enough. The vector is re-initialized to an empty vector in this case.
+    """
+    n = igraph_vector_size(vector)
+    if not _should_transfer(vector, n * np.dtype(np_type_of_igraph_real_t).itemsize):
+        return igraph_vector_t_to_numpy_array(vector)
+
+    igraph_vector_resize_min(vector)
+    result = _transfer_storage_to_numpy_array(
+        vector.unwrap(), (n,), np_type_of_igraph_real_t
+    )
+    igraph_vector_init(vector, 0)
+    return result
+
+
 def igraph_vector_t_to_numpy_array_view(vector: _Vector) -> RealArray:
     n = igraph_vector_size(vector)
     addr = addressof(igraph_vector_get_ptr(vector, 0).contents)
@@ -860,6 +1512,24 @@ def igraph_vector_bool_t_to_numpy_array(vector: _VectorBool) -> BoolArray:
     return result
 
 
+def igraph_vector_bool_t_to_numpy_array_transfer(vector: _VectorBool) -> BoolArray:
+    """Converts an igraph Boolean vector to a NumPy array, taking over the
+    ownership of the memory area of the vector instead of copying it when the
+    vector is large enough. The vector is re-initialized to an empty vector in
+    this case.
+    """
+    n = igraph_vector_bool_size(vector)
+    if not _should_transfer(vector, n * np.dtype(np_type_of_igraph_bool_t).itemsize):
+        return igraph_vector_bool_t_to_numpy_array(vector)
+
+    igraph_vector_bool_resize_min(vector)
+    result = _transfer_storage_to_numpy_array(
+        vector.unwrap(), (n,), np_type_of_igraph_bool_t
+    )
+    igraph_vector_bool_init(vector, 0)
+    return result
+
+
 def igraph_vector_bool_t_to_numpy_array_view(vector: _VectorBool) -> BoolArray:
     n = igraph_vector_bool_size(vector)
     addr = addressof(igraph_vector_bool_get_ptr(vector, 0).contents)
@@ -876,6 +1546,24 @@ def igraph_vector_int_t_to_numpy_array(vector: _VectorInt) -> IntArray:
     return result
 
 
+def igraph_vector_int_t_to_numpy_array_transfer(vector: _VectorInt) -> IntArray:
+    """Converts an igraph integer vector to a NumPy array, taking over the
+    ownership of the memory area of the vector instead of copying it when the
+    vector is large enough. The vector is re-initialized to an empty vector in
+    this case.
+    """
+    n = igraph_vector_int_size(vector)
+    if not _should_transfer(vector, n * np.dtype(np_type_of_igraph_int_t).itemsize):
+        return igraph_vector_int_t_to_numpy_array(vector)
+
+    igraph_vector_int_resize_min(vector)
+    result = _transfer_storage_to_numpy_array(
+        vector.unwrap(), (n,), np_type_of_igraph_int_t
+    )
+    igraph_vector_int_init(vector, 0)
+    return result
+
+
 def igraph_vector_int_t_to_numpy_array_view(vector: _VectorInt) -> IntArray:
     n = igraph_vector_int_size(vector)
     addr = addressof(igraph_vector_int_get_ptr(vector, 0).contents)
@@ -884,6 +1572,20 @@ def igraph_vector_int_t_to_numpy_array_view(vector: _VectorInt) -> IntArray:
     return np.frombuffer(buf, dtype=np_type_of_igraph_int_t)
 
 
+def igraph_vector_list_t_to_flat_numpy_arrays(
+    vector_list: _VectorList,
+) -> FlatRealArrayList:
+    """Converts an igraph vector list into a flat representation, consisting
+    of a NumPy array with the concatenated items of all the vectors and another
+    NumPy array holding the offsets where the vectors start.
+
+    See `igraph_vector_int_list_t_to_flat_numpy_arrays()` for more details.
+    """
+    return _vector_list_to_flat_numpy_arrays(
+        vector_list, igraph_vector_t, np_type_of_igraph_real_t
+    )
+
+
 def igraph_vector_list_t_to_list_of_numpy_array(
     vector_list: _VectorList,
 ) -> list[RealArray]:
@@ -920,6 +1622,82 @@ def igraph_vector_list_t_to_list_of_numpy_array_view(
     return result
 
 
+def _vector_list_to_flat_numpy_arrays(
+    vector_list, vector_type, np_type
+) -> tuple[np.ndarray, IntArray]:
+    """Converts an igraph vector list into a single NumPy array holding the
+    concatenated items of all the vectors in the list, and another NumPy array
+    holding the offsets where the individual vectors start.
+
+    The storage pointers of the vectors are read from the vector structs in
+    the storage of the list in one go through a structured NumPy array; only
+    the copying of the items themselves happens on a per-vector basis.
+
+    Args:
+        vector_list: the vector list to convert; either a wrapped vector list
+            or a raw pointer to one, as received in attribute handlers
+        vector_type: the ctypes struct type of the vectors in the list
+        np_type: the NumPy type of the items in the vectors
+    """
+    if hasattr(vector_list, "unwrap"):
+        wrapped = vector_list.unwrap()
+    else:
+        wrapped = vector_list.contents
+    begin = cast(wrapped.stor_begin, c_void_p).value or 0
+    n = ((cast(wrapped.end, c_void_p).value or 0) - begin) // sizeof(vector_type)
+
+    offsets = np.zeros(n + 1, dtype=np_type_of_igraph_int_t)
+    if n == 0:
+        return np.zeros(0, dtype=np_type), offsets
+
+    structs = np.frombuffer(
+        memoryview((c_char * (n * sizeof(vector_type))).from_address(begin)),
+        dtype=np.dtype(
+            {
+                "names": ["stor_begin", "end"],
+                "formats": [np.uintp, np.uintp],
+                "offsets": [vector_type.stor_begin.offset, vector_type.end.offset],
+                "itemsize": sizeof(vector_type),
+            }
+        ),
+    )
+    starts = structs["stor_begin"]
+    nbytes = structs["end"] - starts
+
+    itemsize = np.dtype(np_type).itemsize
+    np.cumsum(nbytes // itemsize, out=offsets[1:])
+
+    values = np.zeros(offsets[-1], dtype=np_type)
+    targets = offsets[:-1] * itemsize + values.ctypes.data
+    nonempty = np.flatnonzero(nbytes)
+    for target, start, length in zip(
+        targets[nonempty].tolist(),
+        starts[nonempty].tolist(),
+        nbytes[nonempty].tolist(),
+        strict=True,
+    ):
+        memmove(target, start, length)
+
+    return values, offsets
+
+
+def igraph_vector_int_list_t_to_flat_numpy_arrays(
+    vector_list: _VectorIntList,
+) -> FlatIntArrayList:
+    """Converts an igraph integer vector list into a flat representation,
+    consisting of a NumPy array with the concatenated items of all the vectors
+    and another NumPy array holding the offsets where the vectors start.
+
+    The offsets array has one more item than the number of vectors in the
+    list; item ``i`` of the list spans the range ``offsets[i]:offsets[i+1]``
+    in the array of values. This representation is much cheaper to construct
+    than a list of NumPy arrays when the list contains many short vectors.
+    """
+    return _vector_list_to_flat_numpy_arrays(
+        vector_list, igraph_vector_int_t, np_type_of_igraph_int_t
+    )
+
+
 def igraph_vector_int_list_t_to_list_of_numpy_array(
     vector_list: _VectorIntList,
 ) -> list[IntArray]:
@@ -27,15 +27,19 @@ def handle_igraph_error_t(code: igraph_error_t) -> None:
     """Handles the given igraph error code, raising exceptions appropriately."""
     if code:
         from .lib import IGRAPH_FINALLY_FREE
-        from .setup import _get_last_error_state
+        from .setup import _get_last_error_state, _take_pending_interruption
 
         IGRAPH_FINALLY_FREE()
 
         error_state = _get_last_error_state()
-        if error_state:
+        if code == ErrorCode.INTERRUPTED:
+            # The interruption may have been propagated via IGRAPH_ERROR(),
+            # which leaves an empty error message behind
+            if error_state:
+                error_state._reset()
+            raise _take_pending_interruption() or KeyboardInterrupt()
+        elif error_state:
             error_state.raise_error()
-        elif code == ErrorCode.INTERRUPTED:
-            raise KeyboardInterrupt
         else:
             raise IgraphError(f"igraph returned error code {code}")
 
@@ -4,27 +4,36 @@ from contextlib import ExitStack
 from ctypes import c_char_p, c_int
 from typing import Any, Iterable, Optional, TYPE_CHECKING
 
+from . import lib as _lib
 from .conversion import *  # noqa
 from .enums import *  # noqa
-from .lib import *  # noqa
+from .setup import ensure_thread_is_set_up
 from .types import (
     AttributeCombinationSpecification,
     BoolArray,
     EdgeLike,
     EdgeSelector,
     FileLike,
+    FlatIntArrayList,
     IntArray,
     MatrixLike,
     MatrixIntLike,
     RealArray,
+    SparseMatrix,
     VertexLike,
     VertexPair,
     VertexSelector,
+    igraph_bool_t,
+    igraph_int_t,
+    igraph_real_t,
 )
 from .wrappers import (
     _Graph,
+    _GraphList,
     _Matrix,
     _MatrixInt,
+    _SparseMat,
+    _StrVector,
     _Vector,
     _VectorBool,
     _VectorInt,
@@ -34,6 +43,7 @@ from .wrappers import (
 
 if TYPE_CHECKING:
     from igraph_ctypes.graph import Graph
+    from igraph_ctypes.graph_list import GraphList
 
 # fmt: off
 # flake8: noqa: E743
@@ -50,13 +60,15 @@ def empty(n: int = 0, directed: bool = False) -> Graph:
     Returns:
         the newly created graph
     """
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_empty(c_graph, c_n, c_directed)
+    _lib.igraph_empty(c_graph, c_n, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -67,34 +79,40 @@ def empty(n: int = 0, directed: bool = False) -> Graph:
 
 def add_edges(graph: Graph, edges: Iterable[VertexPair]) -> None:
     """Type-annotated wrapper for ``igraph_add_edges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_edges = vertex_pairs_to_igraph_vector_int_t(edges)
     c_attr = None
 
     # Call wrapped function
-    igraph_add_edges(c_graph, c_edges, c_attr)
+    _lib.igraph_add_edges(c_graph, c_edges, c_attr)
 
 
 def add_vertices(graph: Graph, nv: int) -> None:
     """Type-annotated wrapper for ``igraph_add_vertices``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_nv = nv
     c_attr = None
 
     # Call wrapped function
-    igraph_add_vertices(c_graph, c_nv, c_attr)
+    _lib.igraph_add_vertices(c_graph, c_nv, c_attr)
 
 
 def copy(from_: Graph) -> Graph:
     """Type-annotated wrapper for ``igraph_copy``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_to = _Graph()
     c_from = from_
 
     # Call wrapped function
-    igraph_copy(c_to, c_from)
+    _lib.igraph_copy(c_to, c_from)
 
     # Prepare output arguments
     to = _create_graph_from_boxed(c_to)
@@ -105,38 +123,44 @@ def copy(from_: Graph) -> Graph:
 
 def delete_edges(graph: Graph, edges: EdgeSelector) -> None:
     """Type-annotated wrapper for ``igraph_delete_edges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_edges = edge_selector_to_igraph_es_t(edges, graph)
 
     # Call wrapped function
-    igraph_delete_edges(c_graph, c_edges.unwrap())
+    _lib.igraph_delete_edges(c_graph, c_edges.unwrap())
 
 
 def delete_vertices(graph: Graph, vertices: VertexSelector) -> None:
     """Type-annotated wrapper for ``igraph_delete_vertices``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_vertices = vertex_selector_to_igraph_vs_t(vertices, graph)
 
     # Call wrapped function
-    igraph_delete_vertices(c_graph, c_vertices.unwrap())
+    _lib.igraph_delete_vertices(c_graph, c_vertices.unwrap())
 
 
 def delete_vertices_map(graph: Graph, vertices: VertexSelector) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_delete_vertices_map``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_vertices = vertex_selector_to_igraph_vs_t(vertices, graph)
     c_idx = _VectorInt.create(0)
     c_invidx = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_delete_vertices_map(c_graph, c_vertices.unwrap(), c_idx, c_invidx)
+    _lib.igraph_delete_vertices_map(c_graph, c_vertices.unwrap(), c_idx, c_invidx)
 
     # Prepare output arguments
-    idx = igraph_vector_int_t_to_numpy_array(c_idx)
-    invidx = igraph_vector_int_t_to_numpy_array(c_invidx)
+    idx = igraph_vector_int_t_to_numpy_array_transfer(c_idx)
+    invidx = igraph_vector_int_t_to_numpy_array_transfer(c_invidx)
 
     # Construct return value
     return idx, invidx
@@ -144,11 +168,13 @@ def delete_vertices_map(graph: Graph, vertices: VertexSelector) -> tuple[IntArra
 
 def vcount(graph: Graph) -> int:
     """Type-annotated wrapper for ``igraph_vcount``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
 
     # Call wrapped function
-    c__result = igraph_vcount(c_graph)
+    c__result = _lib.igraph_vcount(c_graph)
 
     # Construct return value
     return c__result
@@ -156,11 +182,13 @@ def vcount(graph: Graph) -> int:
 
 def ecount(graph: Graph) -> int:
     """Type-annotated wrapper for ``igraph_ecount``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
 
     # Call wrapped function
-    c__result = igraph_ecount(c_graph)
+    c__result = _lib.igraph_ecount(c_graph)
 
     # Construct return value
     return c__result
@@ -168,6 +196,8 @@ def ecount(graph: Graph) -> int:
 
 def neighbors(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.ALL, loops: Loops = Loops.TWICE, multiple: bool = True) -> IntArray:
     """Type-annotated wrapper for ``igraph_neighbors``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_neis = _VectorInt.create(0)
@@ -177,10 +207,10 @@ def neighbors(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.A
     c_multiple = any_to_igraph_bool_t(multiple)
 
     # Call wrapped function
-    igraph_neighbors(c_graph, c_neis, c_vid, c_mode, c_loops, c_multiple)
+    _lib.igraph_neighbors(c_graph, c_neis, c_vid, c_mode, c_loops, c_multiple)
 
     # Prepare output arguments
-    neis = igraph_vector_int_t_to_numpy_array(c_neis)
+    neis = igraph_vector_int_t_to_numpy_array_transfer(c_neis)
 
     # Construct return value
     return neis
@@ -188,11 +218,13 @@ def neighbors(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.A
 
 def is_directed(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_directed``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
 
     # Call wrapped function
-    c__result = igraph_is_directed(c_graph)
+    c__result = _lib.igraph_is_directed(c_graph)
 
     # Construct return value
     return c__result
@@ -200,6 +232,8 @@ def is_directed(graph: Graph) -> bool:
 
 def degree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: Loops = Loops.TWICE) -> IntArray:
     """Type-annotated wrapper for ``igraph_degree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
@@ -208,10 +242,10 @@ def degree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = Neig
     c_loops = c_int(loops)
 
     # Call wrapped function
-    igraph_degree(c_graph, c_res, c_vids.unwrap(), c_mode, c_loops)
+    _lib.igraph_degree(c_graph, c_res, c_vids.unwrap(), c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -219,6 +253,8 @@ def degree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = Neig
 
 def edge(graph: Graph, eid: int) -> tuple[int, int]:
     """Type-annotated wrapper for ``igraph_edge``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_eid = eid
@@ -226,7 +262,7 @@ def edge(graph: Graph, eid: int) -> tuple[int, int]:
     c_to = igraph_int_t()
 
     # Call wrapped function
-    igraph_edge(c_graph, c_eid, c_from, c_to)
+    _lib.igraph_edge(c_graph, c_eid, c_from, c_to)
 
     # Prepare output arguments
     from_ = c_from.value
@@ -238,6 +274,8 @@ def edge(graph: Graph, eid: int) -> tuple[int, int]:
 
 def edges(graph: Graph, eids: EdgeSelector, bycol: bool = False) -> IntArray:
     """Type-annotated wrapper for ``igraph_edges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_eids = edge_selector_to_igraph_es_t(eids, graph)
@@ -245,10 +283,10 @@ def edges(graph: Graph, eids: EdgeSelector, bycol: bool = False) -> IntArray:
     c_bycol = any_to_igraph_bool_t(bycol)
 
     # Call wrapped function
-    igraph_edges(c_graph, c_eids.unwrap(), c_edges, c_bycol)
+    _lib.igraph_edges(c_graph, c_eids.unwrap(), c_edges, c_bycol)
 
     # Prepare output arguments
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return edges
@@ -256,6 +294,8 @@ def edges(graph: Graph, eids: EdgeSelector, bycol: bool = False) -> IntArray:
 
 def get_eid(graph: Graph, from_: VertexLike, to: VertexLike, directed: bool = True, error: bool = True) -> int:
     """Type-annotated wrapper for ``igraph_get_eid``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_eid = igraph_int_t(0)
@@ -265,7 +305,7 @@ def get_eid(graph: Graph, from_: VertexLike, to: VertexLike, directed: bool = Tr
     c_error = any_to_igraph_bool_t(error)
 
     # Call wrapped function
-    igraph_get_eid(c_graph, c_eid, c_from, c_to, c_directed, c_error)
+    _lib.igraph_get_eid(c_graph, c_eid, c_from, c_to, c_directed, c_error)
 
     # Prepare output arguments
     eid = c_eid.value
@@ -276,6 +316,8 @@ def get_eid(graph: Graph, from_: VertexLike, to: VertexLike, directed: bool = Tr
 
 def get_eids(graph: Graph, pairs: Iterable[VertexPair], directed: bool = True, error: bool = True) -> IntArray:
     """Type-annotated wrapper for ``igraph_get_eids``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_eids = _VectorInt.create(0)
@@ -284,10 +326,10 @@ def get_eids(graph: Graph, pairs: Iterable[VertexPair], directed: bool = True, e
     c_error = any_to_igraph_bool_t(error)
 
     # Call wrapped function
-    igraph_get_eids(c_graph, c_eids, c_pairs, c_directed, c_error)
+    _lib.igraph_get_eids(c_graph, c_eids, c_pairs, c_directed, c_error)
 
     # Prepare output arguments
-    eids = igraph_vector_int_t_to_numpy_array(c_eids)
+    eids = igraph_vector_int_t_to_numpy_array_transfer(c_eids)
 
     # Construct return value
     return eids
@@ -295,6 +337,8 @@ def get_eids(graph: Graph, pairs: Iterable[VertexPair], directed: bool = True, e
 
 def get_all_eids_between(graph: Graph, from_: VertexLike, to: VertexLike, directed: bool = True) -> IntArray:
     """Type-annotated wrapper for ``igraph_get_all_eids_between``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_eids = _VectorInt.create(0)
@@ -303,10 +347,10 @@ def get_all_eids_between(graph: Graph, from_: VertexLike, to: VertexLike, direct
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_get_all_eids_between(c_graph, c_eids, c_from, c_to, c_directed)
+    _lib.igraph_get_all_eids_between(c_graph, c_eids, c_from, c_to, c_directed)
 
     # Prepare output arguments
-    eids = igraph_vector_int_t_to_numpy_array(c_eids)
+    eids = igraph_vector_int_t_to_numpy_array_transfer(c_eids)
 
     # Construct return value
     return eids
@@ -314,6 +358,8 @@ def get_all_eids_between(graph: Graph, from_: VertexLike, to: VertexLike, direct
 
 def incident(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.ALL, loops: Loops = Loops.TWICE) -> IntArray:
     """Type-annotated wrapper for ``igraph_incident``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_eids = _VectorInt.create(0)
@@ -322,10 +368,10 @@ def incident(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.AL
     c_loops = c_int(loops)
 
     # Call wrapped function
-    igraph_incident(c_graph, c_eids, c_vid, c_mode, c_loops)
+    _lib.igraph_incident(c_graph, c_eids, c_vid, c_mode, c_loops)
 
     # Prepare output arguments
-    eids = igraph_vector_int_t_to_numpy_array(c_eids)
+    eids = igraph_vector_int_t_to_numpy_array_transfer(c_eids)
 
     # Construct return value
     return eids
@@ -333,13 +379,15 @@ def incident(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.AL
 
 def is_same_graph(graph1: Graph, graph2: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_same_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph1 = graph1
     c_graph2 = graph2
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_same_graph(c_graph1, c_graph2, c_res)
+    _lib.igraph_is_same_graph(c_graph1, c_graph2, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -359,6 +407,8 @@ def create(edges: Iterable[int], n: int = 0, directed: bool = True) -> Graph:
     Returns:
         the newly created graph
     """
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_edges = iterable_to_igraph_vector_int_t_view(edges)
@@ -366,7 +416,7 @@ def create(edges: Iterable[int], n: int = 0, directed: bool = True) -> Graph:
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_create(c_graph, c_edges, c_n, c_directed)
+    _lib.igraph_create(c_graph, c_edges, c_n, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -377,6 +427,8 @@ def create(edges: Iterable[int], n: int = 0, directed: bool = True) -> Graph:
 
 def adjacency(adjmatrix: MatrixLike, mode: AdjacencyMode = AdjacencyMode.DIRECTED, loops: Loops = Loops.ONCE) -> Graph:
     """Type-annotated wrapper for ``igraph_adjacency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_adjmatrix = sequence_to_igraph_matrix_t_view(adjmatrix)
@@ -384,7 +436,27 @@ def adjacency(adjmatrix: MatrixLike, mode: AdjacencyMode = AdjacencyMode.DIRECTE
     c_loops = c_int(loops)
 
     # Call wrapped function
-    igraph_adjacency(c_graph, c_adjmatrix, c_mode, c_loops)
+    _lib.igraph_adjacency(c_graph, c_adjmatrix, c_mode, c_loops)
+
+    # Prepare output arguments
+    graph = _create_graph_from_boxed(c_graph)
+
+    # Construct return value
+    return graph
+
+
+def sparse_adjacency(adjmatrix: SparseMatrix, mode: AdjacencyMode = AdjacencyMode.DIRECTED, loops: Loops = Loops.ONCE) -> Graph:
+    """Type-annotated wrapper for ``igraph_sparse_adjacency``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = _Graph()
+    c_adjmatrix = sparse_matrix_to_igraph_sparsemat_t_view(adjmatrix)
+    c_mode = c_int(mode)
+    c_loops = c_int(loops)
+
+    # Call wrapped function
+    _lib.igraph_sparse_adjacency(c_graph, c_adjmatrix, c_mode, c_loops)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -392,13 +464,33 @@ def adjacency(adjmatrix: MatrixLike, mode: AdjacencyMode = AdjacencyMode.DIRECTE
     # Construct return value
     return graph
 
-# igraph_sparse_adjacency: no Python type known for type: SPARSEMAT
 
-# igraph_sparse_weighted_adjacency: no Python type known for type: SPARSEMAT
+def sparse_weighted_adjacency(adjmatrix: SparseMatrix, mode: AdjacencyMode = AdjacencyMode.DIRECTED, loops: Loops = Loops.ONCE) -> tuple[Graph, RealArray]:
+    """Type-annotated wrapper for ``igraph_sparse_weighted_adjacency``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = _Graph()
+    c_adjmatrix = sparse_matrix_to_igraph_sparsemat_t_view(adjmatrix)
+    c_mode = c_int(mode)
+    c_weights = _Vector.create(0)
+    c_loops = c_int(loops)
+
+    # Call wrapped function
+    _lib.igraph_sparse_weighted_adjacency(c_graph, c_adjmatrix, c_mode, c_weights, c_loops)
+
+    # Prepare output arguments
+    graph = _create_graph_from_boxed(c_graph)
+    weights = igraph_vector_t_to_numpy_array_transfer(c_weights)
+
+    # Construct return value
+    return graph, weights
 
 
 def weighted_adjacency(adjmatrix: MatrixLike, mode: AdjacencyMode = AdjacencyMode.DIRECTED, loops: Loops = Loops.ONCE) -> tuple[Graph, RealArray]:
     """Type-annotated wrapper for ``igraph_weighted_adjacency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_adjmatrix = sequence_to_igraph_matrix_t_view(adjmatrix)
@@ -407,11 +499,11 @@ def weighted_adjacency(adjmatrix: MatrixLike, mode: AdjacencyMode = AdjacencyMod
     c_loops = c_int(loops)
 
     # Call wrapped function
-    igraph_weighted_adjacency(c_graph, c_adjmatrix, c_mode, c_weights, c_loops)
+    _lib.igraph_weighted_adjacency(c_graph, c_adjmatrix, c_mode, c_weights, c_loops)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    weights = igraph_vector_t_to_numpy_array(c_weights)
+    weights = igraph_vector_t_to_numpy_array_transfer(c_weights)
 
     # Construct return value
     return graph, weights
@@ -419,6 +511,8 @@ def weighted_adjacency(adjmatrix: MatrixLike, mode: AdjacencyMode = AdjacencyMod
 
 def star(n: int, mode: StarMode = StarMode.OUT, center: int = 0) -> Graph:
     """Type-annotated wrapper for ``igraph_star``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -426,7 +520,7 @@ def star(n: int, mode: StarMode = StarMode.OUT, center: int = 0) -> Graph:
     c_center = center
 
     # Call wrapped function
-    igraph_star(c_graph, c_n, c_mode, c_center)
+    _lib.igraph_star(c_graph, c_n, c_mode, c_center)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -437,6 +531,8 @@ def star(n: int, mode: StarMode = StarMode.OUT, center: int = 0) -> Graph:
 
 def wheel(n: int, mode: WheelMode = WheelMode.OUT, center: int = 0) -> Graph:
     """Type-annotated wrapper for ``igraph_wheel``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -444,7 +540,7 @@ def wheel(n: int, mode: WheelMode = WheelMode.OUT, center: int = 0) -> Graph:
     c_center = center
 
     # Call wrapped function
-    igraph_wheel(c_graph, c_n, c_mode, c_center)
+    _lib.igraph_wheel(c_graph, c_n, c_mode, c_center)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -455,13 +551,15 @@ def wheel(n: int, mode: WheelMode = WheelMode.OUT, center: int = 0) -> Graph:
 
 def hypercube(n: int, directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_hypercube``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_hypercube(c_graph, c_n, c_directed)
+    _lib.igraph_hypercube(c_graph, c_n, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -472,6 +570,8 @@ def hypercube(n: int, directed: bool = False) -> Graph:
 
 def square_lattice(dimvector: Iterable[int], nei: int = 1, directed: bool = False, mutual: bool = False, periodic: Optional[Iterable[bool]] = None) -> Graph:
     """Type-annotated wrapper for ``igraph_square_lattice``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_dimvector = iterable_to_igraph_vector_int_t_view(dimvector)
@@ -481,7 +581,7 @@ def square_lattice(dimvector: Iterable[int], nei: int = 1, directed: bool = Fals
     c_periodic = iterable_to_igraph_vector_bool_t_view(periodic) if periodic is not None else None
 
     # Call wrapped function
-    igraph_square_lattice(c_graph, c_dimvector, c_nei, c_directed, c_mutual, c_periodic)
+    _lib.igraph_square_lattice(c_graph, c_dimvector, c_nei, c_directed, c_mutual, c_periodic)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -492,6 +592,8 @@ def square_lattice(dimvector: Iterable[int], nei: int = 1, directed: bool = Fals
 
 def triangular_lattice(dimvector: Iterable[int], directed: bool = False, mutual: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_triangular_lattice``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_dimvector = iterable_to_igraph_vector_int_t_view(dimvector)
@@ -499,7 +601,7 @@ def triangular_lattice(dimvector: Iterable[int], directed: bool = False, mutual:
     c_mutual = any_to_igraph_bool_t(mutual)
 
     # Call wrapped function
-    igraph_triangular_lattice(c_graph, c_dimvector, c_directed, c_mutual)
+    _lib.igraph_triangular_lattice(c_graph, c_dimvector, c_directed, c_mutual)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -510,6 +612,8 @@ def triangular_lattice(dimvector: Iterable[int], directed: bool = False, mutual:
 
 def ring(n: int, directed: bool = False, mutual: bool = False, circular: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_ring``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -518,7 +622,7 @@ def ring(n: int, directed: bool = False, mutual: bool = False, circular: bool =
     c_circular = any_to_igraph_bool_t(circular)
 
     # Call wrapped function
-    igraph_ring(c_graph, c_n, c_directed, c_mutual, c_circular)
+    _lib.igraph_ring(c_graph, c_n, c_directed, c_mutual, c_circular)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -529,6 +633,8 @@ def ring(n: int, directed: bool = False, mutual: bool = False, circular: bool =
 
 def path_graph(n: int, directed: bool = False, mutual: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_path_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -536,7 +642,7 @@ def path_graph(n: int, directed: bool = False, mutual: bool = False) -> Graph:
     c_mutual = any_to_igraph_bool_t(mutual)
 
     # Call wrapped function
-    igraph_path_graph(c_graph, c_n, c_directed, c_mutual)
+    _lib.igraph_path_graph(c_graph, c_n, c_directed, c_mutual)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -547,6 +653,8 @@ def path_graph(n: int, directed: bool = False, mutual: bool = False) -> Graph:
 
 def cycle_graph(n: int, directed: bool = False, mutual: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_cycle_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -554,7 +662,7 @@ def cycle_graph(n: int, directed: bool = False, mutual: bool = False) -> Graph:
     c_mutual = any_to_igraph_bool_t(mutual)
 
     # Call wrapped function
-    igraph_cycle_graph(c_graph, c_n, c_directed, c_mutual)
+    _lib.igraph_cycle_graph(c_graph, c_n, c_directed, c_mutual)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -565,6 +673,8 @@ def cycle_graph(n: int, directed: bool = False, mutual: bool = False) -> Graph:
 
 def kary_tree(n: int, children: int = 2, type: TreeMode = TreeMode.OUT) -> Graph:
     """Type-annotated wrapper for ``igraph_kary_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -572,7 +682,7 @@ def kary_tree(n: int, children: int = 2, type: TreeMode = TreeMode.OUT) -> Graph
     c_type = c_int(type)
 
     # Call wrapped function
-    igraph_kary_tree(c_graph, c_n, c_children, c_type)
+    _lib.igraph_kary_tree(c_graph, c_n, c_children, c_type)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -583,13 +693,15 @@ def kary_tree(n: int, children: int = 2, type: TreeMode = TreeMode.OUT) -> Graph
 
 def symmetric_tree(branches: Iterable[int], type: TreeMode = TreeMode.OUT) -> Graph:
     """Type-annotated wrapper for ``igraph_symmetric_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_branches = iterable_to_igraph_vector_int_t_view(branches)
     c_type = c_int(type)
 
     # Call wrapped function
-    igraph_symmetric_tree(c_graph, c_branches, c_type)
+    _lib.igraph_symmetric_tree(c_graph, c_branches, c_type)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -600,6 +712,8 @@ def symmetric_tree(branches: Iterable[int], type: TreeMode = TreeMode.OUT) -> Gr
 
 def regular_tree(h: int, k: int = 3, type: TreeMode = TreeMode.UNDIRECTED) -> Graph:
     """Type-annotated wrapper for ``igraph_regular_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_h = h
@@ -607,7 +721,7 @@ def regular_tree(h: int, k: int = 3, type: TreeMode = TreeMode.UNDIRECTED) -> Gr
     c_type = c_int(type)
 
     # Call wrapped function
-    igraph_regular_tree(c_graph, c_h, c_k, c_type)
+    _lib.igraph_regular_tree(c_graph, c_h, c_k, c_type)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -627,6 +741,8 @@ def full(n: int, directed: bool = False, loops: bool = False) -> Graph:
     Returns:
         the newly created graph
     """
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -634,7 +750,7 @@ def full(n: int, directed: bool = False, loops: bool = False) -> Graph:
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_full(c_graph, c_n, c_directed, c_loops)
+    _lib.igraph_full(c_graph, c_n, c_directed, c_loops)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -645,13 +761,15 @@ def full(n: int, directed: bool = False, loops: bool = False) -> Graph:
 
 def full_citation(n: int, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_full_citation``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_full_citation(c_graph, c_n, c_directed)
+    _lib.igraph_full_citation(c_graph, c_n, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -662,12 +780,14 @@ def full_citation(n: int, directed: bool = True) -> Graph:
 
 def atlas(number: int = 0) -> Graph:
     """Type-annotated wrapper for ``igraph_atlas``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_number = number
 
     # Call wrapped function
-    igraph_atlas(c_graph, c_number)
+    _lib.igraph_atlas(c_graph, c_number)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -678,6 +798,8 @@ def atlas(number: int = 0) -> Graph:
 
 def extended_chordal_ring(nodes: int, W: MatrixIntLike, directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_extended_chordal_ring``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -685,7 +807,7 @@ def extended_chordal_ring(nodes: int, W: MatrixIntLike, directed: bool = False)
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_extended_chordal_ring(c_graph, c_nodes, c_W, c_directed)
+    _lib.igraph_extended_chordal_ring(c_graph, c_nodes, c_W, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -696,17 +818,21 @@ def extended_chordal_ring(nodes: int, W: MatrixIntLike, directed: bool = False)
 
 def connect_neighborhood(graph: Graph, order: int = 2, mode: NeighborMode = NeighborMode.ALL) -> None:
     """Type-annotated wrapper for ``igraph_connect_neighborhood``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_order = order
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_connect_neighborhood(c_graph, c_order, c_mode)
+    _lib.igraph_connect_neighborhood(c_graph, c_order, c_mode)
 
 
 def graph_power(graph: Graph, order: int, directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_graph_power``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
@@ -714,7 +840,7 @@ def graph_power(graph: Graph, order: int, directed: bool = False) -> Graph:
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_graph_power(c_graph, c_res, c_order, c_directed)
+    _lib.igraph_graph_power(c_graph, c_res, c_order, c_directed)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -725,12 +851,14 @@ def graph_power(graph: Graph, order: int, directed: bool = False) -> Graph:
 
 def linegraph(graph: Graph) -> Graph:
     """Type-annotated wrapper for ``igraph_linegraph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_linegraph = _Graph()
 
     # Call wrapped function
-    igraph_linegraph(c_graph, c_linegraph)
+    _lib.igraph_linegraph(c_graph, c_linegraph)
 
     # Prepare output arguments
     linegraph = _create_graph_from_boxed(c_linegraph)
@@ -741,13 +869,15 @@ def linegraph(graph: Graph) -> Graph:
 
 def de_bruijn(m: int, n: int) -> Graph:
     """Type-annotated wrapper for ``igraph_de_bruijn``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_m = m
     c_n = n
 
     # Call wrapped function
-    igraph_de_bruijn(c_graph, c_m, c_n)
+    _lib.igraph_de_bruijn(c_graph, c_m, c_n)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -758,13 +888,15 @@ def de_bruijn(m: int, n: int) -> Graph:
 
 def kautz(m: int, n: int) -> Graph:
     """Type-annotated wrapper for ``igraph_kautz``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_m = m
     c_n = n
 
     # Call wrapped function
-    igraph_kautz(c_graph, c_m, c_n)
+    _lib.igraph_kautz(c_graph, c_m, c_n)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -785,12 +917,14 @@ def famous(name: str) -> Graph:
     Returns:
         the constructed graph
     """
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_name = name.encode("utf-8")
 
     # Call wrapped function
-    igraph_famous(c_graph, c_name)
+    _lib.igraph_famous(c_graph, c_name)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -801,6 +935,8 @@ def famous(name: str) -> Graph:
 
 def lcf(n: int, shifts: Iterable[int], repeats: int = 1) -> Graph:
     """Type-annotated wrapper for ``igraph_lcf``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -808,7 +944,7 @@ def lcf(n: int, shifts: Iterable[int], repeats: int = 1) -> Graph:
     c_repeats = repeats
 
     # Call wrapped function
-    igraph_lcf(c_graph, c_n, c_shifts, c_repeats)
+    _lib.igraph_lcf(c_graph, c_n, c_shifts, c_repeats)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -819,12 +955,14 @@ def lcf(n: int, shifts: Iterable[int], repeats: int = 1) -> Graph:
 
 def mycielski_graph(k: int) -> Graph:
     """Type-annotated wrapper for ``igraph_mycielski_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_k = k
 
     # Call wrapped function
-    igraph_mycielski_graph(c_graph, c_k)
+    _lib.igraph_mycielski_graph(c_graph, c_k)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -837,6 +975,8 @@ def mycielski_graph(k: int) -> Graph:
 
 def full_bipartite(n1: int, n2: int, directed: bool = False, mode: NeighborMode = NeighborMode.ALL) -> tuple[Graph, BoolArray]:
     """Type-annotated wrapper for ``igraph_full_bipartite``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = _VectorBool.create(0)
@@ -846,7 +986,7 @@ def full_bipartite(n1: int, n2: int, directed: bool = False, mode: NeighborMode
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_full_bipartite(c_graph, c_types, c_n1, c_n2, c_directed, c_mode)
+    _lib.igraph_full_bipartite(c_graph, c_types, c_n1, c_n2, c_directed, c_mode)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -858,6 +998,8 @@ def full_bipartite(n1: int, n2: int, directed: bool = False, mode: NeighborMode
 
 def full_multipartite(n: Iterable[int], directed: bool = False, mode: NeighborMode = NeighborMode.ALL) -> tuple[Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_full_multipartite``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = _VectorInt.create(0)
@@ -866,11 +1008,11 @@ def full_multipartite(n: Iterable[int], directed: bool = False, mode: NeighborMo
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_full_multipartite(c_graph, c_types, c_n, c_directed, c_mode)
+    _lib.igraph_full_multipartite(c_graph, c_types, c_n, c_directed, c_mode)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    types = igraph_vector_int_t_to_numpy_array(c_types)
+    types = igraph_vector_int_t_to_numpy_array_transfer(c_types)
 
     # Construct return value
     return graph, types
@@ -882,6 +1024,8 @@ def full_multipartite(n: Iterable[int], directed: bool = False, mode: NeighborMo
 
 def circulant(n: int, shifts: Iterable[int], directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_circulant``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -889,7 +1033,7 @@ def circulant(n: int, shifts: Iterable[int], directed: bool = False) -> Graph:
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_circulant(c_graph, c_n, c_shifts, c_directed)
+    _lib.igraph_circulant(c_graph, c_n, c_shifts, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -900,13 +1044,15 @@ def circulant(n: int, shifts: Iterable[int], directed: bool = False) -> Graph:
 
 def generalized_petersen(n: int, k: int) -> Graph:
     """Type-annotated wrapper for ``igraph_generalized_petersen``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
     c_k = k
 
     # Call wrapped function
-    igraph_generalized_petersen(c_graph, c_n, c_k)
+    _lib.igraph_generalized_petersen(c_graph, c_n, c_k)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -917,6 +1063,8 @@ def generalized_petersen(n: int, k: int) -> Graph:
 
 def turan(n: int, r: int) -> tuple[Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_turan``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = _VectorInt.create(0)
@@ -924,11 +1072,11 @@ def turan(n: int, r: int) -> tuple[Graph, IntArray]:
     c_r = r
 
     # Call wrapped function
-    igraph_turan(c_graph, c_types, c_n, c_r)
+    _lib.igraph_turan(c_graph, c_types, c_n, c_r)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    types = igraph_vector_int_t_to_numpy_array(c_types)
+    types = igraph_vector_int_t_to_numpy_array_transfer(c_types)
 
     # Construct return value
     return graph, types
@@ -936,6 +1084,8 @@ def turan(n: int, r: int) -> tuple[Graph, IntArray]:
 
 def barabasi_game(n: int, power: float = 1.0, m: int = 1, outseq: Optional[Iterable[int]] = None, outpref: bool = False, A: float = 1.0, directed: bool = True, algo: BarabasiAlgorithm = BarabasiAlgorithm.BAG, start_from: Optional[Graph] = None) -> Graph:
     """Type-annotated wrapper for ``igraph_barabasi_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -949,7 +1099,7 @@ def barabasi_game(n: int, power: float = 1.0, m: int = 1, outseq: Optional[Itera
     c_start_from = start_from if start_from is not None else None
 
     # Call wrapped function
-    igraph_barabasi_game(c_graph, c_n, c_power, c_m, c_outseq, c_outpref, c_A, c_directed, c_algo, c_start_from)
+    _lib.igraph_barabasi_game(c_graph, c_n, c_power, c_m, c_outseq, c_outpref, c_A, c_directed, c_algo, c_start_from)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -964,6 +1114,8 @@ def barabasi_game(n: int, power: float = 1.0, m: int = 1, outseq: Optional[Itera
 
 def iea_game(n: int, m: int, directed: bool = False, loops: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_iea_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -972,7 +1124,7 @@ def iea_game(n: int, m: int, directed: bool = False, loops: bool = False) -> Gra
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_iea_game(c_graph, c_n, c_m, c_directed, c_loops)
+    _lib.igraph_iea_game(c_graph, c_n, c_m, c_directed, c_loops)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -983,6 +1135,8 @@ def iea_game(n: int, m: int, directed: bool = False, loops: bool = False) -> Gra
 
 def degree_sequence_game(out_deg: Iterable[int], in_deg: Optional[Iterable[int]] = None, method: DegreeSequenceMode = DegreeSequenceMode.CONFIGURATION) -> Graph:
     """Type-annotated wrapper for ``igraph_degree_sequence_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_out_deg = iterable_to_igraph_vector_int_t_view(out_deg)
@@ -990,7 +1144,7 @@ def degree_sequence_game(out_deg: Iterable[int], in_deg: Optional[Iterable[int]]
     c_method = c_int(method)
 
     # Call wrapped function
-    igraph_degree_sequence_game(c_graph, c_out_deg, c_in_deg, c_method)
+    _lib.igraph_degree_sequence_game(c_graph, c_out_deg, c_in_deg, c_method)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1001,6 +1155,8 @@ def degree_sequence_game(out_deg: Iterable[int], in_deg: Optional[Iterable[int]]
 
 def growing_random_game(n: int, m: int = 1, directed: bool = False, citation: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_growing_random_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -1009,7 +1165,7 @@ def growing_random_game(n: int, m: int = 1, directed: bool = False, citation: bo
     c_citation = any_to_igraph_bool_t(citation)
 
     # Call wrapped function
-    igraph_growing_random_game(c_graph, c_n, c_m, c_directed, c_citation)
+    _lib.igraph_growing_random_game(c_graph, c_n, c_m, c_directed, c_citation)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1020,6 +1176,8 @@ def growing_random_game(n: int, m: int = 1, directed: bool = False, citation: bo
 
 def barabasi_aging_game(nodes: int, m: int = 1, outseq: Optional[Iterable[int]] = None, outpref: bool = False, pa_exp: float = 1.0, aging_exp: float = 0.0, aging_bin: int = 1, zero_deg_appeal: float = 1.0, zero_age_appeal: float = 0.0, deg_coef: float = 1.0, age_coef: float = 1.0, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_barabasi_aging_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1036,7 +1194,7 @@ def barabasi_aging_game(nodes: int, m: int = 1, outseq: Optional[Iterable[int]]
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_barabasi_aging_game(c_graph, c_nodes, c_m, c_outseq, c_outpref, c_pa_exp, c_aging_exp, c_aging_bin, c_zero_deg_appeal, c_zero_age_appeal, c_deg_coef, c_age_coef, c_directed)
+    _lib.igraph_barabasi_aging_game(c_graph, c_nodes, c_m, c_outseq, c_outpref, c_pa_exp, c_aging_exp, c_aging_bin, c_zero_deg_appeal, c_zero_age_appeal, c_deg_coef, c_age_coef, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1047,6 +1205,8 @@ def barabasi_aging_game(nodes: int, m: int = 1, outseq: Optional[Iterable[int]]
 
 def recent_degree_game(n: int, power: float = 1.0, window: int = 1, m: int = 1, outseq: Optional[Iterable[int]] = None, outpref: bool = False, zero_appeal: float = 1.0, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_recent_degree_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -1059,7 +1219,7 @@ def recent_degree_game(n: int, power: float = 1.0, window: int = 1, m: int = 1,
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_recent_degree_game(c_graph, c_n, c_power, c_window, c_m, c_outseq, c_outpref, c_zero_appeal, c_directed)
+    _lib.igraph_recent_degree_game(c_graph, c_n, c_power, c_window, c_m, c_outseq, c_outpref, c_zero_appeal, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1070,6 +1230,8 @@ def recent_degree_game(n: int, power: float = 1.0, window: int = 1, m: int = 1,
 
 def recent_degree_aging_game(nodes: int, m: int = 1, outseq: Optional[Iterable[int]] = None, outpref: bool = False, pa_exp: float = 1.0, aging_exp: float = 0.0, aging_bin: int = 1, window: int = 1, zero_appeal: float = 1.0, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_recent_degree_aging_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1084,7 +1246,7 @@ def recent_degree_aging_game(nodes: int, m: int = 1, outseq: Optional[Iterable[i
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_recent_degree_aging_game(c_graph, c_nodes, c_m, c_outseq, c_outpref, c_pa_exp, c_aging_exp, c_aging_bin, c_window, c_zero_appeal, c_directed)
+    _lib.igraph_recent_degree_aging_game(c_graph, c_nodes, c_m, c_outseq, c_outpref, c_pa_exp, c_aging_exp, c_aging_bin, c_window, c_zero_appeal, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1095,6 +1257,8 @@ def recent_degree_aging_game(nodes: int, m: int = 1, outseq: Optional[Iterable[i
 
 def callaway_traits_game(nodes: int, types: int, type_dist: Iterable[float], pref_matrix: MatrixLike, edges_per_step: int = 1, directed: bool = False) -> tuple[Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_callaway_traits_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1106,11 +1270,11 @@ def callaway_traits_game(nodes: int, types: int, type_dist: Iterable[float], pre
     c_node_type_vec = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_callaway_traits_game(c_graph, c_nodes, c_types, c_edges_per_step, c_type_dist, c_pref_matrix, c_directed, c_node_type_vec)
+    _lib.igraph_callaway_traits_game(c_graph, c_nodes, c_types, c_edges_per_step, c_type_dist, c_pref_matrix, c_directed, c_node_type_vec)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    node_type_vec = igraph_vector_int_t_to_numpy_array(c_node_type_vec)
+    node_type_vec = igraph_vector_int_t_to_numpy_array_transfer(c_node_type_vec)
 
     # Construct return value
     return graph, node_type_vec
@@ -1118,6 +1282,8 @@ def callaway_traits_game(nodes: int, types: int, type_dist: Iterable[float], pre
 
 def establishment_game(nodes: int, types: int, type_dist: Iterable[float], pref_matrix: MatrixLike, k: int = 1, directed: bool = True) -> tuple[Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_establishment_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1129,11 +1295,11 @@ def establishment_game(nodes: int, types: int, type_dist: Iterable[float], pref_
     c_node_type_vec = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_establishment_game(c_graph, c_nodes, c_types, c_k, c_type_dist, c_pref_matrix, c_directed, c_node_type_vec)
+    _lib.igraph_establishment_game(c_graph, c_nodes, c_types, c_k, c_type_dist, c_pref_matrix, c_directed, c_node_type_vec)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    node_type_vec = igraph_vector_int_t_to_numpy_array(c_node_type_vec)
+    node_type_vec = igraph_vector_int_t_to_numpy_array_transfer(c_node_type_vec)
 
     # Construct return value
     return graph, node_type_vec
@@ -1141,6 +1307,8 @@ def establishment_game(nodes: int, types: int, type_dist: Iterable[float], pref_
 
 def grg_game(nodes: int, radius: float, torus: bool = False) -> tuple[Graph, RealArray, RealArray]:
     """Type-annotated wrapper for ``igraph_grg_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1150,12 +1318,12 @@ def grg_game(nodes: int, radius: float, torus: bool = False) -> tuple[Graph, Rea
     c_y = _Vector.create(0)
 
     # Call wrapped function
-    igraph_grg_game(c_graph, c_nodes, c_radius, c_torus, c_x, c_y)
+    _lib.igraph_grg_game(c_graph, c_nodes, c_radius, c_torus, c_x, c_y)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    x = igraph_vector_t_to_numpy_array(c_x)
-    y = igraph_vector_t_to_numpy_array(c_y)
+    x = igraph_vector_t_to_numpy_array_transfer(c_x)
+    y = igraph_vector_t_to_numpy_array_transfer(c_y)
 
     # Construct return value
     return graph, x, y
@@ -1163,6 +1331,8 @@ def grg_game(nodes: int, radius: float, torus: bool = False) -> tuple[Graph, Rea
 
 def preference_game(nodes: int, types: int, type_dist: Iterable[float], pref_matrix: MatrixLike, fixed_sizes: bool = False, directed: bool = False, loops: bool = False) -> tuple[Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_preference_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1175,11 +1345,11 @@ def preference_game(nodes: int, types: int, type_dist: Iterable[float], pref_mat
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_preference_game(c_graph, c_nodes, c_types, c_type_dist, c_fixed_sizes, c_pref_matrix, c_node_type_vec, c_directed, c_loops)
+    _lib.igraph_preference_game(c_graph, c_nodes, c_types, c_type_dist, c_fixed_sizes, c_pref_matrix, c_node_type_vec, c_directed, c_loops)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    node_type_vec = igraph_vector_int_t_to_numpy_array(c_node_type_vec)
+    node_type_vec = igraph_vector_int_t_to_numpy_array_transfer(c_node_type_vec)
 
     # Construct return value
     return graph, node_type_vec
@@ -1187,6 +1357,8 @@ def preference_game(nodes: int, types: int, type_dist: Iterable[float], pref_mat
 
 def asymmetric_preference_game(nodes: int, out_types: int, in_types: int, type_dist_matrix: MatrixLike, pref_matrix: MatrixLike, loops: bool = False) -> tuple[Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_asymmetric_preference_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1199,12 +1371,12 @@ def asymmetric_preference_game(nodes: int, out_types: int, in_types: int, type_d
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_asymmetric_preference_game(c_graph, c_nodes, c_out_types, c_in_types, c_type_dist_matrix, c_pref_matrix, c_node_type_out_vec, c_node_type_in_vec, c_loops)
+    _lib.igraph_asymmetric_preference_game(c_graph, c_nodes, c_out_types, c_in_types, c_type_dist_matrix, c_pref_matrix, c_node_type_out_vec, c_node_type_in_vec, c_loops)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    node_type_out_vec = igraph_vector_int_t_to_numpy_array(c_node_type_out_vec)
-    node_type_in_vec = igraph_vector_int_t_to_numpy_array(c_node_type_in_vec)
+    node_type_out_vec = igraph_vector_int_t_to_numpy_array_transfer(c_node_type_out_vec)
+    node_type_in_vec = igraph_vector_int_t_to_numpy_array_transfer(c_node_type_in_vec)
 
     # Construct return value
     return graph, node_type_out_vec, node_type_in_vec
@@ -1214,20 +1386,24 @@ def asymmetric_preference_game(nodes: int, out_types: int, in_types: int, type_d
 
 def rewire_directed_edges(graph: Graph, prob: float, loops: bool = False, mode: NeighborMode = NeighborMode.OUT) -> None:
     """Type-annotated wrapper for ``igraph_rewire_directed_edges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_prob = prob
     c_loops = any_to_igraph_bool_t(loops)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_rewire_directed_edges(c_graph, c_prob, c_loops, c_mode)
+    _lib.igraph_rewire_directed_edges(c_graph, c_prob, c_loops, c_mode)
 
 # igraph_watts_strogatz_game: no Python type known for type: EDGE_TYPE_SW
 
 
 def lastcit_game(nodes: int, preference: Iterable[float], edges_per_node: int = 1, agebins: int = 1, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_lastcit_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1237,7 +1413,7 @@ def lastcit_game(nodes: int, preference: Iterable[float], edges_per_node: int =
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_lastcit_game(c_graph, c_nodes, c_edges_per_node, c_agebins, c_preference, c_directed)
+    _lib.igraph_lastcit_game(c_graph, c_nodes, c_edges_per_node, c_agebins, c_preference, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1248,6 +1424,8 @@ def lastcit_game(nodes: int, preference: Iterable[float], edges_per_node: int =
 
 def cited_type_game(nodes: int, types: Iterable[int], pref: Iterable[float], edges_per_step: int = 1, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_cited_type_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1257,7 +1435,7 @@ def cited_type_game(nodes: int, types: Iterable[int], pref: Iterable[float], edg
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_cited_type_game(c_graph, c_nodes, c_types, c_pref, c_edges_per_step, c_directed)
+    _lib.igraph_cited_type_game(c_graph, c_nodes, c_types, c_pref, c_edges_per_step, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1268,6 +1446,8 @@ def cited_type_game(nodes: int, types: Iterable[int], pref: Iterable[float], edg
 
 def citing_cited_type_game(nodes: int, types: Iterable[int], pref: MatrixLike, edges_per_step: int = 1, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_citing_cited_type_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1277,7 +1457,7 @@ def citing_cited_type_game(nodes: int, types: Iterable[int], pref: MatrixLike, e
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_citing_cited_type_game(c_graph, c_nodes, c_types, c_pref, c_edges_per_step, c_directed)
+    _lib.igraph_citing_cited_type_game(c_graph, c_nodes, c_types, c_pref, c_edges_per_step, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1288,6 +1468,8 @@ def citing_cited_type_game(nodes: int, types: Iterable[int], pref: MatrixLike, e
 
 def forest_fire_game(nodes: int, fw_prob: float, bw_factor: float = 1, ambs: int = 1, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_forest_fire_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_nodes = nodes
@@ -1297,7 +1479,7 @@ def forest_fire_game(nodes: int, fw_prob: float, bw_factor: float = 1, ambs: int
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_forest_fire_game(c_graph, c_nodes, c_fw_prob, c_bw_factor, c_ambs, c_directed)
+    _lib.igraph_forest_fire_game(c_graph, c_nodes, c_fw_prob, c_bw_factor, c_ambs, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1308,6 +1490,8 @@ def forest_fire_game(nodes: int, fw_prob: float, bw_factor: float = 1, ambs: int
 
 def simple_interconnected_islands_game(islands_n: int, islands_size: int, islands_pin: float, n_inter: int) -> Graph:
     """Type-annotated wrapper for ``igraph_simple_interconnected_islands_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_islands_n = islands_n
@@ -1316,7 +1500,7 @@ def simple_interconnected_islands_game(islands_n: int, islands_size: int, island
     c_n_inter = n_inter
 
     # Call wrapped function
-    igraph_simple_interconnected_islands_game(c_graph, c_islands_n, c_islands_size, c_islands_pin, c_n_inter)
+    _lib.igraph_simple_interconnected_islands_game(c_graph, c_islands_n, c_islands_size, c_islands_pin, c_n_inter)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1333,6 +1517,8 @@ def simple_interconnected_islands_game(islands_n: int, islands_size: int, island
 
 def k_regular_game(no_of_nodes: int, k: int, directed: bool = False, multiple: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_k_regular_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_no_of_nodes = no_of_nodes
@@ -1341,7 +1527,7 @@ def k_regular_game(no_of_nodes: int, k: int, directed: bool = False, multiple: b
     c_multiple = any_to_igraph_bool_t(multiple)
 
     # Call wrapped function
-    igraph_k_regular_game(c_graph, c_no_of_nodes, c_k, c_directed, c_multiple)
+    _lib.igraph_k_regular_game(c_graph, c_no_of_nodes, c_k, c_directed, c_multiple)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1354,6 +1540,8 @@ def k_regular_game(no_of_nodes: int, k: int, directed: bool = False, multiple: b
 
 def hsbm_game(n: int, m: int, rho: Iterable[float], C: MatrixLike, p: float) -> Graph:
     """Type-annotated wrapper for ``igraph_hsbm_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -1363,7 +1551,7 @@ def hsbm_game(n: int, m: int, rho: Iterable[float], C: MatrixLike, p: float) ->
     c_p = p
 
     # Call wrapped function
-    igraph_hsbm_game(c_graph, c_n, c_m, c_rho, c_C, c_p)
+    _lib.igraph_hsbm_game(c_graph, c_n, c_m, c_rho, c_C, c_p)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1376,13 +1564,15 @@ def hsbm_game(n: int, m: int, rho: Iterable[float], C: MatrixLike, p: float) ->
 
 def dot_product_game(vecs: MatrixLike, directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_dot_product_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_vecs = sequence_to_igraph_matrix_t_view(vecs)
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_dot_product_game(c_graph, c_vecs, c_directed)
+    _lib.igraph_dot_product_game(c_graph, c_vecs, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -1393,6 +1583,8 @@ def dot_product_game(vecs: MatrixLike, directed: bool = False) -> Graph:
 
 def are_adjacent(graph: Graph, v1: VertexLike, v2: VertexLike) -> bool:
     """Type-annotated wrapper for ``igraph_are_adjacent``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_v1 = vertexlike_to_igraph_int_t(v1)
@@ -1400,7 +1592,7 @@ def are_adjacent(graph: Graph, v1: VertexLike, v2: VertexLike) -> bool:
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_are_adjacent(c_graph, c_v1, c_v2, c_res)
+    _lib.igraph_are_adjacent(c_graph, c_v1, c_v2, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -1411,6 +1603,8 @@ def are_adjacent(graph: Graph, v1: VertexLike, v2: VertexLike) -> bool:
 
 def diameter(graph: Graph, weights: Optional[Iterable[float]] = None, directed: bool = True, unconnected: bool = True) -> tuple[float, int, int, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_diameter``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1423,14 +1617,14 @@ def diameter(graph: Graph, weights: Optional[Iterable[float]] = None, directed:
     c_unconnected = any_to_igraph_bool_t(unconnected)
 
     # Call wrapped function
-    igraph_diameter(c_graph, c_weights, c_res, c_from, c_to, c_vertex_path, c_edge_path, c_directed, c_unconnected)
+    _lib.igraph_diameter(c_graph, c_weights, c_res, c_from, c_to, c_vertex_path, c_edge_path, c_directed, c_unconnected)
 
     # Prepare output arguments
     res = c_res.value
     from_ = c_from.value
     to = c_to.value
-    vertex_path = igraph_vector_int_t_to_numpy_array(c_vertex_path)
-    edge_path = igraph_vector_int_t_to_numpy_array(c_edge_path)
+    vertex_path = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_path)
+    edge_path = igraph_vector_int_t_to_numpy_array_transfer(c_edge_path)
 
     # Construct return value
     return res, from_, to, vertex_path, edge_path
@@ -1438,6 +1632,8 @@ def diameter(graph: Graph, weights: Optional[Iterable[float]] = None, directed:
 
 def closeness(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, weights: Optional[Iterable[float]] = None, normalized: bool = False) -> tuple[RealArray, IntArray, bool]:
     """Type-annotated wrapper for ``igraph_closeness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -1449,11 +1645,11 @@ def closeness(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = N
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_closeness(c_graph, c_res, c_reachable_count, c_all_reachable, c_vids.unwrap(), c_mode, c_weights, c_normalized)
+    _lib.igraph_closeness(c_graph, c_res, c_reachable_count, c_all_reachable, c_vids.unwrap(), c_mode, c_weights, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
-    reachable_count = igraph_vector_int_t_to_numpy_array(c_reachable_count)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
+    reachable_count = igraph_vector_int_t_to_numpy_array_transfer(c_reachable_count)
     all_reachable = c_all_reachable.value
 
     # Construct return value
@@ -1462,6 +1658,8 @@ def closeness(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = N
 
 def closeness_cutoff(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, weights: Optional[Iterable[float]] = None, normalized: bool = False, cutoff: float = -1) -> tuple[RealArray, IntArray, bool]:
     """Type-annotated wrapper for ``igraph_closeness_cutoff``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -1474,11 +1672,11 @@ def closeness_cutoff(graph: Graph, vids: VertexSelector = "all", mode: NeighborM
     c_cutoff = cutoff
 
     # Call wrapped function
-    igraph_closeness_cutoff(c_graph, c_res, c_reachable_count, c_all_reachable, c_vids.unwrap(), c_mode, c_weights, c_normalized, c_cutoff)
+    _lib.igraph_closeness_cutoff(c_graph, c_res, c_reachable_count, c_all_reachable, c_vids.unwrap(), c_mode, c_weights, c_normalized, c_cutoff)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
-    reachable_count = igraph_vector_int_t_to_numpy_array(c_reachable_count)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
+    reachable_count = igraph_vector_int_t_to_numpy_array_transfer(c_reachable_count)
     all_reachable = c_all_reachable.value
 
     # Construct return value
@@ -1487,19 +1685,21 @@ def closeness_cutoff(graph: Graph, vids: VertexSelector = "all", mode: NeighborM
 
 def distances(graph: Graph, weights: Optional[Iterable[float]] = None, from_: VertexSelector = "all", to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_distances(c_graph, c_weights, c_res, c_from.unwrap(), c_to.unwrap(), c_mode)
+    _lib.igraph_distances(c_graph, c_weights, c_res, c_from.unwrap(), c_to.unwrap(), c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1507,20 +1707,22 @@ def distances(graph: Graph, weights: Optional[Iterable[float]] = None, from_: Ve
 
 def distances_cutoff(graph: Graph, weights: Optional[Iterable[float]] = None, from_: VertexSelector = "all", to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, cutoff: float = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances_cutoff``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_mode = c_int(mode)
     c_cutoff = cutoff
 
     # Call wrapped function
-    igraph_distances_cutoff(c_graph, c_weights, c_res, c_from.unwrap(), c_to.unwrap(), c_mode, c_cutoff)
+    _lib.igraph_distances_cutoff(c_graph, c_weights, c_res, c_from.unwrap(), c_to.unwrap(), c_mode, c_cutoff)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1528,6 +1730,8 @@ def distances_cutoff(graph: Graph, weights: Optional[Iterable[float]] = None, fr
 
 def get_shortest_path(graph: Graph, from_: VertexLike, to: VertexLike, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_shortest_path``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1538,11 +1742,11 @@ def get_shortest_path(graph: Graph, from_: VertexLike, to: VertexLike, weights:
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_shortest_path(c_graph, c_weights, c_vertices, c_edges, c_from, c_to, c_mode)
+    _lib.igraph_get_shortest_path(c_graph, c_weights, c_vertices, c_edges, c_from, c_to, c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_t_to_numpy_array(c_vertices)
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    vertices = igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return vertices, edges
@@ -1550,6 +1754,8 @@ def get_shortest_path(graph: Graph, from_: VertexLike, to: VertexLike, weights:
 
 def get_shortest_path_bellman_ford(graph: Graph, from_: VertexLike, to: VertexLike, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_shortest_path_bellman_ford``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorInt.create(0)
@@ -1560,11 +1766,11 @@ def get_shortest_path_bellman_ford(graph: Graph, from_: VertexLike, to: VertexLi
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_shortest_path_bellman_ford(c_graph, c_vertices, c_edges, c_from, c_to, c_weights, c_mode)
+    _lib.igraph_get_shortest_path_bellman_ford(c_graph, c_vertices, c_edges, c_from, c_to, c_weights, c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_t_to_numpy_array(c_vertices)
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    vertices = igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return vertices, edges
@@ -1572,6 +1778,8 @@ def get_shortest_path_bellman_ford(graph: Graph, from_: VertexLike, to: VertexLi
 
 def get_shortest_path_dijkstra(graph: Graph, from_: VertexLike, to: VertexLike, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_shortest_path_dijkstra``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorInt.create(0)
@@ -1582,18 +1790,20 @@ def get_shortest_path_dijkstra(graph: Graph, from_: VertexLike, to: VertexLike,
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_shortest_path_dijkstra(c_graph, c_vertices, c_edges, c_from, c_to, c_weights, c_mode)
+    _lib.igraph_get_shortest_path_dijkstra(c_graph, c_vertices, c_edges, c_from, c_to, c_weights, c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_t_to_numpy_array(c_vertices)
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    vertices = igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return vertices, edges
 
 
-def get_shortest_paths(graph: Graph, from_: VertexLike, weights: Optional[Iterable[float]] = None, to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray], IntArray, IntArray]:
+def get_shortest_paths(graph: Graph, from_: VertexLike, weights: Optional[Iterable[float]] = None, to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_shortest_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1606,20 +1816,22 @@ def get_shortest_paths(graph: Graph, from_: VertexLike, weights: Optional[Iterab
     c_inbound_edges = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_get_shortest_paths(c_graph, c_weights, c_vertices, c_edges, c_from, c_to.unwrap(), c_mode, c_parents, c_inbound_edges)
+    _lib.igraph_get_shortest_paths(c_graph, c_weights, c_vertices, c_edges, c_from, c_to.unwrap(), c_mode, c_parents, c_inbound_edges)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
-    parents = igraph_vector_int_t_to_numpy_array(c_parents)
-    inbound_edges = igraph_vector_int_t_to_numpy_array(c_inbound_edges)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
+    inbound_edges = igraph_vector_int_t_to_numpy_array_transfer(c_inbound_edges)
 
     # Construct return value
     return vertices, edges, parents, inbound_edges
 
 
-def get_all_shortest_paths(graph: Graph, from_: VertexLike, to: VertexSelector, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray], IntArray]:
+def get_all_shortest_paths(graph: Graph, from_: VertexLike, to: VertexSelector, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray]:
     """Type-annotated wrapper for ``igraph_get_all_shortest_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1631,12 +1843,12 @@ def get_all_shortest_paths(graph: Graph, from_: VertexLike, to: VertexSelector,
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_all_shortest_paths(c_graph, c_weights, c_vertices, c_edges, c_nrgeo, c_from, c_to.unwrap(), c_mode)
+    _lib.igraph_get_all_shortest_paths(c_graph, c_weights, c_vertices, c_edges, c_nrgeo, c_from, c_to.unwrap(), c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
-    nrgeo = igraph_vector_int_t_to_numpy_array(c_nrgeo)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    nrgeo = igraph_vector_int_t_to_numpy_array_transfer(c_nrgeo)
 
     # Construct return value
     return vertices, edges, nrgeo
@@ -1644,19 +1856,21 @@ def get_all_shortest_paths(graph: Graph, from_: VertexLike, to: VertexSelector,
 
 def distances_dijkstra(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances_dijkstra``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_distances_dijkstra(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
+    _lib.igraph_distances_dijkstra(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1664,9 +1878,11 @@ def distances_dijkstra(graph: Graph, from_: VertexSelector = "all", to: VertexSe
 
 def distances_dijkstra_cutoff(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, cutoff: float = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances_dijkstra_cutoff``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1674,17 +1890,19 @@ def distances_dijkstra_cutoff(graph: Graph, from_: VertexSelector = "all", to: V
     c_cutoff = cutoff
 
     # Call wrapped function
-    igraph_distances_dijkstra_cutoff(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode, c_cutoff)
+    _lib.igraph_distances_dijkstra_cutoff(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode, c_cutoff)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
 
 
-def get_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray], IntArray, IntArray]:
+def get_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_shortest_paths_dijkstra``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorIntList.create(0)
@@ -1697,20 +1915,22 @@ def get_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexSelec
     c_inbound_edges = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_get_shortest_paths_dijkstra(c_graph, c_vertices, c_edges, c_from, c_to.unwrap(), c_weights, c_mode, c_parents, c_inbound_edges)
+    _lib.igraph_get_shortest_paths_dijkstra(c_graph, c_vertices, c_edges, c_from, c_to.unwrap(), c_weights, c_mode, c_parents, c_inbound_edges)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
-    parents = igraph_vector_int_t_to_numpy_array(c_parents)
-    inbound_edges = igraph_vector_int_t_to_numpy_array(c_inbound_edges)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
+    inbound_edges = igraph_vector_int_t_to_numpy_array_transfer(c_inbound_edges)
 
     # Construct return value
     return vertices, edges, parents, inbound_edges
 
 
-def get_shortest_paths_bellman_ford(graph: Graph, from_: VertexLike, to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray], IntArray, IntArray]:
+def get_shortest_paths_bellman_ford(graph: Graph, from_: VertexLike, to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_shortest_paths_bellman_ford``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorIntList.create(0)
@@ -1723,20 +1943,22 @@ def get_shortest_paths_bellman_ford(graph: Graph, from_: VertexLike, to: VertexS
     c_inbound_edges = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_get_shortest_paths_bellman_ford(c_graph, c_vertices, c_edges, c_from, c_to.unwrap(), c_weights, c_mode, c_parents, c_inbound_edges)
+    _lib.igraph_get_shortest_paths_bellman_ford(c_graph, c_vertices, c_edges, c_from, c_to.unwrap(), c_weights, c_mode, c_parents, c_inbound_edges)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
-    parents = igraph_vector_int_t_to_numpy_array(c_parents)
-    inbound_edges = igraph_vector_int_t_to_numpy_array(c_inbound_edges)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
+    inbound_edges = igraph_vector_int_t_to_numpy_array_transfer(c_inbound_edges)
 
     # Construct return value
     return vertices, edges, parents, inbound_edges
 
 
-def get_all_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray], IntArray]:
+def get_all_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray]:
     """Type-annotated wrapper for ``igraph_get_all_shortest_paths_dijkstra``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorIntList.create(0)
@@ -1748,12 +1970,12 @@ def get_all_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexS
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_all_shortest_paths_dijkstra(c_graph, c_vertices, c_edges, c_nrgeo, c_from, c_to.unwrap(), c_weights, c_mode)
+    _lib.igraph_get_all_shortest_paths_dijkstra(c_graph, c_vertices, c_edges, c_nrgeo, c_from, c_to.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
-    nrgeo = igraph_vector_int_t_to_numpy_array(c_nrgeo)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    nrgeo = igraph_vector_int_t_to_numpy_array_transfer(c_nrgeo)
 
     # Construct return value
     return vertices, edges, nrgeo
@@ -1761,19 +1983,21 @@ def get_all_shortest_paths_dijkstra(graph: Graph, from_: VertexLike, to: VertexS
 
 def distances_bellman_ford(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances_bellman_ford``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_distances_bellman_ford(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
+    _lib.igraph_distances_bellman_ford(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1781,19 +2005,21 @@ def distances_bellman_ford(graph: Graph, from_: VertexSelector = "all", to: Vert
 
 def distances_johnson(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances_johnson``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_distances_johnson(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
+    _lib.igraph_distances_johnson(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1801,9 +2027,11 @@ def distances_johnson(graph: Graph, from_: VertexSelector = "all", to: VertexSel
 
 def distances_floyd_warshall(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, method: FloydWarshallAlgorithm = FloydWarshallAlgorithm.AUTOMATIC) -> RealArray:
     """Type-annotated wrapper for ``igraph_distances_floyd_warshall``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1811,10 +2039,10 @@ def distances_floyd_warshall(graph: Graph, from_: VertexSelector = "all", to: Ve
     c_method = c_int(method)
 
     # Call wrapped function
-    igraph_distances_floyd_warshall(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode, c_method)
+    _lib.igraph_distances_floyd_warshall(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode, c_method)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1822,6 +2050,8 @@ def distances_floyd_warshall(graph: Graph, from_: VertexSelector = "all", to: Ve
 
 def voronoi(graph: Graph, generators: Iterable[VertexLike], weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, tiebreaker: VoronoiTiebreaker = VoronoiTiebreaker.RANDOM) -> tuple[IntArray, RealArray]:
     """Type-annotated wrapper for ``igraph_voronoi``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_membership = _VectorInt.create(0)
@@ -1832,18 +2062,20 @@ def voronoi(graph: Graph, generators: Iterable[VertexLike], weights: Optional[It
     c_tiebreaker = c_int(tiebreaker)
 
     # Call wrapped function
-    igraph_voronoi(c_graph, c_membership, c_distances, c_generators, c_weights, c_mode, c_tiebreaker)
+    _lib.igraph_voronoi(c_graph, c_membership, c_distances, c_generators, c_weights, c_mode, c_tiebreaker)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    distances = igraph_vector_t_to_numpy_array(c_distances)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    distances = igraph_vector_t_to_numpy_array_transfer(c_distances)
 
     # Construct return value
     return membership, distances
 
 
-def get_all_simple_paths(graph: Graph, from_: VertexLike, to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, minlen: int = -1, maxlen: int = -1, max_results: int = -1) -> list[IntArray]:
+def get_all_simple_paths(graph: Graph, from_: VertexLike, to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, minlen: int = -1, maxlen: int = -1, max_results: int = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_get_all_simple_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
@@ -1855,17 +2087,19 @@ def get_all_simple_paths(graph: Graph, from_: VertexLike, to: VertexSelector = "
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_get_all_simple_paths(c_graph, c_res, c_from, c_to.unwrap(), c_mode, c_minlen, c_maxlen, c_max_results)
+    _lib.igraph_get_all_simple_paths(c_graph, c_res, c_from, c_to.unwrap(), c_mode, c_minlen, c_maxlen, c_max_results)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
 
-def get_k_shortest_paths(graph: Graph, k: int, from_: VertexLike, to: VertexLike, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray]]:
+def get_k_shortest_paths(graph: Graph, k: int, from_: VertexLike, to: VertexLike, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList]:
     """Type-annotated wrapper for ``igraph_get_k_shortest_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -1877,11 +2111,11 @@ def get_k_shortest_paths(graph: Graph, k: int, from_: VertexLike, to: VertexLike
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_k_shortest_paths(c_graph, c_weights, c_vertex_paths, c_edge_paths, c_k, c_from, c_to, c_mode)
+    _lib.igraph_get_k_shortest_paths(c_graph, c_weights, c_vertex_paths, c_edge_paths, c_k, c_from, c_to, c_mode)
 
     # Prepare output arguments
-    vertex_paths = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertex_paths)
-    edge_paths = igraph_vector_int_list_t_to_list_of_numpy_array(c_edge_paths)
+    vertex_paths = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertex_paths) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertex_paths)
+    edge_paths = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edge_paths) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edge_paths)
 
     # Construct return value
     return vertex_paths, edge_paths
@@ -1889,6 +2123,8 @@ def get_k_shortest_paths(graph: Graph, k: int, from_: VertexLike, to: VertexLike
 
 def get_widest_path(graph: Graph, from_: VertexLike, to: VertexLike, weights: Iterable[float], mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_widest_path``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorInt.create(0)
@@ -1899,18 +2135,20 @@ def get_widest_path(graph: Graph, from_: VertexLike, to: VertexLike, weights: It
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_get_widest_path(c_graph, c_vertices, c_edges, c_from, c_to, c_weights, c_mode)
+    _lib.igraph_get_widest_path(c_graph, c_vertices, c_edges, c_from, c_to, c_weights, c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_t_to_numpy_array(c_vertices)
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    vertices = igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return vertices, edges
 
 
-def get_widest_paths(graph: Graph, from_: VertexLike, weights: Iterable[float], to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT) -> tuple[list[IntArray], list[IntArray], IntArray, IntArray]:
+def get_widest_paths(graph: Graph, from_: VertexLike, weights: Iterable[float], to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_widest_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorIntList.create(0)
@@ -1923,13 +2161,13 @@ def get_widest_paths(graph: Graph, from_: VertexLike, weights: Iterable[float],
     c_inbound_edges = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_get_widest_paths(c_graph, c_vertices, c_edges, c_from, c_to.unwrap(), c_weights, c_mode, c_parents, c_inbound_edges)
+    _lib.igraph_get_widest_paths(c_graph, c_vertices, c_edges, c_from, c_to.unwrap(), c_weights, c_mode, c_parents, c_inbound_edges)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
-    parents = igraph_vector_int_t_to_numpy_array(c_parents)
-    inbound_edges = igraph_vector_int_t_to_numpy_array(c_inbound_edges)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
+    inbound_edges = igraph_vector_int_t_to_numpy_array_transfer(c_inbound_edges)
 
     # Construct return value
     return vertices, edges, parents, inbound_edges
@@ -1937,19 +2175,21 @@ def get_widest_paths(graph: Graph, from_: VertexLike, weights: Iterable[float],
 
 def widest_path_widths_dijkstra(graph: Graph, weights: Iterable[float], from_: VertexSelector = "all", to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_widest_path_widths_dijkstra``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_widest_path_widths_dijkstra(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
+    _lib.igraph_widest_path_widths_dijkstra(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1957,19 +2197,21 @@ def widest_path_widths_dijkstra(graph: Graph, weights: Iterable[float], from_: V
 
 def widest_path_widths_floyd_warshall(graph: Graph, weights: Iterable[float], from_: VertexSelector = "all", to: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_widest_path_widths_floyd_warshall``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_widest_path_widths_floyd_warshall(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
+    _lib.igraph_widest_path_widths_floyd_warshall(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -1977,6 +2219,8 @@ def widest_path_widths_floyd_warshall(graph: Graph, weights: Iterable[float], fr
 
 def spanner(graph: Graph, stretch: float, weights: Optional[Iterable[float]] = None) -> IntArray:
     """Type-annotated wrapper for ``igraph_spanner``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_spanner = _VectorInt.create(0)
@@ -1984,10 +2228,10 @@ def spanner(graph: Graph, stretch: float, weights: Optional[Iterable[float]] = N
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
 
     # Call wrapped function
-    igraph_spanner(c_graph, c_spanner, c_stretch, c_weights)
+    _lib.igraph_spanner(c_graph, c_spanner, c_stretch, c_weights)
 
     # Prepare output arguments
-    spanner = igraph_vector_int_t_to_numpy_array(c_spanner)
+    spanner = igraph_vector_int_t_to_numpy_array_transfer(c_spanner)
 
     # Construct return value
     return spanner
@@ -1995,6 +2239,8 @@ def spanner(graph: Graph, stretch: float, weights: Optional[Iterable[float]] = N
 
 def subcomponent(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMode.ALL) -> IntArray:
     """Type-annotated wrapper for ``igraph_subcomponent``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
@@ -2002,10 +2248,10 @@ def subcomponent(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMod
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_subcomponent(c_graph, c_res, c_vid, c_mode)
+    _lib.igraph_subcomponent(c_graph, c_res, c_vid, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2013,6 +2259,8 @@ def subcomponent(graph: Graph, vid: VertexLike, mode: NeighborMode = NeighborMod
 
 def betweenness(graph: Graph, weights: Optional[Iterable[float]] = None, vids: VertexSelector = "all", directed: bool = True, normalized: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_betweenness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2022,10 +2270,10 @@ def betweenness(graph: Graph, weights: Optional[Iterable[float]] = None, vids: V
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_betweenness(c_graph, c_weights, c_res, c_vids.unwrap(), c_directed, c_normalized)
+    _lib.igraph_betweenness(c_graph, c_weights, c_res, c_vids.unwrap(), c_directed, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2033,6 +2281,8 @@ def betweenness(graph: Graph, weights: Optional[Iterable[float]] = None, vids: V
 
 def betweenness_cutoff(graph: Graph, weights: Optional[Iterable[float]] = None, vids: VertexSelector = "all", directed: bool = True, normalized: bool = False, cutoff: float = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_betweenness_cutoff``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2043,32 +2293,34 @@ def betweenness_cutoff(graph: Graph, weights: Optional[Iterable[float]] = None,
     c_cutoff = cutoff
 
     # Call wrapped function
-    igraph_betweenness_cutoff(c_graph, c_weights, c_res, c_vids.unwrap(), c_directed, c_normalized, c_cutoff)
+    _lib.igraph_betweenness_cutoff(c_graph, c_weights, c_res, c_vids.unwrap(), c_directed, c_normalized, c_cutoff)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
 
 
-def betweenness_subset(graph: Graph, weights: Optional[Iterable[float]] = None, vids: VertexSelector = "all", sources: VertexSelector = "all", targets: VertexSelector = "all", directed: bool = True, normalized: bool = False) -> RealArray:
+def betweenness_subset(graph: Graph, weights: Optional[Iterable[float]] = None, sources: VertexSelector = "all", targets: VertexSelector = "all", vids: VertexSelector = "all", directed: bool = True, normalized: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_betweenness_subset``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_res = _Vector.create(0)
-    c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
     c_sources = vertex_selector_to_igraph_vs_t(sources, graph)
     c_targets = vertex_selector_to_igraph_vs_t(targets, graph)
+    c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
     c_directed = any_to_igraph_bool_t(directed)
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_betweenness_subset(c_graph, c_weights, c_res, c_vids.unwrap(), c_sources.unwrap(), c_targets.unwrap(), c_directed, c_normalized)
+    _lib.igraph_betweenness_subset(c_graph, c_weights, c_res, c_sources.unwrap(), c_targets.unwrap(), c_vids.unwrap(), c_directed, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2076,6 +2328,8 @@ def betweenness_subset(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def edge_betweenness(graph: Graph, weights: Optional[Iterable[float]] = None, eids: EdgeSelector = "all", directed: bool = True, normalized: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_edge_betweenness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2085,10 +2339,10 @@ def edge_betweenness(graph: Graph, weights: Optional[Iterable[float]] = None, ei
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_edge_betweenness(c_graph, c_weights, c_res, c_eids.unwrap(), c_directed, c_normalized)
+    _lib.igraph_edge_betweenness(c_graph, c_weights, c_res, c_eids.unwrap(), c_directed, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2096,6 +2350,8 @@ def edge_betweenness(graph: Graph, weights: Optional[Iterable[float]] = None, ei
 
 def edge_betweenness_cutoff(graph: Graph, weights: Optional[Iterable[float]] = None, eids: EdgeSelector = "all", directed: bool = True, normalized: bool = False, cutoff: float = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_edge_betweenness_cutoff``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2106,10 +2362,10 @@ def edge_betweenness_cutoff(graph: Graph, weights: Optional[Iterable[float]] = N
     c_cutoff = cutoff
 
     # Call wrapped function
-    igraph_edge_betweenness_cutoff(c_graph, c_weights, c_res, c_eids.unwrap(), c_directed, c_normalized, c_cutoff)
+    _lib.igraph_edge_betweenness_cutoff(c_graph, c_weights, c_res, c_eids.unwrap(), c_directed, c_normalized, c_cutoff)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2117,6 +2373,8 @@ def edge_betweenness_cutoff(graph: Graph, weights: Optional[Iterable[float]] = N
 
 def edge_betweenness_subset(graph: Graph, weights: Optional[Iterable[float]] = None, sources: VertexSelector = "all", targets: VertexSelector = "all", eids: EdgeSelector = "all", directed: bool = True, normalized: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_edge_betweenness_subset``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2128,10 +2386,10 @@ def edge_betweenness_subset(graph: Graph, weights: Optional[Iterable[float]] = N
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_edge_betweenness_subset(c_graph, c_weights, c_res, c_sources.unwrap(), c_targets.unwrap(), c_eids.unwrap(), c_directed, c_normalized)
+    _lib.igraph_edge_betweenness_subset(c_graph, c_weights, c_res, c_sources.unwrap(), c_targets.unwrap(), c_eids.unwrap(), c_directed, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2139,6 +2397,8 @@ def edge_betweenness_subset(graph: Graph, weights: Optional[Iterable[float]] = N
 
 def harmonic_centrality(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, weights: Optional[Iterable[float]] = None, normalized: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_harmonic_centrality``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2148,10 +2408,10 @@ def harmonic_centrality(graph: Graph, vids: VertexSelector = "all", mode: Neighb
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_harmonic_centrality(c_graph, c_res, c_vids.unwrap(), c_mode, c_weights, c_normalized)
+    _lib.igraph_harmonic_centrality(c_graph, c_res, c_vids.unwrap(), c_mode, c_weights, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2159,6 +2419,8 @@ def harmonic_centrality(graph: Graph, vids: VertexSelector = "all", mode: Neighb
 
 def harmonic_centrality_cutoff(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.OUT, weights: Optional[Iterable[float]] = None, normalized: bool = False, cutoff: float = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_harmonic_centrality_cutoff``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2169,10 +2431,10 @@ def harmonic_centrality_cutoff(graph: Graph, vids: VertexSelector = "all", mode:
     c_cutoff = cutoff
 
     # Call wrapped function
-    igraph_harmonic_centrality_cutoff(c_graph, c_res, c_vids.unwrap(), c_mode, c_weights, c_normalized, c_cutoff)
+    _lib.igraph_harmonic_centrality_cutoff(c_graph, c_res, c_vids.unwrap(), c_mode, c_weights, c_normalized, c_cutoff)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2188,6 +2450,8 @@ def harmonic_centrality_cutoff(graph: Graph, vids: VertexSelector = "all", mode:
 
 def induced_subgraph(graph: Graph, vids: VertexSelector, impl: SubgraphImplementation = SubgraphImplementation.AUTO) -> Graph:
     """Type-annotated wrapper for ``igraph_induced_subgraph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
@@ -2195,7 +2459,7 @@ def induced_subgraph(graph: Graph, vids: VertexSelector, impl: SubgraphImplement
     c_impl = c_int(impl)
 
     # Call wrapped function
-    igraph_induced_subgraph(c_graph, c_res, c_vids.unwrap(), c_impl)
+    _lib.igraph_induced_subgraph(c_graph, c_res, c_vids.unwrap(), c_impl)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -2206,6 +2470,8 @@ def induced_subgraph(graph: Graph, vids: VertexSelector, impl: SubgraphImplement
 
 def subgraph_from_edges(graph: Graph, eids: EdgeSelector, delete_vertices: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_subgraph_from_edges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
@@ -2213,7 +2479,7 @@ def subgraph_from_edges(graph: Graph, eids: EdgeSelector, delete_vertices: bool
     c_delete_vertices = any_to_igraph_bool_t(delete_vertices)
 
     # Call wrapped function
-    igraph_subgraph_from_edges(c_graph, c_res, c_eids.unwrap(), c_delete_vertices)
+    _lib.igraph_subgraph_from_edges(c_graph, c_res, c_eids.unwrap(), c_delete_vertices)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -2224,16 +2490,20 @@ def subgraph_from_edges(graph: Graph, eids: EdgeSelector, delete_vertices: bool
 
 def reverse_edges(graph: Graph, eids: EdgeSelector = "all") -> None:
     """Type-annotated wrapper for ``igraph_reverse_edges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_eids = edge_selector_to_igraph_es_t(eids, graph)
 
     # Call wrapped function
-    igraph_reverse_edges(c_graph, c_eids.unwrap())
+    _lib.igraph_reverse_edges(c_graph, c_eids.unwrap())
 
 
 def average_path_length(graph: Graph, weights: Optional[Iterable[float]] = None, directed: bool = True, unconn: bool = True) -> tuple[float, float]:
     """Type-annotated wrapper for ``igraph_average_path_length``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2243,7 +2513,7 @@ def average_path_length(graph: Graph, weights: Optional[Iterable[float]] = None,
     c_unconn = any_to_igraph_bool_t(unconn)
 
     # Call wrapped function
-    igraph_average_path_length(c_graph, c_weights, c_res, c_unconn_pairs, c_directed, c_unconn)
+    _lib.igraph_average_path_length(c_graph, c_weights, c_res, c_unconn_pairs, c_directed, c_unconn)
 
     # Prepare output arguments
     res = c_res.value
@@ -2255,6 +2525,8 @@ def average_path_length(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def path_length_hist(graph: Graph, directed: bool = True) -> tuple[RealArray, float]:
     """Type-annotated wrapper for ``igraph_path_length_hist``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2262,10 +2534,10 @@ def path_length_hist(graph: Graph, directed: bool = True) -> tuple[RealArray, fl
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_path_length_hist(c_graph, c_res, c_unconnected, c_directed)
+    _lib.igraph_path_length_hist(c_graph, c_res, c_unconnected, c_directed)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
     unconnected = c_unconnected.value
 
     # Construct return value
@@ -2274,25 +2546,29 @@ def path_length_hist(graph: Graph, directed: bool = True) -> tuple[RealArray, fl
 
 def simplify(graph: Graph, remove_multiple: bool = True, remove_loops: bool = True, edge_attr_comb: Optional[AttributeCombinationSpecification] = None) -> None:
     """Type-annotated wrapper for ``igraph_simplify``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_remove_multiple = any_to_igraph_bool_t(remove_multiple)
     c_remove_loops = any_to_igraph_bool_t(remove_loops)
     c_edge_attr_comb = mapping_to_attribute_combination_t(edge_attr_comb)
 
     # Call wrapped function
-    igraph_simplify(c_graph, c_remove_multiple, c_remove_loops, c_edge_attr_comb)
+    _lib.igraph_simplify(c_graph, c_remove_multiple, c_remove_loops, c_edge_attr_comb)
 
 
 def transitivity_undirected(graph: Graph, mode: TransitivityMode = TransitivityMode.NAN) -> float:
     """Type-annotated wrapper for ``igraph_transitivity_undirected``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_transitivity_undirected(c_graph, c_res, c_mode)
+    _lib.igraph_transitivity_undirected(c_graph, c_res, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -2303,6 +2579,8 @@ def transitivity_undirected(graph: Graph, mode: TransitivityMode = TransitivityM
 
 def transitivity_local_undirected(graph: Graph, vids: VertexSelector = "all", mode: TransitivityMode = TransitivityMode.NAN) -> RealArray:
     """Type-annotated wrapper for ``igraph_transitivity_local_undirected``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2310,10 +2588,10 @@ def transitivity_local_undirected(graph: Graph, vids: VertexSelector = "all", mo
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_transitivity_local_undirected(c_graph, c_res, c_vids.unwrap(), c_mode)
+    _lib.igraph_transitivity_local_undirected(c_graph, c_res, c_vids.unwrap(), c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2321,13 +2599,15 @@ def transitivity_local_undirected(graph: Graph, vids: VertexSelector = "all", mo
 
 def transitivity_avglocal_undirected(graph: Graph, mode: TransitivityMode = TransitivityMode.NAN) -> float:
     """Type-annotated wrapper for ``igraph_transitivity_avglocal_undirected``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_transitivity_avglocal_undirected(c_graph, c_res, c_mode)
+    _lib.igraph_transitivity_avglocal_undirected(c_graph, c_res, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -2338,6 +2618,8 @@ def transitivity_avglocal_undirected(graph: Graph, mode: TransitivityMode = Tran
 
 def transitivity_barrat(graph: Graph, vids: VertexSelector = "all", weights: Optional[Iterable[float]] = None, mode: TransitivityMode = TransitivityMode.NAN) -> RealArray:
     """Type-annotated wrapper for ``igraph_transitivity_barrat``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2346,10 +2628,10 @@ def transitivity_barrat(graph: Graph, vids: VertexSelector = "all", weights: Opt
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_transitivity_barrat(c_graph, c_res, c_vids.unwrap(), c_weights, c_mode)
+    _lib.igraph_transitivity_barrat(c_graph, c_res, c_vids.unwrap(), c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2357,6 +2639,8 @@ def transitivity_barrat(graph: Graph, vids: VertexSelector = "all", weights: Opt
 
 def ecc(graph: Graph, eids: EdgeSelector = "all", k: int = 3, offset: bool = False, normalize: bool = True) -> RealArray:
     """Type-annotated wrapper for ``igraph_ecc``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2366,10 +2650,10 @@ def ecc(graph: Graph, eids: EdgeSelector = "all", k: int = 3, offset: bool = Fal
     c_normalize = any_to_igraph_bool_t(normalize)
 
     # Call wrapped function
-    igraph_ecc(c_graph, c_res, c_eids.unwrap(), c_k, c_offset, c_normalize)
+    _lib.igraph_ecc(c_graph, c_res, c_eids.unwrap(), c_k, c_offset, c_normalize)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2377,6 +2661,8 @@ def ecc(graph: Graph, eids: EdgeSelector = "all", k: int = 3, offset: bool = Fal
 
 def reciprocity(graph: Graph, ignore_loops: bool = True, mode: Reciprocity = Reciprocity.DEFAULT) -> float:
     """Type-annotated wrapper for ``igraph_reciprocity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
@@ -2384,7 +2670,7 @@ def reciprocity(graph: Graph, ignore_loops: bool = True, mode: Reciprocity = Rec
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_reciprocity(c_graph, c_res, c_ignore_loops, c_mode)
+    _lib.igraph_reciprocity(c_graph, c_res, c_ignore_loops, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -2395,6 +2681,8 @@ def reciprocity(graph: Graph, ignore_loops: bool = True, mode: Reciprocity = Rec
 
 def constraint(graph: Graph, vids: VertexSelector = "all", weights: Optional[Iterable[float]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_constraint``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2402,10 +2690,10 @@ def constraint(graph: Graph, vids: VertexSelector = "all", weights: Optional[Ite
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
 
     # Call wrapped function
-    igraph_constraint(c_graph, c_res, c_vids.unwrap(), c_weights)
+    _lib.igraph_constraint(c_graph, c_res, c_vids.unwrap(), c_weights)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2413,6 +2701,8 @@ def constraint(graph: Graph, vids: VertexSelector = "all", weights: Optional[Ite
 
 def maxdegree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: Loops = Loops.TWICE) -> int:
     """Type-annotated wrapper for ``igraph_maxdegree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
@@ -2421,7 +2711,7 @@ def maxdegree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = N
     c_loops = c_int(loops)
 
     # Call wrapped function
-    igraph_maxdegree(c_graph, c_res, c_vids.unwrap(), c_mode, c_loops)
+    _lib.igraph_maxdegree(c_graph, c_res, c_vids.unwrap(), c_mode, c_loops)
 
     # Prepare output arguments
     res = c_res.value
@@ -2432,6 +2722,8 @@ def maxdegree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = N
 
 def density(graph: Graph, weights: Optional[Iterable[float]] = None, loops: bool = False) -> float:
     """Type-annotated wrapper for ``igraph_density``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2439,7 +2731,7 @@ def density(graph: Graph, weights: Optional[Iterable[float]] = None, loops: bool
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_density(c_graph, c_weights, c_res, c_loops)
+    _lib.igraph_density(c_graph, c_weights, c_res, c_loops)
 
     # Prepare output arguments
     res = c_res.value
@@ -2450,13 +2742,15 @@ def density(graph: Graph, weights: Optional[Iterable[float]] = None, loops: bool
 
 def mean_degree(graph: Graph, loops: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_mean_degree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_mean_degree(c_graph, c_res, c_loops)
+    _lib.igraph_mean_degree(c_graph, c_res, c_loops)
 
     # Prepare output arguments
     res = c_res.value
@@ -2467,6 +2761,8 @@ def mean_degree(graph: Graph, loops: bool = True) -> float:
 
 def neighborhood_size(graph: Graph, vids: VertexSelector, order: int, mode: NeighborMode = NeighborMode.ALL, mindist: int = 0) -> IntArray:
     """Type-annotated wrapper for ``igraph_neighborhood_size``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
@@ -2476,17 +2772,19 @@ def neighborhood_size(graph: Graph, vids: VertexSelector, order: int, mode: Neig
     c_mindist = mindist
 
     # Call wrapped function
-    igraph_neighborhood_size(c_graph, c_res, c_vids.unwrap(), c_order, c_mode, c_mindist)
+    _lib.igraph_neighborhood_size(c_graph, c_res, c_vids.unwrap(), c_order, c_mode, c_mindist)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
 
 
-def neighborhood(graph: Graph, vids: VertexSelector, order: int, mode: NeighborMode = NeighborMode.ALL, mindist: int = 0) -> list[IntArray]:
+def neighborhood(graph: Graph, vids: VertexSelector, order: int, mode: NeighborMode = NeighborMode.ALL, mindist: int = 0, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_neighborhood``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
@@ -2496,29 +2794,51 @@ def neighborhood(graph: Graph, vids: VertexSelector, order: int, mode: NeighborM
     c_mindist = mindist
 
     # Call wrapped function
-    igraph_neighborhood(c_graph, c_res, c_vids.unwrap(), c_order, c_mode, c_mindist)
+    _lib.igraph_neighborhood(c_graph, c_res, c_vids.unwrap(), c_order, c_mode, c_mindist)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
-# igraph_neighborhood_graphs: no Python type known for type: GRAPH_LIST
+
+def neighborhood_graphs(graph: Graph, vids: VertexSelector, order: int, mode: NeighborMode = NeighborMode.ALL, mindist: int = 0) -> GraphList:
+    """Type-annotated wrapper for ``igraph_neighborhood_graphs``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_res = _GraphList.create(0)
+    c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
+    c_order = order
+    c_mode = c_int(mode)
+    c_mindist = mindist
+
+    # Call wrapped function
+    _lib.igraph_neighborhood_graphs(c_graph, c_res, c_vids.unwrap(), c_order, c_mode, c_mindist)
+
+    # Prepare output arguments
+    res = igraph_graph_list_t_to_graph_list(c_res)
+
+    # Construct return value
+    return res
 
 
 def topological_sorting(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> IntArray:
     """Type-annotated wrapper for ``igraph_topological_sorting``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_topological_sorting(c_graph, c_res, c_mode)
+    _lib.igraph_topological_sorting(c_graph, c_res, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2526,6 +2846,8 @@ def topological_sorting(graph: Graph, mode: NeighborMode = NeighborMode.OUT) ->
 
 def feedback_arc_set(graph: Graph, weights: Optional[Iterable[float]] = None, algo: FeedbackArcSetAlgorithm = FeedbackArcSetAlgorithm.APPROX_EADES) -> IntArray:
     """Type-annotated wrapper for ``igraph_feedback_arc_set``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_result = _VectorInt.create(0)
@@ -2533,10 +2855,10 @@ def feedback_arc_set(graph: Graph, weights: Optional[Iterable[float]] = None, al
     c_algo = c_int(algo)
 
     # Call wrapped function
-    igraph_feedback_arc_set(c_graph, c_result, c_weights, c_algo)
+    _lib.igraph_feedback_arc_set(c_graph, c_result, c_weights, c_algo)
 
     # Prepare output arguments
-    result = igraph_vector_int_t_to_numpy_array(c_result)
+    result = igraph_vector_int_t_to_numpy_array_transfer(c_result)
 
     # Construct return value
     return result
@@ -2546,16 +2868,18 @@ def feedback_arc_set(graph: Graph, weights: Optional[Iterable[float]] = None, al
 
 def is_loop(graph: Graph, es: EdgeSelector = "all") -> BoolArray:
     """Type-annotated wrapper for ``igraph_is_loop``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorBool.create(0)
     c_es = edge_selector_to_igraph_es_t(es, graph)
 
     # Call wrapped function
-    igraph_is_loop(c_graph, c_res, c_es.unwrap())
+    _lib.igraph_is_loop(c_graph, c_res, c_es.unwrap())
 
     # Prepare output arguments
-    res = igraph_vector_bool_t_to_numpy_array(c_res)
+    res = igraph_vector_bool_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2563,12 +2887,14 @@ def is_loop(graph: Graph, es: EdgeSelector = "all") -> BoolArray:
 
 def is_dag(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_dag``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_dag(c_graph, c_res)
+    _lib.igraph_is_dag(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -2579,12 +2905,14 @@ def is_dag(graph: Graph) -> bool:
 
 def is_acyclic(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_acyclic``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_acyclic(c_graph, c_res)
+    _lib.igraph_is_acyclic(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -2595,13 +2923,15 @@ def is_acyclic(graph: Graph) -> bool:
 
 def is_simple(graph: Graph, directed: bool = True) -> bool:
     """Type-annotated wrapper for ``igraph_is_simple``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_is_simple(c_graph, c_res, c_directed)
+    _lib.igraph_is_simple(c_graph, c_res, c_directed)
 
     # Prepare output arguments
     res = c_res.value
@@ -2612,16 +2942,18 @@ def is_simple(graph: Graph, directed: bool = True) -> bool:
 
 def is_multiple(graph: Graph, es: EdgeSelector = "all") -> BoolArray:
     """Type-annotated wrapper for ``igraph_is_multiple``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorBool.create(0)
     c_es = edge_selector_to_igraph_es_t(es, graph)
 
     # Call wrapped function
-    igraph_is_multiple(c_graph, c_res, c_es.unwrap())
+    _lib.igraph_is_multiple(c_graph, c_res, c_es.unwrap())
 
     # Prepare output arguments
-    res = igraph_vector_bool_t_to_numpy_array(c_res)
+    res = igraph_vector_bool_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2629,12 +2961,14 @@ def is_multiple(graph: Graph, es: EdgeSelector = "all") -> BoolArray:
 
 def has_loop(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_has_loop``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_has_loop(c_graph, c_res)
+    _lib.igraph_has_loop(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -2645,12 +2979,14 @@ def has_loop(graph: Graph) -> bool:
 
 def has_multiple(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_has_multiple``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_has_multiple(c_graph, c_res)
+    _lib.igraph_has_multiple(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -2661,12 +2997,14 @@ def has_multiple(graph: Graph) -> bool:
 
 def count_loops(graph: Graph) -> int:
     """Type-annotated wrapper for ``igraph_count_loops``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_loop_count = igraph_int_t()
 
     # Call wrapped function
-    igraph_count_loops(c_graph, c_loop_count)
+    _lib.igraph_count_loops(c_graph, c_loop_count)
 
     # Prepare output arguments
     loop_count = c_loop_count.value
@@ -2677,16 +3015,18 @@ def count_loops(graph: Graph) -> int:
 
 def count_multiple(graph: Graph, es: EdgeSelector = "all") -> IntArray:
     """Type-annotated wrapper for ``igraph_count_multiple``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
     c_es = edge_selector_to_igraph_es_t(es, graph)
 
     # Call wrapped function
-    igraph_count_multiple(c_graph, c_res, c_es.unwrap())
+    _lib.igraph_count_multiple(c_graph, c_res, c_es.unwrap())
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2694,17 +3034,19 @@ def count_multiple(graph: Graph, es: EdgeSelector = "all") -> IntArray:
 
 def girth(graph: Graph) -> tuple[float, IntArray]:
     """Type-annotated wrapper for ``igraph_girth``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_girth = igraph_real_t()
     c_cycle = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_girth(c_graph, c_girth, c_cycle)
+    _lib.igraph_girth(c_graph, c_girth, c_cycle)
 
     # Prepare output arguments
     girth = c_girth.value
-    cycle = igraph_vector_int_t_to_numpy_array(c_cycle)
+    cycle = igraph_vector_int_t_to_numpy_array_transfer(c_cycle)
 
     # Construct return value
     return girth, cycle
@@ -2712,12 +3054,14 @@ def girth(graph: Graph) -> tuple[float, IntArray]:
 
 def is_perfect(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_perfect``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_perfect(c_graph, c_res)
+    _lib.igraph_is_perfect(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -2728,13 +3072,15 @@ def is_perfect(graph: Graph) -> bool:
 
 def add_edge(graph: Graph, from_: int, to: int) -> None:
     """Type-annotated wrapper for ``igraph_add_edge``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_from = from_
     c_to = to
 
     # Call wrapped function
-    igraph_add_edge(c_graph, c_from, c_to)
+    _lib.igraph_add_edge(c_graph, c_from, c_to)
 
 # igraph_eigenvector_centrality: no Python type known for type: ALL_VERTEX_QTY
 
@@ -2743,6 +3089,8 @@ def add_edge(graph: Graph, from_: int, to: int) -> None:
 
 def unfold_tree(graph: Graph, roots: Iterable[int], mode: NeighborMode = NeighborMode.ALL) -> tuple[Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_unfold_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_tree = _Graph()
@@ -2751,11 +3099,11 @@ def unfold_tree(graph: Graph, roots: Iterable[int], mode: NeighborMode = Neighbo
     c_vertex_index = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_unfold_tree(c_graph, c_tree, c_mode, c_roots, c_vertex_index)
+    _lib.igraph_unfold_tree(c_graph, c_tree, c_mode, c_roots, c_vertex_index)
 
     # Prepare output arguments
     tree = _create_graph_from_boxed(c_tree)
-    vertex_index = igraph_vector_int_t_to_numpy_array(c_vertex_index)
+    vertex_index = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_index)
 
     # Construct return value
     return tree, vertex_index
@@ -2763,6 +3111,8 @@ def unfold_tree(graph: Graph, roots: Iterable[int], mode: NeighborMode = Neighbo
 
 def is_mutual(graph: Graph, es: EdgeSelector = "all", loops: bool = True) -> BoolArray:
     """Type-annotated wrapper for ``igraph_is_mutual``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorBool.create(0)
@@ -2770,10 +3120,10 @@ def is_mutual(graph: Graph, es: EdgeSelector = "all", loops: bool = True) -> Boo
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_is_mutual(c_graph, c_res, c_es.unwrap(), c_loops)
+    _lib.igraph_is_mutual(c_graph, c_res, c_es.unwrap(), c_loops)
 
     # Prepare output arguments
-    res = igraph_vector_bool_t_to_numpy_array(c_res)
+    res = igraph_vector_bool_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2781,13 +3131,15 @@ def is_mutual(graph: Graph, es: EdgeSelector = "all", loops: bool = True) -> Boo
 
 def has_mutual(graph: Graph, loops: bool = True) -> bool:
     """Type-annotated wrapper for ``igraph_has_mutual``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_has_mutual(c_graph, c_res, c_loops)
+    _lib.igraph_has_mutual(c_graph, c_res, c_loops)
 
     # Prepare output arguments
     res = c_res.value
@@ -2798,17 +3150,19 @@ def has_mutual(graph: Graph, loops: bool = True) -> bool:
 
 def maximum_cardinality_search(graph: Graph) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_maximum_cardinality_search``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_alpha = _VectorInt.create(0)
     c_alpham1 = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_maximum_cardinality_search(c_graph, c_alpha, c_alpham1)
+    _lib.igraph_maximum_cardinality_search(c_graph, c_alpha, c_alpham1)
 
     # Prepare output arguments
-    alpha = igraph_vector_int_t_to_numpy_array(c_alpha)
-    alpham1 = igraph_vector_int_t_to_numpy_array(c_alpham1)
+    alpha = igraph_vector_int_t_to_numpy_array_transfer(c_alpha)
+    alpham1 = igraph_vector_int_t_to_numpy_array_transfer(c_alpham1)
 
     # Construct return value
     return alpha, alpham1
@@ -2816,6 +3170,8 @@ def maximum_cardinality_search(graph: Graph) -> tuple[IntArray, IntArray]:
 
 def is_chordal(graph: Graph, alpha: Optional[Iterable[int]] = None, alpham1: Optional[Iterable[VertexLike]] = None) -> tuple[bool, IntArray, Graph]:
     """Type-annotated wrapper for ``igraph_is_chordal``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_alpha = iterable_to_igraph_vector_int_t_view(alpha) if alpha is not None else None
@@ -2825,11 +3181,11 @@ def is_chordal(graph: Graph, alpha: Optional[Iterable[int]] = None, alpham1: Opt
     c_newgraph = _Graph()
 
     # Call wrapped function
-    igraph_is_chordal(c_graph, c_alpha, c_alpham1, c_chordal, c_fillin, c_newgraph)
+    _lib.igraph_is_chordal(c_graph, c_alpha, c_alpham1, c_chordal, c_fillin, c_newgraph)
 
     # Prepare output arguments
     chordal = c_chordal.value
-    fillin = igraph_vector_int_t_to_numpy_array(c_fillin)
+    fillin = igraph_vector_int_t_to_numpy_array_transfer(c_fillin)
     newgraph = _create_graph_from_boxed(c_newgraph)
 
     # Construct return value
@@ -2838,6 +3194,8 @@ def is_chordal(graph: Graph, alpha: Optional[Iterable[int]] = None, alpham1: Opt
 
 def avg_nearest_neighbor_degree(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL, neighbor_degree_mode: NeighborMode = NeighborMode.ALL, weights: Optional[Iterable[float]] = None) -> tuple[RealArray, RealArray]:
     """Type-annotated wrapper for ``igraph_avg_nearest_neighbor_degree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
@@ -2848,11 +3206,11 @@ def avg_nearest_neighbor_degree(graph: Graph, vids: VertexSelector = "all", mode
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
 
     # Call wrapped function
-    igraph_avg_nearest_neighbor_degree(c_graph, c_vids.unwrap(), c_mode, c_neighbor_degree_mode, c_knn, c_knnk, c_weights)
+    _lib.igraph_avg_nearest_neighbor_degree(c_graph, c_vids.unwrap(), c_mode, c_neighbor_degree_mode, c_knn, c_knnk, c_weights)
 
     # Prepare output arguments
-    knn = igraph_vector_t_to_numpy_array(c_knn)
-    knnk = igraph_vector_t_to_numpy_array(c_knnk)
+    knn = igraph_vector_t_to_numpy_array_transfer(c_knn)
+    knnk = igraph_vector_t_to_numpy_array_transfer(c_knnk)
 
     # Construct return value
     return knn, knnk
@@ -2860,6 +3218,8 @@ def avg_nearest_neighbor_degree(graph: Graph, vids: VertexSelector = "all", mode
 
 def degree_correlation_vector(graph: Graph, weights: Optional[Iterable[float]] = None, from_mode: NeighborMode = NeighborMode.OUT, to_mode: NeighborMode = NeighborMode.IN, directed_neighbors: bool = True) -> RealArray:
     """Type-annotated wrapper for ``igraph_degree_correlation_vector``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2869,10 +3229,10 @@ def degree_correlation_vector(graph: Graph, weights: Optional[Iterable[float]] =
     c_directed_neighbors = any_to_igraph_bool_t(directed_neighbors)
 
     # Call wrapped function
-    igraph_degree_correlation_vector(c_graph, c_weights, c_knnk, c_from_mode, c_to_mode, c_directed_neighbors)
+    _lib.igraph_degree_correlation_vector(c_graph, c_weights, c_knnk, c_from_mode, c_to_mode, c_directed_neighbors)
 
     # Prepare output arguments
-    knnk = igraph_vector_t_to_numpy_array(c_knnk)
+    knnk = igraph_vector_t_to_numpy_array_transfer(c_knnk)
 
     # Construct return value
     return knnk
@@ -2880,6 +3240,8 @@ def degree_correlation_vector(graph: Graph, weights: Optional[Iterable[float]] =
 
 def rich_club_sequence(graph: Graph, vertex_order: Iterable[int], weights: Optional[Iterable[float]] = None, normalized: bool = True, loops: bool = False, directed: bool = True) -> RealArray:
     """Type-annotated wrapper for ``igraph_rich_club_sequence``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -2890,10 +3252,10 @@ def rich_club_sequence(graph: Graph, vertex_order: Iterable[int], weights: Optio
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_rich_club_sequence(c_graph, c_weights, c_res, c_vertex_order, c_normalized, c_loops, c_directed)
+    _lib.igraph_rich_club_sequence(c_graph, c_weights, c_res, c_vertex_order, c_normalized, c_loops, c_directed)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2901,6 +3263,8 @@ def rich_club_sequence(graph: Graph, vertex_order: Iterable[int], weights: Optio
 
 def strength(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: Loops = Loops.TWICE, weights: Optional[Iterable[float]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_strength``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2910,10 +3274,10 @@ def strength(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = Ne
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
 
     # Call wrapped function
-    igraph_strength(c_graph, c_res, c_vids.unwrap(), c_mode, c_loops, c_weights)
+    _lib.igraph_strength(c_graph, c_res, c_vids.unwrap(), c_mode, c_loops, c_weights)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -2921,13 +3285,15 @@ def strength(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = Ne
 
 def centralization(scores: Iterable[float], theoretical_max: float = 0, normalized: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_centralization``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_scores = iterable_to_igraph_vector_t_view(scores)
     c_theoretical_max = theoretical_max
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    c__result = igraph_centralization(c_scores, c_theoretical_max, c_normalized)
+    c__result = _lib.igraph_centralization(c_scores, c_theoretical_max, c_normalized)
 
     # Construct return value
     return c__result
@@ -2935,6 +3301,8 @@ def centralization(scores: Iterable[float], theoretical_max: float = 0, normaliz
 
 def centralization_degree(graph: Graph, mode: NeighborMode = NeighborMode.ALL, loops: Loops = Loops.TWICE, normalized: bool = True) -> tuple[RealArray, float, float]:
     """Type-annotated wrapper for ``igraph_centralization_degree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2945,10 +3313,10 @@ def centralization_degree(graph: Graph, mode: NeighborMode = NeighborMode.ALL, l
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_centralization_degree(c_graph, c_res, c_mode, c_loops, c_centralization, c_theoretical_max, c_normalized)
+    _lib.igraph_centralization_degree(c_graph, c_res, c_mode, c_loops, c_centralization, c_theoretical_max, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
     centralization = c_centralization.value
     theoretical_max = c_theoretical_max.value
 
@@ -2958,6 +3326,8 @@ def centralization_degree(graph: Graph, mode: NeighborMode = NeighborMode.ALL, l
 
 def centralization_degree_tmax(loops: Loops, graph: Optional[Graph] = None, nodes: int = 0, mode: NeighborMode = NeighborMode.ALL) -> float:
     """Type-annotated wrapper for ``igraph_centralization_degree_tmax``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph if graph is not None else None
     c_nodes = nodes
@@ -2966,7 +3336,7 @@ def centralization_degree_tmax(loops: Loops, graph: Optional[Graph] = None, node
     c_res = igraph_real_t()
 
     # Call wrapped function
-    igraph_centralization_degree_tmax(c_graph, c_nodes, c_mode, c_loops, c_res)
+    _lib.igraph_centralization_degree_tmax(c_graph, c_nodes, c_mode, c_loops, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -2977,6 +3347,8 @@ def centralization_degree_tmax(loops: Loops, graph: Optional[Graph] = None, node
 
 def centralization_betweenness(graph: Graph, directed: bool = True, normalized: bool = True) -> tuple[RealArray, float, float]:
     """Type-annotated wrapper for ``igraph_centralization_betweenness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -2986,10 +3358,10 @@ def centralization_betweenness(graph: Graph, directed: bool = True, normalized:
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_centralization_betweenness(c_graph, c_res, c_directed, c_centralization, c_theoretical_max, c_normalized)
+    _lib.igraph_centralization_betweenness(c_graph, c_res, c_directed, c_centralization, c_theoretical_max, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
     centralization = c_centralization.value
     theoretical_max = c_theoretical_max.value
 
@@ -2999,6 +3371,8 @@ def centralization_betweenness(graph: Graph, directed: bool = True, normalized:
 
 def centralization_betweenness_tmax(graph: Optional[Graph] = None, nodes: int = 0, directed: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_centralization_betweenness_tmax``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph if graph is not None else None
     c_nodes = nodes
@@ -3006,7 +3380,7 @@ def centralization_betweenness_tmax(graph: Optional[Graph] = None, nodes: int =
     c_res = igraph_real_t()
 
     # Call wrapped function
-    igraph_centralization_betweenness_tmax(c_graph, c_nodes, c_directed, c_res)
+    _lib.igraph_centralization_betweenness_tmax(c_graph, c_nodes, c_directed, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -3017,6 +3391,8 @@ def centralization_betweenness_tmax(graph: Optional[Graph] = None, nodes: int =
 
 def centralization_closeness(graph: Graph, mode: NeighborMode = NeighborMode.OUT, normalized: bool = True) -> tuple[RealArray, float, float]:
     """Type-annotated wrapper for ``igraph_centralization_closeness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -3026,10 +3402,10 @@ def centralization_closeness(graph: Graph, mode: NeighborMode = NeighborMode.OUT
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_centralization_closeness(c_graph, c_res, c_mode, c_centralization, c_theoretical_max, c_normalized)
+    _lib.igraph_centralization_closeness(c_graph, c_res, c_mode, c_centralization, c_theoretical_max, c_normalized)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
     centralization = c_centralization.value
     theoretical_max = c_theoretical_max.value
 
@@ -3039,6 +3415,8 @@ def centralization_closeness(graph: Graph, mode: NeighborMode = NeighborMode.OUT
 
 def centralization_closeness_tmax(graph: Optional[Graph] = None, nodes: int = 0, mode: NeighborMode = NeighborMode.OUT) -> float:
     """Type-annotated wrapper for ``igraph_centralization_closeness_tmax``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph if graph is not None else None
     c_nodes = nodes
@@ -3046,7 +3424,7 @@ def centralization_closeness_tmax(graph: Optional[Graph] = None, nodes: int = 0,
     c_res = igraph_real_t()
 
     # Call wrapped function
-    igraph_centralization_closeness_tmax(c_graph, c_nodes, c_mode, c_res)
+    _lib.igraph_centralization_closeness_tmax(c_graph, c_nodes, c_mode, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -3059,6 +3437,8 @@ def centralization_closeness_tmax(graph: Optional[Graph] = None, nodes: int = 0,
 
 def centralization_eigenvector_centrality_tmax(graph: Optional[Graph] = None, nodes: int = 0, mode: NeighborMode = NeighborMode.OUT) -> float:
     """Type-annotated wrapper for ``igraph_centralization_eigenvector_centrality_tmax``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph if graph is not None else None
     c_nodes = nodes
@@ -3066,7 +3446,7 @@ def centralization_eigenvector_centrality_tmax(graph: Optional[Graph] = None, no
     c_res = igraph_real_t()
 
     # Call wrapped function
-    igraph_centralization_eigenvector_centrality_tmax(c_graph, c_nodes, c_mode, c_res)
+    _lib.igraph_centralization_eigenvector_centrality_tmax(c_graph, c_nodes, c_mode, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -3077,6 +3457,8 @@ def centralization_eigenvector_centrality_tmax(graph: Optional[Graph] = None, no
 
 def assortativity_nominal(graph: Graph, types: Iterable[int], weights: Optional[Iterable[float]] = None, directed: bool = True, normalized: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_assortativity_nominal``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3086,7 +3468,7 @@ def assortativity_nominal(graph: Graph, types: Iterable[int], weights: Optional[
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_assortativity_nominal(c_graph, c_weights, c_types, c_res, c_directed, c_normalized)
+    _lib.igraph_assortativity_nominal(c_graph, c_weights, c_types, c_res, c_directed, c_normalized)
 
     # Prepare output arguments
     res = c_res.value
@@ -3097,6 +3479,8 @@ def assortativity_nominal(graph: Graph, types: Iterable[int], weights: Optional[
 
 def assortativity(graph: Graph, values: Iterable[float], weights: Optional[Iterable[float]] = None, values_in: Optional[Iterable[float]] = None, directed: bool = True, normalized: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_assortativity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3107,7 +3491,7 @@ def assortativity(graph: Graph, values: Iterable[float], weights: Optional[Itera
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_assortativity(c_graph, c_weights, c_values, c_values_in, c_res, c_directed, c_normalized)
+    _lib.igraph_assortativity(c_graph, c_weights, c_values, c_values_in, c_res, c_directed, c_normalized)
 
     # Prepare output arguments
     res = c_res.value
@@ -3118,13 +3502,15 @@ def assortativity(graph: Graph, values: Iterable[float], weights: Optional[Itera
 
 def assortativity_degree(graph: Graph, directed: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_assortativity_degree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_assortativity_degree(c_graph, c_res, c_directed)
+    _lib.igraph_assortativity_degree(c_graph, c_res, c_directed)
 
     # Prepare output arguments
     res = c_res.value
@@ -3135,18 +3521,20 @@ def assortativity_degree(graph: Graph, directed: bool = True) -> float:
 
 def joint_degree_matrix(graph: Graph, weights: Optional[Iterable[float]] = None, max_out_degree: int = -1, max_in_degree: int = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_joint_degree_matrix``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_jdm = _Matrix.create(0)
+    c_jdm = _Matrix.create(0, 0)
     c_max_out_degree = max_out_degree
     c_max_in_degree = max_in_degree
 
     # Call wrapped function
-    igraph_joint_degree_matrix(c_graph, c_weights, c_jdm, c_max_out_degree, c_max_in_degree)
+    _lib.igraph_joint_degree_matrix(c_graph, c_weights, c_jdm, c_max_out_degree, c_max_in_degree)
 
     # Prepare output arguments
-    jdm = igraph_matrix_t_to_numpy_array(c_jdm)
+    jdm = igraph_matrix_t_to_numpy_array_transfer(c_jdm)
 
     # Construct return value
     return jdm
@@ -3154,10 +3542,12 @@ def joint_degree_matrix(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def joint_degree_distribution(graph: Graph, weights: Optional[Iterable[float]] = None, from_mode: NeighborMode = NeighborMode.OUT, to_mode: NeighborMode = NeighborMode.IN, directed_neighbors: bool = True, normalized: bool = True, max_from_degree: int = -1, max_to_degree: int = -1) -> RealArray:
     """Type-annotated wrapper for ``igraph_joint_degree_distribution``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_p = _Matrix.create(0)
+    c_p = _Matrix.create(0, 0)
     c_from_mode = c_int(from_mode)
     c_to_mode = c_int(to_mode)
     c_directed_neighbors = any_to_igraph_bool_t(directed_neighbors)
@@ -3166,10 +3556,10 @@ def joint_degree_distribution(graph: Graph, weights: Optional[Iterable[float]] =
     c_max_to_degree = max_to_degree
 
     # Call wrapped function
-    igraph_joint_degree_distribution(c_graph, c_weights, c_p, c_from_mode, c_to_mode, c_directed_neighbors, c_normalized, c_max_from_degree, c_max_to_degree)
+    _lib.igraph_joint_degree_distribution(c_graph, c_weights, c_p, c_from_mode, c_to_mode, c_directed_neighbors, c_normalized, c_max_from_degree, c_max_to_degree)
 
     # Prepare output arguments
-    p = igraph_matrix_t_to_numpy_array(c_p)
+    p = igraph_matrix_t_to_numpy_array_transfer(c_p)
 
     # Construct return value
     return p
@@ -3177,20 +3567,22 @@ def joint_degree_distribution(graph: Graph, weights: Optional[Iterable[float]] =
 
 def joint_type_distribution(graph: Graph, from_types: Iterable[int], weights: Optional[Iterable[float]] = None, to_types: Optional[Iterable[int]] = None, directed: bool = True, normalized: bool = True) -> RealArray:
     """Type-annotated wrapper for ``igraph_joint_type_distribution``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_p = _Matrix.create(0)
+    c_p = _Matrix.create(0, 0)
     c_from_types = iterable_to_igraph_vector_int_t_view(from_types)
     c_to_types = iterable_to_igraph_vector_int_t_view(to_types) if to_types is not None else None
     c_directed = any_to_igraph_bool_t(directed)
     c_normalized = any_to_igraph_bool_t(normalized)
 
     # Call wrapped function
-    igraph_joint_type_distribution(c_graph, c_weights, c_p, c_from_types, c_to_types, c_directed, c_normalized)
+    _lib.igraph_joint_type_distribution(c_graph, c_weights, c_p, c_from_types, c_to_types, c_directed, c_normalized)
 
     # Prepare output arguments
-    p = igraph_matrix_t_to_numpy_array(c_p)
+    p = igraph_matrix_t_to_numpy_array_transfer(c_p)
 
     # Construct return value
     return p
@@ -3198,17 +3590,21 @@ def joint_type_distribution(graph: Graph, from_types: Iterable[int], weights: Op
 
 def contract_vertices(graph: Graph, mapping: Iterable[int], vertex_attr_comb: Optional[AttributeCombinationSpecification] = None) -> None:
     """Type-annotated wrapper for ``igraph_contract_vertices``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_mapping = iterable_to_igraph_vector_int_t_view(mapping)
     c_vertex_attr_comb = mapping_to_attribute_combination_t(vertex_attr_comb)
 
     # Call wrapped function
-    igraph_contract_vertices(c_graph, c_mapping, c_vertex_attr_comb)
+    _lib.igraph_contract_vertices(c_graph, c_mapping, c_vertex_attr_comb)
 
 
 def eccentricity(graph: Graph, weights: Optional[Iterable[float]] = None, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL) -> RealArray:
     """Type-annotated wrapper for ``igraph_eccentricity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3217,10 +3613,10 @@ def eccentricity(graph: Graph, weights: Optional[Iterable[float]] = None, vids:
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_eccentricity(c_graph, c_weights, c_res, c_vids.unwrap(), c_mode)
+    _lib.igraph_eccentricity(c_graph, c_weights, c_res, c_vids.unwrap(), c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -3228,6 +3624,8 @@ def eccentricity(graph: Graph, weights: Optional[Iterable[float]] = None, vids:
 
 def graph_center(graph: Graph, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.ALL) -> IntArray:
     """Type-annotated wrapper for ``igraph_graph_center``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3235,10 +3633,10 @@ def graph_center(graph: Graph, weights: Optional[Iterable[float]] = None, mode:
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_graph_center(c_graph, c_weights, c_res, c_mode)
+    _lib.igraph_graph_center(c_graph, c_weights, c_res, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -3246,6 +3644,8 @@ def graph_center(graph: Graph, weights: Optional[Iterable[float]] = None, mode:
 
 def radius(graph: Graph, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.ALL) -> float:
     """Type-annotated wrapper for ``igraph_radius``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3253,7 +3653,7 @@ def radius(graph: Graph, weights: Optional[Iterable[float]] = None, mode: Neighb
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_radius(c_graph, c_weights, c_radius, c_mode)
+    _lib.igraph_radius(c_graph, c_weights, c_radius, c_mode)
 
     # Prepare output arguments
     radius = c_radius.value
@@ -3264,6 +3664,8 @@ def radius(graph: Graph, weights: Optional[Iterable[float]] = None, mode: Neighb
 
 def pseudo_diameter(graph: Graph, start_vid: VertexLike, weights: Optional[Iterable[float]] = None, directed: bool = True, unconnected: bool = True) -> tuple[float, int, int]:
     """Type-annotated wrapper for ``igraph_pseudo_diameter``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3275,7 +3677,7 @@ def pseudo_diameter(graph: Graph, start_vid: VertexLike, weights: Optional[Itera
     c_unconnected = any_to_igraph_bool_t(unconnected)
 
     # Call wrapped function
-    igraph_pseudo_diameter(c_graph, c_weights, c_diameter, c_start_vid, c_from, c_to, c_directed, c_unconnected)
+    _lib.igraph_pseudo_diameter(c_graph, c_weights, c_diameter, c_start_vid, c_from, c_to, c_directed, c_unconnected)
 
     # Prepare output arguments
     diameter = c_diameter.value
@@ -3288,6 +3690,8 @@ def pseudo_diameter(graph: Graph, start_vid: VertexLike, weights: Optional[Itera
 
 def diversity(graph: Graph, weights: Optional[Iterable[float]] = None, vids: VertexSelector = "all") -> RealArray:
     """Type-annotated wrapper for ``igraph_diversity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3295,10 +3699,10 @@ def diversity(graph: Graph, weights: Optional[Iterable[float]] = None, vids: Ver
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
 
     # Call wrapped function
-    igraph_diversity(c_graph, c_weights, c_res, c_vids.unwrap())
+    _lib.igraph_diversity(c_graph, c_weights, c_res, c_vids.unwrap())
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -3306,6 +3710,8 @@ def diversity(graph: Graph, weights: Optional[Iterable[float]] = None, vids: Ver
 
 def random_walk(graph: Graph, start: VertexLike, steps: int, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, stuck: RandomWalkStuck = RandomWalkStuck.RETURN) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_random_walk``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3317,11 +3723,11 @@ def random_walk(graph: Graph, start: VertexLike, steps: int, weights: Optional[I
     c_stuck = c_int(stuck)
 
     # Call wrapped function
-    igraph_random_walk(c_graph, c_weights, c_vertices, c_edges, c_start, c_mode, c_steps, c_stuck)
+    _lib.igraph_random_walk(c_graph, c_weights, c_vertices, c_edges, c_start, c_mode, c_steps, c_stuck)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_t_to_numpy_array(c_vertices)
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    vertices = igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return vertices, edges
@@ -3329,6 +3735,8 @@ def random_walk(graph: Graph, start: VertexLike, steps: int, weights: Optional[I
 
 def global_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, directed: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_global_efficiency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3336,7 +3744,7 @@ def global_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, d
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_global_efficiency(c_graph, c_weights, c_res, c_directed)
+    _lib.igraph_global_efficiency(c_graph, c_weights, c_res, c_directed)
 
     # Prepare output arguments
     res = c_res.value
@@ -3347,6 +3755,8 @@ def global_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, d
 
 def local_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, vids: VertexSelector = "all", directed: bool = True, mode: NeighborMode = NeighborMode.ALL) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_efficiency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3356,10 +3766,10 @@ def local_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, vi
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_efficiency(c_graph, c_weights, c_res, c_vids.unwrap(), c_directed, c_mode)
+    _lib.igraph_local_efficiency(c_graph, c_weights, c_res, c_vids.unwrap(), c_directed, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -3367,6 +3777,8 @@ def local_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, vi
 
 def average_local_efficiency(graph: Graph, weights: Optional[Iterable[float]] = None, directed: bool = True, mode: NeighborMode = NeighborMode.ALL) -> float:
     """Type-annotated wrapper for ``igraph_average_local_efficiency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -3375,7 +3787,7 @@ def average_local_efficiency(graph: Graph, weights: Optional[Iterable[float]] =
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_average_local_efficiency(c_graph, c_weights, c_res, c_directed, c_mode)
+    _lib.igraph_average_local_efficiency(c_graph, c_weights, c_res, c_directed, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -3386,12 +3798,14 @@ def average_local_efficiency(graph: Graph, weights: Optional[Iterable[float]] =
 
 def transitive_closure(graph: Graph) -> Graph:
     """Type-annotated wrapper for ``igraph_transitive_closure``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_closure = _Graph()
 
     # Call wrapped function
-    igraph_transitive_closure(c_graph, c_closure)
+    _lib.igraph_transitive_closure(c_graph, c_closure)
 
     # Prepare output arguments
     closure = _create_graph_from_boxed(c_closure)
@@ -3402,15 +3816,17 @@ def transitive_closure(graph: Graph) -> Graph:
 
 def trussness(graph: Graph) -> IntArray:
     """Type-annotated wrapper for ``igraph_trussness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_trussness = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_trussness(c_graph, c_trussness)
+    _lib.igraph_trussness(c_graph, c_trussness)
 
     # Prepare output arguments
-    trussness = igraph_vector_int_t_to_numpy_array(c_trussness)
+    trussness = igraph_vector_int_t_to_numpy_array_transfer(c_trussness)
 
     # Construct return value
     return trussness
@@ -3419,11 +3835,10 @@ def trussness(graph: Graph) -> IntArray:
 
 # igraph_is_graphical: no Python type known for type: EDGE_TYPE_SW
 
-# igraph_bfs: no Python type known for type: BFS_FUNC
-
-
 def bfs_simple(graph: Graph, root: VertexLike, mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_bfs_simple``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_root = vertexlike_to_igraph_int_t(root)
@@ -3433,21 +3848,20 @@ def bfs_simple(graph: Graph, root: VertexLike, mode: NeighborMode = NeighborMode
     c_parents = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_bfs_simple(c_graph, c_root, c_mode, c_order, c_layers, c_parents)
+    _lib.igraph_bfs_simple(c_graph, c_root, c_mode, c_order, c_layers, c_parents)
 
     # Prepare output arguments
-    order = igraph_vector_int_t_to_numpy_array(c_order)
-    layers = igraph_vector_int_t_to_numpy_array(c_layers)
-    parents = igraph_vector_int_t_to_numpy_array(c_parents)
+    order = igraph_vector_int_t_to_numpy_array_transfer(c_order)
+    layers = igraph_vector_int_t_to_numpy_array_transfer(c_layers)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
 
     # Construct return value
     return order, layers, parents
 
-# igraph_dfs: no Python type known for type: DFS_FUNC
-
-
 def bipartite_projection_size(graph: Graph, types: Iterable[Any]) -> tuple[int, int, int, int]:
     """Type-annotated wrapper for ``igraph_bipartite_projection_size``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None
@@ -3457,7 +3871,7 @@ def bipartite_projection_size(graph: Graph, types: Iterable[Any]) -> tuple[int,
     c_ecount2 = igraph_int_t()
 
     # Call wrapped function
-    igraph_bipartite_projection_size(c_graph, c_types, c_vcount1, c_ecount1, c_vcount2, c_ecount2)
+    _lib.igraph_bipartite_projection_size(c_graph, c_types, c_vcount1, c_ecount1, c_vcount2, c_ecount2)
 
     # Prepare output arguments
     vcount1 = c_vcount1.value
@@ -3471,6 +3885,8 @@ def bipartite_projection_size(graph: Graph, types: Iterable[Any]) -> tuple[int,
 
 def bipartite_projection(graph: Graph, types: Iterable[Any], probe1: int = -1) -> tuple[Graph, Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_bipartite_projection``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None
@@ -3481,13 +3897,13 @@ def bipartite_projection(graph: Graph, types: Iterable[Any], probe1: int = -1) -
     c_probe1 = probe1
 
     # Call wrapped function
-    igraph_bipartite_projection(c_graph, c_types, c_proj1, c_proj2, c_multiplicity1, c_multiplicity2, c_probe1)
+    _lib.igraph_bipartite_projection(c_graph, c_types, c_proj1, c_proj2, c_multiplicity1, c_multiplicity2, c_probe1)
 
     # Prepare output arguments
     proj1 = _create_graph_from_boxed(c_proj1)
     proj2 = _create_graph_from_boxed(c_proj2)
-    multiplicity1 = igraph_vector_int_t_to_numpy_array(c_multiplicity1)
-    multiplicity2 = igraph_vector_int_t_to_numpy_array(c_multiplicity2)
+    multiplicity1 = igraph_vector_int_t_to_numpy_array_transfer(c_multiplicity1)
+    multiplicity2 = igraph_vector_int_t_to_numpy_array_transfer(c_multiplicity2)
 
     # Construct return value
     return proj1, proj2, multiplicity1, multiplicity2
@@ -3495,6 +3911,8 @@ def bipartite_projection(graph: Graph, types: Iterable[Any], probe1: int = -1) -
 
 def create_bipartite(types: Iterable[Any], edges: Iterable[int], directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_create_bipartite``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None
@@ -3502,7 +3920,7 @@ def create_bipartite(types: Iterable[Any], edges: Iterable[int], directed: bool
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_create_bipartite(c_graph, c_types, c_edges, c_directed)
+    _lib.igraph_create_bipartite(c_graph, c_types, c_edges, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -3513,6 +3931,8 @@ def create_bipartite(types: Iterable[Any], edges: Iterable[int], directed: bool
 
 def biadjacency(biadjmatrix: MatrixLike, directed: bool = False, mode: NeighborMode = NeighborMode.ALL, multiple: bool = False) -> tuple[Graph, BoolArray]:
     """Type-annotated wrapper for ``igraph_biadjacency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = _VectorBool.create(0)
@@ -3522,7 +3942,7 @@ def biadjacency(biadjmatrix: MatrixLike, directed: bool = False, mode: NeighborM
     c_multiple = any_to_igraph_bool_t(multiple)
 
     # Call wrapped function
-    igraph_biadjacency(c_graph, c_types, c_biadjmatrix, c_directed, c_mode, c_multiple)
+    _lib.igraph_biadjacency(c_graph, c_types, c_biadjmatrix, c_directed, c_mode, c_multiple)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -3534,6 +3954,8 @@ def biadjacency(biadjmatrix: MatrixLike, directed: bool = False, mode: NeighborM
 
 def weighted_biadjacency(biadjmatrix: MatrixLike, directed: bool = False, mode: NeighborMode = NeighborMode.ALL) -> tuple[Graph, BoolArray, RealArray]:
     """Type-annotated wrapper for ``igraph_weighted_biadjacency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = _VectorBool.create(0)
@@ -3543,12 +3965,12 @@ def weighted_biadjacency(biadjmatrix: MatrixLike, directed: bool = False, mode:
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_weighted_biadjacency(c_graph, c_types, c_weights, c_biadjmatrix, c_directed, c_mode)
+    _lib.igraph_weighted_biadjacency(c_graph, c_types, c_weights, c_biadjmatrix, c_directed, c_mode)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
     types = c_types.value
-    weights = igraph_vector_t_to_numpy_array(c_weights)
+    weights = igraph_vector_t_to_numpy_array_transfer(c_weights)
 
     # Construct return value
     return graph, types, weights
@@ -3556,21 +3978,23 @@ def weighted_biadjacency(biadjmatrix: MatrixLike, directed: bool = False, mode:
 
 def get_biadjacency(graph: Graph, types: Iterable[Any], weights: Optional[Iterable[float]] = None) -> tuple[RealArray, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_get_biadjacency``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_row_ids = _VectorInt.create(0)
     c_col_ids = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_get_biadjacency(c_graph, c_types, c_weights, c_res, c_row_ids, c_col_ids)
+    _lib.igraph_get_biadjacency(c_graph, c_types, c_weights, c_res, c_row_ids, c_col_ids)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
-    row_ids = igraph_vector_int_t_to_numpy_array(c_row_ids)
-    col_ids = igraph_vector_int_t_to_numpy_array(c_col_ids)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
+    row_ids = igraph_vector_int_t_to_numpy_array_transfer(c_row_ids)
+    col_ids = igraph_vector_int_t_to_numpy_array_transfer(c_col_ids)
 
     # Construct return value
     return res, row_ids, col_ids
@@ -3578,13 +4002,15 @@ def get_biadjacency(graph: Graph, types: Iterable[Any], weights: Optional[Iterab
 
 def is_bipartite(graph: Graph) -> tuple[bool, BoolArray]:
     """Type-annotated wrapper for ``igraph_is_bipartite``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
     c_types = _VectorBool.create(0)
 
     # Call wrapped function
-    igraph_is_bipartite(c_graph, c_res, c_types)
+    _lib.igraph_is_bipartite(c_graph, c_res, c_types)
 
     # Prepare output arguments
     res = c_res.value
@@ -3600,6 +4026,8 @@ def is_bipartite(graph: Graph) -> tuple[bool, BoolArray]:
 
 def bipartite_iea_game(n1: int, n2: int, m: int, directed: bool = False, mode: NeighborMode = NeighborMode.ALL) -> tuple[Graph, BoolArray]:
     """Type-annotated wrapper for ``igraph_bipartite_iea_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_types = _VectorBool.create(0)
@@ -3610,7 +4038,7 @@ def bipartite_iea_game(n1: int, n2: int, m: int, directed: bool = False, mode: N
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_bipartite_iea_game(c_graph, c_types, c_n1, c_n2, c_m, c_directed, c_mode)
+    _lib.igraph_bipartite_iea_game(c_graph, c_types, c_n1, c_n2, c_m, c_directed, c_mode)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -3619,41 +4047,83 @@ def bipartite_iea_game(n1: int, n2: int, m: int, directed: bool = False, mode: N
     # Construct return value
     return graph, types
 
-# igraph_get_laplacian: no Python type known for type: LAPLACIAN_NORMALIZATION
 
-# igraph_get_laplacian_sparse: no Python type known for type: SPARSEMAT
+def get_laplacian(graph: Graph, mode: NeighborMode = NeighborMode.OUT, normalization: LaplacianNormalization = LaplacianNormalization.UNNORMALIZED, weights: Optional[Iterable[float]] = None) -> RealArray:
+    """Type-annotated wrapper for ``igraph_get_laplacian``."""
+    ensure_thread_is_set_up()
 
-
-def connected_components(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> tuple[IntArray, IntArray, int]:
-    """Type-annotated wrapper for ``igraph_connected_components``."""
     # Prepare input arguments
     c_graph = graph
-    c_membership = _VectorInt.create(0)
-    c_csize = _VectorInt.create(0)
-    c_no = igraph_int_t()
+    c_res = _Matrix.create(0, 0)
     c_mode = c_int(mode)
+    c_normalization = c_int(normalization)
+    c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
 
     # Call wrapped function
-    igraph_connected_components(c_graph, c_membership, c_csize, c_no, c_mode)
+    _lib.igraph_get_laplacian(c_graph, c_res, c_mode, c_normalization, c_weights)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    csize = igraph_vector_int_t_to_numpy_array(c_csize)
-    no = c_no.value
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
-    return membership, csize, no
+    return res
 
 
-def is_connected(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> bool:
-    """Type-annotated wrapper for ``igraph_is_connected``."""
+def get_laplacian_sparse(graph: Graph, mode: NeighborMode = NeighborMode.OUT, normalization: LaplacianNormalization = LaplacianNormalization.UNNORMALIZED, weights: Optional[Iterable[float]] = None) -> SparseMatrix:
+    """Type-annotated wrapper for ``igraph_get_laplacian_sparse``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_sparseres = _SparseMat.create(0, 0, 0)
+    c_mode = c_int(mode)
+    c_normalization = c_int(normalization)
+    c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
+
+    # Call wrapped function
+    _lib.igraph_get_laplacian_sparse(c_graph, c_sparseres, c_mode, c_normalization, c_weights)
+
+    # Prepare output arguments
+    sparseres = igraph_sparsemat_t_to_scipy_sparse_transfer(c_sparseres)
+
+    # Construct return value
+    return sparseres
+
+
+def connected_components(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> tuple[IntArray, IntArray, int]:
+    """Type-annotated wrapper for ``igraph_connected_components``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_membership = _VectorInt.create(0)
+    c_csize = _VectorInt.create(0)
+    c_no = igraph_int_t()
+    c_mode = c_int(mode)
+
+    # Call wrapped function
+    _lib.igraph_connected_components(c_graph, c_membership, c_csize, c_no, c_mode)
+
+    # Prepare output arguments
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    csize = igraph_vector_int_t_to_numpy_array_transfer(c_csize)
+    no = c_no.value
+
+    # Construct return value
+    return membership, csize, no
+
+
+def is_connected(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> bool:
+    """Type-annotated wrapper for ``igraph_is_connected``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_is_connected(c_graph, c_res, c_mode)
+    _lib.igraph_is_connected(c_graph, c_res, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -3661,27 +4131,50 @@ def is_connected(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> bool
     # Construct return value
     return res
 
-# igraph_decompose: no Python type known for type: GRAPH_LIST
+
+def decompose(graph: Graph, mode: Connectedness = Connectedness.WEAK, maxcompno: int = -1, minelements: int = 1) -> GraphList:
+    """Type-annotated wrapper for ``igraph_decompose``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_components = _GraphList.create(0)
+    c_mode = c_int(mode)
+    c_maxcompno = maxcompno
+    c_minelements = minelements
+
+    # Call wrapped function
+    _lib.igraph_decompose(c_graph, c_components, c_mode, c_maxcompno, c_minelements)
+
+    # Prepare output arguments
+    components = igraph_graph_list_t_to_graph_list(c_components)
+
+    # Construct return value
+    return components
 
 
 def articulation_points(graph: Graph) -> IntArray:
     """Type-annotated wrapper for ``igraph_articulation_points``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_articulation_points(c_graph, c_res)
+    _lib.igraph_articulation_points(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
 
 
-def biconnected_components(graph: Graph) -> tuple[int, list[IntArray], list[IntArray], list[IntArray], IntArray]:
+def biconnected_components(graph: Graph, flat: bool = False) -> tuple[int, list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList, IntArray]:
     """Type-annotated wrapper for ``igraph_biconnected_components``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_no = igraph_int_t()
@@ -3691,14 +4184,14 @@ def biconnected_components(graph: Graph) -> tuple[int, list[IntArray], list[IntA
     c_articulation_points = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_biconnected_components(c_graph, c_no, c_tree_edges, c_component_edges, c_components, c_articulation_points)
+    _lib.igraph_biconnected_components(c_graph, c_no, c_tree_edges, c_component_edges, c_components, c_articulation_points)
 
     # Prepare output arguments
     no = c_no.value
-    tree_edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_tree_edges)
-    component_edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_component_edges)
-    components = igraph_vector_int_list_t_to_list_of_numpy_array(c_components)
-    articulation_points = igraph_vector_int_t_to_numpy_array(c_articulation_points)
+    tree_edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_tree_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_tree_edges)
+    component_edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_component_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_component_edges)
+    components = igraph_vector_int_list_t_to_flat_numpy_arrays(c_components) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_components)
+    articulation_points = igraph_vector_int_t_to_numpy_array_transfer(c_articulation_points)
 
     # Construct return value
     return no, tree_edges, component_edges, components, articulation_points
@@ -3706,15 +4199,17 @@ def biconnected_components(graph: Graph) -> tuple[int, list[IntArray], list[IntA
 
 def bridges(graph: Graph) -> IntArray:
     """Type-annotated wrapper for ``igraph_bridges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_bridges(c_graph, c_res)
+    _lib.igraph_bridges(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -3722,12 +4217,14 @@ def bridges(graph: Graph) -> IntArray:
 
 def is_biconnected(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_biconnected``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_biconnected(c_graph, c_res)
+    _lib.igraph_is_biconnected(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -3738,16 +4235,18 @@ def is_biconnected(graph: Graph) -> bool:
 
 def count_reachable(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> IntArray:
     """Type-annotated wrapper for ``igraph_count_reachable``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_counts = _VectorInt.create(0)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_count_reachable(c_graph, c_counts, c_mode)
+    _lib.igraph_count_reachable(c_graph, c_counts, c_mode)
 
     # Prepare output arguments
-    counts = igraph_vector_int_t_to_numpy_array(c_counts)
+    counts = igraph_vector_int_t_to_numpy_array_transfer(c_counts)
 
     # Construct return value
     return counts
@@ -3755,6 +4254,8 @@ def count_reachable(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> IntA
 
 def bond_percolation(graph: Graph, edge_order: Optional[Iterable[EdgeLike]] = None) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_bond_percolation``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_giant_size = _VectorInt.create(0)
@@ -3762,11 +4263,11 @@ def bond_percolation(graph: Graph, edge_order: Optional[Iterable[EdgeLike]] = No
     c_edge_order = iterable_edge_indices_to_igraph_vector_int_t(edge_order) if edge_order is not None else None
 
     # Call wrapped function
-    igraph_bond_percolation(c_graph, c_giant_size, c_vetex_count, c_edge_order)
+    _lib.igraph_bond_percolation(c_graph, c_giant_size, c_vetex_count, c_edge_order)
 
     # Prepare output arguments
-    giant_size = igraph_vector_int_t_to_numpy_array(c_giant_size)
-    vetex_count = igraph_vector_int_t_to_numpy_array(c_vetex_count)
+    giant_size = igraph_vector_int_t_to_numpy_array_transfer(c_giant_size)
+    vetex_count = igraph_vector_int_t_to_numpy_array_transfer(c_vetex_count)
 
     # Construct return value
     return giant_size, vetex_count
@@ -3774,6 +4275,8 @@ def bond_percolation(graph: Graph, edge_order: Optional[Iterable[EdgeLike]] = No
 
 def site_percolation(graph: Graph, vertex_order: Optional[Iterable[VertexLike]] = None) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_site_percolation``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_giant_size = _VectorInt.create(0)
@@ -3781,11 +4284,11 @@ def site_percolation(graph: Graph, vertex_order: Optional[Iterable[VertexLike]]
     c_vertex_order = iterable_vertex_indices_to_igraph_vector_int_t(vertex_order) if vertex_order is not None else None
 
     # Call wrapped function
-    igraph_site_percolation(c_graph, c_giant_size, c_edge_count, c_vertex_order)
+    _lib.igraph_site_percolation(c_graph, c_giant_size, c_edge_count, c_vertex_order)
 
     # Prepare output arguments
-    giant_size = igraph_vector_int_t_to_numpy_array(c_giant_size)
-    edge_count = igraph_vector_int_t_to_numpy_array(c_edge_count)
+    giant_size = igraph_vector_int_t_to_numpy_array_transfer(c_giant_size)
+    edge_count = igraph_vector_int_t_to_numpy_array_transfer(c_edge_count)
 
     # Construct return value
     return giant_size, edge_count
@@ -3793,17 +4296,19 @@ def site_percolation(graph: Graph, vertex_order: Optional[Iterable[VertexLike]]
 
 def edgelist_percolation(edges: Iterable[VertexPair]) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_edgelist_percolation``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_edges = vertex_pairs_to_igraph_vector_int_t(edges)
     c_giant_size = _VectorInt.create(0)
     c_vertex_count = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_edgelist_percolation(c_edges, c_giant_size, c_vertex_count)
+    _lib.igraph_edgelist_percolation(c_edges, c_giant_size, c_vertex_count)
 
     # Prepare output arguments
-    giant_size = igraph_vector_int_t_to_numpy_array(c_giant_size)
-    vertex_count = igraph_vector_int_t_to_numpy_array(c_vertex_count)
+    giant_size = igraph_vector_int_t_to_numpy_array_transfer(c_giant_size)
+    vertex_count = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_count)
 
     # Construct return value
     return giant_size, vertex_count
@@ -3811,6 +4316,8 @@ def edgelist_percolation(edges: Iterable[VertexPair]) -> tuple[IntArray, IntArra
 
 def is_clique(graph: Graph, candidate: VertexSelector, directed: bool = False) -> bool:
     """Type-annotated wrapper for ``igraph_is_clique``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_candidate = vertex_selector_to_igraph_vs_t(candidate, graph)
@@ -3818,7 +4325,7 @@ def is_clique(graph: Graph, candidate: VertexSelector, directed: bool = False) -
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_clique(c_graph, c_candidate.unwrap(), c_directed, c_res)
+    _lib.igraph_is_clique(c_graph, c_candidate.unwrap(), c_directed, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -3827,8 +4334,10 @@ def is_clique(graph: Graph, candidate: VertexSelector, directed: bool = False) -
     return res
 
 
-def cliques(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1) -> list[IntArray]:
+def cliques(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_cliques``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
@@ -3837,19 +4346,18 @@ def cliques(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: i
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_cliques(c_graph, c_res, c_min_size, c_max_size, c_max_results)
+    _lib.igraph_cliques(c_graph, c_res, c_min_size, c_max_size, c_max_results)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
-# igraph_cliques_callback: no Python type known for type: CLIQUE_FUNC
-
-
 def clique_size_hist(graph: Graph, min_size: int = 0, max_size: int = 0) -> RealArray:
     """Type-annotated wrapper for ``igraph_clique_size_hist``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_hist = _Vector.create(0)
@@ -3857,33 +4365,37 @@ def clique_size_hist(graph: Graph, min_size: int = 0, max_size: int = 0) -> Real
     c_max_size = max_size
 
     # Call wrapped function
-    igraph_clique_size_hist(c_graph, c_hist, c_min_size, c_max_size)
+    _lib.igraph_clique_size_hist(c_graph, c_hist, c_min_size, c_max_size)
 
     # Prepare output arguments
-    hist = igraph_vector_t_to_numpy_array(c_hist)
+    hist = igraph_vector_t_to_numpy_array_transfer(c_hist)
 
     # Construct return value
     return hist
 
 
-def largest_cliques(graph: Graph) -> list[IntArray]:
+def largest_cliques(graph: Graph, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_largest_cliques``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
 
     # Call wrapped function
-    igraph_largest_cliques(c_graph, c_res)
+    _lib.igraph_largest_cliques(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
 
-def maximal_cliques(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1) -> list[IntArray]:
+def maximal_cliques(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_maximal_cliques``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
@@ -3892,17 +4404,19 @@ def maximal_cliques(graph: Graph, min_size: int = -1, max_size: int = -1, max_re
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_maximal_cliques(c_graph, c_res, c_min_size, c_max_size, c_max_results)
+    _lib.igraph_maximal_cliques(c_graph, c_res, c_min_size, c_max_size, c_max_results)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
 
-def maximal_cliques_subset(graph: Graph, subset: Iterable[VertexLike], outfile: Optional[FileLike] = None, min_size: int = -1, max_size: int = -1, max_results: int = -1) -> tuple[list[IntArray], int]:
+def maximal_cliques_subset(graph: Graph, subset: Iterable[VertexLike], outfile: Optional[FileLike] = None, min_size: int = -1, max_size: int = -1, max_results: int = -1, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, int]:
     """Type-annotated wrapper for ``igraph_maximal_cliques_subset``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -3917,10 +4431,10 @@ def maximal_cliques_subset(graph: Graph, subset: Iterable[VertexLike], outfile:
         c_max_results = max_results
 
         # Call wrapped function
-        igraph_maximal_cliques_subset(c_graph, c_subset, c_res, c_no, c_outfile, c_min_size, c_max_size, c_max_results)
+        _lib.igraph_maximal_cliques_subset(c_graph, c_subset, c_res, c_no, c_outfile, c_min_size, c_max_size, c_max_results)
 
         # Prepare output arguments
-        res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+        res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
         no = c_no.value
 
         # Construct return value
@@ -3929,11 +4443,10 @@ def maximal_cliques_subset(graph: Graph, subset: Iterable[VertexLike], outfile:
     # Help the type checker to figure out that we never get here
     assert False, "unreachable"  # noqa: B011
 
-# igraph_maximal_cliques_callback: no Python type known for type: CLIQUE_FUNC
-
-
 def maximal_cliques_count(graph: Graph, min_size: int = 0, max_size: int = 0) -> int:
     """Type-annotated wrapper for ``igraph_maximal_cliques_count``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_no = igraph_int_t()
@@ -3941,7 +4454,7 @@ def maximal_cliques_count(graph: Graph, min_size: int = 0, max_size: int = 0) ->
     c_max_size = max_size
 
     # Call wrapped function
-    igraph_maximal_cliques_count(c_graph, c_no, c_min_size, c_max_size)
+    _lib.igraph_maximal_cliques_count(c_graph, c_no, c_min_size, c_max_size)
 
     # Prepare output arguments
     no = c_no.value
@@ -3952,6 +4465,8 @@ def maximal_cliques_count(graph: Graph, min_size: int = 0, max_size: int = 0) ->
 
 def maximal_cliques_file(graph: Graph, res: FileLike, min_size: int = -1, max_size: int = -1, max_results: int = -1) -> None:
     """Type-annotated wrapper for ``igraph_maximal_cliques_file``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -3963,11 +4478,13 @@ def maximal_cliques_file(graph: Graph, res: FileLike, min_size: int = -1, max_si
         c_max_results = max_results
 
         # Call wrapped function
-        igraph_maximal_cliques_file(c_graph, c_res, c_min_size, c_max_size, c_max_results)
+        _lib.igraph_maximal_cliques_file(c_graph, c_res, c_min_size, c_max_size, c_max_results)
 
 
 def maximal_cliques_hist(graph: Graph, min_size: int = 0, max_size: int = 0) -> RealArray:
     """Type-annotated wrapper for ``igraph_maximal_cliques_hist``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_hist = _Vector.create(0)
@@ -3975,10 +4492,10 @@ def maximal_cliques_hist(graph: Graph, min_size: int = 0, max_size: int = 0) ->
     c_max_size = max_size
 
     # Call wrapped function
-    igraph_maximal_cliques_hist(c_graph, c_hist, c_min_size, c_max_size)
+    _lib.igraph_maximal_cliques_hist(c_graph, c_hist, c_min_size, c_max_size)
 
     # Prepare output arguments
-    hist = igraph_vector_t_to_numpy_array(c_hist)
+    hist = igraph_vector_t_to_numpy_array_transfer(c_hist)
 
     # Construct return value
     return hist
@@ -3986,12 +4503,14 @@ def maximal_cliques_hist(graph: Graph, min_size: int = 0, max_size: int = 0) ->
 
 def clique_number(graph: Graph) -> int:
     """Type-annotated wrapper for ``igraph_clique_number``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_no = igraph_int_t()
 
     # Call wrapped function
-    igraph_clique_number(c_graph, c_no)
+    _lib.igraph_clique_number(c_graph, c_no)
 
     # Prepare output arguments
     no = c_no.value
@@ -4000,8 +4519,10 @@ def clique_number(graph: Graph) -> int:
     return no
 
 
-def weighted_cliques(graph: Graph, vertex_weights: Optional[Iterable[float]] = None, maximal: bool = False, min_weight: float = -1, max_weight: float = -1, max_results: int = -1) -> list[IntArray]:
+def weighted_cliques(graph: Graph, vertex_weights: Optional[Iterable[float]] = None, maximal: bool = False, min_weight: float = -1, max_weight: float = -1, max_results: int = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_weighted_cliques``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertex_weights = vertex_weights_to_igraph_vector_t_view(vertex_weights, graph) if vertex_weights is not None else None
@@ -4012,27 +4533,29 @@ def weighted_cliques(graph: Graph, vertex_weights: Optional[Iterable[float]] = N
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_weighted_cliques(c_graph, c_vertex_weights, c_res, c_maximal, c_min_weight, c_max_weight, c_max_results)
+    _lib.igraph_weighted_cliques(c_graph, c_vertex_weights, c_res, c_maximal, c_min_weight, c_max_weight, c_max_results)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
 
-def largest_weighted_cliques(graph: Graph, vertex_weights: Optional[Iterable[float]] = None) -> list[IntArray]:
+def largest_weighted_cliques(graph: Graph, vertex_weights: Optional[Iterable[float]] = None, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_largest_weighted_cliques``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertex_weights = vertex_weights_to_igraph_vector_t_view(vertex_weights, graph) if vertex_weights is not None else None
     c_res = _VectorIntList.create(0)
 
     # Call wrapped function
-    igraph_largest_weighted_cliques(c_graph, c_vertex_weights, c_res)
+    _lib.igraph_largest_weighted_cliques(c_graph, c_vertex_weights, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
@@ -4040,13 +4563,15 @@ def largest_weighted_cliques(graph: Graph, vertex_weights: Optional[Iterable[flo
 
 def weighted_clique_number(graph: Graph, vertex_weights: Optional[Iterable[float]] = None) -> float:
     """Type-annotated wrapper for ``igraph_weighted_clique_number``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertex_weights = vertex_weights_to_igraph_vector_t_view(vertex_weights, graph) if vertex_weights is not None else None
     c_res = igraph_real_t()
 
     # Call wrapped function
-    igraph_weighted_clique_number(c_graph, c_vertex_weights, c_res)
+    _lib.igraph_weighted_clique_number(c_graph, c_vertex_weights, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -4057,13 +4582,15 @@ def weighted_clique_number(graph: Graph, vertex_weights: Optional[Iterable[float
 
 def is_independent_vertex_set(graph: Graph, candidate: VertexSelector) -> bool:
     """Type-annotated wrapper for ``igraph_is_independent_vertex_set``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_candidate = vertex_selector_to_igraph_vs_t(candidate, graph)
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_independent_vertex_set(c_graph, c_candidate.unwrap(), c_res)
+    _lib.igraph_is_independent_vertex_set(c_graph, c_candidate.unwrap(), c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -4072,8 +4599,10 @@ def is_independent_vertex_set(graph: Graph, candidate: VertexSelector) -> bool:
     return res
 
 
-def independent_vertex_sets(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1) -> list[IntArray]:
+def independent_vertex_sets(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_independent_vertex_sets``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
@@ -4082,33 +4611,37 @@ def independent_vertex_sets(graph: Graph, min_size: int = -1, max_size: int = -1
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_independent_vertex_sets(c_graph, c_res, c_min_size, c_max_size, c_max_results)
+    _lib.igraph_independent_vertex_sets(c_graph, c_res, c_min_size, c_max_size, c_max_results)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
 
-def largest_independent_vertex_sets(graph: Graph) -> list[IntArray]:
+def largest_independent_vertex_sets(graph: Graph, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_largest_independent_vertex_sets``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
 
     # Call wrapped function
-    igraph_largest_independent_vertex_sets(c_graph, c_res)
+    _lib.igraph_largest_independent_vertex_sets(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
 
 
-def maximal_independent_vertex_sets(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1) -> list[IntArray]:
+def maximal_independent_vertex_sets(graph: Graph, min_size: int = -1, max_size: int = -1, max_results: int = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_maximal_independent_vertex_sets``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorIntList.create(0)
@@ -4117,10 +4650,10 @@ def maximal_independent_vertex_sets(graph: Graph, min_size: int = -1, max_size:
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_maximal_independent_vertex_sets(c_graph, c_res, c_min_size, c_max_size, c_max_results)
+    _lib.igraph_maximal_independent_vertex_sets(c_graph, c_res, c_min_size, c_max_size, c_max_results)
 
     # Prepare output arguments
-    res = igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
+    res = igraph_vector_int_list_t_to_flat_numpy_arrays(c_res) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_res)
 
     # Construct return value
     return res
@@ -4128,12 +4661,14 @@ def maximal_independent_vertex_sets(graph: Graph, min_size: int = -1, max_size:
 
 def independence_number(graph: Graph) -> int:
     """Type-annotated wrapper for ``igraph_independence_number``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_no = igraph_int_t()
 
     # Call wrapped function
-    igraph_independence_number(c_graph, c_no)
+    _lib.igraph_independence_number(c_graph, c_no)
 
     # Prepare output arguments
     no = c_no.value
@@ -4144,15 +4679,17 @@ def independence_number(graph: Graph) -> int:
 
 def layout_random(graph: Graph) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_random``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
 
     # Call wrapped function
-    igraph_layout_random(c_graph, c_res)
+    _lib.igraph_layout_random(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4160,16 +4697,18 @@ def layout_random(graph: Graph) -> RealArray:
 
 def layout_circle(graph: Graph, order: VertexSelector = "all") -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_circle``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_order = vertex_selector_to_igraph_vs_t(order, graph)
 
     # Call wrapped function
-    igraph_layout_circle(c_graph, c_res, c_order.unwrap())
+    _lib.igraph_layout_circle(c_graph, c_res, c_order.unwrap())
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4177,16 +4716,18 @@ def layout_circle(graph: Graph, order: VertexSelector = "all") -> RealArray:
 
 def layout_grid(graph: Graph, width: int = 0) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_grid``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_width = width
 
     # Call wrapped function
-    igraph_layout_grid(c_graph, c_res, c_width)
+    _lib.igraph_layout_grid(c_graph, c_res, c_width)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4194,17 +4735,19 @@ def layout_grid(graph: Graph, width: int = 0) -> RealArray:
 
 def layout_grid_3d(graph: Graph, width: int = 0, height: int = 0) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_grid_3d``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_width = width
     c_height = height
 
     # Call wrapped function
-    igraph_layout_grid_3d(c_graph, c_res, c_width, c_height)
+    _lib.igraph_layout_grid_3d(c_graph, c_res, c_width, c_height)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4214,18 +4757,20 @@ def layout_grid_3d(graph: Graph, width: int = 0, height: int = 0) -> RealArray:
 
 def layout_reingold_tilford(graph: Graph, mode: NeighborMode = NeighborMode.OUT, roots: Optional[Iterable[VertexLike]] = None, rootlevel: Optional[Iterable[int]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_reingold_tilford``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_mode = c_int(mode)
     c_roots = iterable_vertex_indices_to_igraph_vector_int_t(roots) if roots is not None else None
     c_rootlevel = iterable_to_igraph_vector_int_t_view(rootlevel) if rootlevel is not None else None
 
     # Call wrapped function
-    igraph_layout_reingold_tilford(c_graph, c_res, c_mode, c_roots, c_rootlevel)
+    _lib.igraph_layout_reingold_tilford(c_graph, c_res, c_mode, c_roots, c_rootlevel)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4233,18 +4778,20 @@ def layout_reingold_tilford(graph: Graph, mode: NeighborMode = NeighborMode.OUT,
 
 def layout_reingold_tilford_circular(graph: Graph, mode: NeighborMode = NeighborMode.OUT, roots: Optional[Iterable[VertexLike]] = None, rootlevel: Optional[Iterable[int]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_reingold_tilford_circular``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_mode = c_int(mode)
     c_roots = iterable_vertex_indices_to_igraph_vector_int_t(roots) if roots is not None else None
     c_rootlevel = iterable_to_igraph_vector_int_t_view(rootlevel) if rootlevel is not None else None
 
     # Call wrapped function
-    igraph_layout_reingold_tilford_circular(c_graph, c_res, c_mode, c_roots, c_rootlevel)
+    _lib.igraph_layout_reingold_tilford_circular(c_graph, c_res, c_mode, c_roots, c_rootlevel)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4252,6 +4799,8 @@ def layout_reingold_tilford_circular(graph: Graph, mode: NeighborMode = Neighbor
 
 def roots_for_tree_layout(graph: Graph, heuristic: RootChoice, mode: NeighborMode = NeighborMode.OUT) -> IntArray:
     """Type-annotated wrapper for ``igraph_roots_for_tree_layout``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_mode = c_int(mode)
@@ -4259,10 +4808,10 @@ def roots_for_tree_layout(graph: Graph, heuristic: RootChoice, mode: NeighborMod
     c_heuristic = c_int(heuristic)
 
     # Call wrapped function
-    igraph_roots_for_tree_layout(c_graph, c_mode, c_roots, c_heuristic)
+    _lib.igraph_roots_for_tree_layout(c_graph, c_mode, c_roots, c_heuristic)
 
     # Prepare output arguments
-    roots = igraph_vector_int_t_to_numpy_array(c_roots)
+    roots = igraph_vector_int_t_to_numpy_array_transfer(c_roots)
 
     # Construct return value
     return roots
@@ -4270,15 +4819,17 @@ def roots_for_tree_layout(graph: Graph, heuristic: RootChoice, mode: NeighborMod
 
 def layout_random_3d(graph: Graph) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_random_3d``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
 
     # Call wrapped function
-    igraph_layout_random_3d(c_graph, c_res)
+    _lib.igraph_layout_random_3d(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4286,15 +4837,17 @@ def layout_random_3d(graph: Graph) -> RealArray:
 
 def layout_sphere(graph: Graph) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_sphere``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
 
     # Call wrapped function
-    igraph_layout_sphere(c_graph, c_res)
+    _lib.igraph_layout_sphere(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4304,6 +4857,8 @@ def layout_sphere(graph: Graph) -> RealArray:
 
 def layout_graphopt(graph: Graph, res: MatrixLike, niter: int = 500, node_charge: float = 0.001, node_mass: float = 30, spring_length: float = 0, spring_constant: float = 1, max_sa_movement: float = 5, use_seed: bool = False) -> None:
     """Type-annotated wrapper for ``igraph_layout_graphopt``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = sequence_to_igraph_matrix_t(res)
@@ -4316,33 +4871,35 @@ def layout_graphopt(graph: Graph, res: MatrixLike, niter: int = 500, node_charge
     c_use_seed = any_to_igraph_bool_t(use_seed)
 
     # Call wrapped function
-    igraph_layout_graphopt(c_graph, c_res, c_niter, c_node_charge, c_node_mass, c_spring_length, c_spring_constant, c_max_sa_movement, c_use_seed)
+    _lib.igraph_layout_graphopt(c_graph, c_res, c_niter, c_node_charge, c_node_mass, c_spring_length, c_spring_constant, c_max_sa_movement, c_use_seed)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_in_place(c_res, res)
 
 # igraph_layout_drl: no Python type known for type: DRL_OPTIONS
 
 # igraph_layout_drl_3d: no Python type known for type: DRL_OPTIONS
 
-# igraph_layout_merge_dla: no Python type known for type: GRAPH_PTR_LIST
+# igraph_layout_merge_dla: no Python type known for type: MATRIX_LIST
 
 # igraph_layout_sugiyama: no Python type known for type: MATRIX_LIST
 
 
 def layout_mds(graph: Graph, dist: Optional[MatrixLike] = None, dim: int = 2) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_mds``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_dist = sequence_to_igraph_matrix_t_view(dist) if dist is not None else None
     c_dim = dim
 
     # Call wrapped function
-    igraph_layout_mds(c_graph, c_res, c_dist, c_dim)
+    _lib.igraph_layout_mds(c_graph, c_res, c_dist, c_dim)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4350,19 +4907,21 @@ def layout_mds(graph: Graph, dist: Optional[MatrixLike] = None, dim: int = 2) ->
 
 def layout_bipartite(graph: Graph, types: Iterable[Any], hgap: float = 1, vgap: float = 1, maxiter: int = 100) -> RealArray:
     """Type-annotated wrapper for ``igraph_layout_bipartite``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_hgap = hgap
     c_vgap = vgap
     c_maxiter = maxiter
 
     # Call wrapped function
-    igraph_layout_bipartite(c_graph, c_types, c_res, c_hgap, c_vgap, c_maxiter)
+    _lib.igraph_layout_bipartite(c_graph, c_types, c_res, c_hgap, c_vgap, c_maxiter)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4370,6 +4929,8 @@ def layout_bipartite(graph: Graph, types: Iterable[Any], hgap: float = 1, vgap:
 
 def layout_umap(graph: Graph, res: MatrixLike, use_seed: bool = False, distances: Optional[Iterable[float]] = None, min_dist: float = 0.0, epochs: int = 200, distances_are_weights: bool = False) -> None:
     """Type-annotated wrapper for ``igraph_layout_umap``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = sequence_to_igraph_matrix_t(res)
@@ -4380,14 +4941,16 @@ def layout_umap(graph: Graph, res: MatrixLike, use_seed: bool = False, distances
     c_distances_are_weights = any_to_igraph_bool_t(distances_are_weights)
 
     # Call wrapped function
-    igraph_layout_umap(c_graph, c_res, c_use_seed, c_distances, c_min_dist, c_epochs, c_distances_are_weights)
+    _lib.igraph_layout_umap(c_graph, c_res, c_use_seed, c_distances, c_min_dist, c_epochs, c_distances_are_weights)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_in_place(c_res, res)
 
 
 def layout_umap_3d(graph: Graph, res: MatrixLike, use_seed: bool = False, distances: Optional[Iterable[float]] = None, min_dist: float = 0.0, epochs: int = 200, distances_are_weights: bool = False) -> None:
     """Type-annotated wrapper for ``igraph_layout_umap_3d``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = sequence_to_igraph_matrix_t(res)
@@ -4398,51 +4961,57 @@ def layout_umap_3d(graph: Graph, res: MatrixLike, use_seed: bool = False, distan
     c_distances_are_weights = any_to_igraph_bool_t(distances_are_weights)
 
     # Call wrapped function
-    igraph_layout_umap_3d(c_graph, c_res, c_use_seed, c_distances, c_min_dist, c_epochs, c_distances_are_weights)
+    _lib.igraph_layout_umap_3d(c_graph, c_res, c_use_seed, c_distances, c_min_dist, c_epochs, c_distances_are_weights)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_in_place(c_res, res)
 
 
 def layout_umap_compute_weights(graph: Graph, distances: Iterable[float], weights: Iterable[float]) -> None:
     """Type-annotated wrapper for ``igraph_layout_umap_compute_weights``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_distances = iterable_to_igraph_vector_t_view(distances)
     c_weights = iterable_to_igraph_vector_t(weights)
 
     # Call wrapped function
-    igraph_layout_umap_compute_weights(c_graph, c_distances, c_weights)
+    _lib.igraph_layout_umap_compute_weights(c_graph, c_distances, c_weights)
 
     # Prepare output arguments
-    weights = igraph_vector_t_to_numpy_array(c_weights)
+    weights = igraph_vector_t_to_numpy_array_transfer(c_weights)
 
 
 def layout_align(graph: Graph, layout: MatrixLike) -> None:
     """Type-annotated wrapper for ``igraph_layout_align``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_layout = sequence_to_igraph_matrix_t(layout)
 
     # Call wrapped function
-    igraph_layout_align(c_graph, c_layout)
+    _lib.igraph_layout_align(c_graph, c_layout)
 
     # Prepare output arguments
-    layout = igraph_matrix_t_to_numpy_array(c_layout)
+    layout = igraph_matrix_t_to_numpy_array_in_place(c_layout, layout)
 
 
 def cocitation(graph: Graph, vids: VertexSelector = "all") -> RealArray:
     """Type-annotated wrapper for ``igraph_cocitation``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
 
     # Call wrapped function
-    igraph_cocitation(c_graph, c_res, c_vids.unwrap())
+    _lib.igraph_cocitation(c_graph, c_res, c_vids.unwrap())
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4450,16 +5019,18 @@ def cocitation(graph: Graph, vids: VertexSelector = "all") -> RealArray:
 
 def bibcoupling(graph: Graph, vids: VertexSelector = "all") -> RealArray:
     """Type-annotated wrapper for ``igraph_bibcoupling``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
 
     # Call wrapped function
-    igraph_bibcoupling(c_graph, c_res, c_vids.unwrap())
+    _lib.igraph_bibcoupling(c_graph, c_res, c_vids.unwrap())
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4467,19 +5038,21 @@ def bibcoupling(graph: Graph, vids: VertexSelector = "all") -> RealArray:
 
 def similarity_dice(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_dice``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_mode = c_int(mode)
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_similarity_dice(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_mode, c_loops)
+    _lib.igraph_similarity_dice(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4487,6 +5060,8 @@ def similarity_dice(graph: Graph, from_: VertexSelector = "all", to: VertexSelec
 
 def similarity_dice_es(graph: Graph, es: EdgeSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_dice_es``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -4495,10 +5070,10 @@ def similarity_dice_es(graph: Graph, es: EdgeSelector = "all", mode: NeighborMod
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_similarity_dice_es(c_graph, c_res, c_es.unwrap(), c_mode, c_loops)
+    _lib.igraph_similarity_dice_es(c_graph, c_res, c_es.unwrap(), c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4506,6 +5081,8 @@ def similarity_dice_es(graph: Graph, es: EdgeSelector = "all", mode: NeighborMod
 
 def similarity_dice_pairs(graph: Graph, pairs: Iterable[VertexPair], mode: NeighborMode = NeighborMode.ALL, loops: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_dice_pairs``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -4514,10 +5091,10 @@ def similarity_dice_pairs(graph: Graph, pairs: Iterable[VertexPair], mode: Neigh
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_similarity_dice_pairs(c_graph, c_res, c_pairs, c_mode, c_loops)
+    _lib.igraph_similarity_dice_pairs(c_graph, c_res, c_pairs, c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4525,17 +5102,19 @@ def similarity_dice_pairs(graph: Graph, pairs: Iterable[VertexPair], mode: Neigh
 
 def similarity_inverse_log_weighted(graph: Graph, vids: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_inverse_log_weighted``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_similarity_inverse_log_weighted(c_graph, c_res, c_vids.unwrap(), c_mode)
+    _lib.igraph_similarity_inverse_log_weighted(c_graph, c_res, c_vids.unwrap(), c_mode)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4543,19 +5122,21 @@ def similarity_inverse_log_weighted(graph: Graph, vids: VertexSelector = "all",
 
 def similarity_jaccard(graph: Graph, from_: VertexSelector = "all", to: VertexSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_jaccard``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_from = vertex_selector_to_igraph_vs_t(from_, graph)
     c_to = vertex_selector_to_igraph_vs_t(to, graph)
     c_mode = c_int(mode)
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_similarity_jaccard(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_mode, c_loops)
+    _lib.igraph_similarity_jaccard(c_graph, c_res, c_from.unwrap(), c_to.unwrap(), c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4563,6 +5144,8 @@ def similarity_jaccard(graph: Graph, from_: VertexSelector = "all", to: VertexSe
 
 def similarity_jaccard_es(graph: Graph, es: EdgeSelector = "all", mode: NeighborMode = NeighborMode.ALL, loops: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_jaccard_es``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -4571,10 +5154,10 @@ def similarity_jaccard_es(graph: Graph, es: EdgeSelector = "all", mode: Neighbor
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_similarity_jaccard_es(c_graph, c_res, c_es.unwrap(), c_mode, c_loops)
+    _lib.igraph_similarity_jaccard_es(c_graph, c_res, c_es.unwrap(), c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4582,6 +5165,8 @@ def similarity_jaccard_es(graph: Graph, es: EdgeSelector = "all", mode: Neighbor
 
 def similarity_jaccard_pairs(graph: Graph, pairs: Iterable[VertexPair], mode: NeighborMode = NeighborMode.ALL, loops: bool = False) -> RealArray:
     """Type-annotated wrapper for ``igraph_similarity_jaccard_pairs``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -4590,10 +5175,10 @@ def similarity_jaccard_pairs(graph: Graph, pairs: Iterable[VertexPair], mode: Ne
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_similarity_jaccard_pairs(c_graph, c_res, c_pairs, c_mode, c_loops)
+    _lib.igraph_similarity_jaccard_pairs(c_graph, c_res, c_pairs, c_mode, c_loops)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -4601,6 +5186,8 @@ def similarity_jaccard_pairs(graph: Graph, pairs: Iterable[VertexPair], mode: Ne
 
 def compare_communities(comm1: Iterable[int], comm2: Iterable[int], method: CommunityComparison = CommunityComparison.VI) -> float:
     """Type-annotated wrapper for ``igraph_compare_communities``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_comm1 = iterable_to_igraph_vector_int_t_view(comm1)
     c_comm2 = iterable_to_igraph_vector_int_t_view(comm2)
@@ -4608,7 +5195,7 @@ def compare_communities(comm1: Iterable[int], comm2: Iterable[int], method: Comm
     c_method = c_int(method)
 
     # Call wrapped function
-    igraph_compare_communities(c_comm1, c_comm2, c_res, c_method)
+    _lib.igraph_compare_communities(c_comm1, c_comm2, c_res, c_method)
 
     # Prepare output arguments
     res = c_res.value
@@ -4619,6 +5206,8 @@ def compare_communities(comm1: Iterable[int], comm2: Iterable[int], method: Comm
 
 def community_spinglass(graph: Graph, weights: Optional[Iterable[float]] = None, spins: int = 25, parupdate: bool = False, starttemp: float = 1, stoptemp: float = 0.01, coolfact: float = 0.99, update_rule: SpinglassUpdateMode = SpinglassUpdateMode.CONFIG, gamma: float = 1.0, implementation: SpinglassImplementation = SpinglassImplementation.ORIG, lambda_: float = 1.0) -> tuple[float, float, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_community_spinglass``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -4637,13 +5226,13 @@ def community_spinglass(graph: Graph, weights: Optional[Iterable[float]] = None,
     c_lambda = lambda_
 
     # Call wrapped function
-    igraph_community_spinglass(c_graph, c_weights, c_modularity, c_temperature, c_membership, c_csize, c_spins, c_parupdate, c_starttemp, c_stoptemp, c_coolfact, c_update_rule, c_gamma, c_implementation, c_lambda)
+    _lib.igraph_community_spinglass(c_graph, c_weights, c_modularity, c_temperature, c_membership, c_csize, c_spins, c_parupdate, c_starttemp, c_stoptemp, c_coolfact, c_update_rule, c_gamma, c_implementation, c_lambda)
 
     # Prepare output arguments
     modularity = c_modularity.value
     temperature = c_temperature.value
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    csize = igraph_vector_int_t_to_numpy_array(c_csize)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    csize = igraph_vector_int_t_to_numpy_array_transfer(c_csize)
 
     # Construct return value
     return modularity, temperature, membership, csize
@@ -4651,6 +5240,8 @@ def community_spinglass(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def community_spinglass_single(graph: Graph, vertex: int, weights: Optional[Iterable[float]] = None, spins: int = 25, update_rule: SpinglassUpdateMode = SpinglassUpdateMode.CONFIG, gamma: float = 1.0) -> tuple[IntArray, float, float, float, float]:
     """Type-annotated wrapper for ``igraph_community_spinglass_single``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -4665,10 +5256,10 @@ def community_spinglass_single(graph: Graph, vertex: int, weights: Optional[Iter
     c_gamma = gamma
 
     # Call wrapped function
-    igraph_community_spinglass_single(c_graph, c_weights, c_vertex, c_community, c_cohesion, c_adhesion, c_inner_links, c_outer_links, c_spins, c_update_rule, c_gamma)
+    _lib.igraph_community_spinglass_single(c_graph, c_weights, c_vertex, c_community, c_cohesion, c_adhesion, c_inner_links, c_outer_links, c_spins, c_update_rule, c_gamma)
 
     # Prepare output arguments
-    community = igraph_vector_int_t_to_numpy_array(c_community)
+    community = igraph_vector_int_t_to_numpy_array_transfer(c_community)
     cohesion = c_cohesion.value
     adhesion = c_adhesion.value
     inner_links = c_inner_links.value
@@ -4680,21 +5271,23 @@ def community_spinglass_single(graph: Graph, vertex: int, weights: Optional[Iter
 
 def community_walktrap(graph: Graph, weights: Optional[Iterable[float]] = None, steps: int = 4) -> tuple[IntArray, RealArray, IntArray]:
     """Type-annotated wrapper for ``igraph_community_walktrap``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_steps = steps
-    c_merges = _MatrixInt.create(0)
+    c_merges = _MatrixInt.create(0, 0)
     c_modularity = _Vector.create(0)
     c_membership = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_community_walktrap(c_graph, c_weights, c_steps, c_merges, c_modularity, c_membership)
+    _lib.igraph_community_walktrap(c_graph, c_weights, c_steps, c_merges, c_modularity, c_membership)
 
     # Prepare output arguments
-    merges = igraph_matrix_int_t_to_numpy_array(c_merges)
-    modularity = igraph_vector_t_to_numpy_array(c_modularity)
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    merges = igraph_matrix_int_t_to_numpy_array_transfer(c_merges)
+    modularity = igraph_vector_t_to_numpy_array_transfer(c_modularity)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
 
     # Construct return value
     return merges, modularity, membership
@@ -4702,11 +5295,13 @@ def community_walktrap(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def community_edge_betweenness(graph: Graph, directed: bool = True, weights: Optional[Iterable[float]] = None, lengths: Optional[Iterable[float]] = None) -> tuple[IntArray, RealArray, IntArray, IntArray, RealArray, IntArray]:
     """Type-annotated wrapper for ``igraph_community_edge_betweenness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_removed_edges = _VectorInt.create(0)
     c_edge_betweenness = _Vector.create(0)
-    c_merges = _MatrixInt.create(0)
+    c_merges = _MatrixInt.create(0, 0)
     c_bridges = _VectorInt.create(0)
     c_modularity = _Vector.create(0)
     c_membership = _VectorInt.create(0)
@@ -4715,15 +5310,15 @@ def community_edge_betweenness(graph: Graph, directed: bool = True, weights: Opt
     c_lengths = edge_lengths_to_igraph_vector_t_view(lengths, graph) if lengths is not None else None
 
     # Call wrapped function
-    igraph_community_edge_betweenness(c_graph, c_removed_edges, c_edge_betweenness, c_merges, c_bridges, c_modularity, c_membership, c_directed, c_weights, c_lengths)
+    _lib.igraph_community_edge_betweenness(c_graph, c_removed_edges, c_edge_betweenness, c_merges, c_bridges, c_modularity, c_membership, c_directed, c_weights, c_lengths)
 
     # Prepare output arguments
-    removed_edges = igraph_vector_int_t_to_numpy_array(c_removed_edges)
-    edge_betweenness = igraph_vector_t_to_numpy_array(c_edge_betweenness)
-    merges = igraph_matrix_int_t_to_numpy_array(c_merges)
-    bridges = igraph_vector_int_t_to_numpy_array(c_bridges)
-    modularity = igraph_vector_t_to_numpy_array(c_modularity)
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    removed_edges = igraph_vector_int_t_to_numpy_array_transfer(c_removed_edges)
+    edge_betweenness = igraph_vector_t_to_numpy_array_transfer(c_edge_betweenness)
+    merges = igraph_matrix_int_t_to_numpy_array_transfer(c_merges)
+    bridges = igraph_vector_int_t_to_numpy_array_transfer(c_bridges)
+    modularity = igraph_vector_t_to_numpy_array_transfer(c_modularity)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
 
     # Construct return value
     return removed_edges, edge_betweenness, merges, bridges, modularity, membership
@@ -4731,24 +5326,26 @@ def community_edge_betweenness(graph: Graph, directed: bool = True, weights: Opt
 
 def community_eb_get_merges(graph: Graph, directed: bool, edges: Iterable[EdgeLike], weights: Optional[Iterable[float]] = None) -> tuple[IntArray, IntArray, RealArray, IntArray]:
     """Type-annotated wrapper for ``igraph_community_eb_get_merges``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_directed = any_to_igraph_bool_t(directed)
     c_edges = iterable_edge_indices_to_igraph_vector_int_t(edges)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_merges = _MatrixInt.create(0)
+    c_merges = _MatrixInt.create(0, 0)
     c_bridges = _VectorInt.create(0)
     c_modularity = _Vector.create(0)
     c_membership = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_community_eb_get_merges(c_graph, c_directed, c_edges, c_weights, c_merges, c_bridges, c_modularity, c_membership)
+    _lib.igraph_community_eb_get_merges(c_graph, c_directed, c_edges, c_weights, c_merges, c_bridges, c_modularity, c_membership)
 
     # Prepare output arguments
-    merges = igraph_matrix_int_t_to_numpy_array(c_merges)
-    bridges = igraph_vector_int_t_to_numpy_array(c_bridges)
-    modularity = igraph_vector_t_to_numpy_array(c_modularity)
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    merges = igraph_matrix_int_t_to_numpy_array_transfer(c_merges)
+    bridges = igraph_vector_int_t_to_numpy_array_transfer(c_bridges)
+    modularity = igraph_vector_t_to_numpy_array_transfer(c_modularity)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
 
     # Construct return value
     return merges, bridges, modularity, membership
@@ -4756,20 +5353,22 @@ def community_eb_get_merges(graph: Graph, directed: bool, edges: Iterable[EdgeLi
 
 def community_fastgreedy(graph: Graph, weights: Optional[Iterable[float]] = None) -> tuple[IntArray, RealArray, IntArray]:
     """Type-annotated wrapper for ``igraph_community_fastgreedy``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
-    c_merges = _MatrixInt.create(0)
+    c_merges = _MatrixInt.create(0, 0)
     c_modularity = _Vector.create(0)
     c_membership = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_community_fastgreedy(c_graph, c_weights, c_merges, c_modularity, c_membership)
+    _lib.igraph_community_fastgreedy(c_graph, c_weights, c_merges, c_modularity, c_membership)
 
     # Prepare output arguments
-    merges = igraph_matrix_int_t_to_numpy_array(c_merges)
-    modularity = igraph_vector_t_to_numpy_array(c_modularity)
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    merges = igraph_matrix_int_t_to_numpy_array_transfer(c_merges)
+    modularity = igraph_vector_t_to_numpy_array_transfer(c_modularity)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
 
     # Construct return value
     return merges, modularity, membership
@@ -4777,6 +5376,8 @@ def community_fastgreedy(graph: Graph, weights: Optional[Iterable[float]] = None
 
 def community_to_membership(merges: MatrixIntLike, nodes: int, steps: int) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_community_to_membership``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_merges = sequence_to_igraph_matrix_int_t_view(merges)
     c_nodes = nodes
@@ -4785,11 +5386,11 @@ def community_to_membership(merges: MatrixIntLike, nodes: int, steps: int) -> tu
     c_csize = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_community_to_membership(c_merges, c_nodes, c_steps, c_membership, c_csize)
+    _lib.igraph_community_to_membership(c_merges, c_nodes, c_steps, c_membership, c_csize)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    csize = igraph_vector_int_t_to_numpy_array(c_csize)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    csize = igraph_vector_int_t_to_numpy_array_transfer(c_csize)
 
     # Construct return value
     return membership, csize
@@ -4797,6 +5398,8 @@ def community_to_membership(merges: MatrixIntLike, nodes: int, steps: int) -> tu
 
 def le_community_to_membership(merges: MatrixIntLike, steps: int, membership: Iterable[int]) -> IntArray:
     """Type-annotated wrapper for ``igraph_le_community_to_membership``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_merges = sequence_to_igraph_matrix_int_t_view(merges)
     c_steps = steps
@@ -4804,11 +5407,11 @@ def le_community_to_membership(merges: MatrixIntLike, steps: int, membership: It
     c_csize = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_le_community_to_membership(c_merges, c_steps, c_membership, c_csize)
+    _lib.igraph_le_community_to_membership(c_merges, c_steps, c_membership, c_csize)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    csize = igraph_vector_int_t_to_numpy_array(c_csize)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    csize = igraph_vector_int_t_to_numpy_array_transfer(c_csize)
 
     # Construct return value
     return csize
@@ -4816,6 +5419,8 @@ def le_community_to_membership(merges: MatrixIntLike, steps: int, membership: It
 
 def modularity(graph: Graph, membership: Iterable[int], weights: Optional[Iterable[float]] = None, resolution: float = 1.0, directed: bool = True) -> float:
     """Type-annotated wrapper for ``igraph_modularity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_membership = iterable_to_igraph_vector_int_t_view(membership)
@@ -4825,7 +5430,7 @@ def modularity(graph: Graph, membership: Iterable[int], weights: Optional[Iterab
     c_modularity = igraph_real_t()
 
     # Call wrapped function
-    igraph_modularity(c_graph, c_membership, c_weights, c_resolution, c_directed, c_modularity)
+    _lib.igraph_modularity(c_graph, c_membership, c_weights, c_resolution, c_directed, c_modularity)
 
     # Prepare output arguments
     modularity = c_modularity.value
@@ -4836,18 +5441,20 @@ def modularity(graph: Graph, membership: Iterable[int], weights: Optional[Iterab
 
 def modularity_matrix(graph: Graph, weights: Optional[Iterable[float]] = None, resolution: float = 1.0, directed: bool = True) -> RealArray:
     """Type-annotated wrapper for ``igraph_modularity_matrix``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_resolution = resolution
-    c_modmat = _Matrix.create(0)
+    c_modmat = _Matrix.create(0, 0)
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_modularity_matrix(c_graph, c_weights, c_resolution, c_modmat, c_directed)
+    _lib.igraph_modularity_matrix(c_graph, c_weights, c_resolution, c_modmat, c_directed)
 
     # Prepare output arguments
-    modmat = igraph_matrix_t_to_numpy_array(c_modmat)
+    modmat = igraph_matrix_t_to_numpy_array_transfer(c_modmat)
 
     # Construct return value
     return modmat
@@ -4855,17 +5462,19 @@ def modularity_matrix(graph: Graph, weights: Optional[Iterable[float]] = None, r
 
 def reindex_membership(membership: Iterable[int]) -> tuple[IntArray, int]:
     """Type-annotated wrapper for ``igraph_reindex_membership``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_membership = iterable_to_igraph_vector_int_t(membership)
     c_new_to_old = _VectorInt.create(0)
     c_nb_clusters = igraph_int_t()
 
     # Call wrapped function
-    igraph_reindex_membership(c_membership, c_new_to_old, c_nb_clusters)
+    _lib.igraph_reindex_membership(c_membership, c_new_to_old, c_nb_clusters)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    new_to_old = igraph_vector_int_t_to_numpy_array(c_new_to_old)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    new_to_old = igraph_vector_int_t_to_numpy_array_transfer(c_new_to_old)
     nb_clusters = c_nb_clusters.value
 
     # Construct return value
@@ -4876,16 +5485,18 @@ def reindex_membership(membership: Iterable[int]) -> tuple[IntArray, int]:
 
 def community_fluid_communities(graph: Graph, no_of_communities: int) -> IntArray:
     """Type-annotated wrapper for ``igraph_community_fluid_communities``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_no_of_communities = no_of_communities
     c_membership = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_community_fluid_communities(c_graph, c_no_of_communities, c_membership)
+    _lib.igraph_community_fluid_communities(c_graph, c_no_of_communities, c_membership)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
 
     # Construct return value
     return membership
@@ -4895,21 +5506,23 @@ def community_fluid_communities(graph: Graph, no_of_communities: int) -> IntArra
 
 def community_multilevel(graph: Graph, weights: Optional[Iterable[float]] = None, resolution: float = 1.0) -> tuple[IntArray, IntArray, RealArray]:
     """Type-annotated wrapper for ``igraph_community_multilevel``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
     c_resolution = resolution
     c_membership = _VectorInt.create(0)
-    c_memberships = _MatrixInt.create(0)
+    c_memberships = _MatrixInt.create(0, 0)
     c_modularity = _Vector.create(0)
 
     # Call wrapped function
-    igraph_community_multilevel(c_graph, c_weights, c_resolution, c_membership, c_memberships, c_modularity)
+    _lib.igraph_community_multilevel(c_graph, c_weights, c_resolution, c_membership, c_memberships, c_modularity)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    memberships = igraph_matrix_int_t_to_numpy_array(c_memberships)
-    modularity = igraph_vector_t_to_numpy_array(c_modularity)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    memberships = igraph_matrix_int_t_to_numpy_array_transfer(c_memberships)
+    modularity = igraph_vector_t_to_numpy_array_transfer(c_modularity)
 
     # Construct return value
     return membership, memberships, modularity
@@ -4917,6 +5530,8 @@ def community_multilevel(graph: Graph, weights: Optional[Iterable[float]] = None
 
 def community_optimal_modularity(graph: Graph, weights: Optional[Iterable[float]] = None, resolution: float = 1.0) -> tuple[float, IntArray]:
     """Type-annotated wrapper for ``igraph_community_optimal_modularity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -4925,18 +5540,20 @@ def community_optimal_modularity(graph: Graph, weights: Optional[Iterable[float]
     c_membership = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_community_optimal_modularity(c_graph, c_weights, c_resolution, c_modularity, c_membership)
+    _lib.igraph_community_optimal_modularity(c_graph, c_weights, c_resolution, c_modularity, c_membership)
 
     # Prepare output arguments
     modularity = c_modularity.value
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
 
     # Construct return value
     return modularity, membership
 
 
-def community_leiden(graph: Graph, resolution: float, weights: Optional[Iterable[float]] = None, vertex_out_weights: Optional[Iterable[float]] = None, vertex_in_weights: Optional[Iterable[float]] = None, beta: float = 0.01, start: bool = False, n_iterations: int = 2, membership: Optional[Iterable[int]] = None) -> tuple[int, float]:
+def community_leiden(graph: Graph, resolution: float, weights: Optional[Iterable[float]] = None, vertex_out_weights: Optional[Iterable[float]] = None, vertex_in_weights: Optional[Iterable[float]] = None, beta: float = 0.01, start: bool = False, n_iterations: int = 2, membership: Optional[Iterable[int]] = None) -> tuple[IntArray, int, float]:
     """Type-annotated wrapper for ``igraph_community_leiden``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -4946,26 +5563,28 @@ def community_leiden(graph: Graph, resolution: float, weights: Optional[Iterable
     c_beta = beta
     c_start = any_to_igraph_bool_t(start)
     c_n_iterations = n_iterations
-    c_membership = iterable_to_igraph_vector_int_t(membership) if membership is not None else None
+    c_membership = iterable_to_igraph_vector_int_t(membership) if membership is not None else _VectorInt.create(0)
     c_nb_clusters = igraph_int_t()
     c_quality = igraph_real_t()
 
     # Call wrapped function
-    igraph_community_leiden(c_graph, c_weights, c_vertex_out_weights, c_vertex_in_weights, c_resolution, c_beta, c_start, c_n_iterations, c_membership, c_nb_clusters, c_quality)
+    _lib.igraph_community_leiden(c_graph, c_weights, c_vertex_out_weights, c_vertex_in_weights, c_resolution, c_beta, c_start, c_n_iterations, c_membership, c_nb_clusters, c_quality)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
     nb_clusters = c_nb_clusters.value
     quality = c_quality.value
 
     # Construct return value
-    return nb_clusters, quality
+    return membership, nb_clusters, quality
 
 # igraph_community_leiden_simple: no Python type known for type: LEIDEN_OBJECTIVE
 
 
 def split_join_distance(comm1: Iterable[int], comm2: Iterable[int]) -> tuple[int, int]:
     """Type-annotated wrapper for ``igraph_split_join_distance``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_comm1 = iterable_to_igraph_vector_int_t_view(comm1)
     c_comm2 = iterable_to_igraph_vector_int_t_view(comm2)
@@ -4973,7 +5592,7 @@ def split_join_distance(comm1: Iterable[int], comm2: Iterable[int]) -> tuple[int
     c_distance21 = igraph_int_t()
 
     # Call wrapped function
-    igraph_split_join_distance(c_comm1, c_comm2, c_distance12, c_distance21)
+    _lib.igraph_split_join_distance(c_comm1, c_comm2, c_distance12, c_distance21)
 
     # Prepare output arguments
     distance12 = c_distance12.value
@@ -4985,6 +5604,8 @@ def split_join_distance(comm1: Iterable[int], comm2: Iterable[int]) -> tuple[int
 
 def community_infomap(graph: Graph, edge_weights: Optional[Iterable[float]] = None, vertex_weights: Optional[Iterable[float]] = None, nb_trials: int = 10, is_regularized: bool = False, regularization_strength: float = 1) -> tuple[IntArray, float]:
     """Type-annotated wrapper for ``igraph_community_infomap``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_edge_weights = edge_weights_to_igraph_vector_t_view(edge_weights, graph) if edge_weights is not None else None
@@ -4996,10 +5617,10 @@ def community_infomap(graph: Graph, edge_weights: Optional[Iterable[float]] = No
     c_codelength = igraph_real_t()
 
     # Call wrapped function
-    igraph_community_infomap(c_graph, c_edge_weights, c_vertex_weights, c_nb_trials, c_is_regularized, c_regularization_strength, c_membership, c_codelength)
+    _lib.igraph_community_infomap(c_graph, c_edge_weights, c_vertex_weights, c_nb_trials, c_is_regularized, c_regularization_strength, c_membership, c_codelength)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
     codelength = c_codelength.value
 
     # Construct return value
@@ -5008,6 +5629,8 @@ def community_infomap(graph: Graph, edge_weights: Optional[Iterable[float]] = No
 
 def community_voronoi(graph: Graph, lengths: Optional[Iterable[float]] = None, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT, radius: float = -1) -> tuple[IntArray, IntArray, float]:
     """Type-annotated wrapper for ``igraph_community_voronoi``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_membership = _VectorInt.create(0)
@@ -5019,19 +5642,21 @@ def community_voronoi(graph: Graph, lengths: Optional[Iterable[float]] = None, w
     c_radius = radius
 
     # Call wrapped function
-    igraph_community_voronoi(c_graph, c_membership, c_generators, c_modularity, c_lengths, c_weights, c_mode, c_radius)
+    _lib.igraph_community_voronoi(c_graph, c_membership, c_generators, c_modularity, c_lengths, c_weights, c_mode, c_radius)
 
     # Prepare output arguments
-    membership = igraph_vector_int_t_to_numpy_array(c_membership)
-    generators = igraph_vector_int_t_to_numpy_array(c_generators)
+    membership = igraph_vector_int_t_to_numpy_array_transfer(c_membership)
+    generators = igraph_vector_int_t_to_numpy_array_transfer(c_generators)
     modularity = c_modularity.value
 
     # Construct return value
     return membership, generators, modularity
 
 
-def graphlets(graph: Graph, weights: Optional[Iterable[float]] = None, niter: int = 1000) -> tuple[list[IntArray], RealArray]:
+def graphlets(graph: Graph, weights: Optional[Iterable[float]] = None, niter: int = 1000, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, RealArray]:
     """Type-annotated wrapper for ``igraph_graphlets``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -5040,18 +5665,20 @@ def graphlets(graph: Graph, weights: Optional[Iterable[float]] = None, niter: in
     c_niter = niter
 
     # Call wrapped function
-    igraph_graphlets(c_graph, c_weights, c_cliques, c_Mu, c_niter)
+    _lib.igraph_graphlets(c_graph, c_weights, c_cliques, c_Mu, c_niter)
 
     # Prepare output arguments
-    cliques = igraph_vector_int_list_t_to_list_of_numpy_array(c_cliques)
-    Mu = igraph_vector_t_to_numpy_array(c_Mu)
+    cliques = igraph_vector_int_list_t_to_flat_numpy_arrays(c_cliques) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_cliques)
+    Mu = igraph_vector_t_to_numpy_array_transfer(c_Mu)
 
     # Construct return value
     return cliques, Mu
 
 
-def graphlets_candidate_basis(graph: Graph, weights: Optional[Iterable[float]] = None) -> tuple[list[IntArray], RealArray]:
+def graphlets_candidate_basis(graph: Graph, weights: Optional[Iterable[float]] = None, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, RealArray]:
     """Type-annotated wrapper for ``igraph_graphlets_candidate_basis``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -5059,11 +5686,11 @@ def graphlets_candidate_basis(graph: Graph, weights: Optional[Iterable[float]] =
     c_thresholds = _Vector.create(0)
 
     # Call wrapped function
-    igraph_graphlets_candidate_basis(c_graph, c_weights, c_cliques, c_thresholds)
+    _lib.igraph_graphlets_candidate_basis(c_graph, c_weights, c_cliques, c_thresholds)
 
     # Prepare output arguments
-    cliques = igraph_vector_int_list_t_to_list_of_numpy_array(c_cliques)
-    thresholds = igraph_vector_t_to_numpy_array(c_thresholds)
+    cliques = igraph_vector_int_list_t_to_flat_numpy_arrays(c_cliques) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_cliques)
+    thresholds = igraph_vector_t_to_numpy_array_transfer(c_thresholds)
 
     # Construct return value
     return cliques, thresholds
@@ -5071,6 +5698,8 @@ def graphlets_candidate_basis(graph: Graph, weights: Optional[Iterable[float]] =
 
 def graphlets_project(graph: Graph, cliques: Iterable[Iterable[VertexLike]], Muc: Iterable[float], weights: Optional[Iterable[float]] = None, startMu: bool = False, niter: int = 1000) -> None:
     """Type-annotated wrapper for ``igraph_graphlets_project``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -5080,10 +5709,10 @@ def graphlets_project(graph: Graph, cliques: Iterable[Iterable[VertexLike]], Muc
     c_niter = niter
 
     # Call wrapped function
-    igraph_graphlets_project(c_graph, c_weights, c_cliques, c_Muc, c_startMu, c_niter)
+    _lib.igraph_graphlets_project(c_graph, c_weights, c_cliques, c_Muc, c_startMu, c_niter)
 
     # Prepare output arguments
-    Muc = igraph_vector_t_to_numpy_array(c_Muc)
+    Muc = igraph_vector_t_to_numpy_array_transfer(c_Muc)
 
 # igraph_hrg_fit: no Python type known for type: HRG
 
@@ -5105,23 +5734,63 @@ def graphlets_project(graph: Graph, cliques: Iterable[Iterable[VertexLike]], Muc
 
 # igraph_from_hrg_dendrogram: no Python type known for type: HRG
 
-# igraph_get_adjacency: no Python type known for type: GETADJACENCY
 
-# igraph_get_adjacency_sparse: no Python type known for type: SPARSEMAT
+def get_adjacency(graph: Graph, type: GetAdjacency = GetAdjacency.BOTH, weights: Optional[Iterable[float]] = None, loops: Loops = Loops.ONCE) -> RealArray:
+    """Type-annotated wrapper for ``igraph_get_adjacency``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_res = _Matrix.create(0, 0)
+    c_type = c_int(type)
+    c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
+    c_loops = c_int(loops)
+
+    # Call wrapped function
+    _lib.igraph_get_adjacency(c_graph, c_res, c_type, c_weights, c_loops)
+
+    # Prepare output arguments
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
+
+    # Construct return value
+    return res
+
+
+def get_adjacency_sparse(graph: Graph, type: GetAdjacency = GetAdjacency.BOTH, weights: Optional[Iterable[float]] = None, loops: Loops = Loops.ONCE) -> SparseMatrix:
+    """Type-annotated wrapper for ``igraph_get_adjacency_sparse``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_sparsemat = _SparseMat.create(0, 0, 0)
+    c_type = c_int(type)
+    c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
+    c_loops = c_int(loops)
+
+    # Call wrapped function
+    _lib.igraph_get_adjacency_sparse(c_graph, c_sparsemat, c_type, c_weights, c_loops)
+
+    # Prepare output arguments
+    sparsemat = igraph_sparsemat_t_to_scipy_sparse_transfer(c_sparsemat)
+
+    # Construct return value
+    return sparsemat
 
 
 def get_edgelist(graph: Graph, bycol: bool = False) -> IntArray:
     """Type-annotated wrapper for ``igraph_get_edgelist``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
     c_bycol = any_to_igraph_bool_t(bycol)
 
     # Call wrapped function
-    igraph_get_edgelist(c_graph, c_res, c_bycol)
+    _lib.igraph_get_edgelist(c_graph, c_res, c_bycol)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5129,47 +5798,73 @@ def get_edgelist(graph: Graph, bycol: bool = False) -> IntArray:
 
 def get_stochastic(graph: Graph, column_wise: bool = False, weights: Optional[Iterable[float]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_get_stochastic``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
-    c_res = _Matrix.create(0)
+    c_res = _Matrix.create(0, 0)
     c_column_wise = any_to_igraph_bool_t(column_wise)
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
 
     # Call wrapped function
-    igraph_get_stochastic(c_graph, c_res, c_column_wise, c_weights)
+    _lib.igraph_get_stochastic(c_graph, c_res, c_column_wise, c_weights)
 
     # Prepare output arguments
-    res = igraph_matrix_t_to_numpy_array(c_res)
+    res = igraph_matrix_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
 
-# igraph_get_stochastic_sparse: no Python type known for type: SPARSEMAT
+
+def get_stochastic_sparse(graph: Graph, column_wise: bool = False, weights: Optional[Iterable[float]] = None) -> SparseMatrix:
+    """Type-annotated wrapper for ``igraph_get_stochastic_sparse``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_graph = graph
+    c_sparsemat = _SparseMat.create(0, 0, 0)
+    c_column_wise = any_to_igraph_bool_t(column_wise)
+    c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
+
+    # Call wrapped function
+    _lib.igraph_get_stochastic_sparse(c_graph, c_sparsemat, c_column_wise, c_weights)
+
+    # Prepare output arguments
+    sparsemat = igraph_sparsemat_t_to_scipy_sparse_transfer(c_sparsemat)
+
+    # Construct return value
+    return sparsemat
 
 
 def to_directed(graph: Graph, mode: ToDirected = ToDirected.MUTUAL) -> None:
     """Type-annotated wrapper for ``igraph_to_directed``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_to_directed(c_graph, c_mode)
+    _lib.igraph_to_directed(c_graph, c_mode)
 
 
 def to_undirected(graph: Graph, mode: ToUndirected = ToUndirected.COLLAPSE, edge_attr_comb: Optional[AttributeCombinationSpecification] = None) -> None:
     """Type-annotated wrapper for ``igraph_to_undirected``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
-    c_graph = graph
+    c_graph = mutable_graph_to_igraph_t(graph)
     c_mode = c_int(mode)
     c_edge_attr_comb = mapping_to_attribute_combination_t(edge_attr_comb)
 
     # Call wrapped function
-    igraph_to_undirected(c_graph, c_mode, c_edge_attr_comb)
+    _lib.igraph_to_undirected(c_graph, c_mode, c_edge_attr_comb)
 
 
 def read_graph_edgelist(instream: FileLike, n: int = 0, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_read_graph_edgelist``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5180,7 +5875,34 @@ def read_graph_edgelist(instream: FileLike, n: int = 0, directed: bool = True) -
         c_directed = any_to_igraph_bool_t(directed)
 
         # Call wrapped function
-        igraph_read_graph_edgelist(c_graph, c_instream, c_n, c_directed)
+        _lib.igraph_read_graph_edgelist(c_graph, c_instream, c_n, c_directed)
+
+        # Prepare output arguments
+        graph = _create_graph_from_boxed(c_graph)
+
+        # Construct return value
+        return graph
+
+    # Help the type checker to figure out that we never get here
+    assert False, "unreachable"  # noqa: B011
+
+def read_graph_ncol(instream: FileLike, predefnames: Optional[Iterable[str]] = None, names: bool = True, weights: AddWeights = AddWeights.YES, directed: bool = True) -> Graph:
+    """Type-annotated wrapper for ``igraph_read_graph_ncol``."""
+    ensure_thread_is_set_up()
+
+    # Create exit stack for graceful cleanup
+    with ExitStack() as py__stack:
+
+        # Prepare input arguments
+        c_graph = _Graph()
+        c_instream = py__stack.enter_context(any_to_file_ptr(instream, "r"))
+        c_predefnames = iterable_to_igraph_strvector_t_view(predefnames) if predefnames is not None else None
+        c_names = any_to_igraph_bool_t(names)
+        c_weights = c_int(weights)
+        c_directed = any_to_igraph_bool_t(directed)
+
+        # Call wrapped function
+        _lib.igraph_read_graph_ncol(c_graph, c_instream, c_predefnames, c_names, c_weights, c_directed)
 
         # Prepare output arguments
         graph = _create_graph_from_boxed(c_graph)
@@ -5191,13 +5913,38 @@ def read_graph_edgelist(instream: FileLike, n: int = 0, directed: bool = True) -
     # Help the type checker to figure out that we never get here
     assert False, "unreachable"  # noqa: B011
 
-# igraph_read_graph_ncol: no Python type known for type: VECTOR_STR
 
-# igraph_read_graph_lgl: no Python type known for type: ADD_WEIGHTS
+def read_graph_lgl(instream: FileLike, names: bool = True, weights: AddWeights = AddWeights.YES, directed: bool = True) -> Graph:
+    """Type-annotated wrapper for ``igraph_read_graph_lgl``."""
+    ensure_thread_is_set_up()
+
+    # Create exit stack for graceful cleanup
+    with ExitStack() as py__stack:
+
+        # Prepare input arguments
+        c_graph = _Graph()
+        c_instream = py__stack.enter_context(any_to_file_ptr(instream, "r"))
+        c_names = any_to_igraph_bool_t(names)
+        c_weights = c_int(weights)
+        c_directed = any_to_igraph_bool_t(directed)
+
+        # Call wrapped function
+        _lib.igraph_read_graph_lgl(c_graph, c_instream, c_names, c_weights, c_directed)
+
+        # Prepare output arguments
+        graph = _create_graph_from_boxed(c_graph)
+
+        # Construct return value
+        return graph
+
+    # Help the type checker to figure out that we never get here
+    assert False, "unreachable"  # noqa: B011
 
 
 def read_graph_pajek(instream: FileLike) -> Graph:
     """Type-annotated wrapper for ``igraph_read_graph_pajek``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5206,7 +5953,7 @@ def read_graph_pajek(instream: FileLike) -> Graph:
         c_instream = py__stack.enter_context(any_to_file_ptr(instream, "r"))
 
         # Call wrapped function
-        igraph_read_graph_pajek(c_graph, c_instream)
+        _lib.igraph_read_graph_pajek(c_graph, c_instream)
 
         # Prepare output arguments
         graph = _create_graph_from_boxed(c_graph)
@@ -5220,6 +5967,8 @@ def read_graph_pajek(instream: FileLike) -> Graph:
 
 def read_graph_graphml(instream: FileLike, index: int = 0) -> Graph:
     """Type-annotated wrapper for ``igraph_read_graph_graphml``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5229,7 +5978,7 @@ def read_graph_graphml(instream: FileLike, index: int = 0) -> Graph:
         c_index = index
 
         # Call wrapped function
-        igraph_read_graph_graphml(c_graph, c_instream, c_index)
+        _lib.igraph_read_graph_graphml(c_graph, c_instream, c_index)
 
         # Prepare output arguments
         graph = _create_graph_from_boxed(c_graph)
@@ -5240,11 +5989,46 @@ def read_graph_graphml(instream: FileLike, index: int = 0) -> Graph:
     # Help the type checker to figure out that we never get here
     assert False, "unreachable"  # noqa: B011
 
-# igraph_read_graph_dimacs_flow: no Python type known for type: VECTOR_STR
+
+def read_graph_dimacs_flow(instream: FileLike, directed: bool = True) -> tuple[Graph, list[str], IntArray, int, int, RealArray]:
+    """Type-annotated wrapper for ``igraph_read_graph_dimacs_flow``."""
+    ensure_thread_is_set_up()
+
+    # Create exit stack for graceful cleanup
+    with ExitStack() as py__stack:
+
+        # Prepare input arguments
+        c_graph = _Graph()
+        c_instream = py__stack.enter_context(any_to_file_ptr(instream, "r"))
+        c_problem = _StrVector.create(0)
+        c_label = _VectorInt.create(0)
+        c_source = igraph_int_t()
+        c_target = igraph_int_t()
+        c_capacity = _Vector.create(0)
+        c_directed = any_to_igraph_bool_t(directed)
+
+        # Call wrapped function
+        _lib.igraph_read_graph_dimacs_flow(c_graph, c_instream, c_problem, c_label, c_source, c_target, c_capacity, c_directed)
+
+        # Prepare output arguments
+        graph = _create_graph_from_boxed(c_graph)
+        problem = igraph_strvector_t_to_list(c_problem)
+        label = igraph_vector_int_t_to_numpy_array_transfer(c_label)
+        source = c_source.value
+        target = c_target.value
+        capacity = igraph_vector_t_to_numpy_array_transfer(c_capacity)
+
+        # Construct return value
+        return graph, problem, label, source, target, capacity
+
+    # Help the type checker to figure out that we never get here
+    assert False, "unreachable"  # noqa: B011
 
 
 def read_graph_graphdb(instream: FileLike, directed: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_read_graph_graphdb``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5254,7 +6038,7 @@ def read_graph_graphdb(instream: FileLike, directed: bool = False) -> Graph:
         c_directed = any_to_igraph_bool_t(directed)
 
         # Call wrapped function
-        igraph_read_graph_graphdb(c_graph, c_instream, c_directed)
+        _lib.igraph_read_graph_graphdb(c_graph, c_instream, c_directed)
 
         # Prepare output arguments
         graph = _create_graph_from_boxed(c_graph)
@@ -5268,6 +6052,8 @@ def read_graph_graphdb(instream: FileLike, directed: bool = False) -> Graph:
 
 def read_graph_gml(instream: FileLike) -> Graph:
     """Type-annotated wrapper for ``igraph_read_graph_gml``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5276,7 +6062,7 @@ def read_graph_gml(instream: FileLike) -> Graph:
         c_instream = py__stack.enter_context(any_to_file_ptr(instream, "r"))
 
         # Call wrapped function
-        igraph_read_graph_gml(c_graph, c_instream)
+        _lib.igraph_read_graph_gml(c_graph, c_instream)
 
         # Prepare output arguments
         graph = _create_graph_from_boxed(c_graph)
@@ -5290,6 +6076,8 @@ def read_graph_gml(instream: FileLike) -> Graph:
 
 def read_graph_dl(instream: FileLike, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_read_graph_dl``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5299,7 +6087,7 @@ def read_graph_dl(instream: FileLike, directed: bool = True) -> Graph:
         c_directed = any_to_igraph_bool_t(directed)
 
         # Call wrapped function
-        igraph_read_graph_dl(c_graph, c_instream, c_directed)
+        _lib.igraph_read_graph_dl(c_graph, c_instream, c_directed)
 
         # Prepare output arguments
         graph = _create_graph_from_boxed(c_graph)
@@ -5327,6 +6115,8 @@ def write_graph_edgelist(graph: Graph, outstream: FileLike) -> None:
             filename, a path-like object or a file-like object if it is backed
             by a low-level file handle
     """
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5335,7 +6125,7 @@ def write_graph_edgelist(graph: Graph, outstream: FileLike) -> None:
         c_outstream = py__stack.enter_context(any_to_file_ptr(outstream, "w"))
 
         # Call wrapped function
-        igraph_write_graph_edgelist(c_graph, c_outstream)
+        _lib.igraph_write_graph_edgelist(c_graph, c_outstream)
 
 
 def write_graph_ncol(graph: Graph, outstream: FileLike, names: str = "name", weights: str = "weight") -> None:
@@ -5363,6 +6153,8 @@ def write_graph_ncol(graph: Graph, outstream: FileLike, names: str = "name", wei
             attribute does not exist or is not a numeric attribute, and all weights
             will be assumed to be equal to 1 if this is the case.
     """
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5373,7 +6165,7 @@ def write_graph_ncol(graph: Graph, outstream: FileLike, names: str = "name", wei
         c_weights = weights.encode("utf-8")
 
         # Call wrapped function
-        igraph_write_graph_ncol(c_graph, c_outstream, c_names, c_weights)
+        _lib.igraph_write_graph_ncol(c_graph, c_outstream, c_names, c_weights)
 
 
 def write_graph_lgl(graph: Graph, outstream: FileLike, names: str = "name", weights: str = "weight", isolates: bool = True) -> None:
@@ -5400,6 +6192,8 @@ def write_graph_lgl(graph: Graph, outstream: FileLike, names: str = "name", weig
             will be assumed to be equal to 1 if this is the case.
         isolates: whether to save isolated vertices to the output
     """
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5411,11 +6205,13 @@ def write_graph_lgl(graph: Graph, outstream: FileLike, names: str = "name", weig
         c_isolates = any_to_igraph_bool_t(isolates)
 
         # Call wrapped function
-        igraph_write_graph_lgl(c_graph, c_outstream, c_names, c_weights, c_isolates)
+        _lib.igraph_write_graph_lgl(c_graph, c_outstream, c_names, c_weights, c_isolates)
 
 
 def write_graph_leda(graph: Graph, outstream: FileLike, names: str = "name", weights: str = "weight") -> None:
     """Type-annotated wrapper for ``igraph_write_graph_leda``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5426,7 +6222,7 @@ def write_graph_leda(graph: Graph, outstream: FileLike, names: str = "name", wei
         c_weights = weights.encode("utf-8")
 
         # Call wrapped function
-        igraph_write_graph_leda(c_graph, c_outstream, c_names, c_weights)
+        _lib.igraph_write_graph_leda(c_graph, c_outstream, c_names, c_weights)
 
 
 def write_graph_graphml(graph: Graph, outstream: FileLike, prefixattr: bool = True) -> None:
@@ -5443,6 +6239,8 @@ def write_graph_graphml(graph: Graph, outstream: FileLike, prefixattr: bool = Tr
             ensure uniqueness if the graph has vertex and edge (or graph)
             attributes with the same name
     """
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5452,11 +6250,13 @@ def write_graph_graphml(graph: Graph, outstream: FileLike, prefixattr: bool = Tr
         c_prefixattr = any_to_igraph_bool_t(prefixattr)
 
         # Call wrapped function
-        igraph_write_graph_graphml(c_graph, c_outstream, c_prefixattr)
+        _lib.igraph_write_graph_graphml(c_graph, c_outstream, c_prefixattr)
 
 
 def write_graph_pajek(graph: Graph, outstream: FileLike) -> None:
     """Type-annotated wrapper for ``igraph_write_graph_pajek``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5465,11 +6265,13 @@ def write_graph_pajek(graph: Graph, outstream: FileLike) -> None:
         c_outstream = py__stack.enter_context(any_to_file_ptr(outstream, "w"))
 
         # Call wrapped function
-        igraph_write_graph_pajek(c_graph, c_outstream)
+        _lib.igraph_write_graph_pajek(c_graph, c_outstream)
 
 
 def write_graph_dimacs_flow(graph: Graph, outstream: FileLike, capacity: Iterable[float], source: VertexLike = 0, target: VertexLike = 0) -> None:
     """Type-annotated wrapper for ``igraph_write_graph_dimacs_flow``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5481,13 +6283,15 @@ def write_graph_dimacs_flow(graph: Graph, outstream: FileLike, capacity: Iterabl
         c_capacity = iterable_to_igraph_vector_t_view(capacity)
 
         # Call wrapped function
-        igraph_write_graph_dimacs_flow(c_graph, c_outstream, c_source, c_target, c_capacity)
+        _lib.igraph_write_graph_dimacs_flow(c_graph, c_outstream, c_source, c_target, c_capacity)
 
 # igraph_write_graph_gml: no Python type known for type: WRITE_GML_SW
 
 
 def write_graph_dot(graph: Graph, outstream: FileLike) -> None:
     """Type-annotated wrapper for ``igraph_write_graph_dot``."""
+    ensure_thread_is_set_up()
+
     # Create exit stack for graceful cleanup
     with ExitStack() as py__stack:
 
@@ -5496,11 +6300,13 @@ def write_graph_dot(graph: Graph, outstream: FileLike) -> None:
         c_outstream = py__stack.enter_context(any_to_file_ptr(outstream, "w"))
 
         # Call wrapped function
-        igraph_write_graph_dot(c_graph, c_outstream)
+        _lib.igraph_write_graph_dot(c_graph, c_outstream)
 
 
 def motifs_randesu(graph: Graph, size: int = 3, cut_prob: Optional[Iterable[float]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_motifs_randesu``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_hist = _Vector.create(0)
@@ -5508,10 +6314,10 @@ def motifs_randesu(graph: Graph, size: int = 3, cut_prob: Optional[Iterable[floa
     c_cut_prob = iterable_to_igraph_vector_t_view(cut_prob) if cut_prob is not None else None
 
     # Call wrapped function
-    igraph_motifs_randesu(c_graph, c_hist, c_size, c_cut_prob)
+    _lib.igraph_motifs_randesu(c_graph, c_hist, c_size, c_cut_prob)
 
     # Prepare output arguments
-    hist = igraph_vector_t_to_numpy_array(c_hist)
+    hist = igraph_vector_t_to_numpy_array_transfer(c_hist)
 
     # Construct return value
     return hist
@@ -5519,6 +6325,8 @@ def motifs_randesu(graph: Graph, size: int = 3, cut_prob: Optional[Iterable[floa
 
 def motifs_randesu_estimate(graph: Graph, sample_size: int, size: int = 3, cut_prob: Optional[Iterable[float]] = None, sample: Optional[Iterable[int]] = None) -> float:
     """Type-annotated wrapper for ``igraph_motifs_randesu_estimate``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_est = igraph_real_t()
@@ -5528,7 +6336,7 @@ def motifs_randesu_estimate(graph: Graph, sample_size: int, size: int = 3, cut_p
     c_sample = iterable_to_igraph_vector_int_t_view(sample) if sample is not None else None
 
     # Call wrapped function
-    igraph_motifs_randesu_estimate(c_graph, c_est, c_size, c_cut_prob, c_sample_size, c_sample)
+    _lib.igraph_motifs_randesu_estimate(c_graph, c_est, c_size, c_cut_prob, c_sample_size, c_sample)
 
     # Prepare output arguments
     est = c_est.value
@@ -5539,6 +6347,8 @@ def motifs_randesu_estimate(graph: Graph, sample_size: int, size: int = 3, cut_p
 
 def motifs_randesu_no(graph: Graph, size: int = 3, cut_prob: Optional[Iterable[float]] = None) -> float:
     """Type-annotated wrapper for ``igraph_motifs_randesu_no``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_no = igraph_real_t()
@@ -5546,7 +6356,7 @@ def motifs_randesu_no(graph: Graph, size: int = 3, cut_prob: Optional[Iterable[f
     c_cut_prob = iterable_to_igraph_vector_t_view(cut_prob) if cut_prob is not None else None
 
     # Call wrapped function
-    igraph_motifs_randesu_no(c_graph, c_no, c_size, c_cut_prob)
+    _lib.igraph_motifs_randesu_no(c_graph, c_no, c_size, c_cut_prob)
 
     # Prepare output arguments
     no = c_no.value
@@ -5557,6 +6367,8 @@ def motifs_randesu_no(graph: Graph, size: int = 3, cut_prob: Optional[Iterable[f
 
 def dyad_census(graph: Graph) -> tuple[float, float, float]:
     """Type-annotated wrapper for ``igraph_dyad_census``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_mut = igraph_real_t()
@@ -5564,7 +6376,7 @@ def dyad_census(graph: Graph) -> tuple[float, float, float]:
     c_null = igraph_real_t()
 
     # Call wrapped function
-    igraph_dyad_census(c_graph, c_mut, c_asym, c_null)
+    _lib.igraph_dyad_census(c_graph, c_mut, c_asym, c_null)
 
     # Prepare output arguments
     mut = c_mut.value
@@ -5577,15 +6389,17 @@ def dyad_census(graph: Graph) -> tuple[float, float, float]:
 
 def triad_census(graph: Graph) -> RealArray:
     """Type-annotated wrapper for ``igraph_triad_census``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
 
     # Call wrapped function
-    igraph_triad_census(c_graph, c_res)
+    _lib.igraph_triad_census(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5593,16 +6407,18 @@ def triad_census(graph: Graph) -> RealArray:
 
 def count_adjacent_triangles(graph: Graph, vids: VertexSelector = "all") -> RealArray:
     """Type-annotated wrapper for ``igraph_count_adjacent_triangles``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
 
     # Call wrapped function
-    igraph_count_adjacent_triangles(c_graph, c_res, c_vids.unwrap())
+    _lib.igraph_count_adjacent_triangles(c_graph, c_res, c_vids.unwrap())
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5610,12 +6426,14 @@ def count_adjacent_triangles(graph: Graph, vids: VertexSelector = "all") -> Real
 
 def count_triangles(graph: Graph) -> float:
     """Type-annotated wrapper for ``igraph_count_triangles``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
 
     # Call wrapped function
-    igraph_count_triangles(c_graph, c_res)
+    _lib.igraph_count_triangles(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -5626,6 +6444,8 @@ def count_triangles(graph: Graph) -> float:
 
 def local_scan_0(graph: Graph, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_0``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -5633,10 +6453,10 @@ def local_scan_0(graph: Graph, weights: Optional[Iterable[float]] = None, mode:
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_scan_0(c_graph, c_res, c_weights, c_mode)
+    _lib.igraph_local_scan_0(c_graph, c_res, c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5644,6 +6464,8 @@ def local_scan_0(graph: Graph, weights: Optional[Iterable[float]] = None, mode:
 
 def local_scan_0_them(us: Graph, them: Graph, weights_them: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_0_them``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_us = us
     c_them = them
@@ -5652,10 +6474,10 @@ def local_scan_0_them(us: Graph, them: Graph, weights_them: Optional[Iterable[fl
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_scan_0_them(c_us, c_them, c_res, c_weights_them, c_mode)
+    _lib.igraph_local_scan_0_them(c_us, c_them, c_res, c_weights_them, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5663,6 +6485,8 @@ def local_scan_0_them(us: Graph, them: Graph, weights_them: Optional[Iterable[fl
 
 def local_scan_1_ecount(graph: Graph, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_1_ecount``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -5670,10 +6494,10 @@ def local_scan_1_ecount(graph: Graph, weights: Optional[Iterable[float]] = None,
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_scan_1_ecount(c_graph, c_res, c_weights, c_mode)
+    _lib.igraph_local_scan_1_ecount(c_graph, c_res, c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5681,6 +6505,8 @@ def local_scan_1_ecount(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def local_scan_1_ecount_them(us: Graph, them: Graph, weights_them: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_1_ecount_them``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_us = us
     c_them = them
@@ -5689,10 +6515,10 @@ def local_scan_1_ecount_them(us: Graph, them: Graph, weights_them: Optional[Iter
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_scan_1_ecount_them(c_us, c_them, c_res, c_weights_them, c_mode)
+    _lib.igraph_local_scan_1_ecount_them(c_us, c_them, c_res, c_weights_them, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5700,6 +6526,8 @@ def local_scan_1_ecount_them(us: Graph, them: Graph, weights_them: Optional[Iter
 
 def local_scan_k_ecount(graph: Graph, k: int, weights: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_k_ecount``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_k = k
@@ -5708,10 +6536,10 @@ def local_scan_k_ecount(graph: Graph, k: int, weights: Optional[Iterable[float]]
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_scan_k_ecount(c_graph, c_k, c_res, c_weights, c_mode)
+    _lib.igraph_local_scan_k_ecount(c_graph, c_k, c_res, c_weights, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5719,6 +6547,8 @@ def local_scan_k_ecount(graph: Graph, k: int, weights: Optional[Iterable[float]]
 
 def local_scan_k_ecount_them(us: Graph, them: Graph, k: int, weights_them: Optional[Iterable[float]] = None, mode: NeighborMode = NeighborMode.OUT) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_k_ecount_them``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_us = us
     c_them = them
@@ -5728,10 +6558,10 @@ def local_scan_k_ecount_them(us: Graph, them: Graph, k: int, weights_them: Optio
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_local_scan_k_ecount_them(c_us, c_them, c_k, c_res, c_weights_them, c_mode)
+    _lib.igraph_local_scan_k_ecount_them(c_us, c_them, c_k, c_res, c_weights_them, c_mode)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5739,6 +6569,8 @@ def local_scan_k_ecount_them(us: Graph, them: Graph, k: int, weights_them: Optio
 
 def local_scan_neighborhood_ecount(graph: Graph, neighborhoods: Iterable[Iterable[VertexLike]], weights: Optional[Iterable[float]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_neighborhood_ecount``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -5746,10 +6578,10 @@ def local_scan_neighborhood_ecount(graph: Graph, neighborhoods: Iterable[Iterabl
     c_neighborhoods = iterable_of_vertex_index_iterable_to_igraph_vector_int_list_t(neighborhoods)
 
     # Call wrapped function
-    igraph_local_scan_neighborhood_ecount(c_graph, c_res, c_weights, c_neighborhoods)
+    _lib.igraph_local_scan_neighborhood_ecount(c_graph, c_res, c_weights, c_neighborhoods)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5757,6 +6589,8 @@ def local_scan_neighborhood_ecount(graph: Graph, neighborhoods: Iterable[Iterabl
 
 def local_scan_subset_ecount(graph: Graph, subsets: Iterable[Iterable[VertexLike]], weights: Optional[Iterable[float]] = None) -> RealArray:
     """Type-annotated wrapper for ``igraph_local_scan_subset_ecount``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Vector.create(0)
@@ -5764,10 +6598,10 @@ def local_scan_subset_ecount(graph: Graph, subsets: Iterable[Iterable[VertexLike
     c_subsets = iterable_of_vertex_index_iterable_to_igraph_vector_int_list_t(subsets)
 
     # Call wrapped function
-    igraph_local_scan_subset_ecount(c_graph, c_res, c_weights, c_subsets)
+    _lib.igraph_local_scan_subset_ecount(c_graph, c_res, c_weights, c_subsets)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5775,15 +6609,17 @@ def local_scan_subset_ecount(graph: Graph, subsets: Iterable[Iterable[VertexLike
 
 def list_triangles(graph: Graph) -> IntArray:
     """Type-annotated wrapper for ``igraph_list_triangles``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_list_triangles(c_graph, c_res)
+    _lib.igraph_list_triangles(c_graph, c_res)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -5791,13 +6627,15 @@ def list_triangles(graph: Graph) -> IntArray:
 
 def disjoint_union(left: Graph, right: Graph) -> Graph:
     """Type-annotated wrapper for ``igraph_disjoint_union``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_left = left
     c_right = right
 
     # Call wrapped function
-    igraph_disjoint_union(c_res, c_left, c_right)
+    _lib.igraph_disjoint_union(c_res, c_left, c_right)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -5805,18 +6643,36 @@ def disjoint_union(left: Graph, right: Graph) -> Graph:
     # Construct return value
     return res
 
-# igraph_disjoint_union_many: no Python type known for type: GRAPH_PTR_LIST
+
+def disjoint_union_many(graphs: Iterable[Graph]) -> Graph:
+    """Type-annotated wrapper for ``igraph_disjoint_union_many``."""
+    ensure_thread_is_set_up()
+
+    # Prepare input arguments
+    c_res = _Graph()
+    c_graphs = iterable_of_graphs_to_igraph_vector_ptr_t(graphs)
+
+    # Call wrapped function
+    _lib.igraph_disjoint_union_many(c_res, c_graphs)
+
+    # Prepare output arguments
+    res = _create_graph_from_boxed(c_res)
+
+    # Construct return value
+    return res
 
 
 def join(left: Graph, right: Graph) -> Graph:
     """Type-annotated wrapper for ``igraph_join``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_left = left
     c_right = right
 
     # Call wrapped function
-    igraph_join(c_res, c_left, c_right)
+    _lib.igraph_join(c_res, c_left, c_right)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -5827,6 +6683,8 @@ def join(left: Graph, right: Graph) -> Graph:
 
 def union(left: Graph, right: Graph) -> tuple[Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_union``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_left = left
@@ -5835,21 +6693,23 @@ def union(left: Graph, right: Graph) -> tuple[Graph, IntArray, IntArray]:
     c_edge_map_right = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_union(c_res, c_left, c_right, c_edge_map_left, c_edge_map_right)
+    _lib.igraph_union(c_res, c_left, c_right, c_edge_map_left, c_edge_map_right)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
-    edge_map_left = igraph_vector_int_t_to_numpy_array(c_edge_map_left)
-    edge_map_right = igraph_vector_int_t_to_numpy_array(c_edge_map_right)
+    edge_map_left = igraph_vector_int_t_to_numpy_array_transfer(c_edge_map_left)
+    edge_map_right = igraph_vector_int_t_to_numpy_array_transfer(c_edge_map_right)
 
     # Construct return value
     return res, edge_map_left, edge_map_right
 
-# igraph_union_many: no Python type known for type: GRAPH_PTR_LIST
+# igraph_union_many: no Python type known for type: VECTOR_INT_LIST
 
 
 def intersection(left: Graph, right: Graph) -> tuple[Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_intersection``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_left = left
@@ -5858,28 +6718,30 @@ def intersection(left: Graph, right: Graph) -> tuple[Graph, IntArray, IntArray]:
     c_edge_map_right = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_intersection(c_res, c_left, c_right, c_edge_map_left, c_edge_map_right)
+    _lib.igraph_intersection(c_res, c_left, c_right, c_edge_map_left, c_edge_map_right)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
-    edge_map_left = igraph_vector_int_t_to_numpy_array(c_edge_map_left)
-    edge_map_right = igraph_vector_int_t_to_numpy_array(c_edge_map_right)
+    edge_map_left = igraph_vector_int_t_to_numpy_array_transfer(c_edge_map_left)
+    edge_map_right = igraph_vector_int_t_to_numpy_array_transfer(c_edge_map_right)
 
     # Construct return value
     return res, edge_map_left, edge_map_right
 
-# igraph_intersection_many: no Python type known for type: GRAPH_PTR_LIST
+# igraph_intersection_many: no Python type known for type: VECTOR_INT_LIST
 
 
 def difference(orig: Graph, sub: Graph) -> Graph:
     """Type-annotated wrapper for ``igraph_difference``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_orig = orig
     c_sub = sub
 
     # Call wrapped function
-    igraph_difference(c_res, c_orig, c_sub)
+    _lib.igraph_difference(c_res, c_orig, c_sub)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -5890,13 +6752,15 @@ def difference(orig: Graph, sub: Graph) -> Graph:
 
 def complementer(graph: Graph, loops: bool = False) -> Graph:
     """Type-annotated wrapper for ``igraph_complementer``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_graph = graph
     c_loops = any_to_igraph_bool_t(loops)
 
     # Call wrapped function
-    igraph_complementer(c_res, c_graph, c_loops)
+    _lib.igraph_complementer(c_res, c_graph, c_loops)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -5907,6 +6771,8 @@ def complementer(graph: Graph, loops: bool = False) -> Graph:
 
 def compose(g1: Graph, g2: Graph) -> tuple[Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_compose``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_g1 = g1
@@ -5915,12 +6781,12 @@ def compose(g1: Graph, g2: Graph) -> tuple[Graph, IntArray, IntArray]:
     c_edge_map2 = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_compose(c_res, c_g1, c_g2, c_edge_map1, c_edge_map2)
+    _lib.igraph_compose(c_res, c_g1, c_g2, c_edge_map1, c_edge_map2)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
-    edge_map1 = igraph_vector_int_t_to_numpy_array(c_edge_map1)
-    edge_map2 = igraph_vector_int_t_to_numpy_array(c_edge_map2)
+    edge_map1 = igraph_vector_int_t_to_numpy_array_transfer(c_edge_map1)
+    edge_map2 = igraph_vector_int_t_to_numpy_array_transfer(c_edge_map2)
 
     # Construct return value
     return res, edge_map1, edge_map2
@@ -5928,6 +6794,8 @@ def compose(g1: Graph, g2: Graph) -> tuple[Graph, IntArray, IntArray]:
 
 def induced_subgraph_map(graph: Graph, vids: VertexSelector, impl: SubgraphImplementation = SubgraphImplementation.AUTO) -> tuple[Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_induced_subgraph_map``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
@@ -5937,12 +6805,12 @@ def induced_subgraph_map(graph: Graph, vids: VertexSelector, impl: SubgraphImple
     c_invmap = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_induced_subgraph_map(c_graph, c_res, c_vids.unwrap(), c_impl, c_map, c_invmap)
+    _lib.igraph_induced_subgraph_map(c_graph, c_res, c_vids.unwrap(), c_impl, c_map, c_invmap)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
-    map = igraph_vector_int_t_to_numpy_array(c_map)
-    invmap = igraph_vector_int_t_to_numpy_array(c_invmap)
+    map = igraph_vector_int_t_to_numpy_array_transfer(c_map)
+    invmap = igraph_vector_int_t_to_numpy_array_transfer(c_invmap)
 
     # Construct return value
     return res, map, invmap
@@ -5950,13 +6818,15 @@ def induced_subgraph_map(graph: Graph, vids: VertexSelector, impl: SubgraphImple
 
 def mycielskian(graph: Graph, k: int = 1) -> Graph:
     """Type-annotated wrapper for ``igraph_mycielskian``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
     c_k = k
 
     # Call wrapped function
-    igraph_mycielskian(c_graph, c_res, c_k)
+    _lib.igraph_mycielskian(c_graph, c_res, c_k)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -5969,6 +6839,8 @@ def mycielskian(graph: Graph, k: int = 1) -> Graph:
 
 def rooted_product(g1: Graph, g2: Graph, root: VertexLike) -> Graph:
     """Type-annotated wrapper for ``igraph_rooted_product``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _Graph()
     c_g1 = g1
@@ -5976,7 +6848,7 @@ def rooted_product(g1: Graph, g2: Graph, root: VertexLike) -> Graph:
     c_root = vertexlike_to_igraph_int_t(root)
 
     # Call wrapped function
-    igraph_rooted_product(c_res, c_g1, c_g2, c_root)
+    _lib.igraph_rooted_product(c_res, c_g1, c_g2, c_root)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -5987,6 +6859,8 @@ def rooted_product(g1: Graph, g2: Graph, root: VertexLike) -> Graph:
 
 def gomory_hu_tree(graph: Graph, capacity: Optional[Iterable[float]] = None) -> tuple[Graph, RealArray]:
     """Type-annotated wrapper for ``igraph_gomory_hu_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_tree = _Graph()
@@ -5994,11 +6868,11 @@ def gomory_hu_tree(graph: Graph, capacity: Optional[Iterable[float]] = None) ->
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph) if capacity is not None else None
 
     # Call wrapped function
-    igraph_gomory_hu_tree(c_graph, c_tree, c_flows, c_capacity)
+    _lib.igraph_gomory_hu_tree(c_graph, c_tree, c_flows, c_capacity)
 
     # Prepare output arguments
     tree = _create_graph_from_boxed(c_tree)
-    flows = igraph_vector_t_to_numpy_array(c_flows)
+    flows = igraph_vector_t_to_numpy_array_transfer(c_flows)
 
     # Construct return value
     return tree, flows
@@ -6010,6 +6884,8 @@ def gomory_hu_tree(graph: Graph, capacity: Optional[Iterable[float]] = None) ->
 
 def mincut(graph: Graph, capacity: Optional[Iterable[float]] = None) -> tuple[float, IntArray, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_mincut``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_value = igraph_real_t()
@@ -6019,13 +6895,13 @@ def mincut(graph: Graph, capacity: Optional[Iterable[float]] = None) -> tuple[fl
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph) if capacity is not None else None
 
     # Call wrapped function
-    igraph_mincut(c_graph, c_value, c_partition1, c_partition2, c_cut, c_capacity)
+    _lib.igraph_mincut(c_graph, c_value, c_partition1, c_partition2, c_cut, c_capacity)
 
     # Prepare output arguments
     value = c_value.value
-    partition1 = igraph_vector_int_t_to_numpy_array(c_partition1)
-    partition2 = igraph_vector_int_t_to_numpy_array(c_partition2)
-    cut = igraph_vector_int_t_to_numpy_array(c_cut)
+    partition1 = igraph_vector_int_t_to_numpy_array_transfer(c_partition1)
+    partition2 = igraph_vector_int_t_to_numpy_array_transfer(c_partition2)
+    cut = igraph_vector_int_t_to_numpy_array_transfer(c_cut)
 
     # Construct return value
     return value, partition1, partition2, cut
@@ -6033,13 +6909,15 @@ def mincut(graph: Graph, capacity: Optional[Iterable[float]] = None) -> tuple[fl
 
 def mincut_value(graph: Graph, capacity: Optional[Iterable[float]] = None) -> float:
     """Type-annotated wrapper for ``igraph_mincut_value``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph) if capacity is not None else None
 
     # Call wrapped function
-    igraph_mincut_value(c_graph, c_res, c_capacity)
+    _lib.igraph_mincut_value(c_graph, c_res, c_capacity)
 
     # Prepare output arguments
     res = c_res.value
@@ -6050,6 +6928,8 @@ def mincut_value(graph: Graph, capacity: Optional[Iterable[float]] = None) -> fl
 
 def residual_graph(graph: Graph, capacity: Iterable[float], flow: Iterable[float]) -> tuple[Graph, RealArray]:
     """Type-annotated wrapper for ``igraph_residual_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph)
@@ -6058,11 +6938,11 @@ def residual_graph(graph: Graph, capacity: Iterable[float], flow: Iterable[float
     c_flow = iterable_to_igraph_vector_t_view(flow)
 
     # Call wrapped function
-    igraph_residual_graph(c_graph, c_capacity, c_residual, c_residual_capacity, c_flow)
+    _lib.igraph_residual_graph(c_graph, c_capacity, c_residual, c_residual_capacity, c_flow)
 
     # Prepare output arguments
     residual = _create_graph_from_boxed(c_residual)
-    residual_capacity = igraph_vector_t_to_numpy_array(c_residual_capacity)
+    residual_capacity = igraph_vector_t_to_numpy_array_transfer(c_residual_capacity)
 
     # Construct return value
     return residual, residual_capacity
@@ -6070,6 +6950,8 @@ def residual_graph(graph: Graph, capacity: Iterable[float], flow: Iterable[float
 
 def reverse_residual_graph(graph: Graph, capacity: Iterable[float], flow: Iterable[float]) -> Graph:
     """Type-annotated wrapper for ``igraph_reverse_residual_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph)
@@ -6077,7 +6959,7 @@ def reverse_residual_graph(graph: Graph, capacity: Iterable[float], flow: Iterab
     c_flow = iterable_to_igraph_vector_t_view(flow)
 
     # Call wrapped function
-    igraph_reverse_residual_graph(c_graph, c_capacity, c_residual, c_flow)
+    _lib.igraph_reverse_residual_graph(c_graph, c_capacity, c_residual, c_flow)
 
     # Prepare output arguments
     residual = _create_graph_from_boxed(c_residual)
@@ -6088,6 +6970,8 @@ def reverse_residual_graph(graph: Graph, capacity: Iterable[float], flow: Iterab
 
 def st_mincut(graph: Graph, source: VertexLike, target: VertexLike, capacity: Optional[Iterable[float]] = None) -> tuple[float, IntArray, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_st_mincut``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_value = igraph_real_t()
@@ -6099,13 +6983,13 @@ def st_mincut(graph: Graph, source: VertexLike, target: VertexLike, capacity: Op
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph) if capacity is not None else None
 
     # Call wrapped function
-    igraph_st_mincut(c_graph, c_value, c_cut, c_partition1, c_partition2, c_source, c_target, c_capacity)
+    _lib.igraph_st_mincut(c_graph, c_value, c_cut, c_partition1, c_partition2, c_source, c_target, c_capacity)
 
     # Prepare output arguments
     value = c_value.value
-    cut = igraph_vector_int_t_to_numpy_array(c_cut)
-    partition1 = igraph_vector_int_t_to_numpy_array(c_partition1)
-    partition2 = igraph_vector_int_t_to_numpy_array(c_partition2)
+    cut = igraph_vector_int_t_to_numpy_array_transfer(c_cut)
+    partition1 = igraph_vector_int_t_to_numpy_array_transfer(c_partition1)
+    partition2 = igraph_vector_int_t_to_numpy_array_transfer(c_partition2)
 
     # Construct return value
     return value, cut, partition1, partition2
@@ -6113,6 +6997,8 @@ def st_mincut(graph: Graph, source: VertexLike, target: VertexLike, capacity: Op
 
 def st_mincut_value(graph: Graph, source: VertexLike, target: VertexLike, capacity: Optional[Iterable[float]] = None) -> float:
     """Type-annotated wrapper for ``igraph_st_mincut_value``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_real_t()
@@ -6121,7 +7007,7 @@ def st_mincut_value(graph: Graph, source: VertexLike, target: VertexLike, capaci
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph) if capacity is not None else None
 
     # Call wrapped function
-    igraph_st_mincut_value(c_graph, c_res, c_source, c_target, c_capacity)
+    _lib.igraph_st_mincut_value(c_graph, c_res, c_source, c_target, c_capacity)
 
     # Prepare output arguments
     res = c_res.value
@@ -6134,13 +7020,15 @@ def st_mincut_value(graph: Graph, source: VertexLike, target: VertexLike, capaci
 
 def vertex_connectivity(graph: Graph, checks: bool = True) -> int:
     """Type-annotated wrapper for ``igraph_vertex_connectivity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
     c_checks = any_to_igraph_bool_t(checks)
 
     # Call wrapped function
-    igraph_vertex_connectivity(c_graph, c_res, c_checks)
+    _lib.igraph_vertex_connectivity(c_graph, c_res, c_checks)
 
     # Prepare output arguments
     res = c_res.value
@@ -6151,6 +7039,8 @@ def vertex_connectivity(graph: Graph, checks: bool = True) -> int:
 
 def st_edge_connectivity(graph: Graph, source: VertexLike, target: VertexLike) -> int:
     """Type-annotated wrapper for ``igraph_st_edge_connectivity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
@@ -6158,7 +7048,7 @@ def st_edge_connectivity(graph: Graph, source: VertexLike, target: VertexLike) -
     c_target = vertexlike_to_igraph_int_t(target)
 
     # Call wrapped function
-    igraph_st_edge_connectivity(c_graph, c_res, c_source, c_target)
+    _lib.igraph_st_edge_connectivity(c_graph, c_res, c_source, c_target)
 
     # Prepare output arguments
     res = c_res.value
@@ -6169,13 +7059,15 @@ def st_edge_connectivity(graph: Graph, source: VertexLike, target: VertexLike) -
 
 def edge_connectivity(graph: Graph, checks: bool = True) -> int:
     """Type-annotated wrapper for ``igraph_edge_connectivity``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
     c_checks = any_to_igraph_bool_t(checks)
 
     # Call wrapped function
-    igraph_edge_connectivity(c_graph, c_res, c_checks)
+    _lib.igraph_edge_connectivity(c_graph, c_res, c_checks)
 
     # Prepare output arguments
     res = c_res.value
@@ -6186,6 +7078,8 @@ def edge_connectivity(graph: Graph, checks: bool = True) -> int:
 
 def edge_disjoint_paths(graph: Graph, source: VertexLike, target: VertexLike) -> int:
     """Type-annotated wrapper for ``igraph_edge_disjoint_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
@@ -6193,7 +7087,7 @@ def edge_disjoint_paths(graph: Graph, source: VertexLike, target: VertexLike) ->
     c_target = vertexlike_to_igraph_int_t(target)
 
     # Call wrapped function
-    igraph_edge_disjoint_paths(c_graph, c_res, c_source, c_target)
+    _lib.igraph_edge_disjoint_paths(c_graph, c_res, c_source, c_target)
 
     # Prepare output arguments
     res = c_res.value
@@ -6204,6 +7098,8 @@ def edge_disjoint_paths(graph: Graph, source: VertexLike, target: VertexLike) ->
 
 def vertex_disjoint_paths(graph: Graph, source: VertexLike, target: VertexLike) -> int:
     """Type-annotated wrapper for ``igraph_vertex_disjoint_paths``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
@@ -6211,7 +7107,7 @@ def vertex_disjoint_paths(graph: Graph, source: VertexLike, target: VertexLike)
     c_target = vertexlike_to_igraph_int_t(target)
 
     # Call wrapped function
-    igraph_vertex_disjoint_paths(c_graph, c_res, c_source, c_target)
+    _lib.igraph_vertex_disjoint_paths(c_graph, c_res, c_source, c_target)
 
     # Prepare output arguments
     res = c_res.value
@@ -6222,13 +7118,15 @@ def vertex_disjoint_paths(graph: Graph, source: VertexLike, target: VertexLike)
 
 def adhesion(graph: Graph, checks: bool = True) -> int:
     """Type-annotated wrapper for ``igraph_adhesion``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
     c_checks = any_to_igraph_bool_t(checks)
 
     # Call wrapped function
-    igraph_adhesion(c_graph, c_res, c_checks)
+    _lib.igraph_adhesion(c_graph, c_res, c_checks)
 
     # Prepare output arguments
     res = c_res.value
@@ -6239,13 +7137,15 @@ def adhesion(graph: Graph, checks: bool = True) -> int:
 
 def cohesion(graph: Graph, checks: bool = True) -> int:
     """Type-annotated wrapper for ``igraph_cohesion``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_int_t()
     c_checks = any_to_igraph_bool_t(checks)
 
     # Call wrapped function
-    igraph_cohesion(c_graph, c_res, c_checks)
+    _lib.igraph_cohesion(c_graph, c_res, c_checks)
 
     # Prepare output arguments
     res = c_res.value
@@ -6256,6 +7156,8 @@ def cohesion(graph: Graph, checks: bool = True) -> int:
 
 def dominator_tree(graph: Graph, root: VertexLike, mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, Graph, IntArray]:
     """Type-annotated wrapper for ``igraph_dominator_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_root = vertexlike_to_igraph_int_t(root)
@@ -6265,19 +7167,21 @@ def dominator_tree(graph: Graph, root: VertexLike, mode: NeighborMode = Neighbor
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_dominator_tree(c_graph, c_root, c_dom, c_domtree, c_leftout, c_mode)
+    _lib.igraph_dominator_tree(c_graph, c_root, c_dom, c_domtree, c_leftout, c_mode)
 
     # Prepare output arguments
-    dom = igraph_vector_int_t_to_numpy_array(c_dom)
+    dom = igraph_vector_int_t_to_numpy_array_transfer(c_dom)
     domtree = _create_graph_from_boxed(c_domtree)
-    leftout = igraph_vector_int_t_to_numpy_array(c_leftout)
+    leftout = igraph_vector_int_t_to_numpy_array_transfer(c_leftout)
 
     # Construct return value
     return dom, domtree, leftout
 
 
-def all_st_cuts(graph: Graph, source: VertexLike, target: VertexLike) -> tuple[list[IntArray], list[IntArray]]:
+def all_st_cuts(graph: Graph, source: VertexLike, target: VertexLike, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList]:
     """Type-annotated wrapper for ``igraph_all_st_cuts``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_cuts = _VectorIntList.create(0)
@@ -6286,18 +7190,20 @@ def all_st_cuts(graph: Graph, source: VertexLike, target: VertexLike) -> tuple[l
     c_target = vertexlike_to_igraph_int_t(target)
 
     # Call wrapped function
-    igraph_all_st_cuts(c_graph, c_cuts, c_partition1s, c_source, c_target)
+    _lib.igraph_all_st_cuts(c_graph, c_cuts, c_partition1s, c_source, c_target)
 
     # Prepare output arguments
-    cuts = igraph_vector_int_list_t_to_list_of_numpy_array(c_cuts)
-    partition1s = igraph_vector_int_list_t_to_list_of_numpy_array(c_partition1s)
+    cuts = igraph_vector_int_list_t_to_flat_numpy_arrays(c_cuts) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_cuts)
+    partition1s = igraph_vector_int_list_t_to_flat_numpy_arrays(c_partition1s) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_partition1s)
 
     # Construct return value
     return cuts, partition1s
 
 
-def all_st_mincuts(graph: Graph, source: VertexLike, target: VertexLike, capacity: Optional[Iterable[float]] = None) -> tuple[float, list[IntArray], list[IntArray]]:
+def all_st_mincuts(graph: Graph, source: VertexLike, target: VertexLike, capacity: Optional[Iterable[float]] = None, flat: bool = False) -> tuple[float, list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList]:
     """Type-annotated wrapper for ``igraph_all_st_mincuts``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_value = igraph_real_t()
@@ -6308,12 +7214,12 @@ def all_st_mincuts(graph: Graph, source: VertexLike, target: VertexLike, capacit
     c_capacity = edge_capacities_to_igraph_vector_t_view(capacity, graph) if capacity is not None else None
 
     # Call wrapped function
-    igraph_all_st_mincuts(c_graph, c_value, c_cuts, c_partition1s, c_source, c_target, c_capacity)
+    _lib.igraph_all_st_mincuts(c_graph, c_value, c_cuts, c_partition1s, c_source, c_target, c_capacity)
 
     # Prepare output arguments
     value = c_value.value
-    cuts = igraph_vector_int_list_t_to_list_of_numpy_array(c_cuts)
-    partition1s = igraph_vector_int_list_t_to_list_of_numpy_array(c_partition1s)
+    cuts = igraph_vector_int_list_t_to_flat_numpy_arrays(c_cuts) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_cuts)
+    partition1s = igraph_vector_int_list_t_to_flat_numpy_arrays(c_partition1s) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_partition1s)
 
     # Construct return value
     return value, cuts, partition1s
@@ -6321,17 +7227,19 @@ def all_st_mincuts(graph: Graph, source: VertexLike, target: VertexLike, capacit
 
 def even_tarjan_reduction(graph: Graph) -> tuple[Graph, RealArray]:
     """Type-annotated wrapper for ``igraph_even_tarjan_reduction``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_graphbar = _Graph()
     c_capacity = _Vector.create(0)
 
     # Call wrapped function
-    igraph_even_tarjan_reduction(c_graph, c_graphbar, c_capacity)
+    _lib.igraph_even_tarjan_reduction(c_graph, c_graphbar, c_capacity)
 
     # Prepare output arguments
     graphbar = _create_graph_from_boxed(c_graphbar)
-    capacity = igraph_vector_t_to_numpy_array(c_capacity)
+    capacity = igraph_vector_t_to_numpy_array_transfer(c_capacity)
 
     # Construct return value
     return graphbar, capacity
@@ -6339,13 +7247,15 @@ def even_tarjan_reduction(graph: Graph) -> tuple[Graph, RealArray]:
 
 def is_separator(graph: Graph, candidate: VertexSelector) -> bool:
     """Type-annotated wrapper for ``igraph_is_separator``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_candidate = vertex_selector_to_igraph_vs_t(candidate, graph)
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_separator(c_graph, c_candidate.unwrap(), c_res)
+    _lib.igraph_is_separator(c_graph, c_candidate.unwrap(), c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -6356,13 +7266,15 @@ def is_separator(graph: Graph, candidate: VertexSelector) -> bool:
 
 def is_minimal_separator(graph: Graph, candidate: VertexSelector) -> bool:
     """Type-annotated wrapper for ``igraph_is_minimal_separator``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_candidate = vertex_selector_to_igraph_vs_t(candidate, graph)
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_minimal_separator(c_graph, c_candidate.unwrap(), c_res)
+    _lib.igraph_is_minimal_separator(c_graph, c_candidate.unwrap(), c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -6371,40 +7283,46 @@ def is_minimal_separator(graph: Graph, candidate: VertexSelector) -> bool:
     return res
 
 
-def all_minimal_st_separators(graph: Graph) -> list[IntArray]:
+def all_minimal_st_separators(graph: Graph, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_all_minimal_st_separators``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_separators = _VectorIntList.create(0)
 
     # Call wrapped function
-    igraph_all_minimal_st_separators(c_graph, c_separators)
+    _lib.igraph_all_minimal_st_separators(c_graph, c_separators)
 
     # Prepare output arguments
-    separators = igraph_vector_int_list_t_to_list_of_numpy_array(c_separators)
+    separators = igraph_vector_int_list_t_to_flat_numpy_arrays(c_separators) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_separators)
 
     # Construct return value
     return separators
 
 
-def minimum_size_separators(graph: Graph) -> list[IntArray]:
+def minimum_size_separators(graph: Graph, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_minimum_size_separators``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_separators = _VectorIntList.create(0)
 
     # Call wrapped function
-    igraph_minimum_size_separators(c_graph, c_separators)
+    _lib.igraph_minimum_size_separators(c_graph, c_separators)
 
     # Prepare output arguments
-    separators = igraph_vector_int_list_t_to_list_of_numpy_array(c_separators)
+    separators = igraph_vector_int_list_t_to_flat_numpy_arrays(c_separators) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_separators)
 
     # Construct return value
     return separators
 
 
-def cohesive_blocks(graph: Graph) -> tuple[list[IntArray], IntArray, IntArray, Graph]:
+def cohesive_blocks(graph: Graph, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, IntArray, IntArray, Graph]:
     """Type-annotated wrapper for ``igraph_cohesive_blocks``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_blocks = _VectorIntList.create(0)
@@ -6413,12 +7331,12 @@ def cohesive_blocks(graph: Graph) -> tuple[list[IntArray], IntArray, IntArray, G
     c_blockTree = _Graph()
 
     # Call wrapped function
-    igraph_cohesive_blocks(c_graph, c_blocks, c_cohesion, c_parent, c_blockTree)
+    _lib.igraph_cohesive_blocks(c_graph, c_blocks, c_cohesion, c_parent, c_blockTree)
 
     # Prepare output arguments
-    blocks = igraph_vector_int_list_t_to_list_of_numpy_array(c_blocks)
-    cohesion = igraph_vector_int_t_to_numpy_array(c_cohesion)
-    parent = igraph_vector_int_t_to_numpy_array(c_parent)
+    blocks = igraph_vector_int_list_t_to_flat_numpy_arrays(c_blocks) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_blocks)
+    cohesion = igraph_vector_int_t_to_numpy_array_transfer(c_cohesion)
+    parent = igraph_vector_int_t_to_numpy_array_transfer(c_parent)
     blockTree = _create_graph_from_boxed(c_blockTree)
 
     # Construct return value
@@ -6427,16 +7345,18 @@ def cohesive_blocks(graph: Graph) -> tuple[list[IntArray], IntArray, IntArray, G
 
 def coreness(graph: Graph, mode: NeighborMode = NeighborMode.ALL) -> IntArray:
     """Type-annotated wrapper for ``igraph_coreness``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_cores = _VectorInt.create(0)
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_coreness(c_graph, c_cores, c_mode)
+    _lib.igraph_coreness(c_graph, c_cores, c_mode)
 
     # Prepare output arguments
-    cores = igraph_vector_int_t_to_numpy_array(c_cores)
+    cores = igraph_vector_int_t_to_numpy_array_transfer(c_cores)
 
     # Construct return value
     return cores
@@ -6444,12 +7364,14 @@ def coreness(graph: Graph, mode: NeighborMode = NeighborMode.ALL) -> IntArray:
 
 def isoclass(graph: Graph) -> int:
     """Type-annotated wrapper for ``igraph_isoclass``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_isoclass = igraph_int_t()
 
     # Call wrapped function
-    igraph_isoclass(c_graph, c_isoclass)
+    _lib.igraph_isoclass(c_graph, c_isoclass)
 
     # Prepare output arguments
     isoclass = c_isoclass.value
@@ -6460,13 +7382,15 @@ def isoclass(graph: Graph) -> int:
 
 def isomorphic(graph1: Graph, graph2: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_isomorphic``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph1 = graph1
     c_graph2 = graph2
     c_iso = igraph_bool_t()
 
     # Call wrapped function
-    igraph_isomorphic(c_graph1, c_graph2, c_iso)
+    _lib.igraph_isomorphic(c_graph1, c_graph2, c_iso)
 
     # Prepare output arguments
     iso = c_iso.value
@@ -6475,18 +7399,20 @@ def isomorphic(graph1: Graph, graph2: Graph) -> bool:
     return iso
 
 
-def automorphism_group(graph: Graph, colors: Optional[Iterable[int]] = None) -> list[IntArray]:
+def automorphism_group(graph: Graph, colors: Optional[Iterable[int]] = None, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_automorphism_group``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_colors = vertex_colors_to_igraph_vector_int_t_view(colors, graph) if colors is not None else None
     c_generators = _VectorIntList.create(0)
 
     # Call wrapped function
-    igraph_automorphism_group(c_graph, c_colors, c_generators)
+    _lib.igraph_automorphism_group(c_graph, c_colors, c_generators)
 
     # Prepare output arguments
-    generators = igraph_vector_int_list_t_to_list_of_numpy_array(c_generators)
+    generators = igraph_vector_int_list_t_to_flat_numpy_arrays(c_generators) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_generators)
 
     # Construct return value
     return generators
@@ -6494,13 +7420,15 @@ def automorphism_group(graph: Graph, colors: Optional[Iterable[int]] = None) ->
 
 def count_automorphisms(graph: Graph, colors: Optional[Iterable[int]] = None) -> float:
     """Type-annotated wrapper for ``igraph_count_automorphisms``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_colors = vertex_colors_to_igraph_vector_int_t_view(colors, graph) if colors is not None else None
     c_result = igraph_real_t()
 
     # Call wrapped function
-    igraph_count_automorphisms(c_graph, c_colors, c_result)
+    _lib.igraph_count_automorphisms(c_graph, c_colors, c_result)
 
     # Prepare output arguments
     result = c_result.value
@@ -6511,13 +7439,15 @@ def count_automorphisms(graph: Graph, colors: Optional[Iterable[int]] = None) ->
 
 def isoclass_subgraph(graph: Graph, vids: VertexSelector) -> int:
     """Type-annotated wrapper for ``igraph_isoclass_subgraph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vids = vertex_selector_to_igraph_vs_t(vids, graph)
     c_isoclass = igraph_int_t()
 
     # Call wrapped function
-    igraph_isoclass_subgraph(c_graph, c_vids.unwrap(), c_isoclass)
+    _lib.igraph_isoclass_subgraph(c_graph, c_vids.unwrap(), c_isoclass)
 
     # Prepare output arguments
     isoclass = c_isoclass.value
@@ -6528,6 +7458,8 @@ def isoclass_subgraph(graph: Graph, vids: VertexSelector) -> int:
 
 def isoclass_create(size: int, number: int, directed: bool = True) -> Graph:
     """Type-annotated wrapper for ``igraph_isoclass_create``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_size = size
@@ -6535,7 +7467,7 @@ def isoclass_create(size: int, number: int, directed: bool = True) -> Graph:
     c_directed = any_to_igraph_bool_t(directed)
 
     # Call wrapped function
-    igraph_isoclass_create(c_graph, c_size, c_number, c_directed)
+    _lib.igraph_isoclass_create(c_graph, c_size, c_number, c_directed)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -6554,13 +7486,15 @@ def isoclass_create(size: int, number: int, directed: bool = True) -> Graph:
 
 def subisomorphic(graph1: Graph, graph2: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_subisomorphic``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph1 = graph1
     c_graph2 = graph2
     c_iso = igraph_bool_t()
 
     # Call wrapped function
-    igraph_subisomorphic(c_graph1, c_graph2, c_iso)
+    _lib.igraph_subisomorphic(c_graph1, c_graph2, c_iso)
 
     # Prepare output arguments
     iso = c_iso.value
@@ -6579,16 +7513,18 @@ def subisomorphic(graph1: Graph, graph2: Graph) -> bool:
 
 def canonical_permutation(graph: Graph, colors: Optional[Iterable[int]] = None) -> IntArray:
     """Type-annotated wrapper for ``igraph_canonical_permutation``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_colors = vertex_colors_to_igraph_vector_int_t_view(colors, graph) if colors is not None else None
     c_labeling = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_canonical_permutation(c_graph, c_colors, c_labeling)
+    _lib.igraph_canonical_permutation(c_graph, c_colors, c_labeling)
 
     # Prepare output arguments
-    labeling = igraph_vector_int_t_to_numpy_array(c_labeling)
+    labeling = igraph_vector_int_t_to_numpy_array_transfer(c_labeling)
 
     # Construct return value
     return labeling
@@ -6598,13 +7534,15 @@ def canonical_permutation(graph: Graph, colors: Optional[Iterable[int]] = None)
 
 def permute_vertices(graph: Graph, permutation: Iterable[int]) -> Graph:
     """Type-annotated wrapper for ``igraph_permute_vertices``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
     c_permutation = iterable_to_igraph_vector_int_t_view(permutation)
 
     # Call wrapped function
-    igraph_permute_vertices(c_graph, c_res, c_permutation)
+    _lib.igraph_permute_vertices(c_graph, c_res, c_permutation)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
@@ -6623,6 +7561,8 @@ def permute_vertices(graph: Graph, permutation: Iterable[int]) -> Graph:
 
 def simplify_and_colorize(graph: Graph) -> tuple[Graph, IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_simplify_and_colorize``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _Graph()
@@ -6630,12 +7570,12 @@ def simplify_and_colorize(graph: Graph) -> tuple[Graph, IntArray, IntArray]:
     c_edge_color = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_simplify_and_colorize(c_graph, c_res, c_vertex_color, c_edge_color)
+    _lib.igraph_simplify_and_colorize(c_graph, c_res, c_vertex_color, c_edge_color)
 
     # Prepare output arguments
     res = _create_graph_from_boxed(c_res)
-    vertex_color = igraph_vector_int_t_to_numpy_array(c_vertex_color)
-    edge_color = igraph_vector_int_t_to_numpy_array(c_edge_color)
+    vertex_color = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_color)
+    edge_color = igraph_vector_int_t_to_numpy_array_transfer(c_edge_color)
 
     # Construct return value
     return res, vertex_color, edge_color
@@ -6643,13 +7583,15 @@ def simplify_and_colorize(graph: Graph) -> tuple[Graph, IntArray, IntArray]:
 
 def graph_count(n: int, directed: bool = False) -> int:
     """Type-annotated wrapper for ``igraph_graph_count``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_n = n
     c_directed = any_to_igraph_bool_t(directed)
     c_count = igraph_int_t()
 
     # Call wrapped function
-    igraph_graph_count(c_n, c_directed, c_count)
+    _lib.igraph_graph_count(c_n, c_directed, c_count)
 
     # Prepare output arguments
     count = c_count.value
@@ -6660,6 +7602,8 @@ def graph_count(n: int, directed: bool = False) -> int:
 
 def is_matching(graph: Graph, matching: Iterable[int], types: Optional[Iterable[Any]] = None) -> bool:
     """Type-annotated wrapper for ``igraph_is_matching``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None if types is not None else None
@@ -6667,7 +7611,7 @@ def is_matching(graph: Graph, matching: Iterable[int], types: Optional[Iterable[
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_matching(c_graph, c_types, c_matching, c_res)
+    _lib.igraph_is_matching(c_graph, c_types, c_matching, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -6678,6 +7622,8 @@ def is_matching(graph: Graph, matching: Iterable[int], types: Optional[Iterable[
 
 def is_maximal_matching(graph: Graph, matching: Iterable[int], types: Optional[Iterable[Any]] = None) -> bool:
     """Type-annotated wrapper for ``igraph_is_maximal_matching``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None if types is not None else None
@@ -6685,7 +7631,7 @@ def is_maximal_matching(graph: Graph, matching: Iterable[int], types: Optional[I
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_maximal_matching(c_graph, c_types, c_matching, c_res)
+    _lib.igraph_is_maximal_matching(c_graph, c_types, c_matching, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -6706,16 +7652,18 @@ def is_maximal_matching(graph: Graph, matching: Iterable[int], types: Optional[I
 
 def running_mean(data: Iterable[float], binwidth: int) -> RealArray:
     """Type-annotated wrapper for ``igraph_running_mean``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_data = iterable_to_igraph_vector_t_view(data)
     c_res = _Vector.create(0)
     c_binwidth = binwidth
 
     # Call wrapped function
-    igraph_running_mean(c_data, c_res, c_binwidth)
+    _lib.igraph_running_mean(c_data, c_res, c_binwidth)
 
     # Prepare output arguments
-    res = igraph_vector_t_to_numpy_array(c_res)
+    res = igraph_vector_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -6723,6 +7671,8 @@ def running_mean(data: Iterable[float], binwidth: int) -> RealArray:
 
 def random_sample(l: int, h: int, length: int) -> IntArray:
     """Type-annotated wrapper for ``igraph_random_sample``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_res = _VectorInt.create(0)
     c_l = l
@@ -6730,10 +7680,10 @@ def random_sample(l: int, h: int, length: int) -> IntArray:
     c_length = length
 
     # Call wrapped function
-    igraph_random_sample(c_res, c_l, c_h, c_length)
+    _lib.igraph_random_sample(c_res, c_l, c_h, c_length)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -6741,17 +7691,19 @@ def random_sample(l: int, h: int, length: int) -> IntArray:
 
 def convex_hull_2d(data: MatrixLike) -> tuple[IntArray, RealArray]:
     """Type-annotated wrapper for ``igraph_convex_hull_2d``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_data = sequence_to_igraph_matrix_t_view(data)
     c_resverts = _VectorInt.create(0)
-    c_rescoords = _Matrix.create(0)
+    c_rescoords = _Matrix.create(0, 0)
 
     # Call wrapped function
-    igraph_convex_hull_2d(c_data, c_resverts, c_rescoords)
+    _lib.igraph_convex_hull_2d(c_data, c_resverts, c_rescoords)
 
     # Prepare output arguments
-    resverts = igraph_vector_int_t_to_numpy_array(c_resverts)
-    rescoords = igraph_matrix_t_to_numpy_array(c_rescoords)
+    resverts = igraph_vector_int_t_to_numpy_array_transfer(c_resverts)
+    rescoords = igraph_matrix_t_to_numpy_array_transfer(c_rescoords)
 
     # Construct return value
     return resverts, rescoords
@@ -6759,12 +7711,14 @@ def convex_hull_2d(data: MatrixLike) -> tuple[IntArray, RealArray]:
 
 def dim_select(sv: Iterable[float]) -> int:
     """Type-annotated wrapper for ``igraph_dim_select``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_sv = iterable_to_igraph_vector_t_view(sv)
     c_dim = igraph_int_t()
 
     # Call wrapped function
-    igraph_dim_select(c_sv, c_dim)
+    _lib.igraph_dim_select(c_sv, c_dim)
 
     # Prepare output arguments
     dim = c_dim.value
@@ -6775,13 +7729,15 @@ def dim_select(sv: Iterable[float]) -> int:
 
 def almost_equals(a: float, b: float, eps: float) -> bool:
     """Type-annotated wrapper for ``igraph_almost_equals``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_a = a
     c_b = b
     c_eps = eps
 
     # Call wrapped function
-    c__result = igraph_almost_equals(c_a, c_b, c_eps)
+    c__result = _lib.igraph_almost_equals(c_a, c_b, c_eps)
 
     # Construct return value
     return c__result
@@ -6789,34 +7745,38 @@ def almost_equals(a: float, b: float, eps: float) -> bool:
 
 def cmp_epsilon(a: float, b: float, eps: float) -> int:
     """Type-annotated wrapper for ``igraph_cmp_epsilon``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_a = a
     c_b = b
     c_eps = eps
 
     # Call wrapped function
-    c__result = igraph_cmp_epsilon(c_a, c_b, c_eps)
+    c__result = _lib.igraph_cmp_epsilon(c_a, c_b, c_eps)
 
     # Construct return value
     return c__result
 
-# igraph_eigen_matrix: no Python type known for type: SPARSEMAT
+# igraph_eigen_matrix: no Python type known for type: ARPACK_FUNC
 
-# igraph_eigen_matrix_symmetric: no Python type known for type: SPARSEMAT
+# igraph_eigen_matrix_symmetric: no Python type known for type: ARPACK_FUNC
 
 
 def solve_lsap(c: MatrixLike, n: int) -> IntArray:
     """Type-annotated wrapper for ``igraph_solve_lsap``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_c = sequence_to_igraph_matrix_t_view(c)
     c_n = n
     c_p = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_solve_lsap(c_c, c_n, c_p)
+    _lib.igraph_solve_lsap(c_c, c_n, c_p)
 
     # Prepare output arguments
-    p = igraph_vector_int_t_to_numpy_array(c_p)
+    p = igraph_vector_int_t_to_numpy_array_transfer(c_p)
 
     # Construct return value
     return p
@@ -6824,6 +7784,8 @@ def solve_lsap(c: MatrixLike, n: int) -> IntArray:
 
 def find_cycle(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_find_cycle``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorInt.create(0)
@@ -6831,18 +7793,20 @@ def find_cycle(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[Int
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_find_cycle(c_graph, c_vertices, c_edges, c_mode)
+    _lib.igraph_find_cycle(c_graph, c_vertices, c_edges, c_mode)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_t_to_numpy_array(c_vertices)
-    edges = igraph_vector_int_t_to_numpy_array(c_edges)
+    vertices = igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+    edges = igraph_vector_int_t_to_numpy_array_transfer(c_edges)
 
     # Construct return value
     return vertices, edges
 
 
-def simple_cycles(graph: Graph, mode: NeighborMode = NeighborMode.OUT, min_cycle_length: int = -1, max_cycle_length: int = -1, max_results: int = -1) -> tuple[list[IntArray], list[IntArray]]:
+def simple_cycles(graph: Graph, mode: NeighborMode = NeighborMode.OUT, min_cycle_length: int = -1, max_cycle_length: int = -1, max_results: int = -1, flat: bool = False) -> tuple[list[IntArray] | FlatIntArrayList, list[IntArray] | FlatIntArrayList]:
     """Type-annotated wrapper for ``igraph_simple_cycles``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_vertices = _VectorIntList.create(0)
@@ -6853,11 +7817,11 @@ def simple_cycles(graph: Graph, mode: NeighborMode = NeighborMode.OUT, min_cycle
     c_max_results = max_results
 
     # Call wrapped function
-    igraph_simple_cycles(c_graph, c_vertices, c_edges, c_mode, c_min_cycle_length, c_max_cycle_length, c_max_results)
+    _lib.igraph_simple_cycles(c_graph, c_vertices, c_edges, c_mode, c_min_cycle_length, c_max_cycle_length, c_max_results)
 
     # Prepare output arguments
-    vertices = igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
-    edges = igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
+    vertices = igraph_vector_int_list_t_to_flat_numpy_arrays(c_vertices) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_vertices)
+    edges = igraph_vector_int_list_t_to_flat_numpy_arrays(c_edges) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_edges)
 
     # Construct return value
     return vertices, edges
@@ -6867,13 +7831,15 @@ def simple_cycles(graph: Graph, mode: NeighborMode = NeighborMode.OUT, min_cycle
 
 def is_eulerian(graph: Graph) -> tuple[bool, bool]:
     """Type-annotated wrapper for ``igraph_is_eulerian``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_has_path = igraph_bool_t()
     c_has_cycle = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_eulerian(c_graph, c_has_path, c_has_cycle)
+    _lib.igraph_is_eulerian(c_graph, c_has_path, c_has_cycle)
 
     # Prepare output arguments
     has_path = c_has_path.value
@@ -6885,17 +7851,19 @@ def is_eulerian(graph: Graph) -> tuple[bool, bool]:
 
 def eulerian_path(graph: Graph) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_eulerian_path``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_edge_res = _VectorInt.create(0)
     c_vertex_res = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_eulerian_path(c_graph, c_edge_res, c_vertex_res)
+    _lib.igraph_eulerian_path(c_graph, c_edge_res, c_vertex_res)
 
     # Prepare output arguments
-    edge_res = igraph_vector_int_t_to_numpy_array(c_edge_res)
-    vertex_res = igraph_vector_int_t_to_numpy_array(c_vertex_res)
+    edge_res = igraph_vector_int_t_to_numpy_array_transfer(c_edge_res)
+    vertex_res = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_res)
 
     # Construct return value
     return edge_res, vertex_res
@@ -6903,24 +7871,28 @@ def eulerian_path(graph: Graph) -> tuple[IntArray, IntArray]:
 
 def eulerian_cycle(graph: Graph) -> tuple[IntArray, IntArray]:
     """Type-annotated wrapper for ``igraph_eulerian_cycle``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_edge_res = _VectorInt.create(0)
     c_vertex_res = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_eulerian_cycle(c_graph, c_edge_res, c_vertex_res)
+    _lib.igraph_eulerian_cycle(c_graph, c_edge_res, c_vertex_res)
 
     # Prepare output arguments
-    edge_res = igraph_vector_int_t_to_numpy_array(c_edge_res)
-    vertex_res = igraph_vector_int_t_to_numpy_array(c_vertex_res)
+    edge_res = igraph_vector_int_t_to_numpy_array_transfer(c_edge_res)
+    vertex_res = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_res)
 
     # Construct return value
     return edge_res, vertex_res
 
 
-def fundamental_cycles(graph: Graph, weights: Optional[Iterable[float]] = None, start: Optional[VertexLike] = None, bfs_cutoff: float = -1) -> list[IntArray]:
+def fundamental_cycles(graph: Graph, weights: Optional[Iterable[float]] = None, start: Optional[VertexLike] = None, bfs_cutoff: float = -1, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_fundamental_cycles``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -6929,17 +7901,19 @@ def fundamental_cycles(graph: Graph, weights: Optional[Iterable[float]] = None,
     c_bfs_cutoff = bfs_cutoff
 
     # Call wrapped function
-    igraph_fundamental_cycles(c_graph, c_weights, c_basis, c_start, c_bfs_cutoff)
+    _lib.igraph_fundamental_cycles(c_graph, c_weights, c_basis, c_start, c_bfs_cutoff)
 
     # Prepare output arguments
-    basis = igraph_vector_int_list_t_to_list_of_numpy_array(c_basis)
+    basis = igraph_vector_int_list_t_to_flat_numpy_arrays(c_basis) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_basis)
 
     # Construct return value
     return basis
 
 
-def minimum_cycle_basis(graph: Graph, weights: Optional[Iterable[float]] = None, bfs_cutoff: float = -1, complete: bool = True, use_cycle_order: bool = True) -> list[IntArray]:
+def minimum_cycle_basis(graph: Graph, weights: Optional[Iterable[float]] = None, bfs_cutoff: float = -1, complete: bool = True, use_cycle_order: bool = True, flat: bool = False) -> list[IntArray] | FlatIntArrayList:
     """Type-annotated wrapper for ``igraph_minimum_cycle_basis``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_weights = edge_weights_to_igraph_vector_t_view(weights, graph) if weights is not None else None
@@ -6949,10 +7923,10 @@ def minimum_cycle_basis(graph: Graph, weights: Optional[Iterable[float]] = None,
     c_use_cycle_order = any_to_igraph_bool_t(use_cycle_order)
 
     # Call wrapped function
-    igraph_minimum_cycle_basis(c_graph, c_weights, c_basis, c_bfs_cutoff, c_complete, c_use_cycle_order)
+    _lib.igraph_minimum_cycle_basis(c_graph, c_weights, c_basis, c_bfs_cutoff, c_complete, c_use_cycle_order)
 
     # Prepare output arguments
-    basis = igraph_vector_int_list_t_to_list_of_numpy_array(c_basis)
+    basis = igraph_vector_int_list_t_to_flat_numpy_arrays(c_basis) if flat else igraph_vector_int_list_t_to_list_of_numpy_array(c_basis)
 
     # Construct return value
     return basis
@@ -6960,6 +7934,8 @@ def minimum_cycle_basis(graph: Graph, weights: Optional[Iterable[float]] = None,
 
 def is_tree(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[bool, int]:
     """Type-annotated wrapper for ``igraph_is_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
@@ -6967,7 +7943,7 @@ def is_tree(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[bool,
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_is_tree(c_graph, c_res, c_root, c_mode)
+    _lib.igraph_is_tree(c_graph, c_res, c_root, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -6979,6 +7955,8 @@ def is_tree(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[bool,
 
 def is_forest(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[bool, IntArray]:
     """Type-annotated wrapper for ``igraph_is_forest``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
@@ -6986,11 +7964,11 @@ def is_forest(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[bool
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_is_forest(c_graph, c_res, c_roots, c_mode)
+    _lib.igraph_is_forest(c_graph, c_res, c_roots, c_mode)
 
     # Prepare output arguments
     res = c_res.value
-    roots = igraph_vector_int_t_to_numpy_array(c_roots)
+    roots = igraph_vector_int_t_to_numpy_array_transfer(c_roots)
 
     # Construct return value
     return res, roots
@@ -6998,12 +7976,14 @@ def is_forest(graph: Graph, mode: NeighborMode = NeighborMode.OUT) -> tuple[bool
 
 def from_prufer(prufer: Iterable[int]) -> Graph:
     """Type-annotated wrapper for ``igraph_from_prufer``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_prufer = iterable_to_igraph_vector_int_t_view(prufer)
 
     # Call wrapped function
-    igraph_from_prufer(c_graph, c_prufer)
+    _lib.igraph_from_prufer(c_graph, c_prufer)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7014,15 +7994,17 @@ def from_prufer(prufer: Iterable[int]) -> Graph:
 
 def to_prufer(graph: Graph) -> IntArray:
     """Type-annotated wrapper for ``igraph_to_prufer``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_prufer = _VectorInt.create(0)
 
     # Call wrapped function
-    igraph_to_prufer(c_graph, c_prufer)
+    _lib.igraph_to_prufer(c_graph, c_prufer)
 
     # Prepare output arguments
-    prufer = igraph_vector_int_t_to_numpy_array(c_prufer)
+    prufer = igraph_vector_int_t_to_numpy_array_transfer(c_prufer)
 
     # Construct return value
     return prufer
@@ -7030,13 +8012,15 @@ def to_prufer(graph: Graph) -> IntArray:
 
 def tree_from_parent_vector(parents: Iterable[int], type: TreeMode = TreeMode.OUT) -> Graph:
     """Type-annotated wrapper for ``igraph_tree_from_parent_vector``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_parents = iterable_to_igraph_vector_int_t_view(parents)
     c_type = c_int(type)
 
     # Call wrapped function
-    igraph_tree_from_parent_vector(c_graph, c_parents, c_type)
+    _lib.igraph_tree_from_parent_vector(c_graph, c_parents, c_type)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7047,12 +8031,14 @@ def tree_from_parent_vector(parents: Iterable[int], type: TreeMode = TreeMode.OU
 
 def is_complete(graph: Graph) -> bool:
     """Type-annotated wrapper for ``igraph_is_complete``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_complete(c_graph, c_res)
+    _lib.igraph_is_complete(c_graph, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -7065,16 +8051,18 @@ def is_complete(graph: Graph) -> bool:
 
 def random_spanning_tree(graph: Graph, vid: Optional[VertexLike] = None) -> IntArray:
     """Type-annotated wrapper for ``igraph_random_spanning_tree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_res = _VectorInt.create(0)
     c_vid = vertexlike_to_igraph_int_t(vid) if vid is not None else None
 
     # Call wrapped function
-    igraph_random_spanning_tree(c_graph, c_res, c_vid)
+    _lib.igraph_random_spanning_tree(c_graph, c_res, c_vid)
 
     # Prepare output arguments
-    res = igraph_vector_int_t_to_numpy_array(c_res)
+    res = igraph_vector_int_t_to_numpy_array_transfer(c_res)
 
     # Construct return value
     return res
@@ -7082,6 +8070,8 @@ def random_spanning_tree(graph: Graph, vid: Optional[VertexLike] = None) -> IntA
 
 def tree_game(n: int, directed: bool = False, method: RandomTreeMethod = RandomTreeMethod.LERW) -> Graph:
     """Type-annotated wrapper for ``igraph_tree_game``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_n = n
@@ -7089,7 +8079,7 @@ def tree_game(n: int, directed: bool = False, method: RandomTreeMethod = RandomT
     c_method = c_int(method)
 
     # Call wrapped function
-    igraph_tree_game(c_graph, c_n, c_directed, c_method)
+    _lib.igraph_tree_game(c_graph, c_n, c_directed, c_method)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7102,12 +8092,14 @@ def tree_game(n: int, directed: bool = False, method: RandomTreeMethod = RandomT
 
 def delaunay_graph(points: MatrixLike) -> Graph:
     """Type-annotated wrapper for ``igraph_delaunay_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_points = sequence_to_igraph_matrix_t_view(points)
 
     # Call wrapped function
-    igraph_delaunay_graph(c_graph, c_points)
+    _lib.igraph_delaunay_graph(c_graph, c_points)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7118,12 +8110,14 @@ def delaunay_graph(points: MatrixLike) -> Graph:
 
 def gabriel_graph(points: MatrixLike) -> Graph:
     """Type-annotated wrapper for ``igraph_gabriel_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_points = sequence_to_igraph_matrix_t_view(points)
 
     # Call wrapped function
-    igraph_gabriel_graph(c_graph, c_points)
+    _lib.igraph_gabriel_graph(c_graph, c_points)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7134,12 +8128,14 @@ def gabriel_graph(points: MatrixLike) -> Graph:
 
 def relative_neighborhood_graph(points: MatrixLike) -> Graph:
     """Type-annotated wrapper for ``igraph_relative_neighborhood_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_points = sequence_to_igraph_matrix_t_view(points)
 
     # Call wrapped function
-    igraph_relative_neighborhood_graph(c_graph, c_points)
+    _lib.igraph_relative_neighborhood_graph(c_graph, c_points)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7150,13 +8146,15 @@ def relative_neighborhood_graph(points: MatrixLike) -> Graph:
 
 def lune_beta_skeleton(points: MatrixLike, beta: float = 1) -> Graph:
     """Type-annotated wrapper for ``igraph_lune_beta_skeleton``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_points = sequence_to_igraph_matrix_t_view(points)
     c_beta = beta
 
     # Call wrapped function
-    igraph_lune_beta_skeleton(c_graph, c_points, c_beta)
+    _lib.igraph_lune_beta_skeleton(c_graph, c_points, c_beta)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7167,13 +8165,15 @@ def lune_beta_skeleton(points: MatrixLike, beta: float = 1) -> Graph:
 
 def circle_beta_skeleton(points: MatrixLike, beta: float = 1) -> Graph:
     """Type-annotated wrapper for ``igraph_circle_beta_skeleton``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_points = sequence_to_igraph_matrix_t_view(points)
     c_beta = beta
 
     # Call wrapped function
-    igraph_circle_beta_skeleton(c_graph, c_points, c_beta)
+    _lib.igraph_circle_beta_skeleton(c_graph, c_points, c_beta)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
@@ -7184,6 +8184,8 @@ def circle_beta_skeleton(points: MatrixLike, beta: float = 1) -> Graph:
 
 def beta_weighted_gabriel_graph(points: MatrixLike, max_beta: float = -1) -> tuple[Graph, RealArray]:
     """Type-annotated wrapper for ``igraph_beta_weighted_gabriel_graph``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = _Graph()
     c_weights = _Vector.create(0)
@@ -7191,11 +8193,11 @@ def beta_weighted_gabriel_graph(points: MatrixLike, max_beta: float = -1) -> tup
     c_max_beta = max_beta
 
     # Call wrapped function
-    igraph_beta_weighted_gabriel_graph(c_graph, c_weights, c_points, c_max_beta)
+    _lib.igraph_beta_weighted_gabriel_graph(c_graph, c_weights, c_points, c_max_beta)
 
     # Prepare output arguments
     graph = _create_graph_from_boxed(c_graph)
-    weights = igraph_vector_t_to_numpy_array(c_weights)
+    weights = igraph_vector_t_to_numpy_array_transfer(c_weights)
 
     # Construct return value
     return graph, weights
@@ -7205,16 +8207,18 @@ def beta_weighted_gabriel_graph(points: MatrixLike, max_beta: float = -1) -> tup
 
 def vertex_coloring_greedy(graph: Graph, heuristic: GreedyColoringHeuristics = GreedyColoringHeuristics.NEIGHBORS) -> IntArray:
     """Type-annotated wrapper for ``igraph_vertex_coloring_greedy``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_colors = _VectorInt.create(0)
     c_heuristic = c_int(heuristic)
 
     # Call wrapped function
-    igraph_vertex_coloring_greedy(c_graph, c_colors, c_heuristic)
+    _lib.igraph_vertex_coloring_greedy(c_graph, c_colors, c_heuristic)
 
     # Prepare output arguments
-    colors = igraph_vector_int_t_to_numpy_array(c_colors)
+    colors = igraph_vector_int_t_to_numpy_array_transfer(c_colors)
 
     # Construct return value
     return colors
@@ -7222,13 +8226,15 @@ def vertex_coloring_greedy(graph: Graph, heuristic: GreedyColoringHeuristics = G
 
 def is_vertex_coloring(graph: Graph, types: Iterable[int]) -> bool:
     """Type-annotated wrapper for ``igraph_is_vertex_coloring``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = vertex_colors_to_igraph_vector_int_t_view(types, graph)
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_vertex_coloring(c_graph, c_types, c_res)
+    _lib.igraph_is_vertex_coloring(c_graph, c_types, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -7239,6 +8245,8 @@ def is_vertex_coloring(graph: Graph, types: Iterable[int]) -> bool:
 
 def is_bipartite_coloring(graph: Graph, types: Iterable[Any]) -> tuple[bool, NeighborMode]:
     """Type-annotated wrapper for ``igraph_is_bipartite_coloring``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = iterable_to_igraph_vector_bool_t_view(types) if types is not None else None
@@ -7246,7 +8254,7 @@ def is_bipartite_coloring(graph: Graph, types: Iterable[Any]) -> tuple[bool, Nei
     c_mode = None
 
     # Call wrapped function
-    igraph_is_bipartite_coloring(c_graph, c_types, c_res, c_mode)
+    _lib.igraph_is_bipartite_coloring(c_graph, c_types, c_res, c_mode)
 
     # Prepare output arguments
     res = c_res.value
@@ -7258,13 +8266,15 @@ def is_bipartite_coloring(graph: Graph, types: Iterable[Any]) -> tuple[bool, Nei
 
 def is_edge_coloring(graph: Graph, types: Iterable[int]) -> bool:
     """Type-annotated wrapper for ``igraph_is_edge_coloring``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_types = edge_colors_to_igraph_vector_int_t_view(types, graph)
     c_res = igraph_bool_t()
 
     # Call wrapped function
-    igraph_is_edge_coloring(c_graph, c_types, c_res)
+    _lib.igraph_is_edge_coloring(c_graph, c_types, c_res)
 
     # Prepare output arguments
     res = c_res.value
@@ -7275,6 +8285,8 @@ def is_edge_coloring(graph: Graph, types: Iterable[int]) -> bool:
 
 def convergence_degree(graph: Graph) -> tuple[RealArray, RealArray, RealArray]:
     """Type-annotated wrapper for ``igraph_convergence_degree``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_result = _Vector.create(0)
@@ -7282,12 +8294,12 @@ def convergence_degree(graph: Graph) -> tuple[RealArray, RealArray, RealArray]:
     c_out = _Vector.create(0)
 
     # Call wrapped function
-    igraph_convergence_degree(c_graph, c_result, c_in, c_out)
+    _lib.igraph_convergence_degree(c_graph, c_result, c_in, c_out)
 
     # Prepare output arguments
-    result = igraph_vector_t_to_numpy_array(c_result)
-    in_ = igraph_vector_t_to_numpy_array(c_in)
-    out = igraph_vector_t_to_numpy_array(c_out)
+    result = igraph_vector_t_to_numpy_array_transfer(c_result)
+    in_ = igraph_vector_t_to_numpy_array_transfer(c_in)
+    out = igraph_vector_t_to_numpy_array_transfer(c_out)
 
     # Construct return value
     return result, in_, out
@@ -7295,8 +8307,10 @@ def convergence_degree(graph: Graph) -> tuple[RealArray, RealArray, RealArray]:
 
 def has_attribute_table() -> bool:
     """Type-annotated wrapper for ``igraph_has_attribute_table``."""
+    ensure_thread_is_set_up()
+
     # Call wrapped function
-    c__result = igraph_has_attribute_table()
+    c__result = _lib.igraph_has_attribute_table()
 
     # Construct return value
     return c__result
@@ -7308,11 +8322,13 @@ def has_attribute_table() -> bool:
 
 def strerror(igraph_errno: int) -> str:
     """Type-annotated wrapper for ``igraph_strerror``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_igraph_errno = igraph_errno
 
     # Call wrapped function
-    c__result = igraph_strerror(c_igraph_errno)
+    c__result = _lib.igraph_strerror(c_igraph_errno)
 
     # Prepare return value
     py__result = bytes_to_str(c__result)
@@ -7323,27 +8339,33 @@ def strerror(igraph_errno: int) -> str:
 
 def expand_path_to_pairs(path: Iterable[VertexLike]) -> None:
     """Type-annotated wrapper for ``igraph_expand_path_to_pairs``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_path = iterable_vertex_indices_to_igraph_vector_int_t(path)
 
     # Call wrapped function
-    igraph_expand_path_to_pairs(c_path)
+    _lib.igraph_expand_path_to_pairs(c_path)
 
     # Prepare output arguments
-    path = igraph_vector_int_t_to_numpy_array(c_path)
+    path = igraph_vector_int_t_to_numpy_array_transfer(c_path)
 
 
 def invalidate_cache(graph: Graph) -> None:
     """Type-annotated wrapper for ``igraph_invalidate_cache``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
 
     # Call wrapped function
-    igraph_invalidate_cache(c_graph)
+    _lib.igraph_invalidate_cache(c_graph)
 
 
 def vertex_path_from_edge_path(graph: Graph, edge_path: Iterable[EdgeLike], start: Optional[VertexLike] = None, mode: NeighborMode = NeighborMode.OUT) -> IntArray:
     """Type-annotated wrapper for ``igraph_vertex_path_from_edge_path``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_graph = graph
     c_start = vertexlike_to_igraph_int_t(start) if start is not None else None
@@ -7352,10 +8374,10 @@ def vertex_path_from_edge_path(graph: Graph, edge_path: Iterable[EdgeLike], star
     c_mode = c_int(mode)
 
     # Call wrapped function
-    igraph_vertex_path_from_edge_path(c_graph, c_start, c_edge_path, c_vertex_path, c_mode)
+    _lib.igraph_vertex_path_from_edge_path(c_graph, c_start, c_edge_path, c_vertex_path, c_mode)
 
     # Prepare output arguments
-    vertex_path = igraph_vector_int_t_to_numpy_array(c_vertex_path)
+    vertex_path = igraph_vector_int_t_to_numpy_array_transfer(c_vertex_path)
 
     # Construct return value
     return vertex_path
@@ -7363,6 +8385,8 @@ def vertex_path_from_edge_path(graph: Graph, edge_path: Iterable[EdgeLike], star
 
 def version() -> tuple[str, int, int, int]:
     """Type-annotated wrapper for ``igraph_version``."""
+    ensure_thread_is_set_up()
+
     # Prepare input arguments
     c_version_string = c_char_p()
     c_major = c_int()
@@ -7370,7 +8394,7 @@ def version() -> tuple[str, int, int, int]:
     c_subminor = c_int()
 
     # Call wrapped function
-    igraph_version(c_version_string, c_major, c_minor, c_subminor)
+    _lib.igraph_version(c_version_string, c_major, c_minor, c_subminor)
 
     # Prepare output arguments
     version_string = bytes_to_str(c_version_string)
@@ -3,7 +3,7 @@
 from ctypes import cdll, c_char_p, c_double, c_int, c_size_t, c_void_p, CDLL, POINTER
 from ctypes.util import find_library
 from platform import system
-from typing import Any
+from typing import Any, Callable, TYPE_CHECKING
 
 from .errors import handle_igraph_error_t
 from .types import (
@@ -33,8 +33,12 @@ from .types import (
     igraph_es_t,
     igraph_adjlist_t,
     igraph_arpack_options_t,
+    igraph_astar_heuristic_func_t,
+    igraph_bfshandler_t,
     igraph_bliss_info_t,
+    igraph_clique_handler_t,
     igraph_cycle_handler_t,
+    igraph_dfshandler_t,
     igraph_error_handler_t,
     igraph_fatal_handler_t,
     igraph_hrg_t,
@@ -44,6 +48,7 @@ from .types import (
     igraph_isocompat_t,
     igraph_isohandler_t,
     igraph_plfit_result_t,
+    igraph_progress_handler_t,
     igraph_rewiring_stats_t,
     igraph_rng_t,
     igraph_rng_type_t,
@@ -81,6 +86,39 @@ def _load_libc():
 _libc: Any = _load_libc()
 _lib: Any = _load_igraph_c_library()
 
+_lazy_symbols: dict[str, Callable[[], tuple[Any, list[Any]]]] = {}
+"""Functions of the igraph C library that are bound lazily, mapped to functions
+that return their return types and argument types. The contents of this
+dictionary are filled by the part of this module that is generated by Stimulus.
+"""
+
+
+def __getattr__(name: str) -> Any:
+    """Binds a function of the igraph C library when it is accessed for the
+    first time and caches it in the namespace of this module so subsequent
+    accesses do not go through this function.
+    """
+    signature = _lazy_symbols.get(name)
+    if signature is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    func = getattr(_lib, name)
+    func.restype, func.argtypes = signature()
+    globals()[name] = func
+    return func
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_symbols})
+
+
+if TYPE_CHECKING:
+    # Lazily bound functions are typed as Any through __getattr__(); the ones
+    # below are declared explicitly for the type checker
+    def igraph_vcount(graph: Any) -> int: ...
+    def igraph_ecount(graph: Any) -> int: ...
+
+
 # Standard libc functions
 
 fclose = _libc.fclose
@@ -133,6 +171,10 @@ igraph_vector_resize = _lib.igraph_vector_resize
 igraph_vector_resize.restype = handle_igraph_error_t
 igraph_vector_resize.argtypes = [POINTER(igraph_vector_t), igraph_int_t]
 
+igraph_vector_resize_min = _lib.igraph_vector_resize_min
+igraph_vector_resize_min.restype = None
+igraph_vector_resize_min.argtypes = [POINTER(igraph_vector_t)]
+
 igraph_vector_set = _lib.igraph_vector_set
 igraph_vector_set.restype = None
 igraph_vector_set.argtypes = [POINTER(igraph_vector_t), igraph_int_t, igraph_real_t]
@@ -183,6 +225,10 @@ igraph_vector_int_resize = _lib.igraph_vector_int_resize
 igraph_vector_int_resize.restype = handle_igraph_error_t
 igraph_vector_int_resize.argtypes = [POINTER(igraph_vector_int_t), igraph_int_t]
 
+igraph_vector_int_resize_min = _lib.igraph_vector_int_resize_min
+igraph_vector_int_resize_min.restype = None
+igraph_vector_int_resize_min.argtypes = [POINTER(igraph_vector_int_t)]
+
 igraph_vector_int_set = _lib.igraph_vector_int_set
 igraph_vector_int_set.restype = None
 igraph_vector_int_set.argtypes = [POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t]
@@ -233,6 +279,10 @@ igraph_vector_bool_resize = _lib.igraph_vector_bool_resize
 igraph_vector_bool_resize.restype = handle_igraph_error_t
 igraph_vector_bool_resize.argtypes = [POINTER(igraph_vector_bool_t), igraph_int_t]
 
+igraph_vector_bool_resize_min = _lib.igraph_vector_bool_resize_min
+igraph_vector_bool_resize_min.restype = None
+igraph_vector_bool_resize_min.argtypes = [POINTER(igraph_vector_bool_t)]
+
 igraph_vector_bool_set = _lib.igraph_vector_bool_set
 igraph_vector_bool_set.restype = None
 igraph_vector_bool_set.argtypes = [POINTER(igraph_vector_bool_t), igraph_int_t, igraph_bool_t]
@@ -263,6 +313,10 @@ igraph_vector_ptr_get = _lib.igraph_vector_ptr_get
 igraph_vector_ptr_get.restype = c_void_p
 igraph_vector_ptr_get.argtypes = [POINTER(igraph_vector_ptr_t), igraph_int_t]
 
+igraph_vector_ptr_set = _lib.igraph_vector_ptr_set
+igraph_vector_ptr_set.restype = None
+igraph_vector_ptr_set.argtypes = [POINTER(igraph_vector_ptr_t), igraph_int_t, c_void_p]
+
 igraph_vector_ptr_resize = _lib.igraph_vector_ptr_resize
 igraph_vector_ptr_resize.restype = handle_igraph_error_t
 igraph_vector_ptr_resize.argtypes = [POINTER(igraph_vector_ptr_t), igraph_int_t]
@@ -273,6 +327,14 @@ igraph_vector_ptr_size.argtypes = [POINTER(igraph_vector_ptr_t)]
 
 # String vector type
 
+igraph_strvector_init = _lib.igraph_strvector_init
+igraph_strvector_init.restype = handle_igraph_error_t
+igraph_strvector_init.argtypes = [POINTER(igraph_strvector_t), igraph_int_t]
+
+igraph_strvector_destroy = _lib.igraph_strvector_destroy
+igraph_strvector_destroy.restype = None
+igraph_strvector_destroy.argtypes = [POINTER(igraph_strvector_t)]
+
 igraph_strvector_clear = _lib.igraph_strvector_clear
 igraph_strvector_clear.restype = None
 igraph_strvector_clear.argtypes = [POINTER(igraph_strvector_t)]
@@ -297,6 +359,10 @@ igraph_strvector_size = _lib.igraph_strvector_size
 igraph_strvector_size.restype = igraph_int_t
 igraph_strvector_size.argtypes = [POINTER(igraph_strvector_t)]
 
+igraph_strvector_update = _lib.igraph_strvector_update
+igraph_strvector_update.restype = handle_igraph_error_t
+igraph_strvector_update.argtypes = [POINTER(igraph_strvector_t), POINTER(igraph_strvector_t)]
+
 # Matrix type
 
 igraph_matrix_init = _lib.igraph_matrix_init
@@ -377,6 +443,21 @@ igraph_matrix_int_nrow = _lib.igraph_matrix_int_nrow
 igraph_matrix_int_nrow.restype = igraph_int_t
 igraph_matrix_int_nrow.argtypes = [POINTER(igraph_matrix_int_t)]
 
+# Sparse matrix type
+
+igraph_sparsemat_init = _lib.igraph_sparsemat_init
+igraph_sparsemat_init.restype = handle_igraph_error_t
+igraph_sparsemat_init.argtypes = [
+    POINTER(igraph_sparsemat_t),
+    igraph_int_t,
+    igraph_int_t,
+    igraph_int_t,
+]
+
+igraph_sparsemat_destroy = _lib.igraph_sparsemat_destroy
+igraph_sparsemat_destroy.restype = None
+igraph_sparsemat_destroy.argtypes = [c_void_p]
+
 # List of vectors type
 
 igraph_vector_list_init = _lib.igraph_vector_list_init
@@ -421,6 +502,24 @@ igraph_vector_int_list_size = _lib.igraph_vector_int_list_size
 igraph_vector_int_list_size.restype = igraph_int_t
 igraph_vector_int_list_size.argtypes = [POINTER(igraph_vector_int_list_t)]
 
+# List of graphs type
+
+igraph_graph_list_init = _lib.igraph_graph_list_init
+igraph_graph_list_init.restype = handle_igraph_error_t
+igraph_graph_list_init.argtypes = [POINTER(igraph_graph_list_t), igraph_int_t]
+
+igraph_graph_list_destroy = _lib.igraph_graph_list_destroy
+igraph_graph_list_destroy.restype = None
+igraph_graph_list_destroy.argtypes = [c_void_p]
+
+igraph_graph_list_replace = _lib.igraph_graph_list_replace
+igraph_graph_list_replace.restype = None
+igraph_graph_list_replace.argtypes = [POINTER(igraph_graph_list_t), igraph_int_t, POINTER(igraph_t)]
+
+igraph_graph_list_size = _lib.igraph_graph_list_size
+igraph_graph_list_size.restype = igraph_int_t
+igraph_graph_list_size.argtypes = [POINTER(igraph_graph_list_t)]
+
 # Vertex selector type
 
 igraph_vs_none = _lib.igraph_vs_none
@@ -439,6 +538,10 @@ igraph_vs_as_vector = _lib.igraph_vs_as_vector
 igraph_vs_as_vector.restype = handle_igraph_error_t
 igraph_vs_as_vector.argtypes = [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_vector_int_t)]
 
+igraph_vs_size = _lib.igraph_vs_size
+igraph_vs_size.restype = handle_igraph_error_t
+igraph_vs_size.argtypes = [POINTER(igraph_t), POINTER(igraph_vs_t), POINTER(igraph_int_t)]
+
 igraph_vs_type = _lib.igraph_vs_type
 igraph_vs_type.restype = c_int
 igraph_vs_type.argtypes = [POINTER(igraph_vs_t)]
@@ -546,6 +649,12 @@ igraph_attribute_record_list_size = _lib.igraph_attribute_record_list_size
 igraph_attribute_record_list_size.restype = igraph_int_t
 igraph_attribute_record_list_size.argtypes = [POINTER(igraph_attribute_record_list_t)]
 
+# Memory management
+
+igraph_free = _lib.igraph_free
+igraph_free.restype = None
+igraph_free.argtypes = [c_void_p]
+
 # Error handling and interruptions
 
 igraph_error = _lib.igraph_error
@@ -572,6 +681,12 @@ igraph_set_warning_handler = _lib.igraph_set_warning_handler
 igraph_set_warning_handler.restype = igraph_warning_handler_t
 igraph_set_warning_handler.argtypes = [igraph_warning_handler_t]
 
+# Progress reporting
+
+igraph_set_progress_handler = _lib.igraph_set_progress_handler
+igraph_set_progress_handler.restype = igraph_progress_handler_t
+igraph_set_progress_handler.argtypes = [igraph_progress_handler_t]
+
 # The rest of this file is generated by Stimulus
 # Set up aliases for all enum types
 
@@ -624,1890 +739,956 @@ igraph_write_gml_sw_t = c_int
 
 # Add argument and return types for functions imported from igraph
 
-igraph_empty = _lib.igraph_empty
-igraph_empty.restype = handle_igraph_error_t
-igraph_empty.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_empty"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t])
 
-igraph_add_edges = _lib.igraph_add_edges
-igraph_add_edges.restype = handle_igraph_error_t
-igraph_add_edges.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_attribute_record_list_t)]
+_lazy_symbols["igraph_add_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_attribute_record_list_t)])
 
-igraph_add_vertices = _lib.igraph_add_vertices
-igraph_add_vertices.restype = handle_igraph_error_t
-igraph_add_vertices.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_attribute_record_list_t)]
+_lazy_symbols["igraph_add_vertices"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_attribute_record_list_t)])
 
-igraph_copy = _lib.igraph_copy
-igraph_copy.restype = handle_igraph_error_t
-igraph_copy.argtypes = [POINTER(igraph_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_copy"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t)])
 
-igraph_delete_edges = _lib.igraph_delete_edges
-igraph_delete_edges.restype = handle_igraph_error_t
-igraph_delete_edges.argtypes = [POINTER(igraph_t), igraph_es_t]
+_lazy_symbols["igraph_delete_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_es_t])
 
-igraph_delete_vertices = _lib.igraph_delete_vertices
-igraph_delete_vertices.restype = handle_igraph_error_t
-igraph_delete_vertices.argtypes = [POINTER(igraph_t), igraph_vs_t]
+_lazy_symbols["igraph_delete_vertices"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t])
 
-igraph_delete_vertices_map = _lib.igraph_delete_vertices_map
-igraph_delete_vertices_map.restype = handle_igraph_error_t
-igraph_delete_vertices_map.argtypes = [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_delete_vertices_map"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_vcount = _lib.igraph_vcount
-igraph_vcount.restype = igraph_int_t
-igraph_vcount.argtypes = [POINTER(igraph_t)]
+_lazy_symbols["igraph_vcount"] = lambda: (igraph_int_t, [POINTER(igraph_t)])
 
-igraph_ecount = _lib.igraph_ecount
-igraph_ecount.restype = igraph_int_t
-igraph_ecount.argtypes = [POINTER(igraph_t)]
+_lazy_symbols["igraph_ecount"] = lambda: (igraph_int_t, [POINTER(igraph_t)])
 
-igraph_neighbors = _lib.igraph_neighbors
-igraph_neighbors.restype = handle_igraph_error_t
-igraph_neighbors.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t, igraph_loops_t, igraph_bool_t]
+_lazy_symbols["igraph_neighbors"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t, igraph_loops_t, igraph_bool_t])
 
-igraph_is_directed = _lib.igraph_is_directed
-igraph_is_directed.restype = igraph_bool_t
-igraph_is_directed.argtypes = [POINTER(igraph_t)]
+_lazy_symbols["igraph_is_directed"] = lambda: (igraph_bool_t, [POINTER(igraph_t)])
 
-igraph_degree = _lib.igraph_degree
-igraph_degree.restype = handle_igraph_error_t
-igraph_degree.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_vs_t, igraph_neimode_t, igraph_loops_t]
+_lazy_symbols["igraph_degree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_vs_t, igraph_neimode_t, igraph_loops_t])
 
-igraph_edge = _lib.igraph_edge
-igraph_edge.restype = handle_igraph_error_t
-igraph_edge.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_int_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_edge"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_int_t), POINTER(igraph_int_t)])
 
-igraph_edges = _lib.igraph_edges
-igraph_edges.restype = handle_igraph_error_t
-igraph_edges.argtypes = [POINTER(igraph_t), igraph_es_t, POINTER(igraph_vector_int_t), igraph_bool_t]
+_lazy_symbols["igraph_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_es_t, POINTER(igraph_vector_int_t), igraph_bool_t])
 
-igraph_get_eid = _lib.igraph_get_eid
-igraph_get_eid.restype = handle_igraph_error_t
-igraph_get_eid.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_get_eid"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_get_eids = _lib.igraph_get_eids
-igraph_get_eids.restype = handle_igraph_error_t
-igraph_get_eids.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_get_eids"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t])
 
-igraph_get_all_eids_between = _lib.igraph_get_all_eids_between
-igraph_get_all_eids_between.restype = handle_igraph_error_t
-igraph_get_all_eids_between.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_get_all_eids_between"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, igraph_bool_t])
 
-igraph_incident = _lib.igraph_incident
-igraph_incident.restype = handle_igraph_error_t
-igraph_incident.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t, igraph_loops_t]
+_lazy_symbols["igraph_incident"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t, igraph_loops_t])
 
-igraph_is_same_graph = _lib.igraph_is_same_graph
-igraph_is_same_graph.restype = handle_igraph_error_t
-igraph_is_same_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_is_same_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_create = _lib.igraph_create
-igraph_create.restype = handle_igraph_error_t
-igraph_create.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_create"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_bool_t])
 
-igraph_adjacency = _lib.igraph_adjacency
-igraph_adjacency.restype = handle_igraph_error_t
-igraph_adjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_adjacency_t, igraph_loops_t]
+_lazy_symbols["igraph_adjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_adjacency_t, igraph_loops_t])
 
-igraph_sparse_adjacency = _lib.igraph_sparse_adjacency
-igraph_sparse_adjacency.restype = handle_igraph_error_t
-igraph_sparse_adjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_adjacency_t, igraph_loops_t]
+_lazy_symbols["igraph_sparse_adjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_adjacency_t, igraph_loops_t])
 
-igraph_sparse_weighted_adjacency = _lib.igraph_sparse_weighted_adjacency
-igraph_sparse_weighted_adjacency.restype = handle_igraph_error_t
-igraph_sparse_weighted_adjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t]
+_lazy_symbols["igraph_sparse_weighted_adjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t])
 
-igraph_weighted_adjacency = _lib.igraph_weighted_adjacency
-igraph_weighted_adjacency.restype = handle_igraph_error_t
-igraph_weighted_adjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t]
+_lazy_symbols["igraph_weighted_adjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t])
 
-igraph_star = _lib.igraph_star
-igraph_star.restype = handle_igraph_error_t
-igraph_star.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_star_mode_t, igraph_int_t]
+_lazy_symbols["igraph_star"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_star_mode_t, igraph_int_t])
 
-igraph_wheel = _lib.igraph_wheel
-igraph_wheel.restype = handle_igraph_error_t
-igraph_wheel.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_wheel_mode_t, igraph_int_t]
+_lazy_symbols["igraph_wheel"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_wheel_mode_t, igraph_int_t])
 
-igraph_hypercube = _lib.igraph_hypercube
-igraph_hypercube.restype = handle_igraph_error_t
-igraph_hypercube.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_hypercube"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t])
 
-igraph_square_lattice = _lib.igraph_square_lattice
-igraph_square_lattice.restype = handle_igraph_error_t
-igraph_square_lattice.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_bool_t, igraph_bool_t, POINTER(igraph_vector_bool_t)]
+_lazy_symbols["igraph_square_lattice"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_bool_t, igraph_bool_t, POINTER(igraph_vector_bool_t)])
 
-igraph_triangular_lattice = _lib.igraph_triangular_lattice
-igraph_triangular_lattice.restype = handle_igraph_error_t
-igraph_triangular_lattice.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_triangular_lattice"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t])
 
-igraph_ring = _lib.igraph_ring
-igraph_ring.restype = handle_igraph_error_t
-igraph_ring.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_ring"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t, igraph_bool_t])
 
-igraph_path_graph = _lib.igraph_path_graph
-igraph_path_graph.restype = handle_igraph_error_t
-igraph_path_graph.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_path_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_cycle_graph = _lib.igraph_cycle_graph
-igraph_cycle_graph.restype = handle_igraph_error_t
-igraph_cycle_graph.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_cycle_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_kary_tree = _lib.igraph_kary_tree
-igraph_kary_tree.restype = handle_igraph_error_t
-igraph_kary_tree.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_tree_mode_t]
+_lazy_symbols["igraph_kary_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_tree_mode_t])
 
-igraph_symmetric_tree = _lib.igraph_symmetric_tree
-igraph_symmetric_tree.restype = handle_igraph_error_t
-igraph_symmetric_tree.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_tree_mode_t]
+_lazy_symbols["igraph_symmetric_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_tree_mode_t])
 
-igraph_regular_tree = _lib.igraph_regular_tree
-igraph_regular_tree.restype = handle_igraph_error_t
-igraph_regular_tree.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_tree_mode_t]
+_lazy_symbols["igraph_regular_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_tree_mode_t])
 
-igraph_full = _lib.igraph_full
-igraph_full.restype = handle_igraph_error_t
-igraph_full.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_full"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_full_citation = _lib.igraph_full_citation
-igraph_full_citation.restype = handle_igraph_error_t
-igraph_full_citation.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_full_citation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t])
 
-igraph_atlas = _lib.igraph_atlas
-igraph_atlas.restype = handle_igraph_error_t
-igraph_atlas.argtypes = [POINTER(igraph_t), igraph_int_t]
+_lazy_symbols["igraph_atlas"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t])
 
-igraph_extended_chordal_ring = _lib.igraph_extended_chordal_ring
-igraph_extended_chordal_ring.restype = handle_igraph_error_t
-igraph_extended_chordal_ring.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_matrix_int_t), igraph_bool_t]
+_lazy_symbols["igraph_extended_chordal_ring"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_matrix_int_t), igraph_bool_t])
 
-igraph_connect_neighborhood = _lib.igraph_connect_neighborhood
-igraph_connect_neighborhood.restype = handle_igraph_error_t
-igraph_connect_neighborhood.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_neimode_t]
+_lazy_symbols["igraph_connect_neighborhood"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_neimode_t])
 
-igraph_graph_power = _lib.igraph_graph_power
-igraph_graph_power.restype = handle_igraph_error_t
-igraph_graph_power.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_graph_power"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t, igraph_bool_t])
 
-igraph_linegraph = _lib.igraph_linegraph
-igraph_linegraph.restype = handle_igraph_error_t
-igraph_linegraph.argtypes = [POINTER(igraph_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_linegraph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t)])
 
-igraph_de_bruijn = _lib.igraph_de_bruijn
-igraph_de_bruijn.restype = handle_igraph_error_t
-igraph_de_bruijn.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_de_bruijn"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t])
 
-igraph_kautz = _lib.igraph_kautz
-igraph_kautz.restype = handle_igraph_error_t
-igraph_kautz.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_kautz"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t])
 
-igraph_famous = _lib.igraph_famous
-igraph_famous.restype = handle_igraph_error_t
-igraph_famous.argtypes = [POINTER(igraph_t), c_char_p]
+_lazy_symbols["igraph_famous"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), c_char_p])
 
-igraph_lcf = _lib.igraph_lcf
-igraph_lcf.restype = handle_igraph_error_t
-igraph_lcf.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), igraph_int_t]
+_lazy_symbols["igraph_lcf"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), igraph_int_t])
 
-igraph_mycielski_graph = _lib.igraph_mycielski_graph
-igraph_mycielski_graph.restype = handle_igraph_error_t
-igraph_mycielski_graph.argtypes = [POINTER(igraph_t), igraph_int_t]
+_lazy_symbols["igraph_mycielski_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t])
 
-igraph_adjlist = _lib.igraph_adjlist
-igraph_adjlist.restype = handle_igraph_error_t
-igraph_adjlist.argtypes = [POINTER(igraph_t), POINTER(igraph_adjlist_t), igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_adjlist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_adjlist_t), igraph_neimode_t, igraph_bool_t])
 
-igraph_full_bipartite = _lib.igraph_full_bipartite
-igraph_full_bipartite.restype = handle_igraph_error_t
-igraph_full_bipartite.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_full_bipartite"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_neimode_t])
 
-igraph_full_multipartite = _lib.igraph_full_multipartite
-igraph_full_multipartite.restype = handle_igraph_error_t
-igraph_full_multipartite.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_full_multipartite"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_neimode_t])
 
-igraph_realize_degree_sequence = _lib.igraph_realize_degree_sequence
-igraph_realize_degree_sequence.restype = handle_igraph_error_t
-igraph_realize_degree_sequence.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, igraph_realize_degseq_t]
+_lazy_symbols["igraph_realize_degree_sequence"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, igraph_realize_degseq_t])
 
-igraph_realize_bipartite_degree_sequence = _lib.igraph_realize_bipartite_degree_sequence
-igraph_realize_bipartite_degree_sequence.restype = handle_igraph_error_t
-igraph_realize_bipartite_degree_sequence.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, igraph_realize_degseq_t]
+_lazy_symbols["igraph_realize_bipartite_degree_sequence"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, igraph_realize_degseq_t])
 
-igraph_circulant = _lib.igraph_circulant
-igraph_circulant.restype = handle_igraph_error_t
-igraph_circulant.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t]
+_lazy_symbols["igraph_circulant"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t])
 
-igraph_generalized_petersen = _lib.igraph_generalized_petersen
-igraph_generalized_petersen.restype = handle_igraph_error_t
-igraph_generalized_petersen.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_generalized_petersen"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t])
 
-igraph_turan = _lib.igraph_turan
-igraph_turan.restype = handle_igraph_error_t
-igraph_turan.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_turan"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t])
 
-igraph_barabasi_game = _lib.igraph_barabasi_game
-igraph_barabasi_game.restype = handle_igraph_error_t
-igraph_barabasi_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_bool_t, igraph_barabasi_algorithm_t, POINTER(igraph_t)]
+_lazy_symbols["igraph_barabasi_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_bool_t, igraph_barabasi_algorithm_t, POINTER(igraph_t)])
 
-igraph_erdos_renyi_game_gnp = _lib.igraph_erdos_renyi_game_gnp
-igraph_erdos_renyi_game_gnp.restype = handle_igraph_error_t
-igraph_erdos_renyi_game_gnp.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_bool_t, igraph_edge_type_sw_t, igraph_bool_t]
+_lazy_symbols["igraph_erdos_renyi_game_gnp"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_bool_t, igraph_edge_type_sw_t, igraph_bool_t])
 
-igraph_erdos_renyi_game_gnm = _lib.igraph_erdos_renyi_game_gnm
-igraph_erdos_renyi_game_gnm.restype = handle_igraph_error_t
-igraph_erdos_renyi_game_gnm.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_edge_type_sw_t, igraph_bool_t]
+_lazy_symbols["igraph_erdos_renyi_game_gnm"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_edge_type_sw_t, igraph_bool_t])
 
-igraph_iea_game = _lib.igraph_iea_game
-igraph_iea_game.restype = handle_igraph_error_t
-igraph_iea_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_iea_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_degree_sequence_game = _lib.igraph_degree_sequence_game
-igraph_degree_sequence_game.restype = handle_igraph_error_t
-igraph_degree_sequence_game.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_degseq_t]
+_lazy_symbols["igraph_degree_sequence_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_degseq_t])
 
-igraph_growing_random_game = _lib.igraph_growing_random_game
-igraph_growing_random_game.restype = handle_igraph_error_t
-igraph_growing_random_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_growing_random_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_barabasi_aging_game = _lib.igraph_barabasi_aging_game
-igraph_barabasi_aging_game.restype = handle_igraph_error_t
-igraph_barabasi_aging_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_real_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_barabasi_aging_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_real_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_bool_t])
 
-igraph_recent_degree_game = _lib.igraph_recent_degree_game
-igraph_recent_degree_game.restype = handle_igraph_error_t
-igraph_recent_degree_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_recent_degree_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_bool_t])
 
-igraph_recent_degree_aging_game = _lib.igraph_recent_degree_aging_game
-igraph_recent_degree_aging_game.restype = handle_igraph_error_t
-igraph_recent_degree_aging_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_real_t, igraph_int_t, igraph_int_t, igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_recent_degree_aging_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), igraph_bool_t, igraph_real_t, igraph_real_t, igraph_int_t, igraph_int_t, igraph_real_t, igraph_bool_t])
 
-igraph_callaway_traits_game = _lib.igraph_callaway_traits_game
-igraph_callaway_traits_game.restype = handle_igraph_error_t
-igraph_callaway_traits_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_callaway_traits_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_int_t)])
 
-igraph_establishment_game = _lib.igraph_establishment_game
-igraph_establishment_game.restype = handle_igraph_error_t
-igraph_establishment_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_establishment_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_int_t)])
 
-igraph_grg_game = _lib.igraph_grg_game
-igraph_grg_game.restype = handle_igraph_error_t
-igraph_grg_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_bool_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_grg_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_bool_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_preference_game = _lib.igraph_preference_game
-igraph_preference_game.restype = handle_igraph_error_t
-igraph_preference_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_bool_t, POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_preference_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_bool_t, POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t])
 
-igraph_asymmetric_preference_game = _lib.igraph_asymmetric_preference_game
-igraph_asymmetric_preference_game.restype = handle_igraph_error_t
-igraph_asymmetric_preference_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t]
+_lazy_symbols["igraph_asymmetric_preference_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t])
 
-igraph_rewire_edges = _lib.igraph_rewire_edges
-igraph_rewire_edges.restype = handle_igraph_error_t
-igraph_rewire_edges.argtypes = [POINTER(igraph_t), igraph_real_t, igraph_edge_type_sw_t]
+_lazy_symbols["igraph_rewire_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_real_t, igraph_edge_type_sw_t])
 
-igraph_rewire_directed_edges = _lib.igraph_rewire_directed_edges
-igraph_rewire_directed_edges.restype = handle_igraph_error_t
-igraph_rewire_directed_edges.argtypes = [POINTER(igraph_t), igraph_real_t, igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_rewire_directed_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_real_t, igraph_bool_t, igraph_neimode_t])
 
-igraph_watts_strogatz_game = _lib.igraph_watts_strogatz_game
-igraph_watts_strogatz_game.restype = handle_igraph_error_t
-igraph_watts_strogatz_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_real_t, igraph_edge_type_sw_t]
+_lazy_symbols["igraph_watts_strogatz_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_real_t, igraph_edge_type_sw_t])
 
-igraph_lastcit_game = _lib.igraph_lastcit_game
-igraph_lastcit_game.restype = handle_igraph_error_t
-igraph_lastcit_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_bool_t]
+_lazy_symbols["igraph_lastcit_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_bool_t])
 
-igraph_cited_type_game = _lib.igraph_cited_type_game
-igraph_cited_type_game.restype = handle_igraph_error_t
-igraph_cited_type_game.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_cited_type_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_int_t, igraph_bool_t])
 
-igraph_citing_cited_type_game = _lib.igraph_citing_cited_type_game
-igraph_citing_cited_type_game.restype = handle_igraph_error_t
-igraph_citing_cited_type_game.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_citing_cited_type_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_bool_t])
 
-igraph_forest_fire_game = _lib.igraph_forest_fire_game
-igraph_forest_fire_game.restype = handle_igraph_error_t
-igraph_forest_fire_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_forest_fire_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_int_t, igraph_bool_t])
 
-igraph_simple_interconnected_islands_game = _lib.igraph_simple_interconnected_islands_game
-igraph_simple_interconnected_islands_game.restype = handle_igraph_error_t
-igraph_simple_interconnected_islands_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_real_t, igraph_int_t]
+_lazy_symbols["igraph_simple_interconnected_islands_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_real_t, igraph_int_t])
 
-igraph_chung_lu_game = _lib.igraph_chung_lu_game
-igraph_chung_lu_game.restype = handle_igraph_error_t
-igraph_chung_lu_game.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_bool_t, igraph_chung_lu_t]
+_lazy_symbols["igraph_chung_lu_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_bool_t, igraph_chung_lu_t])
 
-igraph_static_fitness_game = _lib.igraph_static_fitness_game
-igraph_static_fitness_game.restype = handle_igraph_error_t
-igraph_static_fitness_game.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_edge_type_sw_t]
+_lazy_symbols["igraph_static_fitness_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_edge_type_sw_t])
 
-igraph_static_power_law_game = _lib.igraph_static_power_law_game
-igraph_static_power_law_game.restype = handle_igraph_error_t
-igraph_static_power_law_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_edge_type_sw_t, igraph_bool_t]
+_lazy_symbols["igraph_static_power_law_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_edge_type_sw_t, igraph_bool_t])
 
-igraph_k_regular_game = _lib.igraph_k_regular_game
-igraph_k_regular_game.restype = handle_igraph_error_t
-igraph_k_regular_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_k_regular_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_sbm_game = _lib.igraph_sbm_game
-igraph_sbm_game.restype = handle_igraph_error_t
-igraph_sbm_game.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_edge_type_sw_t]
+_lazy_symbols["igraph_sbm_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_edge_type_sw_t])
 
-igraph_hsbm_game = _lib.igraph_hsbm_game
-igraph_hsbm_game.restype = handle_igraph_error_t
-igraph_hsbm_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_real_t]
+_lazy_symbols["igraph_hsbm_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_real_t])
 
-igraph_hsbm_list_game = _lib.igraph_hsbm_list_game
-igraph_hsbm_list_game.restype = handle_igraph_error_t
-igraph_hsbm_list_game.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_list_t), POINTER(igraph_matrix_list_t), igraph_real_t]
+_lazy_symbols["igraph_hsbm_list_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_list_t), POINTER(igraph_matrix_list_t), igraph_real_t])
 
-igraph_correlated_game = _lib.igraph_correlated_game
-igraph_correlated_game.restype = handle_igraph_error_t
-igraph_correlated_game.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_real_t, igraph_real_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_correlated_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_real_t, igraph_real_t, POINTER(igraph_vector_int_t)])
 
-igraph_correlated_pair_game = _lib.igraph_correlated_pair_game
-igraph_correlated_pair_game.restype = handle_igraph_error_t
-igraph_correlated_pair_game.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_bool_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_correlated_pair_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_bool_t, POINTER(igraph_vector_int_t)])
 
-igraph_dot_product_game = _lib.igraph_dot_product_game
-igraph_dot_product_game.restype = handle_igraph_error_t
-igraph_dot_product_game.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t]
+_lazy_symbols["igraph_dot_product_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t])
 
-igraph_are_adjacent = _lib.igraph_are_adjacent
-igraph_are_adjacent.restype = handle_igraph_error_t
-igraph_are_adjacent.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_are_adjacent"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, POINTER(igraph_bool_t)])
 
-igraph_diameter = _lib.igraph_diameter
-igraph_diameter.restype = handle_igraph_error_t
-igraph_diameter.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_diameter"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t])
 
-igraph_closeness = _lib.igraph_closeness
-igraph_closeness.restype = handle_igraph_error_t
-igraph_closeness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t]
+_lazy_symbols["igraph_closeness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t])
 
-igraph_closeness_cutoff = _lib.igraph_closeness_cutoff
-igraph_closeness_cutoff.restype = handle_igraph_error_t
-igraph_closeness_cutoff.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t, igraph_real_t]
+_lazy_symbols["igraph_closeness_cutoff"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t, igraph_real_t])
 
-igraph_distances = _lib.igraph_distances
-igraph_distances.restype = handle_igraph_error_t
-igraph_distances.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t]
+_lazy_symbols["igraph_distances"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t])
 
-igraph_distances_cutoff = _lib.igraph_distances_cutoff
-igraph_distances_cutoff.restype = handle_igraph_error_t
-igraph_distances_cutoff.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t, igraph_real_t]
+_lazy_symbols["igraph_distances_cutoff"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t, igraph_real_t])
 
-igraph_get_shortest_path = _lib.igraph_get_shortest_path
-igraph_get_shortest_path.restype = handle_igraph_error_t
-igraph_get_shortest_path.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, igraph_neimode_t]
+_lazy_symbols["igraph_get_shortest_path"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, igraph_neimode_t])
 
-igraph_get_shortest_path_bellman_ford = _lib.igraph_get_shortest_path_bellman_ford
-igraph_get_shortest_path_bellman_ford.restype = handle_igraph_error_t
-igraph_get_shortest_path_bellman_ford.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_shortest_path_bellman_ford"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_get_shortest_path_dijkstra = _lib.igraph_get_shortest_path_dijkstra
-igraph_get_shortest_path_dijkstra.restype = handle_igraph_error_t
-igraph_get_shortest_path_dijkstra.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_shortest_path_dijkstra"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_get_shortest_paths = _lib.igraph_get_shortest_paths
-igraph_get_shortest_paths.restype = handle_igraph_error_t
-igraph_get_shortest_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_get_shortest_path_astar"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t, igraph_astar_heuristic_func_t, c_void_p])
 
-igraph_get_all_shortest_paths = _lib.igraph_get_all_shortest_paths
-igraph_get_all_shortest_paths.restype = handle_igraph_error_t
-igraph_get_all_shortest_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_vs_t, igraph_neimode_t]
+_lazy_symbols["igraph_get_shortest_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_distances_dijkstra = _lib.igraph_distances_dijkstra
-igraph_distances_dijkstra.restype = handle_igraph_error_t
-igraph_distances_dijkstra.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_all_shortest_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_vs_t, igraph_neimode_t])
 
-igraph_distances_dijkstra_cutoff = _lib.igraph_distances_dijkstra_cutoff
-igraph_distances_dijkstra_cutoff.restype = handle_igraph_error_t
-igraph_distances_dijkstra_cutoff.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, igraph_real_t]
+_lazy_symbols["igraph_distances_dijkstra"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_get_shortest_paths_dijkstra = _lib.igraph_get_shortest_paths_dijkstra
-igraph_get_shortest_paths_dijkstra.restype = handle_igraph_error_t
-igraph_get_shortest_paths_dijkstra.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_distances_dijkstra_cutoff"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, igraph_real_t])
 
-igraph_get_shortest_paths_bellman_ford = _lib.igraph_get_shortest_paths_bellman_ford
-igraph_get_shortest_paths_bellman_ford.restype = handle_igraph_error_t
-igraph_get_shortest_paths_bellman_ford.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_get_shortest_paths_dijkstra"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_get_all_shortest_paths_dijkstra = _lib.igraph_get_all_shortest_paths_dijkstra
-igraph_get_all_shortest_paths_dijkstra.restype = handle_igraph_error_t
-igraph_get_all_shortest_paths_dijkstra.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_shortest_paths_bellman_ford"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_distances_bellman_ford = _lib.igraph_distances_bellman_ford
-igraph_distances_bellman_ford.restype = handle_igraph_error_t
-igraph_distances_bellman_ford.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_all_shortest_paths_dijkstra"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_distances_johnson = _lib.igraph_distances_johnson
-igraph_distances_johnson.restype = handle_igraph_error_t
-igraph_distances_johnson.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_distances_bellman_ford"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_distances_floyd_warshall = _lib.igraph_distances_floyd_warshall
-igraph_distances_floyd_warshall.restype = handle_igraph_error_t
-igraph_distances_floyd_warshall.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, igraph_floyd_warshall_algorithm_t]
+_lazy_symbols["igraph_distances_johnson"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_voronoi = _lib.igraph_voronoi
-igraph_voronoi.restype = handle_igraph_error_t
-igraph_voronoi.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_voronoi_tiebreaker_t]
+_lazy_symbols["igraph_distances_floyd_warshall"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, igraph_floyd_warshall_algorithm_t])
 
-igraph_get_all_simple_paths = _lib.igraph_get_all_simple_paths
-igraph_get_all_simple_paths.restype = handle_igraph_error_t
-igraph_get_all_simple_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, igraph_neimode_t, igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_voronoi"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_voronoi_tiebreaker_t])
 
-igraph_get_k_shortest_paths = _lib.igraph_get_k_shortest_paths
-igraph_get_k_shortest_paths.restype = handle_igraph_error_t
-igraph_get_k_shortest_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_neimode_t]
+_lazy_symbols["igraph_get_all_simple_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, igraph_neimode_t, igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_get_widest_path = _lib.igraph_get_widest_path
-igraph_get_widest_path.restype = handle_igraph_error_t
-igraph_get_widest_path.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_k_shortest_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_neimode_t])
 
-igraph_get_widest_paths = _lib.igraph_get_widest_paths
-igraph_get_widest_paths.restype = handle_igraph_error_t
-igraph_get_widest_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_get_widest_path"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_widest_path_widths_dijkstra = _lib.igraph_widest_path_widths_dijkstra
-igraph_widest_path_widths_dijkstra.restype = handle_igraph_error_t
-igraph_widest_path_widths_dijkstra.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_get_widest_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_widest_path_widths_floyd_warshall = _lib.igraph_widest_path_widths_floyd_warshall
-igraph_widest_path_widths_floyd_warshall.restype = handle_igraph_error_t
-igraph_widest_path_widths_floyd_warshall.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_widest_path_widths_dijkstra"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_spanner = _lib.igraph_spanner
-igraph_spanner.restype = handle_igraph_error_t
-igraph_spanner.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_real_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_widest_path_widths_floyd_warshall"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_subcomponent = _lib.igraph_subcomponent
-igraph_subcomponent.restype = handle_igraph_error_t
-igraph_subcomponent.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t]
+_lazy_symbols["igraph_spanner"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_real_t, POINTER(igraph_vector_t)])
 
-igraph_betweenness = _lib.igraph_betweenness
-igraph_betweenness.restype = handle_igraph_error_t
-igraph_betweenness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_subcomponent"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t])
 
-igraph_betweenness_cutoff = _lib.igraph_betweenness_cutoff
-igraph_betweenness_cutoff.restype = handle_igraph_error_t
-igraph_betweenness_cutoff.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_bool_t, igraph_bool_t, igraph_real_t]
+_lazy_symbols["igraph_betweenness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_bool_t, igraph_bool_t])
 
-igraph_betweenness_subset = _lib.igraph_betweenness_subset
-igraph_betweenness_subset.restype = handle_igraph_error_t
-igraph_betweenness_subset.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_vs_t, igraph_vs_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_betweenness_cutoff"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_bool_t, igraph_bool_t, igraph_real_t])
 
-igraph_edge_betweenness = _lib.igraph_edge_betweenness
-igraph_edge_betweenness.restype = handle_igraph_error_t
-igraph_edge_betweenness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_es_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_betweenness_subset"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_vs_t, igraph_vs_t, igraph_bool_t, igraph_bool_t])
 
-igraph_edge_betweenness_cutoff = _lib.igraph_edge_betweenness_cutoff
-igraph_edge_betweenness_cutoff.restype = handle_igraph_error_t
-igraph_edge_betweenness_cutoff.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_es_t, igraph_bool_t, igraph_bool_t, igraph_real_t]
+_lazy_symbols["igraph_edge_betweenness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_es_t, igraph_bool_t, igraph_bool_t])
 
-igraph_edge_betweenness_subset = _lib.igraph_edge_betweenness_subset
-igraph_edge_betweenness_subset.restype = handle_igraph_error_t
-igraph_edge_betweenness_subset.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_vs_t, igraph_es_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_edge_betweenness_cutoff"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_es_t, igraph_bool_t, igraph_bool_t, igraph_real_t])
 
-igraph_harmonic_centrality = _lib.igraph_harmonic_centrality
-igraph_harmonic_centrality.restype = handle_igraph_error_t
-igraph_harmonic_centrality.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t]
+_lazy_symbols["igraph_edge_betweenness_subset"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_vs_t, igraph_es_t, igraph_bool_t, igraph_bool_t])
 
-igraph_harmonic_centrality_cutoff = _lib.igraph_harmonic_centrality_cutoff
-igraph_harmonic_centrality_cutoff.restype = handle_igraph_error_t
-igraph_harmonic_centrality_cutoff.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t, igraph_real_t]
+_lazy_symbols["igraph_harmonic_centrality"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t])
 
-igraph_pagerank = _lib.igraph_pagerank
-igraph_pagerank.restype = handle_igraph_error_t
-igraph_pagerank.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_real_t, igraph_bool_t, igraph_vs_t, igraph_pagerank_algo_t, POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_harmonic_centrality_cutoff"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t, POINTER(igraph_vector_t), igraph_bool_t, igraph_real_t])
 
-igraph_personalized_pagerank = _lib.igraph_personalized_pagerank
-igraph_personalized_pagerank.restype = handle_igraph_error_t
-igraph_personalized_pagerank.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), igraph_real_t, igraph_bool_t, igraph_vs_t, igraph_pagerank_algo_t, POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_pagerank"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_real_t, igraph_bool_t, igraph_vs_t, igraph_pagerank_algo_t, POINTER(igraph_arpack_options_t)])
 
-igraph_personalized_pagerank_vs = _lib.igraph_personalized_pagerank_vs
-igraph_personalized_pagerank_vs.restype = handle_igraph_error_t
-igraph_personalized_pagerank_vs.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_vs_t, igraph_real_t, igraph_bool_t, igraph_vs_t, igraph_pagerank_algo_t, POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_personalized_pagerank"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), igraph_real_t, igraph_bool_t, igraph_vs_t, igraph_pagerank_algo_t, POINTER(igraph_arpack_options_t)])
 
-igraph_rewire = _lib.igraph_rewire
-igraph_rewire.restype = handle_igraph_error_t
-igraph_rewire.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_edge_type_sw_t, POINTER(igraph_rewiring_stats_t)]
+_lazy_symbols["igraph_personalized_pagerank_vs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_vs_t, igraph_real_t, igraph_bool_t, igraph_vs_t, igraph_pagerank_algo_t, POINTER(igraph_arpack_options_t)])
 
-igraph_induced_subgraph = _lib.igraph_induced_subgraph
-igraph_induced_subgraph.restype = handle_igraph_error_t
-igraph_induced_subgraph.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_vs_t, igraph_subgraph_implementation_t]
+_lazy_symbols["igraph_rewire"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_edge_type_sw_t, POINTER(igraph_rewiring_stats_t)])
 
-igraph_subgraph_from_edges = _lib.igraph_subgraph_from_edges
-igraph_subgraph_from_edges.restype = handle_igraph_error_t
-igraph_subgraph_from_edges.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_es_t, igraph_bool_t]
+_lazy_symbols["igraph_induced_subgraph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_vs_t, igraph_subgraph_implementation_t])
 
-igraph_reverse_edges = _lib.igraph_reverse_edges
-igraph_reverse_edges.restype = handle_igraph_error_t
-igraph_reverse_edges.argtypes = [POINTER(igraph_t), igraph_es_t]
+_lazy_symbols["igraph_subgraph_from_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_es_t, igraph_bool_t])
 
-igraph_average_path_length = _lib.igraph_average_path_length
-igraph_average_path_length.restype = handle_igraph_error_t
-igraph_average_path_length.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_reverse_edges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_es_t])
 
-igraph_path_length_hist = _lib.igraph_path_length_hist
-igraph_path_length_hist.restype = handle_igraph_error_t
-igraph_path_length_hist.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_average_path_length"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t, igraph_bool_t])
 
-igraph_simplify = _lib.igraph_simplify
-igraph_simplify.restype = handle_igraph_error_t
-igraph_simplify.argtypes = [POINTER(igraph_t), igraph_bool_t, igraph_bool_t, POINTER(igraph_attribute_combination_t)]
+_lazy_symbols["igraph_path_length_hist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_transitivity_undirected = _lib.igraph_transitivity_undirected
-igraph_transitivity_undirected.restype = handle_igraph_error_t
-igraph_transitivity_undirected.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_transitivity_mode_t]
+_lazy_symbols["igraph_simplify"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_bool_t, igraph_bool_t, POINTER(igraph_attribute_combination_t)])
 
-igraph_transitivity_local_undirected = _lib.igraph_transitivity_local_undirected
-igraph_transitivity_local_undirected.restype = handle_igraph_error_t
-igraph_transitivity_local_undirected.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_transitivity_mode_t]
+_lazy_symbols["igraph_transitivity_undirected"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_transitivity_mode_t])
 
-igraph_transitivity_avglocal_undirected = _lib.igraph_transitivity_avglocal_undirected
-igraph_transitivity_avglocal_undirected.restype = handle_igraph_error_t
-igraph_transitivity_avglocal_undirected.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_transitivity_mode_t]
+_lazy_symbols["igraph_transitivity_local_undirected"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_transitivity_mode_t])
 
-igraph_transitivity_barrat = _lib.igraph_transitivity_barrat
-igraph_transitivity_barrat.restype = handle_igraph_error_t
-igraph_transitivity_barrat.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, POINTER(igraph_vector_t), igraph_transitivity_mode_t]
+_lazy_symbols["igraph_transitivity_avglocal_undirected"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_transitivity_mode_t])
 
-igraph_ecc = _lib.igraph_ecc
-igraph_ecc.restype = handle_igraph_error_t
-igraph_ecc.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_es_t, igraph_int_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_transitivity_barrat"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, POINTER(igraph_vector_t), igraph_transitivity_mode_t])
 
-igraph_reciprocity = _lib.igraph_reciprocity
-igraph_reciprocity.restype = handle_igraph_error_t
-igraph_reciprocity.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_bool_t, igraph_reciprocity_t]
+_lazy_symbols["igraph_ecc"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_es_t, igraph_int_t, igraph_bool_t, igraph_bool_t])
 
-igraph_constraint = _lib.igraph_constraint
-igraph_constraint.restype = handle_igraph_error_t
-igraph_constraint.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_reciprocity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_bool_t, igraph_reciprocity_t])
 
-igraph_maxdegree = _lib.igraph_maxdegree
-igraph_maxdegree.restype = handle_igraph_error_t
-igraph_maxdegree.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_vs_t, igraph_neimode_t, igraph_loops_t]
+_lazy_symbols["igraph_constraint"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, POINTER(igraph_vector_t)])
 
-igraph_density = _lib.igraph_density
-igraph_density.restype = handle_igraph_error_t
-igraph_density.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_maxdegree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_vs_t, igraph_neimode_t, igraph_loops_t])
 
-igraph_mean_degree = _lib.igraph_mean_degree
-igraph_mean_degree.restype = handle_igraph_error_t
-igraph_mean_degree.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_density"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_neighborhood_size = _lib.igraph_neighborhood_size
-igraph_neighborhood_size.restype = handle_igraph_error_t
-igraph_neighborhood_size.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_vs_t, igraph_int_t, igraph_neimode_t, igraph_int_t]
+_lazy_symbols["igraph_mean_degree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_neighborhood = _lib.igraph_neighborhood
-igraph_neighborhood.restype = handle_igraph_error_t
-igraph_neighborhood.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_vs_t, igraph_int_t, igraph_neimode_t, igraph_int_t]
+_lazy_symbols["igraph_neighborhood_size"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_vs_t, igraph_int_t, igraph_neimode_t, igraph_int_t])
 
-igraph_neighborhood_graphs = _lib.igraph_neighborhood_graphs
-igraph_neighborhood_graphs.restype = handle_igraph_error_t
-igraph_neighborhood_graphs.argtypes = [POINTER(igraph_t), POINTER(igraph_graph_list_t), igraph_vs_t, igraph_int_t, igraph_neimode_t, igraph_int_t]
+_lazy_symbols["igraph_neighborhood"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_vs_t, igraph_int_t, igraph_neimode_t, igraph_int_t])
 
-igraph_topological_sorting = _lib.igraph_topological_sorting
-igraph_topological_sorting.restype = handle_igraph_error_t
-igraph_topological_sorting.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_neighborhood_graphs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_graph_list_t), igraph_vs_t, igraph_int_t, igraph_neimode_t, igraph_int_t])
 
-igraph_feedback_arc_set = _lib.igraph_feedback_arc_set
-igraph_feedback_arc_set.restype = handle_igraph_error_t
-igraph_feedback_arc_set.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_fas_algorithm_t]
+_lazy_symbols["igraph_topological_sorting"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_feedback_vertex_set = _lib.igraph_feedback_vertex_set
-igraph_feedback_vertex_set.restype = handle_igraph_error_t
-igraph_feedback_vertex_set.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_fvs_algorithm_t]
+_lazy_symbols["igraph_feedback_arc_set"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_fas_algorithm_t])
 
-igraph_is_loop = _lib.igraph_is_loop
-igraph_is_loop.restype = handle_igraph_error_t
-igraph_is_loop.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_es_t]
+_lazy_symbols["igraph_feedback_vertex_set"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_fvs_algorithm_t])
 
-igraph_is_dag = _lib.igraph_is_dag
-igraph_is_dag.restype = handle_igraph_error_t
-igraph_is_dag.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_is_loop"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_es_t])
 
-igraph_is_acyclic = _lib.igraph_is_acyclic
-igraph_is_acyclic.restype = handle_igraph_error_t
-igraph_is_acyclic.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_is_dag"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_is_simple = _lib.igraph_is_simple
-igraph_is_simple.restype = handle_igraph_error_t
-igraph_is_simple.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), igraph_bool_t]
+_lazy_symbols["igraph_is_acyclic"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_is_multiple = _lib.igraph_is_multiple
-igraph_is_multiple.restype = handle_igraph_error_t
-igraph_is_multiple.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_es_t]
+_lazy_symbols["igraph_is_simple"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), igraph_bool_t])
 
-igraph_has_loop = _lib.igraph_has_loop
-igraph_has_loop.restype = handle_igraph_error_t
-igraph_has_loop.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_is_multiple"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_es_t])
 
-igraph_has_multiple = _lib.igraph_has_multiple
-igraph_has_multiple.restype = handle_igraph_error_t
-igraph_has_multiple.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_has_loop"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_count_loops = _lib.igraph_count_loops
-igraph_count_loops.restype = handle_igraph_error_t
-igraph_count_loops.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_has_multiple"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_count_multiple = _lib.igraph_count_multiple
-igraph_count_multiple.restype = handle_igraph_error_t
-igraph_count_multiple.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_es_t]
+_lazy_symbols["igraph_count_loops"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t)])
 
-igraph_girth = _lib.igraph_girth
-igraph_girth.restype = handle_igraph_error_t
-igraph_girth.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_count_multiple"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_es_t])
 
-igraph_is_perfect = _lib.igraph_is_perfect
-igraph_is_perfect.restype = handle_igraph_error_t
-igraph_is_perfect.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_girth"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t)])
 
-igraph_add_edge = _lib.igraph_add_edge
-igraph_add_edge.restype = handle_igraph_error_t
-igraph_add_edge.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_is_perfect"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_eigenvector_centrality = _lib.igraph_eigenvector_centrality
-igraph_eigenvector_centrality.restype = handle_igraph_error_t
-igraph_eigenvector_centrality.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_neimode_t, POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_add_edge"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t])
 
-igraph_hub_and_authority_scores = _lib.igraph_hub_and_authority_scores
-igraph_hub_and_authority_scores.restype = handle_igraph_error_t
-igraph_hub_and_authority_scores.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_eigenvector_centrality"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_neimode_t, POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)])
 
-igraph_unfold_tree = _lib.igraph_unfold_tree
-igraph_unfold_tree.restype = handle_igraph_error_t
-igraph_unfold_tree.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_hub_and_authority_scores"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)])
 
-igraph_is_mutual = _lib.igraph_is_mutual
-igraph_is_mutual.restype = handle_igraph_error_t
-igraph_is_mutual.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_es_t, igraph_bool_t]
+_lazy_symbols["igraph_unfold_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_has_mutual = _lib.igraph_has_mutual
-igraph_has_mutual.restype = handle_igraph_error_t
-igraph_has_mutual.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), igraph_bool_t]
+_lazy_symbols["igraph_is_mutual"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_es_t, igraph_bool_t])
 
-igraph_maximum_cardinality_search = _lib.igraph_maximum_cardinality_search
-igraph_maximum_cardinality_search.restype = handle_igraph_error_t
-igraph_maximum_cardinality_search.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_has_mutual"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), igraph_bool_t])
 
-igraph_is_chordal = _lib.igraph_is_chordal
-igraph_is_chordal.restype = handle_igraph_error_t
-igraph_is_chordal.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_maximum_cardinality_search"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_avg_nearest_neighbor_degree = _lib.igraph_avg_nearest_neighbor_degree
-igraph_avg_nearest_neighbor_degree.restype = handle_igraph_error_t
-igraph_avg_nearest_neighbor_degree.argtypes = [POINTER(igraph_t), igraph_vs_t, igraph_neimode_t, igraph_neimode_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_is_chordal"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_t)])
 
-igraph_degree_correlation_vector = _lib.igraph_degree_correlation_vector
-igraph_degree_correlation_vector.restype = handle_igraph_error_t
-igraph_degree_correlation_vector.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_avg_nearest_neighbor_degree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, igraph_neimode_t, igraph_neimode_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_rich_club_sequence = _lib.igraph_rich_club_sequence
-igraph_rich_club_sequence.restype = handle_igraph_error_t
-igraph_rich_club_sequence.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_degree_correlation_vector"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_neimode_t, igraph_bool_t])
 
-igraph_strength = _lib.igraph_strength
-igraph_strength.restype = handle_igraph_error_t
-igraph_strength.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t, igraph_loops_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_rich_club_sequence"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t, igraph_bool_t])
 
-igraph_centralization = _lib.igraph_centralization
-igraph_centralization.restype = igraph_real_t
-igraph_centralization.argtypes = [POINTER(igraph_vector_t), igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_strength"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t, igraph_loops_t, POINTER(igraph_vector_t)])
 
-igraph_centralization_degree = _lib.igraph_centralization_degree
-igraph_centralization_degree.restype = handle_igraph_error_t
-igraph_centralization_degree.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_loops_t, POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_centralization"] = lambda: (igraph_real_t, [POINTER(igraph_vector_t), igraph_real_t, igraph_bool_t])
 
-igraph_centralization_degree_tmax = _lib.igraph_centralization_degree_tmax
-igraph_centralization_degree_tmax.restype = handle_igraph_error_t
-igraph_centralization_degree_tmax.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, igraph_loops_t, POINTER(igraph_real_t)]
+_lazy_symbols["igraph_centralization_degree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_loops_t, POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_centralization_betweenness = _lib.igraph_centralization_betweenness
-igraph_centralization_betweenness.restype = handle_igraph_error_t
-igraph_centralization_betweenness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_bool_t, POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_centralization_degree_tmax"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, igraph_loops_t, POINTER(igraph_real_t)])
 
-igraph_centralization_betweenness_tmax = _lib.igraph_centralization_betweenness_tmax
-igraph_centralization_betweenness_tmax.restype = handle_igraph_error_t
-igraph_centralization_betweenness_tmax.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t, POINTER(igraph_real_t)]
+_lazy_symbols["igraph_centralization_betweenness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_bool_t, POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_centralization_closeness = _lib.igraph_centralization_closeness
-igraph_centralization_closeness.restype = handle_igraph_error_t
-igraph_centralization_closeness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_centralization_betweenness_tmax"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t, POINTER(igraph_real_t)])
 
-igraph_centralization_closeness_tmax = _lib.igraph_centralization_closeness_tmax
-igraph_centralization_closeness_tmax.restype = handle_igraph_error_t
-igraph_centralization_closeness_tmax.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, POINTER(igraph_real_t)]
+_lazy_symbols["igraph_centralization_closeness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_neimode_t, POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_centralization_eigenvector_centrality = _lib.igraph_centralization_eigenvector_centrality
-igraph_centralization_eigenvector_centrality.restype = handle_igraph_error_t
-igraph_centralization_eigenvector_centrality.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_neimode_t, POINTER(igraph_arpack_options_t), POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_centralization_closeness_tmax"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, POINTER(igraph_real_t)])
 
-igraph_centralization_eigenvector_centrality_tmax = _lib.igraph_centralization_eigenvector_centrality_tmax
-igraph_centralization_eigenvector_centrality_tmax.restype = handle_igraph_error_t
-igraph_centralization_eigenvector_centrality_tmax.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, POINTER(igraph_real_t)]
+_lazy_symbols["igraph_centralization_eigenvector_centrality"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_neimode_t, POINTER(igraph_arpack_options_t), POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_assortativity_nominal = _lib.igraph_assortativity_nominal
-igraph_assortativity_nominal.restype = handle_igraph_error_t
-igraph_assortativity_nominal.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_centralization_eigenvector_centrality_tmax"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, POINTER(igraph_real_t)])
 
-igraph_assortativity = _lib.igraph_assortativity
-igraph_assortativity.restype = handle_igraph_error_t
-igraph_assortativity.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_assortativity_nominal"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t), igraph_bool_t, igraph_bool_t])
 
-igraph_assortativity_degree = _lib.igraph_assortativity_degree
-igraph_assortativity_degree.restype = handle_igraph_error_t
-igraph_assortativity_degree.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_assortativity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t, igraph_bool_t])
 
-igraph_joint_degree_matrix = _lib.igraph_joint_degree_matrix
-igraph_joint_degree_matrix.restype = handle_igraph_error_t
-igraph_joint_degree_matrix.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_assortativity_degree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_joint_degree_distribution = _lib.igraph_joint_degree_distribution
-igraph_joint_degree_distribution.restype = handle_igraph_error_t
-igraph_joint_degree_distribution.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_neimode_t, igraph_neimode_t, igraph_bool_t, igraph_bool_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_joint_degree_matrix"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_int_t])
 
-igraph_joint_type_distribution = _lib.igraph_joint_type_distribution
-igraph_joint_type_distribution.restype = handle_igraph_error_t
-igraph_joint_type_distribution.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_joint_degree_distribution"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_neimode_t, igraph_neimode_t, igraph_bool_t, igraph_bool_t, igraph_int_t, igraph_int_t])
 
-igraph_contract_vertices = _lib.igraph_contract_vertices
-igraph_contract_vertices.restype = handle_igraph_error_t
-igraph_contract_vertices.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_attribute_combination_t)]
+_lazy_symbols["igraph_joint_type_distribution"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bool_t, igraph_bool_t])
 
-igraph_eccentricity = _lib.igraph_eccentricity
-igraph_eccentricity.restype = handle_igraph_error_t
-igraph_eccentricity.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t]
+_lazy_symbols["igraph_contract_vertices"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_attribute_combination_t)])
 
-igraph_graph_center = _lib.igraph_graph_center
-igraph_graph_center.restype = handle_igraph_error_t
-igraph_graph_center.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_eccentricity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_neimode_t])
 
-igraph_radius = _lib.igraph_radius
-igraph_radius.restype = handle_igraph_error_t
-igraph_radius.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_neimode_t]
+_lazy_symbols["igraph_graph_center"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_pseudo_diameter = _lib.igraph_pseudo_diameter
-igraph_pseudo_diameter.restype = handle_igraph_error_t
-igraph_pseudo_diameter.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_int_t, POINTER(igraph_int_t), POINTER(igraph_int_t), igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_radius"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_neimode_t])
 
-igraph_diversity = _lib.igraph_diversity
-igraph_diversity.restype = handle_igraph_error_t
-igraph_diversity.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t]
+_lazy_symbols["igraph_pseudo_diameter"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_int_t, POINTER(igraph_int_t), POINTER(igraph_int_t), igraph_bool_t, igraph_bool_t])
 
-igraph_random_walk = _lib.igraph_random_walk
-igraph_random_walk.restype = handle_igraph_error_t
-igraph_random_walk.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t, igraph_int_t, igraph_random_walk_stuck_t]
+_lazy_symbols["igraph_diversity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t])
 
-igraph_global_efficiency = _lib.igraph_global_efficiency
-igraph_global_efficiency.restype = handle_igraph_error_t
-igraph_global_efficiency.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t]
+_lazy_symbols["igraph_random_walk"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_neimode_t, igraph_int_t, igraph_random_walk_stuck_t])
 
-igraph_local_efficiency = _lib.igraph_local_efficiency
-igraph_local_efficiency.restype = handle_igraph_error_t
-igraph_local_efficiency.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_global_efficiency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t])
 
-igraph_average_local_efficiency = _lib.igraph_average_local_efficiency
-igraph_average_local_efficiency.restype = handle_igraph_error_t
-igraph_average_local_efficiency.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_local_efficiency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_vs_t, igraph_bool_t, igraph_neimode_t])
 
-igraph_transitive_closure = _lib.igraph_transitive_closure
-igraph_transitive_closure.restype = handle_igraph_error_t
-igraph_transitive_closure.argtypes = [POINTER(igraph_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_average_local_efficiency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), igraph_bool_t, igraph_neimode_t])
 
-igraph_trussness = _lib.igraph_trussness
-igraph_trussness.restype = handle_igraph_error_t
-igraph_trussness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_transitive_closure"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t)])
 
-igraph_is_bigraphical = _lib.igraph_is_bigraphical
-igraph_is_bigraphical.restype = handle_igraph_error_t
-igraph_is_bigraphical.argtypes = [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_trussness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_is_graphical = _lib.igraph_is_graphical
-igraph_is_graphical.restype = handle_igraph_error_t
-igraph_is_graphical.argtypes = [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_is_bigraphical"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, POINTER(igraph_bool_t)])
 
-igraph_bfs_simple = _lib.igraph_bfs_simple
-igraph_bfs_simple.restype = handle_igraph_error_t
-igraph_bfs_simple.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_is_graphical"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_edge_type_sw_t, POINTER(igraph_bool_t)])
 
-igraph_bipartite_projection_size = _lib.igraph_bipartite_projection_size
-igraph_bipartite_projection_size.restype = handle_igraph_error_t
-igraph_bipartite_projection_size.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_bfs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), igraph_neimode_t, igraph_bool_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bfshandler_t, c_void_p])
 
-igraph_bipartite_projection = _lib.igraph_bipartite_projection
-igraph_bipartite_projection.restype = handle_igraph_error_t
-igraph_bipartite_projection.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t]
+_lazy_symbols["igraph_bfs_simple"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_create_bipartite = _lib.igraph_create_bipartite
-igraph_create_bipartite.restype = handle_igraph_error_t
-igraph_create_bipartite.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_int_t), igraph_bool_t]
+_lazy_symbols["igraph_dfs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_neimode_t, igraph_bool_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_dfshandler_t, igraph_dfshandler_t, c_void_p])
 
-igraph_biadjacency = _lib.igraph_biadjacency
-igraph_biadjacency.restype = handle_igraph_error_t
-igraph_biadjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_bipartite_projection_size"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t)])
 
-igraph_weighted_biadjacency = _lib.igraph_weighted_biadjacency
-igraph_weighted_biadjacency.restype = handle_igraph_error_t
-igraph_weighted_biadjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_bipartite_projection"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t])
 
-igraph_get_biadjacency = _lib.igraph_get_biadjacency
-igraph_get_biadjacency.restype = handle_igraph_error_t
-igraph_get_biadjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_create_bipartite"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_int_t), igraph_bool_t])
 
-igraph_is_bipartite = _lib.igraph_is_bipartite
-igraph_is_bipartite.restype = handle_igraph_error_t
-igraph_is_bipartite.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_vector_bool_t)]
+_lazy_symbols["igraph_biadjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_neimode_t, igraph_bool_t])
 
-igraph_bipartite_game_gnp = _lib.igraph_bipartite_game_gnp
-igraph_bipartite_game_gnp.restype = handle_igraph_error_t
-igraph_bipartite_game_gnp.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_real_t, igraph_bool_t, igraph_neimode_t, igraph_edge_type_sw_t, igraph_bool_t]
+_lazy_symbols["igraph_weighted_biadjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_neimode_t])
 
-igraph_bipartite_game_gnm = _lib.igraph_bipartite_game_gnm
-igraph_bipartite_game_gnm.restype = handle_igraph_error_t
-igraph_bipartite_game_gnm.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_bool_t, igraph_neimode_t, igraph_edge_type_sw_t, igraph_bool_t]
+_lazy_symbols["igraph_get_biadjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_bipartite_iea_game = _lib.igraph_bipartite_iea_game
-igraph_bipartite_iea_game.restype = handle_igraph_error_t
-igraph_bipartite_iea_game.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_bool_t, igraph_neimode_t]
+_lazy_symbols["igraph_is_bipartite"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_vector_bool_t)])
 
-igraph_get_laplacian = _lib.igraph_get_laplacian
-igraph_get_laplacian.restype = handle_igraph_error_t
-igraph_get_laplacian.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_neimode_t, igraph_laplacian_normalization_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_bipartite_game_gnp"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_real_t, igraph_bool_t, igraph_neimode_t, igraph_edge_type_sw_t, igraph_bool_t])
 
-igraph_get_laplacian_sparse = _lib.igraph_get_laplacian_sparse
-igraph_get_laplacian_sparse.restype = handle_igraph_error_t
-igraph_get_laplacian_sparse.argtypes = [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_neimode_t, igraph_laplacian_normalization_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_bipartite_game_gnm"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_bool_t, igraph_neimode_t, igraph_edge_type_sw_t, igraph_bool_t])
 
-igraph_connected_components = _lib.igraph_connected_components
-igraph_connected_components.restype = handle_igraph_error_t
-igraph_connected_components.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), igraph_connectedness_t]
+_lazy_symbols["igraph_bipartite_iea_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), igraph_int_t, igraph_int_t, igraph_int_t, igraph_bool_t, igraph_neimode_t])
 
-igraph_is_connected = _lib.igraph_is_connected
-igraph_is_connected.restype = handle_igraph_error_t
-igraph_is_connected.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), igraph_connectedness_t]
+_lazy_symbols["igraph_get_laplacian"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_neimode_t, igraph_laplacian_normalization_t, POINTER(igraph_vector_t)])
 
-igraph_decompose = _lib.igraph_decompose
-igraph_decompose.restype = handle_igraph_error_t
-igraph_decompose.argtypes = [POINTER(igraph_t), POINTER(igraph_graph_list_t), igraph_connectedness_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_get_laplacian_sparse"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_neimode_t, igraph_laplacian_normalization_t, POINTER(igraph_vector_t)])
 
-igraph_articulation_points = _lib.igraph_articulation_points
-igraph_articulation_points.restype = handle_igraph_error_t
-igraph_articulation_points.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_connected_components"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), igraph_connectedness_t])
 
-igraph_biconnected_components = _lib.igraph_biconnected_components
-igraph_biconnected_components.restype = handle_igraph_error_t
-igraph_biconnected_components.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_is_connected"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), igraph_connectedness_t])
 
-igraph_bridges = _lib.igraph_bridges
-igraph_bridges.restype = handle_igraph_error_t
-igraph_bridges.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_decompose"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_graph_list_t), igraph_connectedness_t, igraph_int_t, igraph_int_t])
 
-igraph_is_biconnected = _lib.igraph_is_biconnected
-igraph_is_biconnected.restype = handle_igraph_error_t
-igraph_is_biconnected.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_articulation_points"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_count_reachable = _lib.igraph_count_reachable
-igraph_count_reachable.restype = handle_igraph_error_t
-igraph_count_reachable.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_biconnected_components"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t)])
 
-igraph_bond_percolation = _lib.igraph_bond_percolation
-igraph_bond_percolation.restype = handle_igraph_error_t
-igraph_bond_percolation.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_bridges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_site_percolation = _lib.igraph_site_percolation
-igraph_site_percolation.restype = handle_igraph_error_t
-igraph_site_percolation.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_is_biconnected"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_edgelist_percolation = _lib.igraph_edgelist_percolation
-igraph_edgelist_percolation.restype = handle_igraph_error_t
-igraph_edgelist_percolation.argtypes = [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_count_reachable"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_is_clique = _lib.igraph_is_clique
-igraph_is_clique.restype = handle_igraph_error_t
-igraph_is_clique.argtypes = [POINTER(igraph_t), igraph_vs_t, igraph_bool_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_bond_percolation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_cliques = _lib.igraph_cliques
-igraph_cliques.restype = handle_igraph_error_t
-igraph_cliques.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_site_percolation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_clique_size_hist = _lib.igraph_clique_size_hist
-igraph_clique_size_hist.restype = handle_igraph_error_t
-igraph_clique_size_hist.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_edgelist_percolation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_largest_cliques = _lib.igraph_largest_cliques
-igraph_largest_cliques.restype = handle_igraph_error_t
-igraph_largest_cliques.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_is_clique"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, igraph_bool_t, POINTER(igraph_bool_t)])
 
-igraph_maximal_cliques = _lib.igraph_maximal_cliques
-igraph_maximal_cliques.restype = handle_igraph_error_t
-igraph_maximal_cliques.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_cliques"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_maximal_cliques_subset = _lib.igraph_maximal_cliques_subset
-igraph_maximal_cliques_subset.restype = handle_igraph_error_t
-igraph_maximal_cliques_subset.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_int_t), POINTER(FILE), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_cliques_callback"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_clique_handler_t, c_void_p])
 
-igraph_maximal_cliques_count = _lib.igraph_maximal_cliques_count
-igraph_maximal_cliques_count.restype = handle_igraph_error_t
-igraph_maximal_cliques_count.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_clique_size_hist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, igraph_int_t])
 
-igraph_maximal_cliques_file = _lib.igraph_maximal_cliques_file
-igraph_maximal_cliques_file.restype = handle_igraph_error_t
-igraph_maximal_cliques_file.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_largest_cliques"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_maximal_cliques_hist = _lib.igraph_maximal_cliques_hist
-igraph_maximal_cliques_hist.restype = handle_igraph_error_t
-igraph_maximal_cliques_hist.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_maximal_cliques"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_clique_number = _lib.igraph_clique_number
-igraph_clique_number.restype = handle_igraph_error_t
-igraph_clique_number.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_maximal_cliques_subset"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_int_t), POINTER(FILE), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_weighted_cliques = _lib.igraph_weighted_cliques
-igraph_weighted_cliques.restype = handle_igraph_error_t
-igraph_weighted_cliques.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), igraph_bool_t, igraph_real_t, igraph_real_t, igraph_int_t]
+_lazy_symbols["igraph_maximal_cliques_callback"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_clique_handler_t, c_void_p])
 
-igraph_largest_weighted_cliques = _lib.igraph_largest_weighted_cliques
-igraph_largest_weighted_cliques.restype = handle_igraph_error_t
-igraph_largest_weighted_cliques.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_maximal_cliques_count"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t])
 
-igraph_weighted_clique_number = _lib.igraph_weighted_clique_number
-igraph_weighted_clique_number.restype = handle_igraph_error_t
-igraph_weighted_clique_number.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_maximal_cliques_file"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_is_independent_vertex_set = _lib.igraph_is_independent_vertex_set
-igraph_is_independent_vertex_set.restype = handle_igraph_error_t
-igraph_is_independent_vertex_set.argtypes = [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_maximal_cliques_hist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, igraph_int_t])
 
-igraph_independent_vertex_sets = _lib.igraph_independent_vertex_sets
-igraph_independent_vertex_sets.restype = handle_igraph_error_t
-igraph_independent_vertex_sets.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_clique_number"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t)])
 
-igraph_largest_independent_vertex_sets = _lib.igraph_largest_independent_vertex_sets
-igraph_largest_independent_vertex_sets.restype = handle_igraph_error_t
-igraph_largest_independent_vertex_sets.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_weighted_cliques"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), igraph_bool_t, igraph_real_t, igraph_real_t, igraph_int_t])
 
-igraph_maximal_independent_vertex_sets = _lib.igraph_maximal_independent_vertex_sets
-igraph_maximal_independent_vertex_sets.restype = handle_igraph_error_t
-igraph_maximal_independent_vertex_sets.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_largest_weighted_cliques"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_independence_number = _lib.igraph_independence_number
-igraph_independence_number.restype = handle_igraph_error_t
-igraph_independence_number.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_weighted_clique_number"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t)])
 
-igraph_layout_random = _lib.igraph_layout_random
-igraph_layout_random.restype = handle_igraph_error_t
-igraph_layout_random.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_is_independent_vertex_set"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_bool_t)])
 
-igraph_layout_circle = _lib.igraph_layout_circle
-igraph_layout_circle.restype = handle_igraph_error_t
-igraph_layout_circle.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t]
+_lazy_symbols["igraph_independent_vertex_sets"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_layout_star = _lib.igraph_layout_star
-igraph_layout_star.restype = handle_igraph_error_t
-igraph_layout_star.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_largest_independent_vertex_sets"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_layout_grid = _lib.igraph_layout_grid
-igraph_layout_grid.restype = handle_igraph_error_t
-igraph_layout_grid.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t]
+_lazy_symbols["igraph_maximal_independent_vertex_sets"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_layout_grid_3d = _lib.igraph_layout_grid_3d
-igraph_layout_grid_3d.restype = handle_igraph_error_t
-igraph_layout_grid_3d.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_independence_number"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t)])
 
-igraph_layout_fruchterman_reingold = _lib.igraph_layout_fruchterman_reingold
-igraph_layout_fruchterman_reingold.restype = handle_igraph_error_t
-igraph_layout_fruchterman_reingold.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_layout_grid_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_random"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_layout_kamada_kawai = _lib.igraph_layout_kamada_kawai
-igraph_layout_kamada_kawai.restype = handle_igraph_error_t
-igraph_layout_kamada_kawai.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_real_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_circle"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t])
 
-igraph_layout_lgl = _lib.igraph_layout_lgl
-igraph_layout_lgl.restype = handle_igraph_error_t
-igraph_layout_lgl.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_int_t]
+_lazy_symbols["igraph_layout_star"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, POINTER(igraph_vector_int_t)])
 
-igraph_layout_reingold_tilford = _lib.igraph_layout_reingold_tilford
-igraph_layout_reingold_tilford.restype = handle_igraph_error_t
-igraph_layout_reingold_tilford.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_layout_grid"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t])
 
-igraph_layout_reingold_tilford_circular = _lib.igraph_layout_reingold_tilford_circular
-igraph_layout_reingold_tilford_circular.restype = handle_igraph_error_t
-igraph_layout_reingold_tilford_circular.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_layout_grid_3d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_int_t])
 
-igraph_roots_for_tree_layout = _lib.igraph_roots_for_tree_layout
-igraph_roots_for_tree_layout.restype = handle_igraph_error_t
-igraph_roots_for_tree_layout.argtypes = [POINTER(igraph_t), igraph_neimode_t, POINTER(igraph_vector_int_t), igraph_root_choice_t]
+_lazy_symbols["igraph_layout_fruchterman_reingold"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_layout_grid_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_layout_random_3d = _lib.igraph_layout_random_3d
-igraph_layout_random_3d.restype = handle_igraph_error_t
-igraph_layout_random_3d.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_layout_kamada_kawai"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_real_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_layout_sphere = _lib.igraph_layout_sphere
-igraph_layout_sphere.restype = handle_igraph_error_t
-igraph_layout_sphere.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_layout_lgl"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_int_t])
 
-igraph_layout_fruchterman_reingold_3d = _lib.igraph_layout_fruchterman_reingold_3d
-igraph_layout_fruchterman_reingold_3d.restype = handle_igraph_error_t
-igraph_layout_fruchterman_reingold_3d.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_reingold_tilford"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_layout_kamada_kawai_3d = _lib.igraph_layout_kamada_kawai_3d
-igraph_layout_kamada_kawai_3d.restype = handle_igraph_error_t
-igraph_layout_kamada_kawai_3d.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_real_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_reingold_tilford_circular"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_neimode_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_layout_graphopt = _lib.igraph_layout_graphopt
-igraph_layout_graphopt.restype = handle_igraph_error_t
-igraph_layout_graphopt.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_roots_for_tree_layout"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_neimode_t, POINTER(igraph_vector_int_t), igraph_root_choice_t])
 
-igraph_layout_drl = _lib.igraph_layout_drl
-igraph_layout_drl.restype = handle_igraph_error_t
-igraph_layout_drl.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_layout_drl_options_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_random_3d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_layout_drl_3d = _lib.igraph_layout_drl_3d
-igraph_layout_drl_3d.restype = handle_igraph_error_t
-igraph_layout_drl_3d.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_layout_drl_options_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_sphere"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_layout_merge_dla = _lib.igraph_layout_merge_dla
-igraph_layout_merge_dla.restype = handle_igraph_error_t
-igraph_layout_merge_dla.argtypes = [POINTER(igraph_vector_ptr_t), POINTER(igraph_matrix_list_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_layout_fruchterman_reingold_3d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_layout_sugiyama = _lib.igraph_layout_sugiyama
-igraph_layout_sugiyama.restype = handle_igraph_error_t
-igraph_layout_sugiyama.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), POINTER(igraph_matrix_list_t), POINTER(igraph_vector_int_t), igraph_real_t, igraph_real_t, igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_kamada_kawai_3d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_real_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_layout_mds = _lib.igraph_layout_mds
-igraph_layout_mds.restype = handle_igraph_error_t
-igraph_layout_mds.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), igraph_int_t]
+_lazy_symbols["igraph_layout_graphopt"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_bool_t])
 
-igraph_layout_bipartite = _lib.igraph_layout_bipartite
-igraph_layout_bipartite.restype = handle_igraph_error_t
-igraph_layout_bipartite.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_matrix_t), igraph_real_t, igraph_real_t, igraph_int_t]
+_lazy_symbols["igraph_layout_drl"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_layout_drl_options_t), POINTER(igraph_vector_t)])
 
-igraph_layout_gem = _lib.igraph_layout_gem
-igraph_layout_gem.restype = handle_igraph_error_t
-igraph_layout_gem.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t]
+_lazy_symbols["igraph_layout_drl_3d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_layout_drl_options_t), POINTER(igraph_vector_t)])
 
-igraph_layout_davidson_harel = _lib.igraph_layout_davidson_harel
-igraph_layout_davidson_harel.restype = handle_igraph_error_t
-igraph_layout_davidson_harel.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t]
+_lazy_symbols["igraph_layout_merge_dla"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_ptr_t), POINTER(igraph_matrix_list_t), POINTER(igraph_matrix_t)])
 
-igraph_layout_umap = _lib.igraph_layout_umap
-igraph_layout_umap.restype = handle_igraph_error_t
-igraph_layout_umap.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_t), igraph_real_t, igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_layout_sugiyama"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), POINTER(igraph_matrix_list_t), POINTER(igraph_vector_int_t), igraph_real_t, igraph_real_t, igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_layout_umap_3d = _lib.igraph_layout_umap_3d
-igraph_layout_umap_3d.restype = handle_igraph_error_t
-igraph_layout_umap_3d.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_t), igraph_real_t, igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_layout_mds"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), igraph_int_t])
 
-igraph_layout_umap_compute_weights = _lib.igraph_layout_umap_compute_weights
-igraph_layout_umap_compute_weights.restype = handle_igraph_error_t
-igraph_layout_umap_compute_weights.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_layout_bipartite"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_matrix_t), igraph_real_t, igraph_real_t, igraph_int_t])
 
-igraph_layout_align = _lib.igraph_layout_align
-igraph_layout_align.restype = handle_igraph_error_t
-igraph_layout_align.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_layout_gem"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t])
 
-igraph_cocitation = _lib.igraph_cocitation
-igraph_cocitation.restype = handle_igraph_error_t
-igraph_cocitation.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t]
+_lazy_symbols["igraph_layout_davidson_harel"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, igraph_int_t, igraph_int_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_real_t])
 
-igraph_bibcoupling = _lib.igraph_bibcoupling
-igraph_bibcoupling.restype = handle_igraph_error_t
-igraph_bibcoupling.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t]
+_lazy_symbols["igraph_layout_umap"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_t), igraph_real_t, igraph_int_t, igraph_bool_t])
 
-igraph_similarity_dice = _lib.igraph_similarity_dice
-igraph_similarity_dice.restype = handle_igraph_error_t
-igraph_similarity_dice.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_layout_umap_3d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_t), igraph_real_t, igraph_int_t, igraph_bool_t])
 
-igraph_similarity_dice_es = _lib.igraph_similarity_dice_es
-igraph_similarity_dice_es.restype = handle_igraph_error_t
-igraph_similarity_dice_es.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_es_t, igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_layout_umap_compute_weights"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_similarity_dice_pairs = _lib.igraph_similarity_dice_pairs
-igraph_similarity_dice_pairs.restype = handle_igraph_error_t
-igraph_similarity_dice_pairs.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_layout_align"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_similarity_inverse_log_weighted = _lib.igraph_similarity_inverse_log_weighted
-igraph_similarity_inverse_log_weighted.restype = handle_igraph_error_t
-igraph_similarity_inverse_log_weighted.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_neimode_t]
+_lazy_symbols["igraph_cocitation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t])
 
-igraph_similarity_jaccard = _lib.igraph_similarity_jaccard
-igraph_similarity_jaccard.restype = handle_igraph_error_t
-igraph_similarity_jaccard.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_bibcoupling"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t])
 
-igraph_similarity_jaccard_es = _lib.igraph_similarity_jaccard_es
-igraph_similarity_jaccard_es.restype = handle_igraph_error_t
-igraph_similarity_jaccard_es.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_es_t, igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_similarity_dice"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t, igraph_bool_t])
 
-igraph_similarity_jaccard_pairs = _lib.igraph_similarity_jaccard_pairs
-igraph_similarity_jaccard_pairs.restype = handle_igraph_error_t
-igraph_similarity_jaccard_pairs.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_neimode_t, igraph_bool_t]
+_lazy_symbols["igraph_similarity_dice_es"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_es_t, igraph_neimode_t, igraph_bool_t])
 
-igraph_compare_communities = _lib.igraph_compare_communities
-igraph_compare_communities.restype = handle_igraph_error_t
-igraph_compare_communities.argtypes = [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t), igraph_community_comparison_t]
+_lazy_symbols["igraph_similarity_dice_pairs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_neimode_t, igraph_bool_t])
 
-igraph_community_spinglass = _lib.igraph_community_spinglass
-igraph_community_spinglass.restype = handle_igraph_error_t
-igraph_community_spinglass.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_bool_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_spincomm_update_t, igraph_real_t, igraph_spinglass_implementation_t, igraph_real_t]
+_lazy_symbols["igraph_similarity_inverse_log_weighted"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_neimode_t])
 
-igraph_community_spinglass_single = _lib.igraph_community_spinglass_single
-igraph_community_spinglass_single.restype = handle_igraph_error_t
-igraph_community_spinglass_single.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_int_t, igraph_spincomm_update_t, igraph_real_t]
+_lazy_symbols["igraph_similarity_jaccard"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_vs_t, igraph_vs_t, igraph_neimode_t, igraph_bool_t])
 
-igraph_community_walktrap = _lib.igraph_community_walktrap
-igraph_community_walktrap.restype = handle_igraph_error_t
-igraph_community_walktrap.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_matrix_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_similarity_jaccard_es"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_es_t, igraph_neimode_t, igraph_bool_t])
 
-igraph_community_edge_betweenness = _lib.igraph_community_edge_betweenness
-igraph_community_edge_betweenness.restype = handle_igraph_error_t
-igraph_community_edge_betweenness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_bool_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_similarity_jaccard_pairs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_neimode_t, igraph_bool_t])
 
-igraph_community_eb_get_merges = _lib.igraph_community_eb_get_merges
-igraph_community_eb_get_merges.restype = handle_igraph_error_t
-igraph_community_eb_get_merges.argtypes = [POINTER(igraph_t), igraph_bool_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_compare_communities"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t), igraph_community_comparison_t])
 
-igraph_community_fastgreedy = _lib.igraph_community_fastgreedy
-igraph_community_fastgreedy.restype = handle_igraph_error_t
-igraph_community_fastgreedy.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_community_spinglass"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_bool_t, igraph_real_t, igraph_real_t, igraph_real_t, igraph_spincomm_update_t, igraph_real_t, igraph_spinglass_implementation_t, igraph_real_t])
 
-igraph_community_to_membership = _lib.igraph_community_to_membership
-igraph_community_to_membership.restype = handle_igraph_error_t
-igraph_community_to_membership.argtypes = [POINTER(igraph_matrix_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_community_spinglass_single"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_real_t), igraph_int_t, igraph_spincomm_update_t, igraph_real_t])
 
-igraph_le_community_to_membership = _lib.igraph_le_community_to_membership
-igraph_le_community_to_membership.restype = handle_igraph_error_t
-igraph_le_community_to_membership.argtypes = [POINTER(igraph_matrix_int_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_community_walktrap"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_matrix_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t)])
 
-igraph_modularity = _lib.igraph_modularity
-igraph_modularity.restype = handle_igraph_error_t
-igraph_modularity.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_real_t, igraph_bool_t, POINTER(igraph_real_t)]
+_lazy_symbols["igraph_community_edge_betweenness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), igraph_bool_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_modularity_matrix = _lib.igraph_modularity_matrix
-igraph_modularity_matrix.restype = handle_igraph_error_t
-igraph_modularity_matrix.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_real_t, POINTER(igraph_matrix_t), igraph_bool_t]
+_lazy_symbols["igraph_community_eb_get_merges"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_bool_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t)])
 
-igraph_reindex_membership = _lib.igraph_reindex_membership
-igraph_reindex_membership.restype = handle_igraph_error_t
-igraph_reindex_membership.argtypes = [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_community_fastgreedy"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t)])
 
-igraph_community_fluid_communities = _lib.igraph_community_fluid_communities
-igraph_community_fluid_communities.restype = handle_igraph_error_t
-igraph_community_fluid_communities.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_community_to_membership"] = lambda: (handle_igraph_error_t, [POINTER(igraph_matrix_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_community_label_propagation = _lib.igraph_community_label_propagation
-igraph_community_label_propagation.restype = handle_igraph_error_t
-igraph_community_label_propagation.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t, POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_bool_t), igraph_lpa_variant_t]
+_lazy_symbols["igraph_le_community_to_membership"] = lambda: (handle_igraph_error_t, [POINTER(igraph_matrix_int_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_community_multilevel = _lib.igraph_community_multilevel
-igraph_community_multilevel.restype = handle_igraph_error_t
-igraph_community_multilevel.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_real_t, POINTER(igraph_vector_int_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_modularity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_real_t, igraph_bool_t, POINTER(igraph_real_t)])
 
-igraph_community_optimal_modularity = _lib.igraph_community_optimal_modularity
-igraph_community_optimal_modularity.restype = handle_igraph_error_t
-igraph_community_optimal_modularity.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_real_t, POINTER(igraph_real_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_modularity_matrix"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_real_t, POINTER(igraph_matrix_t), igraph_bool_t])
 
-igraph_community_leiden = _lib.igraph_community_leiden
-igraph_community_leiden.restype = handle_igraph_error_t
-igraph_community_leiden.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_real_t, igraph_real_t, igraph_bool_t, igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_reindex_membership"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t)])
 
-igraph_community_leiden_simple = _lib.igraph_community_leiden_simple
-igraph_community_leiden_simple.restype = handle_igraph_error_t
-igraph_community_leiden_simple.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_leiden_objective_t, igraph_real_t, igraph_real_t, igraph_bool_t, igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_community_fluid_communities"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t)])
 
-igraph_split_join_distance = _lib.igraph_split_join_distance
-igraph_split_join_distance.restype = handle_igraph_error_t
-igraph_split_join_distance.argtypes = [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_community_label_propagation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t, POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_bool_t), igraph_lpa_variant_t])
 
-igraph_community_infomap = _lib.igraph_community_infomap
-igraph_community_infomap.restype = handle_igraph_error_t
-igraph_community_infomap.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_int_t, igraph_bool_t, igraph_real_t, POINTER(igraph_vector_int_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_community_multilevel"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_real_t, POINTER(igraph_vector_int_t), POINTER(igraph_matrix_int_t), POINTER(igraph_vector_t)])
 
-igraph_community_voronoi = _lib.igraph_community_voronoi
-igraph_community_voronoi.restype = handle_igraph_error_t
-igraph_community_voronoi.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_real_t]
+_lazy_symbols["igraph_community_optimal_modularity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_real_t, POINTER(igraph_real_t), POINTER(igraph_vector_int_t)])
 
-igraph_graphlets = _lib.igraph_graphlets
-igraph_graphlets.restype = handle_igraph_error_t
-igraph_graphlets.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_t), igraph_int_t]
+_lazy_symbols["igraph_community_leiden"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_real_t, igraph_real_t, igraph_bool_t, igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_real_t)])
 
-igraph_graphlets_candidate_basis = _lib.igraph_graphlets_candidate_basis
-igraph_graphlets_candidate_basis.restype = handle_igraph_error_t
-igraph_graphlets_candidate_basis.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_community_leiden_simple"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_leiden_objective_t, igraph_real_t, igraph_real_t, igraph_bool_t, igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_real_t)])
 
-igraph_graphlets_project = _lib.igraph_graphlets_project
-igraph_graphlets_project.restype = handle_igraph_error_t
-igraph_graphlets_project.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_t), igraph_bool_t, igraph_int_t]
+_lazy_symbols["igraph_split_join_distance"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t)])
 
-igraph_hrg_fit = _lib.igraph_hrg_fit
-igraph_hrg_fit.restype = handle_igraph_error_t
-igraph_hrg_fit.argtypes = [POINTER(igraph_t), POINTER(igraph_hrg_t), igraph_bool_t, igraph_int_t]
+_lazy_symbols["igraph_community_infomap"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_int_t, igraph_bool_t, igraph_real_t, POINTER(igraph_vector_int_t), POINTER(igraph_real_t)])
 
-igraph_hrg_sample = _lib.igraph_hrg_sample
-igraph_hrg_sample.restype = handle_igraph_error_t
-igraph_hrg_sample.argtypes = [POINTER(igraph_hrg_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_community_voronoi"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t, igraph_real_t])
 
-igraph_hrg_sample_many = _lib.igraph_hrg_sample_many
-igraph_hrg_sample_many.restype = handle_igraph_error_t
-igraph_hrg_sample_many.argtypes = [POINTER(igraph_hrg_t), POINTER(igraph_graph_list_t), igraph_int_t]
+_lazy_symbols["igraph_graphlets"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_t), igraph_int_t])
 
-igraph_hrg_game = _lib.igraph_hrg_game
-igraph_hrg_game.restype = handle_igraph_error_t
-igraph_hrg_game.argtypes = [POINTER(igraph_t), POINTER(igraph_hrg_t)]
+_lazy_symbols["igraph_graphlets_candidate_basis"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_t)])
 
-igraph_hrg_consensus = _lib.igraph_hrg_consensus
-igraph_hrg_consensus.restype = handle_igraph_error_t
-igraph_hrg_consensus.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_hrg_t), igraph_bool_t, igraph_int_t]
+_lazy_symbols["igraph_graphlets_project"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_t), igraph_bool_t, igraph_int_t])
 
-igraph_hrg_predict = _lib.igraph_hrg_predict
-igraph_hrg_predict.restype = handle_igraph_error_t
-igraph_hrg_predict.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_hrg_t), igraph_bool_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_hrg_fit"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_hrg_t), igraph_bool_t, igraph_int_t])
 
-igraph_hrg_create = _lib.igraph_hrg_create
-igraph_hrg_create.restype = handle_igraph_error_t
-igraph_hrg_create.argtypes = [POINTER(igraph_hrg_t), POINTER(igraph_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_hrg_sample"] = lambda: (handle_igraph_error_t, [POINTER(igraph_hrg_t), POINTER(igraph_t)])
 
-igraph_hrg_resize = _lib.igraph_hrg_resize
-igraph_hrg_resize.restype = handle_igraph_error_t
-igraph_hrg_resize.argtypes = [POINTER(igraph_hrg_t), igraph_int_t]
+_lazy_symbols["igraph_hrg_sample_many"] = lambda: (handle_igraph_error_t, [POINTER(igraph_hrg_t), POINTER(igraph_graph_list_t), igraph_int_t])
 
-igraph_hrg_size = _lib.igraph_hrg_size
-igraph_hrg_size.restype = igraph_int_t
-igraph_hrg_size.argtypes = [POINTER(igraph_hrg_t)]
+_lazy_symbols["igraph_hrg_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_hrg_t)])
 
-igraph_from_hrg_dendrogram = _lib.igraph_from_hrg_dendrogram
-igraph_from_hrg_dendrogram.restype = handle_igraph_error_t
-igraph_from_hrg_dendrogram.argtypes = [POINTER(igraph_t), POINTER(igraph_hrg_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_hrg_consensus"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_hrg_t), igraph_bool_t, igraph_int_t])
 
-igraph_get_adjacency = _lib.igraph_get_adjacency
-igraph_get_adjacency.restype = handle_igraph_error_t
-igraph_get_adjacency.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_get_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t]
+_lazy_symbols["igraph_hrg_predict"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), POINTER(igraph_hrg_t), igraph_bool_t, igraph_int_t, igraph_int_t])
 
-igraph_get_adjacency_sparse = _lib.igraph_get_adjacency_sparse
-igraph_get_adjacency_sparse.restype = handle_igraph_error_t
-igraph_get_adjacency_sparse.argtypes = [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_get_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t]
+_lazy_symbols["igraph_hrg_create"] = lambda: (handle_igraph_error_t, [POINTER(igraph_hrg_t), POINTER(igraph_t), POINTER(igraph_vector_t)])
 
-igraph_get_edgelist = _lib.igraph_get_edgelist
-igraph_get_edgelist.restype = handle_igraph_error_t
-igraph_get_edgelist.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_bool_t]
+_lazy_symbols["igraph_hrg_resize"] = lambda: (handle_igraph_error_t, [POINTER(igraph_hrg_t), igraph_int_t])
 
-igraph_get_stochastic = _lib.igraph_get_stochastic
-igraph_get_stochastic.restype = handle_igraph_error_t
-igraph_get_stochastic.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_hrg_size"] = lambda: (igraph_int_t, [POINTER(igraph_hrg_t)])
 
-igraph_get_stochastic_sparse = _lib.igraph_get_stochastic_sparse
-igraph_get_stochastic_sparse.restype = handle_igraph_error_t
-igraph_get_stochastic_sparse.argtypes = [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_bool_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_from_hrg_dendrogram"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_hrg_t), POINTER(igraph_vector_t)])
 
-igraph_to_directed = _lib.igraph_to_directed
-igraph_to_directed.restype = handle_igraph_error_t
-igraph_to_directed.argtypes = [POINTER(igraph_t), igraph_to_directed_t]
+_lazy_symbols["igraph_get_adjacency"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_get_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t])
 
-igraph_to_undirected = _lib.igraph_to_undirected
-igraph_to_undirected.restype = handle_igraph_error_t
-igraph_to_undirected.argtypes = [POINTER(igraph_t), igraph_to_undirected_t, POINTER(igraph_attribute_combination_t)]
+_lazy_symbols["igraph_get_adjacency_sparse"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_get_adjacency_t, POINTER(igraph_vector_t), igraph_loops_t])
 
-igraph_read_graph_edgelist = _lib.igraph_read_graph_edgelist
-igraph_read_graph_edgelist.restype = handle_igraph_error_t
-igraph_read_graph_edgelist.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_get_edgelist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_bool_t])
 
-igraph_read_graph_ncol = _lib.igraph_read_graph_ncol
-igraph_read_graph_ncol.restype = handle_igraph_error_t
-igraph_read_graph_ncol.argtypes = [POINTER(igraph_t), POINTER(FILE), POINTER(igraph_strvector_t), igraph_bool_t, igraph_add_weights_t, igraph_bool_t]
+_lazy_symbols["igraph_get_stochastic"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_bool_t, POINTER(igraph_vector_t)])
 
-igraph_read_graph_lgl = _lib.igraph_read_graph_lgl
-igraph_read_graph_lgl.restype = handle_igraph_error_t
-igraph_read_graph_lgl.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_bool_t, igraph_add_weights_t, igraph_bool_t]
+_lazy_symbols["igraph_get_stochastic_sparse"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_sparsemat_t), igraph_bool_t, POINTER(igraph_vector_t)])
 
-igraph_read_graph_pajek = _lib.igraph_read_graph_pajek
-igraph_read_graph_pajek.restype = handle_igraph_error_t
-igraph_read_graph_pajek.argtypes = [POINTER(igraph_t), POINTER(FILE)]
+_lazy_symbols["igraph_to_directed"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_to_directed_t])
 
-igraph_read_graph_graphml = _lib.igraph_read_graph_graphml
-igraph_read_graph_graphml.restype = handle_igraph_error_t
-igraph_read_graph_graphml.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_int_t]
+_lazy_symbols["igraph_to_undirected"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_to_undirected_t, POINTER(igraph_attribute_combination_t)])
 
-igraph_read_graph_dimacs_flow = _lib.igraph_read_graph_dimacs_flow
-igraph_read_graph_dimacs_flow.restype = handle_igraph_error_t
-igraph_read_graph_dimacs_flow.argtypes = [POINTER(igraph_t), POINTER(FILE), POINTER(igraph_strvector_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_vector_t), igraph_bool_t]
+_lazy_symbols["igraph_read_graph_edgelist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_int_t, igraph_bool_t])
 
-igraph_read_graph_graphdb = _lib.igraph_read_graph_graphdb
-igraph_read_graph_graphdb.restype = handle_igraph_error_t
-igraph_read_graph_graphdb.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_bool_t]
+_lazy_symbols["igraph_read_graph_ncol"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), POINTER(igraph_strvector_t), igraph_bool_t, igraph_add_weights_t, igraph_bool_t])
 
-igraph_read_graph_gml = _lib.igraph_read_graph_gml
-igraph_read_graph_gml.restype = handle_igraph_error_t
-igraph_read_graph_gml.argtypes = [POINTER(igraph_t), POINTER(FILE)]
+_lazy_symbols["igraph_read_graph_lgl"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_bool_t, igraph_add_weights_t, igraph_bool_t])
 
-igraph_read_graph_dl = _lib.igraph_read_graph_dl
-igraph_read_graph_dl.restype = handle_igraph_error_t
-igraph_read_graph_dl.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_bool_t]
+_lazy_symbols["igraph_read_graph_pajek"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE)])
 
-igraph_write_graph_edgelist = _lib.igraph_write_graph_edgelist
-igraph_write_graph_edgelist.restype = handle_igraph_error_t
-igraph_write_graph_edgelist.argtypes = [POINTER(igraph_t), POINTER(FILE)]
+_lazy_symbols["igraph_read_graph_graphml"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_int_t])
 
-igraph_write_graph_ncol = _lib.igraph_write_graph_ncol
-igraph_write_graph_ncol.restype = handle_igraph_error_t
-igraph_write_graph_ncol.argtypes = [POINTER(igraph_t), POINTER(FILE), c_char_p, c_char_p]
+_lazy_symbols["igraph_read_graph_dimacs_flow"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), POINTER(igraph_strvector_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), POINTER(igraph_int_t), POINTER(igraph_vector_t), igraph_bool_t])
 
-igraph_write_graph_lgl = _lib.igraph_write_graph_lgl
-igraph_write_graph_lgl.restype = handle_igraph_error_t
-igraph_write_graph_lgl.argtypes = [POINTER(igraph_t), POINTER(FILE), c_char_p, c_char_p, igraph_bool_t]
+_lazy_symbols["igraph_read_graph_graphdb"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_bool_t])
 
-igraph_write_graph_leda = _lib.igraph_write_graph_leda
-igraph_write_graph_leda.restype = handle_igraph_error_t
-igraph_write_graph_leda.argtypes = [POINTER(igraph_t), POINTER(FILE), c_char_p, c_char_p]
+_lazy_symbols["igraph_read_graph_gml"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE)])
 
-igraph_write_graph_graphml = _lib.igraph_write_graph_graphml
-igraph_write_graph_graphml.restype = handle_igraph_error_t
-igraph_write_graph_graphml.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_bool_t]
+_lazy_symbols["igraph_read_graph_dl"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_bool_t])
 
-igraph_write_graph_pajek = _lib.igraph_write_graph_pajek
-igraph_write_graph_pajek.restype = handle_igraph_error_t
-igraph_write_graph_pajek.argtypes = [POINTER(igraph_t), POINTER(FILE)]
+_lazy_symbols["igraph_write_graph_edgelist"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE)])
 
-igraph_write_graph_dimacs_flow = _lib.igraph_write_graph_dimacs_flow
-igraph_write_graph_dimacs_flow.restype = handle_igraph_error_t
-igraph_write_graph_dimacs_flow.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_write_graph_ncol"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), c_char_p, c_char_p])
 
-igraph_write_graph_gml = _lib.igraph_write_graph_gml
-igraph_write_graph_gml.restype = handle_igraph_error_t
-igraph_write_graph_gml.argtypes = [POINTER(igraph_t), POINTER(FILE), igraph_write_gml_sw_t, POINTER(igraph_vector_t), c_char_p]
+_lazy_symbols["igraph_write_graph_lgl"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), c_char_p, c_char_p, igraph_bool_t])
 
-igraph_write_graph_dot = _lib.igraph_write_graph_dot
-igraph_write_graph_dot.restype = handle_igraph_error_t
-igraph_write_graph_dot.argtypes = [POINTER(igraph_t), POINTER(FILE)]
+_lazy_symbols["igraph_write_graph_leda"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), c_char_p, c_char_p])
 
-igraph_motifs_randesu = _lib.igraph_motifs_randesu
-igraph_motifs_randesu.restype = handle_igraph_error_t
-igraph_motifs_randesu.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_write_graph_graphml"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_bool_t])
 
-igraph_motifs_randesu_estimate = _lib.igraph_motifs_randesu_estimate
-igraph_motifs_randesu_estimate.restype = handle_igraph_error_t
-igraph_motifs_randesu_estimate.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_write_graph_pajek"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE)])
 
-igraph_motifs_randesu_no = _lib.igraph_motifs_randesu_no
-igraph_motifs_randesu_no.restype = handle_igraph_error_t
-igraph_motifs_randesu_no.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_write_graph_dimacs_flow"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_dyad_census = _lib.igraph_dyad_census
-igraph_dyad_census.restype = handle_igraph_error_t
-igraph_dyad_census.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_write_graph_gml"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE), igraph_write_gml_sw_t, POINTER(igraph_vector_t), c_char_p])
 
-igraph_triad_census = _lib.igraph_triad_census
-igraph_triad_census.restype = handle_igraph_error_t
-igraph_triad_census.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_write_graph_dot"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(FILE)])
 
-igraph_count_adjacent_triangles = _lib.igraph_count_adjacent_triangles
-igraph_count_adjacent_triangles.restype = handle_igraph_error_t
-igraph_count_adjacent_triangles.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t]
+_lazy_symbols["igraph_motifs_randesu"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_count_triangles = _lib.igraph_count_triangles
-igraph_count_triangles.restype = handle_igraph_error_t
-igraph_count_triangles.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_motifs_randesu_estimate"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, POINTER(igraph_vector_t), igraph_int_t, POINTER(igraph_vector_int_t)])
 
-igraph_local_scan_0 = _lib.igraph_local_scan_0
-igraph_local_scan_0.restype = handle_igraph_error_t
-igraph_local_scan_0.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_motifs_randesu_no"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_local_scan_0_them = _lib.igraph_local_scan_0_them
-igraph_local_scan_0_them.restype = handle_igraph_error_t
-igraph_local_scan_0_them.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_dyad_census"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_real_t), POINTER(igraph_real_t)])
 
-igraph_local_scan_1_ecount = _lib.igraph_local_scan_1_ecount
-igraph_local_scan_1_ecount.restype = handle_igraph_error_t
-igraph_local_scan_1_ecount.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_triad_census"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t)])
 
-igraph_local_scan_1_ecount_them = _lib.igraph_local_scan_1_ecount_them
-igraph_local_scan_1_ecount_them.restype = handle_igraph_error_t
-igraph_local_scan_1_ecount_them.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_count_adjacent_triangles"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), igraph_vs_t])
 
-igraph_local_scan_k_ecount = _lib.igraph_local_scan_k_ecount
-igraph_local_scan_k_ecount.restype = handle_igraph_error_t
-igraph_local_scan_k_ecount.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_count_triangles"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t)])
 
-igraph_local_scan_k_ecount_them = _lib.igraph_local_scan_k_ecount_them
-igraph_local_scan_k_ecount_them.restype = handle_igraph_error_t
-igraph_local_scan_k_ecount_them.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t]
+_lazy_symbols["igraph_local_scan_0"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_local_scan_neighborhood_ecount = _lib.igraph_local_scan_neighborhood_ecount
-igraph_local_scan_neighborhood_ecount.restype = handle_igraph_error_t
-igraph_local_scan_neighborhood_ecount.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_local_scan_0_them"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_local_scan_subset_ecount = _lib.igraph_local_scan_subset_ecount
-igraph_local_scan_subset_ecount.restype = handle_igraph_error_t
-igraph_local_scan_subset_ecount.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_local_scan_1_ecount"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_list_triangles = _lib.igraph_list_triangles
-igraph_list_triangles.restype = handle_igraph_error_t
-igraph_list_triangles.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_local_scan_1_ecount_them"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_disjoint_union = _lib.igraph_disjoint_union
-igraph_disjoint_union.restype = handle_igraph_error_t
-igraph_disjoint_union.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_local_scan_k_ecount"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_disjoint_union_many = _lib.igraph_disjoint_union_many
-igraph_disjoint_union_many.restype = handle_igraph_error_t
-igraph_disjoint_union_many.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_ptr_t)]
+_lazy_symbols["igraph_local_scan_k_ecount_them"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_neimode_t])
 
-igraph_join = _lib.igraph_join
-igraph_join.restype = handle_igraph_error_t
-igraph_join.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_local_scan_neighborhood_ecount"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_union = _lib.igraph_union
-igraph_union.restype = handle_igraph_error_t
-igraph_union.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_local_scan_subset_ecount"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_union_many = _lib.igraph_union_many
-igraph_union_many.restype = handle_igraph_error_t
-igraph_union_many.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_ptr_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_list_triangles"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_intersection = _lib.igraph_intersection
-igraph_intersection.restype = handle_igraph_error_t
-igraph_intersection.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_disjoint_union"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t)])
 
-igraph_intersection_many = _lib.igraph_intersection_many
-igraph_intersection_many.restype = handle_igraph_error_t
-igraph_intersection_many.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_ptr_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_disjoint_union_many"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_ptr_t)])
 
-igraph_difference = _lib.igraph_difference
-igraph_difference.restype = handle_igraph_error_t
-igraph_difference.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_join"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t)])
 
-igraph_complementer = _lib.igraph_complementer
-igraph_complementer.restype = handle_igraph_error_t
-igraph_complementer.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_bool_t]
+_lazy_symbols["igraph_union"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_compose = _lib.igraph_compose
-igraph_compose.restype = handle_igraph_error_t
-igraph_compose.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_union_many"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_ptr_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_induced_subgraph_map = _lib.igraph_induced_subgraph_map
-igraph_induced_subgraph_map.restype = handle_igraph_error_t
-igraph_induced_subgraph_map.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_vs_t, igraph_subgraph_implementation_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_intersection"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_mycielskian = _lib.igraph_mycielskian
-igraph_mycielskian.restype = handle_igraph_error_t
-igraph_mycielskian.argtypes = [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t]
+_lazy_symbols["igraph_intersection_many"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_ptr_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_product = _lib.igraph_product
-igraph_product.restype = handle_igraph_error_t
-igraph_product.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), igraph_product_t]
+_lazy_symbols["igraph_difference"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t)])
 
-igraph_rooted_product = _lib.igraph_rooted_product
-igraph_rooted_product.restype = handle_igraph_error_t
-igraph_rooted_product.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), igraph_int_t]
+_lazy_symbols["igraph_complementer"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_bool_t])
 
-igraph_gomory_hu_tree = _lib.igraph_gomory_hu_tree
-igraph_gomory_hu_tree.restype = handle_igraph_error_t
-igraph_gomory_hu_tree.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_compose"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_maxflow = _lib.igraph_maxflow
-igraph_maxflow.restype = handle_igraph_error_t
-igraph_maxflow.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_maxflow_stats_t)]
+_lazy_symbols["igraph_induced_subgraph_map"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_vs_t, igraph_subgraph_implementation_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_maxflow_value = _lib.igraph_maxflow_value
-igraph_maxflow_value.restype = handle_igraph_error_t
-igraph_maxflow_value.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_maxflow_stats_t)]
+_lazy_symbols["igraph_mycielskian"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), igraph_int_t])
 
-igraph_mincut = _lib.igraph_mincut
-igraph_mincut.restype = handle_igraph_error_t
-igraph_mincut.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_product"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), igraph_product_t])
 
-igraph_mincut_value = _lib.igraph_mincut_value
-igraph_mincut_value.restype = handle_igraph_error_t
-igraph_mincut_value.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_rooted_product"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_t), igraph_int_t])
 
-igraph_residual_graph = _lib.igraph_residual_graph
-igraph_residual_graph.restype = handle_igraph_error_t
-igraph_residual_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_gomory_hu_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_reverse_residual_graph = _lib.igraph_reverse_residual_graph
-igraph_reverse_residual_graph.restype = handle_igraph_error_t
-igraph_reverse_residual_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_maxflow"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_maxflow_stats_t)])
 
-igraph_st_mincut = _lib.igraph_st_mincut
-igraph_st_mincut.restype = handle_igraph_error_t
-igraph_st_mincut.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_maxflow_value"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t), POINTER(igraph_maxflow_stats_t)])
 
-igraph_st_mincut_value = _lib.igraph_st_mincut_value
-igraph_st_mincut_value.restype = handle_igraph_error_t
-igraph_st_mincut_value.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_mincut"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t)])
 
-igraph_st_vertex_connectivity = _lib.igraph_st_vertex_connectivity
-igraph_st_vertex_connectivity.restype = handle_igraph_error_t
-igraph_st_vertex_connectivity.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t, igraph_vconn_nei_t]
+_lazy_symbols["igraph_mincut_value"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_t)])
 
-igraph_vertex_connectivity = _lib.igraph_vertex_connectivity
-igraph_vertex_connectivity.restype = handle_igraph_error_t
-igraph_vertex_connectivity.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t]
+_lazy_symbols["igraph_residual_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
 
-igraph_st_edge_connectivity = _lib.igraph_st_edge_connectivity
-igraph_st_edge_connectivity.restype = handle_igraph_error_t
-igraph_st_edge_connectivity.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_reverse_residual_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_t), POINTER(igraph_vector_t)])
 
-igraph_edge_connectivity = _lib.igraph_edge_connectivity
-igraph_edge_connectivity.restype = handle_igraph_error_t
-igraph_edge_connectivity.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t]
+_lazy_symbols["igraph_st_mincut"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_edge_disjoint_paths = _lib.igraph_edge_disjoint_paths
-igraph_edge_disjoint_paths.restype = handle_igraph_error_t
-igraph_edge_disjoint_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_st_mincut_value"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_vertex_disjoint_paths = _lib.igraph_vertex_disjoint_paths
-igraph_vertex_disjoint_paths.restype = handle_igraph_error_t
-igraph_vertex_disjoint_paths.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_st_vertex_connectivity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t, igraph_vconn_nei_t])
 
-igraph_adhesion = _lib.igraph_adhesion
-igraph_adhesion.restype = handle_igraph_error_t
-igraph_adhesion.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t]
+_lazy_symbols["igraph_vertex_connectivity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t])
 
-igraph_cohesion = _lib.igraph_cohesion
-igraph_cohesion.restype = handle_igraph_error_t
-igraph_cohesion.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t]
+_lazy_symbols["igraph_st_edge_connectivity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t])
 
-igraph_dominator_tree = _lib.igraph_dominator_tree
-igraph_dominator_tree.restype = handle_igraph_error_t
-igraph_dominator_tree.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_edge_connectivity"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t])
 
-igraph_all_st_cuts = _lib.igraph_all_st_cuts
-igraph_all_st_cuts.restype = handle_igraph_error_t
-igraph_all_st_cuts.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_edge_disjoint_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t])
 
-igraph_all_st_mincuts = _lib.igraph_all_st_mincuts
-igraph_all_st_mincuts.restype = handle_igraph_error_t
-igraph_all_st_mincuts.argtypes = [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_vertex_disjoint_paths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_int_t, igraph_int_t])
 
-igraph_even_tarjan_reduction = _lib.igraph_even_tarjan_reduction
-igraph_even_tarjan_reduction.restype = handle_igraph_error_t
-igraph_even_tarjan_reduction.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_adhesion"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t])
 
-igraph_is_separator = _lib.igraph_is_separator
-igraph_is_separator.restype = handle_igraph_error_t
-igraph_is_separator.argtypes = [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_cohesion"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t), igraph_bool_t])
 
-igraph_is_minimal_separator = _lib.igraph_is_minimal_separator
-igraph_is_minimal_separator.restype = handle_igraph_error_t
-igraph_is_minimal_separator.argtypes = [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_dominator_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_all_minimal_st_separators = _lib.igraph_all_minimal_st_separators
-igraph_all_minimal_st_separators.restype = handle_igraph_error_t
-igraph_all_minimal_st_separators.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_all_st_cuts"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t])
 
-igraph_minimum_size_separators = _lib.igraph_minimum_size_separators
-igraph_minimum_size_separators.restype = handle_igraph_error_t
-igraph_minimum_size_separators.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_all_st_mincuts"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_int_t, POINTER(igraph_vector_t)])
 
-igraph_cohesive_blocks = _lib.igraph_cohesive_blocks
-igraph_cohesive_blocks.restype = handle_igraph_error_t
-igraph_cohesive_blocks.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_t)]
+_lazy_symbols["igraph_even_tarjan_reduction"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_t)])
 
-igraph_coreness = _lib.igraph_coreness
-igraph_coreness.restype = handle_igraph_error_t
-igraph_coreness.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_is_separator"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_bool_t)])
 
-igraph_isoclass = _lib.igraph_isoclass
-igraph_isoclass.restype = handle_igraph_error_t
-igraph_isoclass.argtypes = [POINTER(igraph_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_is_minimal_separator"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_bool_t)])
 
-igraph_isomorphic = _lib.igraph_isomorphic
-igraph_isomorphic.restype = handle_igraph_error_t
-igraph_isomorphic.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_all_minimal_st_separators"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_automorphism_group = _lib.igraph_automorphism_group
-igraph_automorphism_group.restype = handle_igraph_error_t
-igraph_automorphism_group.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t)]
+_lazy_symbols["igraph_minimum_size_separators"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_count_automorphisms = _lib.igraph_count_automorphisms
-igraph_count_automorphisms.restype = handle_igraph_error_t
-igraph_count_automorphisms.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t)]
+_lazy_symbols["igraph_cohesive_blocks"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_t)])
 
-igraph_isoclass_subgraph = _lib.igraph_isoclass_subgraph
-igraph_isoclass_subgraph.restype = handle_igraph_error_t
-igraph_isoclass_subgraph.argtypes = [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_int_t)]
+_lazy_symbols["igraph_coreness"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_isoclass_create = _lib.igraph_isoclass_create
-igraph_isoclass_create.restype = handle_igraph_error_t
-igraph_isoclass_create.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t]
+_lazy_symbols["igraph_isoclass"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_int_t)])
 
-igraph_isomorphic_vf2 = _lib.igraph_isomorphic_vf2
-igraph_isomorphic_vf2.restype = handle_igraph_error_t
-igraph_isomorphic_vf2.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_isomorphic"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_get_isomorphisms_vf2_callback = _lib.igraph_get_isomorphisms_vf2_callback
-igraph_get_isomorphisms_vf2_callback.restype = handle_igraph_error_t
-igraph_get_isomorphisms_vf2_callback.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isohandler_t, igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_automorphism_group"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t)])
 
-igraph_count_isomorphisms_vf2 = _lib.igraph_count_isomorphisms_vf2
-igraph_count_isomorphisms_vf2.restype = handle_igraph_error_t
-igraph_count_isomorphisms_vf2.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_count_automorphisms"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_real_t)])
 
-igraph_get_isomorphisms_vf2 = _lib.igraph_get_isomorphisms_vf2
-igraph_get_isomorphisms_vf2.restype = handle_igraph_error_t
-igraph_get_isomorphisms_vf2.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_isoclass_subgraph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_vs_t, POINTER(igraph_int_t)])
 
-igraph_subisomorphic = _lib.igraph_subisomorphic
-igraph_subisomorphic.restype = handle_igraph_error_t
-igraph_subisomorphic.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_isoclass_create"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_int_t, igraph_bool_t])
 
-igraph_subisomorphic_vf2 = _lib.igraph_subisomorphic_vf2
-igraph_subisomorphic_vf2.restype = handle_igraph_error_t
-igraph_subisomorphic_vf2.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_isomorphic_vf2"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_get_subisomorphisms_vf2_callback = _lib.igraph_get_subisomorphisms_vf2_callback
-igraph_get_subisomorphisms_vf2_callback.restype = handle_igraph_error_t
-igraph_get_subisomorphisms_vf2_callback.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isohandler_t, igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_get_isomorphisms_vf2_callback"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isohandler_t, igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_count_subisomorphisms_vf2 = _lib.igraph_count_subisomorphisms_vf2
-igraph_count_subisomorphisms_vf2.restype = handle_igraph_error_t
-igraph_count_subisomorphisms_vf2.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_count_isomorphisms_vf2"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_get_subisomorphisms_vf2 = _lib.igraph_get_subisomorphisms_vf2
-igraph_get_subisomorphisms_vf2.restype = handle_igraph_error_t
-igraph_get_subisomorphisms_vf2.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p]
+_lazy_symbols["igraph_get_isomorphisms_vf2"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_canonical_permutation = _lib.igraph_canonical_permutation
-igraph_canonical_permutation.restype = handle_igraph_error_t
-igraph_canonical_permutation.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_subisomorphic"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_canonical_permutation_bliss = _lib.igraph_canonical_permutation_bliss
-igraph_canonical_permutation_bliss.restype = handle_igraph_error_t
-igraph_canonical_permutation_bliss.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t)]
+_lazy_symbols["igraph_subisomorphic_vf2"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_permute_vertices = _lib.igraph_permute_vertices
-igraph_permute_vertices.restype = handle_igraph_error_t
-igraph_permute_vertices.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_get_subisomorphisms_vf2_callback"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_isohandler_t, igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_isomorphic_bliss = _lib.igraph_isomorphic_bliss
-igraph_isomorphic_bliss.restype = handle_igraph_error_t
-igraph_isomorphic_bliss.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t), POINTER(igraph_bliss_info_t)]
+_lazy_symbols["igraph_count_subisomorphisms_vf2"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_int_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_count_automorphisms_bliss = _lib.igraph_count_automorphisms_bliss
-igraph_count_automorphisms_bliss.restype = handle_igraph_error_t
-igraph_count_automorphisms_bliss.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t)]
+_lazy_symbols["igraph_get_subisomorphisms_vf2"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_isocompat_t, igraph_isocompat_t, c_void_p])
 
-igraph_automorphism_group_bliss = _lib.igraph_automorphism_group_bliss
-igraph_automorphism_group_bliss.restype = handle_igraph_error_t
-igraph_automorphism_group_bliss.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t)]
+_lazy_symbols["igraph_canonical_permutation"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_subisomorphic_lad = _lib.igraph_subisomorphic_lad
-igraph_subisomorphic_lad.restype = handle_igraph_error_t
-igraph_subisomorphic_lad.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_bool_t]
+_lazy_symbols["igraph_canonical_permutation_bliss"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t)])
 
-igraph_simplify_and_colorize = _lib.igraph_simplify_and_colorize
-igraph_simplify_and_colorize.restype = handle_igraph_error_t
-igraph_simplify_and_colorize.argtypes = [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_permute_vertices"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_graph_count = _lib.igraph_graph_count
-igraph_graph_count.restype = handle_igraph_error_t
-igraph_graph_count.argtypes = [igraph_int_t, igraph_bool_t, POINTER(igraph_int_t)]
+_lazy_symbols["igraph_isomorphic_bliss"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t), POINTER(igraph_bliss_info_t)])
 
-igraph_is_matching = _lib.igraph_is_matching
-igraph_is_matching.restype = handle_igraph_error_t
-igraph_is_matching.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_count_automorphisms_bliss"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t)])
 
-igraph_is_maximal_matching = _lib.igraph_is_maximal_matching
-igraph_is_maximal_matching.restype = handle_igraph_error_t
-igraph_is_maximal_matching.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_automorphism_group_bliss"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_bliss_sh_t, POINTER(igraph_bliss_info_t)])
 
-igraph_maximum_bipartite_matching = _lib.igraph_maximum_bipartite_matching
-igraph_maximum_bipartite_matching.restype = handle_igraph_error_t
-igraph_maximum_bipartite_matching.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_int_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_real_t]
+_lazy_symbols["igraph_subisomorphic_lad"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_list_t), igraph_bool_t])
 
-igraph_adjacency_spectral_embedding = _lib.igraph_adjacency_spectral_embedding
-igraph_adjacency_spectral_embedding.restype = handle_igraph_error_t
-igraph_adjacency_spectral_embedding.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), igraph_eigen_which_position_t, igraph_bool_t, POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_simplify_and_colorize"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_laplacian_spectral_embedding = _lib.igraph_laplacian_spectral_embedding
-igraph_laplacian_spectral_embedding.restype = handle_igraph_error_t
-igraph_laplacian_spectral_embedding.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), igraph_eigen_which_position_t, igraph_laplacian_spectral_embedding_type_t, igraph_bool_t, POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)]
+_lazy_symbols["igraph_graph_count"] = lambda: (handle_igraph_error_t, [igraph_int_t, igraph_bool_t, POINTER(igraph_int_t)])
 
-igraph_power_law_fit = _lib.igraph_power_law_fit
-igraph_power_law_fit.restype = handle_igraph_error_t
-igraph_power_law_fit.argtypes = [POINTER(igraph_vector_t), POINTER(igraph_plfit_result_t), igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_is_matching"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)])
 
-igraph_sir = _lib.igraph_sir
-igraph_sir.restype = handle_igraph_error_t
-igraph_sir.argtypes = [POINTER(igraph_t), igraph_real_t, igraph_real_t, igraph_int_t, POINTER(igraph_vector_ptr_t)]
+_lazy_symbols["igraph_is_maximal_matching"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)])
 
-igraph_running_mean = _lib.igraph_running_mean
-igraph_running_mean.restype = handle_igraph_error_t
-igraph_running_mean.argtypes = [POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_int_t]
+_lazy_symbols["igraph_maximum_bipartite_matching"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_int_t), POINTER(igraph_real_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_real_t])
 
-igraph_random_sample = _lib.igraph_random_sample
-igraph_random_sample.restype = handle_igraph_error_t
-igraph_random_sample.argtypes = [POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_adjacency_spectral_embedding"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), igraph_eigen_which_position_t, igraph_bool_t, POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)])
 
-igraph_convex_hull_2d = _lib.igraph_convex_hull_2d
-igraph_convex_hull_2d.restype = handle_igraph_error_t
-igraph_convex_hull_2d.argtypes = [POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_laplacian_spectral_embedding"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_t), igraph_eigen_which_position_t, igraph_laplacian_spectral_embedding_type_t, igraph_bool_t, POINTER(igraph_matrix_t), POINTER(igraph_matrix_t), POINTER(igraph_vector_t), POINTER(igraph_arpack_options_t)])
 
-igraph_dim_select = _lib.igraph_dim_select
-igraph_dim_select.restype = handle_igraph_error_t
-igraph_dim_select.argtypes = [POINTER(igraph_vector_t), POINTER(igraph_int_t)]
+_lazy_symbols["igraph_power_law_fit"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_t), POINTER(igraph_plfit_result_t), igraph_real_t, igraph_bool_t])
 
-igraph_almost_equals = _lib.igraph_almost_equals
-igraph_almost_equals.restype = igraph_bool_t
-igraph_almost_equals.argtypes = [c_double, c_double, c_double]
+_lazy_symbols["igraph_sir"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_real_t, igraph_real_t, igraph_int_t, POINTER(igraph_vector_ptr_t)])
 
-igraph_cmp_epsilon = _lib.igraph_cmp_epsilon
-igraph_cmp_epsilon.restype = c_int
-igraph_cmp_epsilon.argtypes = [c_double, c_double, c_double]
+_lazy_symbols["igraph_running_mean"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_t), POINTER(igraph_vector_t), igraph_int_t])
 
-igraph_solve_lsap = _lib.igraph_solve_lsap
-igraph_solve_lsap.restype = handle_igraph_error_t
-igraph_solve_lsap.argtypes = [POINTER(igraph_matrix_t), igraph_int_t, POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_random_sample"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t), igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_find_cycle = _lib.igraph_find_cycle
-igraph_find_cycle.restype = handle_igraph_error_t
-igraph_find_cycle.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_convex_hull_2d"] = lambda: (handle_igraph_error_t, [POINTER(igraph_matrix_t), POINTER(igraph_vector_int_t), POINTER(igraph_matrix_t)])
 
-igraph_simple_cycles = _lib.igraph_simple_cycles
-igraph_simple_cycles.restype = handle_igraph_error_t
-igraph_simple_cycles.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_neimode_t, igraph_int_t, igraph_int_t, igraph_int_t]
+_lazy_symbols["igraph_dim_select"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_t), POINTER(igraph_int_t)])
 
-igraph_simple_cycles_callback = _lib.igraph_simple_cycles_callback
-igraph_simple_cycles_callback.restype = handle_igraph_error_t
-igraph_simple_cycles_callback.argtypes = [POINTER(igraph_t), igraph_neimode_t, igraph_int_t, igraph_int_t, igraph_cycle_handler_t, c_void_p]
+_lazy_symbols["igraph_almost_equals"] = lambda: (igraph_bool_t, [c_double, c_double, c_double])
 
-igraph_is_eulerian = _lib.igraph_is_eulerian
-igraph_is_eulerian.restype = handle_igraph_error_t
-igraph_is_eulerian.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_cmp_epsilon"] = lambda: (c_int, [c_double, c_double, c_double])
 
-igraph_eulerian_path = _lib.igraph_eulerian_path
-igraph_eulerian_path.restype = handle_igraph_error_t
-igraph_eulerian_path.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_solve_lsap"] = lambda: (handle_igraph_error_t, [POINTER(igraph_matrix_t), igraph_int_t, POINTER(igraph_vector_int_t)])
 
-igraph_eulerian_cycle = _lib.igraph_eulerian_cycle
-igraph_eulerian_cycle.restype = handle_igraph_error_t
-igraph_eulerian_cycle.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_find_cycle"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_fundamental_cycles = _lib.igraph_fundamental_cycles
-igraph_fundamental_cycles.restype = handle_igraph_error_t
-igraph_fundamental_cycles.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_real_t]
+_lazy_symbols["igraph_simple_cycles"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_list_t), POINTER(igraph_vector_int_list_t), igraph_neimode_t, igraph_int_t, igraph_int_t, igraph_int_t])
 
-igraph_minimum_cycle_basis = _lib.igraph_minimum_cycle_basis
-igraph_minimum_cycle_basis.restype = handle_igraph_error_t
-igraph_minimum_cycle_basis.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), igraph_real_t, igraph_bool_t, igraph_bool_t]
+_lazy_symbols["igraph_simple_cycles_callback"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_neimode_t, igraph_int_t, igraph_int_t, igraph_cycle_handler_t, c_void_p])
 
-igraph_is_tree = _lib.igraph_is_tree
-igraph_is_tree.restype = handle_igraph_error_t
-igraph_is_tree.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_is_eulerian"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_bool_t)])
 
-igraph_is_forest = _lib.igraph_is_forest
-igraph_is_forest.restype = handle_igraph_error_t
-igraph_is_forest.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_eulerian_path"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_from_prufer = _lib.igraph_from_prufer
-igraph_from_prufer.restype = handle_igraph_error_t
-igraph_from_prufer.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_eulerian_cycle"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t)])
 
-igraph_to_prufer = _lib.igraph_to_prufer
-igraph_to_prufer.restype = handle_igraph_error_t
-igraph_to_prufer.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_fundamental_cycles"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), igraph_int_t, igraph_real_t])
 
-igraph_tree_from_parent_vector = _lib.igraph_tree_from_parent_vector
-igraph_tree_from_parent_vector.restype = handle_igraph_error_t
-igraph_tree_from_parent_vector.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_tree_mode_t]
+_lazy_symbols["igraph_minimum_cycle_basis"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_int_list_t), igraph_real_t, igraph_bool_t, igraph_bool_t])
 
-igraph_is_complete = _lib.igraph_is_complete
-igraph_is_complete.restype = handle_igraph_error_t
-igraph_is_complete.argtypes = [POINTER(igraph_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_is_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_int_t), igraph_neimode_t])
 
-igraph_minimum_spanning_tree = _lib.igraph_minimum_spanning_tree
-igraph_minimum_spanning_tree.restype = handle_igraph_error_t
-igraph_minimum_spanning_tree.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_mst_algorithm_t]
+_lazy_symbols["igraph_is_forest"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_random_spanning_tree = _lib.igraph_random_spanning_tree
-igraph_random_spanning_tree.restype = handle_igraph_error_t
-igraph_random_spanning_tree.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t]
+_lazy_symbols["igraph_from_prufer"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_tree_game = _lib.igraph_tree_game
-igraph_tree_game.restype = handle_igraph_error_t
-igraph_tree_game.argtypes = [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_random_tree_t]
+_lazy_symbols["igraph_to_prufer"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t)])
 
-igraph_nearest_neighbor_graph = _lib.igraph_nearest_neighbor_graph
-igraph_nearest_neighbor_graph.restype = handle_igraph_error_t
-igraph_nearest_neighbor_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_metric_t, igraph_int_t, igraph_real_t, igraph_bool_t]
+_lazy_symbols["igraph_tree_from_parent_vector"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_tree_mode_t])
 
-igraph_delaunay_graph = _lib.igraph_delaunay_graph
-igraph_delaunay_graph.restype = handle_igraph_error_t
-igraph_delaunay_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_is_complete"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_bool_t)])
 
-igraph_gabriel_graph = _lib.igraph_gabriel_graph
-igraph_gabriel_graph.restype = handle_igraph_error_t
-igraph_gabriel_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_minimum_spanning_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_vector_t), igraph_mst_algorithm_t])
 
-igraph_relative_neighborhood_graph = _lib.igraph_relative_neighborhood_graph
-igraph_relative_neighborhood_graph.restype = handle_igraph_error_t
-igraph_relative_neighborhood_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t)]
+_lazy_symbols["igraph_random_spanning_tree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_int_t])
 
-igraph_lune_beta_skeleton = _lib.igraph_lune_beta_skeleton
-igraph_lune_beta_skeleton.restype = handle_igraph_error_t
-igraph_lune_beta_skeleton.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_real_t]
+_lazy_symbols["igraph_tree_game"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, igraph_bool_t, igraph_random_tree_t])
 
-igraph_circle_beta_skeleton = _lib.igraph_circle_beta_skeleton
-igraph_circle_beta_skeleton.restype = handle_igraph_error_t
-igraph_circle_beta_skeleton.argtypes = [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_real_t]
+_lazy_symbols["igraph_nearest_neighbor_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_metric_t, igraph_int_t, igraph_real_t, igraph_bool_t])
 
-igraph_beta_weighted_gabriel_graph = _lib.igraph_beta_weighted_gabriel_graph
-igraph_beta_weighted_gabriel_graph.restype = handle_igraph_error_t
-igraph_beta_weighted_gabriel_graph.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_real_t]
+_lazy_symbols["igraph_delaunay_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_spatial_edge_lengths = _lib.igraph_spatial_edge_lengths
-igraph_spatial_edge_lengths.restype = handle_igraph_error_t
-igraph_spatial_edge_lengths.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_metric_t]
+_lazy_symbols["igraph_gabriel_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_vertex_coloring_greedy = _lib.igraph_vertex_coloring_greedy
-igraph_vertex_coloring_greedy.restype = handle_igraph_error_t
-igraph_vertex_coloring_greedy.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_coloring_greedy_t]
+_lazy_symbols["igraph_relative_neighborhood_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t)])
 
-igraph_is_vertex_coloring = _lib.igraph_is_vertex_coloring
-igraph_is_vertex_coloring.restype = handle_igraph_error_t
-igraph_is_vertex_coloring.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_lune_beta_skeleton"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_real_t])
 
-igraph_is_bipartite_coloring = _lib.igraph_is_bipartite_coloring
-igraph_is_bipartite_coloring.restype = handle_igraph_error_t
-igraph_is_bipartite_coloring.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_bool_t), POINTER(igraph_neimode_t)]
+_lazy_symbols["igraph_circle_beta_skeleton"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_matrix_t), igraph_real_t])
 
-igraph_is_edge_coloring = _lib.igraph_is_edge_coloring
-igraph_is_edge_coloring.restype = handle_igraph_error_t
-igraph_is_edge_coloring.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)]
+_lazy_symbols["igraph_beta_weighted_gabriel_graph"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_real_t])
 
-igraph_convergence_degree = _lib.igraph_convergence_degree
-igraph_convergence_degree.restype = handle_igraph_error_t
-igraph_convergence_degree.argtypes = [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)]
+_lazy_symbols["igraph_spatial_edge_lengths"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_matrix_t), igraph_metric_t])
 
-igraph_has_attribute_table = _lib.igraph_has_attribute_table
-igraph_has_attribute_table.restype = igraph_bool_t
-igraph_has_attribute_table.argtypes = []
+_lazy_symbols["igraph_vertex_coloring_greedy"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), igraph_coloring_greedy_t])
+
+_lazy_symbols["igraph_is_vertex_coloring"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)])
+
+_lazy_symbols["igraph_is_bipartite_coloring"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_bool_t), POINTER(igraph_bool_t), POINTER(igraph_neimode_t)])
+
+_lazy_symbols["igraph_is_edge_coloring"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_int_t), POINTER(igraph_bool_t)])
+
+_lazy_symbols["igraph_convergence_degree"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t), POINTER(igraph_vector_t)])
+
+_lazy_symbols["igraph_has_attribute_table"] = lambda: (igraph_bool_t, [])
 
-igraph_progress = _lib.igraph_progress
-igraph_progress.restype = handle_igraph_error_t
-igraph_progress.argtypes = [c_char_p, igraph_real_t, c_void_p]
+_lazy_symbols["igraph_progress"] = lambda: (handle_igraph_error_t, [c_char_p, igraph_real_t, c_void_p])
 
-igraph_status = _lib.igraph_status
-igraph_status.restype = handle_igraph_error_t
-igraph_status.argtypes = [c_char_p, c_void_p]
+_lazy_symbols["igraph_status"] = lambda: (handle_igraph_error_t, [c_char_p, c_void_p])
 
-igraph_strerror = _lib.igraph_strerror
-igraph_strerror.restype = c_char_p
-igraph_strerror.argtypes = [igraph_error_t]
+_lazy_symbols["igraph_strerror"] = lambda: (c_char_p, [igraph_error_t])
 
-igraph_expand_path_to_pairs = _lib.igraph_expand_path_to_pairs
-igraph_expand_path_to_pairs.restype = handle_igraph_error_t
-igraph_expand_path_to_pairs.argtypes = [POINTER(igraph_vector_int_t)]
+_lazy_symbols["igraph_expand_path_to_pairs"] = lambda: (handle_igraph_error_t, [POINTER(igraph_vector_int_t)])
 
-igraph_invalidate_cache = _lib.igraph_invalidate_cache
-igraph_invalidate_cache.restype = None
-igraph_invalidate_cache.argtypes = [POINTER(igraph_t)]
+_lazy_symbols["igraph_invalidate_cache"] = lambda: (None, [POINTER(igraph_t)])
 
-igraph_vertex_path_from_edge_path = _lib.igraph_vertex_path_from_edge_path
-igraph_vertex_path_from_edge_path.restype = handle_igraph_error_t
-igraph_vertex_path_from_edge_path.argtypes = [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_neimode_t]
+_lazy_symbols["igraph_vertex_path_from_edge_path"] = lambda: (handle_igraph_error_t, [POINTER(igraph_t), igraph_int_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), igraph_neimode_t])
 
-igraph_version = _lib.igraph_version
-igraph_version.restype = None
-igraph_version.argtypes = [POINTER(c_char_p), POINTER(c_int), POINTER(c_int), POINTER(c_int)]
+_lazy_symbols["igraph_version"] = lambda: (None, [POINTER(c_char_p), POINTER(c_int), POINTER(c_int), POINTER(c_int)])
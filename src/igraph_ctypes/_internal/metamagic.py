@@ -193,6 +193,14 @@ class Boxed(Generic[T], metaclass=BoxedMeta):
                 self.__destructor(byref(self.__c_instance))  # type: ignore
             self.__initialized = False
 
+    @property
+    def initialized(self) -> bool:
+        """Returns whether the boxed object is marked as initialized, i.e.
+        whether it owns the wrapped low-level object and will call its
+        destructor when it is garbage-collected.
+        """
+        return self.__initialized
+
     def _set_wrapped_instance(self, value: T):
         assert not self.__initialized
         self.__c_instance = value
@@ -1,7 +1,7 @@
 from ctypes import pointer
-from functools import partial
 from numpy.random import Generator
-from typing import Callable, Optional
+from threading import local
+from typing import Callable
 
 from .lib import igraph_rng_set_default
 from .types import (
@@ -9,7 +9,7 @@ from .types import (
 )
 from .wrappers import _RNG
 
-__all__ = ("NumPyRNG",)
+__all__ = ("NumPyRNG", "get_default_generator")
 
 
 class NumPyRNG:
@@ -35,6 +35,11 @@ class NumPyRNG:
         self._rng = _RNG.create(pointer(self._rng_type))
         self._rng.unwrap().is_seeded = True
 
+    @property
+    def generator(self) -> Generator:
+        """The wrapped NumPy random number generator."""
+        return self._generator
+
     def _rng_init(self, _state):
         _state[0] = self._generator.bit_generator.ctypes.state_address
         return 0  # IGRAPH_SUCCESS
@@ -53,15 +58,39 @@ class NumPyRNG:
             a callable that can be called with no arguments to restore the
             RNG that was in effect before this RNG was attached.
         """
-        global _igraph_default_rng
-
         old = igraph_rng_set_default(self._rng)
-        _igraph_default_rng = self
+        old_owner = getattr(_igraph_default_rng, "rng", None)
+        _igraph_default_rng.rng = self
+
+        def restore() -> None:
+            igraph_rng_set_default(old)
+            _igraph_default_rng.rng = old_owner
 
-        return partial(igraph_rng_set_default, old)
+        return restore
 
 
-_igraph_default_rng: Optional[NumPyRNG] = None
+_igraph_default_rng = local()
 """We need to keep a reference to NumPyRNG to keep the underlying low-level
-C objects alive, so we use an internal object in this module for that.
+C objects alive, so we use an internal object in this module for that. The
+default RNG of igraph is thread-local so the reference is thread-local as well.
 """
+
+
+def get_default_generator() -> Generator:
+    """Returns the NumPy random number generator that backs the default RNG of
+    igraph in the current thread.
+
+    Code that needs random numbers in bulk should draw them from this generator
+    instead of igraph's RNG so that they come from the same source as the
+    random numbers of igraph. Seeds passed to igraph's RNG are ignored; to make
+    the results reproducible, attach a `NumPyRNG` wrapping a seeded generator,
+    e.g. ``NumPyRNG(default_rng(42)).attach()``.
+
+    Raises:
+        RuntimeError: if the default RNG of igraph in the current thread is not
+            backed by a NumPy random number generator
+    """
+    rng = getattr(_igraph_default_rng, "rng", None)
+    if rng is None:
+        raise RuntimeError("the default RNG of igraph is not a NumPy RNG")
+    return rng.generator
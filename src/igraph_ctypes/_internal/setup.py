@@ -1,19 +1,22 @@
 import sys
 
+from contextlib import contextmanager
 from ctypes import pythonapi
 from dataclasses import dataclass
-from typing import Optional
+from threading import local
+from typing import Callable, Iterator, Optional
 from warnings import warn
 
 from .attributes import AttributeHandler
+from .enums import ErrorCode
 from .errors import igraph_error_t_to_python_exception_class, IgraphWarning
-from .functions import strerror
 from .lib import (
     IGRAPH_FINALLY_FREE,
     igraph_set_attribute_table,
     igraph_set_error_handler,
     igraph_set_fatal_handler,
     igraph_set_interruption_handler,
+    igraph_set_progress_handler,
     igraph_set_warning_handler,
 )
 from .rng import NumPyRNG
@@ -21,10 +24,23 @@ from .types import (
     igraph_error_handler_t,
     igraph_fatal_handler_t,
     igraph_interruption_handler_t,
+    igraph_progress_handler_t,
     igraph_warning_handler_t,
 )
+from .utils import lazy_import
+
+__all__ = (
+    "ensure_thread_is_set_up",
+    "interruption_check",
+    "progress_callback",
+    "setup_igraph_library",
+    "_get_interruption_checks",
+    "_get_last_error_state",
+    "_interrupt_with",
+    "_take_pending_interruption",
+)
 
-__all__ = ("setup_igraph_library", "_get_last_error_state")
+_functions = lazy_import("igraph_ctypes._internal.functions")
 
 
 # Expose the PyErr_CheckSignals function from the Python C API
@@ -76,7 +92,7 @@ class IgraphErrorState:
 
         filename_str = self.filename.decode("utf-8", errors="replace")
         message_str = msg.decode("utf-8", errors="replace")
-        error_code_str = strerror(self.error)
+        error_code_str = _functions.strerror(self.error)
         line = self.line
 
         self._reset()
@@ -88,15 +104,58 @@ class IgraphErrorState:
         )
 
 
+class _ThreadState(local):
+    """Per-thread state of the integration between igraph and Python.
+
+    The C core of igraph keeps its error, warning and interruption handlers,
+    its default random number generator and the stack of objects to free when
+    an error happens in thread-local storage, so the Python side needs to
+    keep track of the error state and of the installed handlers separately for
+    each thread as well.
+    """
+
+    is_set_up: bool = False
+    """Whether the thread-local handlers of igraph have been installed in the
+    current thread.
+    """
+
+    last_error: IgraphErrorState
+    """The details of the last error that igraph reported in the current
+    thread.
+    """
+
+    interruption_checks: list[Callable[[], Optional[BaseException]]]
+    """Functions registered with `interruption_check()` in the current thread,
+    in the order they were registered.
+    """
+
+    pending_interruption: Optional[BaseException] = None
+    """The exception to raise from the igraph function that was interrupted
+    by one of the interruption checks in the current thread.
+    """
+
+    progress_callbacks: list[Callable[[str, float], None]]
+    """Functions registered with `progress_callback()` in the current thread,
+    in the order they were registered.
+    """
+
+    def __init__(self):
+        self.last_error = IgraphErrorState()
+        self.interruption_checks = []
+        self.progress_callbacks = []
+
+
 _attribute_handler = AttributeHandler()
-_last_error = IgraphErrorState()
+_thread_state = _ThreadState()
 
 
 @igraph_error_handler_t
 def _error_handler(message: bytes, filename: bytes, line: int, error: int):
-    global _last_error
+    # Error handlers are invoked from the same thread where the error happened
+    # so both the finally stack and the error state belong to the current
+    # thread here
     IGRAPH_FINALLY_FREE()
-    _last_error._error_handler(message, filename, line, error)
+    _thread_state.last_error._error_handler(message, filename, line, error)
 
 
 @igraph_fatal_handler_t
@@ -118,8 +177,30 @@ def _warning_handler(message: bytes, filename: bytes, line: int):
 
 
 def _get_last_error_state() -> Optional[IgraphErrorState]:
-    global _last_error
-    return _last_error if _last_error.has_error else None
+    last_error = _thread_state.last_error
+    return last_error if last_error.has_error else None
+
+
+def _interrupt_with(exc: BaseException) -> int:
+    """Requests the igraph function running in the current thread to be
+    interrupted with the given exception.
+
+    Call this function from callbacks invoked by igraph when they raise an
+    exception, and return its return value to igraph. The exception is then
+    raised when the interrupted igraph function returns, since exceptions
+    cannot propagate through the C core.
+    """
+    _thread_state.pending_interruption = exc
+    return ErrorCode.INTERRUPTED
+
+
+def _take_pending_interruption() -> Optional[BaseException]:
+    """Returns the exception that an interruption check requested to raise in
+    the current thread, and clears it.
+    """
+    state = _thread_state
+    exc, state.pending_interruption = state.pending_interruption, None
+    return exc
 
 
 def _setup_error_handlers() -> None:
@@ -133,24 +214,108 @@ def _setup_error_handlers() -> None:
 
 @igraph_interruption_handler_t
 def _interruption_handler() -> bool:
-    try:
-        # If there is a pending Ctrl-C waiting to be handled, PyErr_CheckSignals
-        # will trigger a KeyboardInterrupt, which we catch and return True.
-        # Otherwise we return False as we don't want to interrupt igraph if
-        # PyErr_CheckSignals() returns True because of other signals (say,
-        # SIGALRM)
-        PyErr_CheckSignals()
-        return False
-    except KeyboardInterrupt:
-        # Calling PyErr_CheckSignals might trigger a KeyboardInterrupt on its
-        # own so we catch it here
-        return True
+    state = _thread_state
+    for check in state.interruption_checks:
+        try:
+            exc = check()
+        except BaseException as ex:
+            exc = ex
+        if exc is not None:
+            state.pending_interruption = exc
+            break
+    else:
+        try:
+            # If there is a pending Ctrl-C waiting to be handled,
+            # PyErr_CheckSignals will trigger a KeyboardInterrupt, which we
+            # catch and return True. Otherwise we return False as we don't want
+            # to interrupt igraph if PyErr_CheckSignals() returns True because
+            # of other signals (say, SIGALRM)
+            PyErr_CheckSignals()
+            return False
+        except KeyboardInterrupt:
+            # Calling PyErr_CheckSignals might trigger a KeyboardInterrupt on
+            # its own so we catch it here
+            pass
+
+    # igraph returns from the interrupted function without an error, so the
+    # objects on the finally stack must be freed now while they still exist
+    IGRAPH_FINALLY_FREE()
+    return True
 
 
 def _setup_interruption_handler() -> None:
     igraph_set_interruption_handler(_interruption_handler)
 
 
+def _get_interruption_checks() -> list[Callable[[], Optional[BaseException]]]:
+    """Returns the functions registered with `interruption_check()` in the
+    current thread.
+
+    The returned list is updated in place when functions are registered or
+    unregistered in the current thread, so it can be used to forward the
+    interruption checks of the current thread to computations running in
+    other threads.
+    """
+    return _thread_state.interruption_checks
+
+
+@contextmanager
+def interruption_check(check: Callable[[], Optional[BaseException]]) -> Iterator[None]:
+    """Context manager that registers a function to be called periodically
+    by long-running igraph functions in the current thread while the context
+    is active.
+
+    The function must return ``None`` if the computation may continue, or an
+    exception to interrupt it. The interrupted igraph function then raises the
+    returned exception.
+    """
+    ensure_thread_is_set_up()
+    checks = _thread_state.interruption_checks
+    checks.append(check)
+    try:
+        yield
+    finally:
+        checks.pop()
+
+
+@igraph_progress_handler_t
+def _progress_handler(message: Optional[bytes], percent: float, data) -> int:
+    state = _thread_state
+    message_str = message.decode("utf-8", "replace") if message else ""
+    try:
+        for callback in state.progress_callbacks:
+            callback(message_str, percent)
+    except BaseException as ex:
+        return _interrupt_with(ex)
+    return 0
+
+
+@contextmanager
+def progress_callback(callback: Callable[[str, float], None]) -> Iterator[None]:
+    """Context manager that registers a function to be called with the
+    progress messages and percentages reported by igraph functions in the
+    current thread while the context is active.
+
+    The progress handler of igraph is installed only while there is at least
+    one registered function in the current thread, so igraph functions do not
+    call back into Python for progress reports otherwise. Exceptions raised
+    by the function interrupt the calculation and are raised from the igraph
+    function that reported its progress.
+    """
+    ensure_thread_is_set_up()
+    callbacks = _thread_state.progress_callbacks
+    previous_handler = (
+        None if callbacks else igraph_set_progress_handler(_progress_handler)
+    )
+    callbacks.append(callback)
+    try:
+        yield
+    finally:
+        callbacks.pop()
+        if previous_handler is not None:
+            igraph_set_progress_handler(previous_handler)
+
+
 def _setup_rng() -> None:
     """Initializes the random number generator of the igraph library."""
     from numpy.random import default_rng
@@ -166,13 +331,34 @@ def _setup_attribute_table() -> None:
     igraph_set_attribute_table(_attribute_handler)
 
 
+def _setup_thread() -> None:
+    """Integrates the thread-local facilities of the igraph library with Python
+    in the current thread.
+    """
+    _setup_error_handlers()
+    _setup_interruption_handler()
+    _setup_rng()
+    _thread_state.is_set_up = True
+
+
+def ensure_thread_is_set_up() -> None:
+    """Ensures that the thread-local facilities of the igraph library are
+    integrated with Python in the current thread.
+
+    This function must be called before the first call into igraph's C core in
+    every thread, otherwise an error in the C core would abort the entire
+    process. The wrappers of the C functions call it automatically so you
+    should not need to call this function directly.
+    """
+    if not _thread_state.is_set_up:
+        _setup_thread()
+
+
 def setup_igraph_library() -> None:
     """Integrates the facilities of the igraph library with Python.
 
     This function is called when the ``igraph_ctypes`` module is imported by the user.
     You should not need to call this function directly.
     """
-    _setup_error_handlers()
-    _setup_interruption_handler()
-    _setup_rng()
+    _setup_thread()
     _setup_attribute_table()
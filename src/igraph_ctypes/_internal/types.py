@@ -153,10 +153,26 @@ class igraph_strvector_t(Structure):
     _fields_ = vector_fields(c_char_p)
 
 
+class cs_igraph(Structure):
+    """ctypes representation of the CXSparse matrix struct used by
+    ``igraph_sparsemat_t``
+    """
+
+    _fields_ = [
+        ("nzmax", igraph_int_t),
+        ("m", igraph_int_t),
+        ("n", igraph_int_t),
+        ("p", POINTER(igraph_int_t)),
+        ("i", POINTER(igraph_int_t)),
+        ("x", POINTER(igraph_real_t)),
+        ("nz", igraph_int_t),
+    ]
+
+
 class igraph_sparsemat_t(Structure):
     """ctypes representation of ``igraph_sparsemat_t``"""
 
-    _fields_ = [("cs", c_void_p)]
+    _fields_ = [("cs", POINTER(cs_igraph))]
 
 
 class igraph_adjlist_t(Structure):
@@ -191,14 +207,26 @@ class igraph_t(Structure):
 class igraph_graph_list_t(Structure):
     """ctypes representation of ``igraph_graph_list_t``"""
 
-    _fields_ = vector_fields("igraph_t") + [("directed", igraph_bool_t)]
+    _fields_ = vector_fields(igraph_t) + [("directed", igraph_bool_t)]
 
 
 class _igraph_vs_es_index_mode_t(Structure):
-    """ctypes representation of a pair of an index and a neighborhood mode,
-    typically used in the .data.adj field in an ``igraph_vs_t``"""
+    """ctypes representation of an index, a neighborhood mode and a loop
+    handling mode, typically used in the .data.incident field in an
+    ``igraph_es_t``"""
 
-    _fields_ = [("vid", igraph_int_t), ("mode", c_int)]
+    _fields_ = [("vid", igraph_int_t), ("mode", c_int), ("loops", c_int)]
+
+
+class _igraph_vs_data_adj_t(Structure):
+    """ctypes representation of the .data.adj field in an ``igraph_vs_t``"""
+
+    _fields_ = [
+        ("vid", igraph_int_t),
+        ("mode", c_int),
+        ("loops", c_int),
+        ("multiple", igraph_bool_t),
+    ]
 
 
 class _igraph_vs_es_index_pair_t(Structure):
@@ -220,10 +248,10 @@ class _igraph_vs_es_index_pair_and_directedness_t(Structure):
 
 
 class _igraph_es_data_path_t(Structure):
-    """ctypes representation of a pair of a vector and a neighborhood mode,
-    typically used in the .data.path field in an ``igraph_es_t``"""
+    """ctypes representation of a pair of a vector pointer and a directedness
+    indicator, typically used in the .data.path field in an ``igraph_es_t``"""
 
-    _fields_ = [("ptr", igraph_vector_t), ("mode", c_int)]
+    _fields_ = [("ptr", POINTER(igraph_vector_int_t)), ("mode", igraph_bool_t)]
 
 
 class _igraph_vs_t_data(CUnion):
@@ -232,7 +260,7 @@ class _igraph_vs_t_data(CUnion):
     _fields_ = [
         ("vid", igraph_int_t),
         ("vecptr", POINTER(igraph_vector_int_t)),
-        ("adj", _igraph_vs_es_index_mode_t),
+        ("adj", _igraph_vs_data_adj_t),
         ("range", _igraph_vs_es_index_pair_t),
     ]
 
@@ -465,9 +493,28 @@ class igraph_rng_t(Structure):
     ]
 
 
+igraph_astar_heuristic_func_t = CFUNCTYPE(
+    igraph_error_t, POINTER(igraph_real_t), igraph_int_t, igraph_int_t, c_void_p
+)
+igraph_bfshandler_t = CFUNCTYPE(
+    igraph_error_t,
+    POINTER(igraph_t),
+    igraph_int_t,
+    igraph_int_t,
+    igraph_int_t,
+    igraph_int_t,
+    igraph_int_t,
+    c_void_p,
+)
+igraph_clique_handler_t = CFUNCTYPE(
+    igraph_error_t, POINTER(igraph_vector_int_t), c_void_p
+)
 igraph_cycle_handler_t = CFUNCTYPE(
     igraph_error_t, POINTER(igraph_vector_int_t), POINTER(igraph_vector_int_t), c_void_p
 )
+igraph_dfshandler_t = CFUNCTYPE(
+    igraph_error_t, POINTER(igraph_t), igraph_int_t, igraph_int_t, c_void_p
+)
 igraph_error_handler_t = CFUNCTYPE(None, c_char_p, c_char_p, c_int, igraph_error_t)
 igraph_fatal_handler_t = CFUNCTYPE(None, c_char_p, c_char_p, c_int)
 igraph_interruption_handler_t = CFUNCTYPE(igraph_bool_t)
@@ -485,6 +532,7 @@ igraph_isohandler_t = CFUNCTYPE(
     POINTER(igraph_vector_int_t),
     c_void_p,
 )
+igraph_progress_handler_t = CFUNCTYPE(igraph_error_t, c_char_p, igraph_real_t, c_void_p)
 igraph_warning_handler_t = CFUNCTYPE(None, c_char_p, c_char_p, c_int)
 
 
@@ -619,12 +667,29 @@ IntArray = npt.NDArray[np_type_of_igraph_int_t]
 RealArray = npt.NDArray[np_type_of_igraph_real_t]
 """Type alias for NumPy arrays containing igraph reals"""
 
+FlatIntArrayList = tuple[IntArray, IntArray]
+"""Type alias for a list of integer arrays in flat form, i.e. a pair consisting
+of a single array with the concatenated values of all the arrays and an array
+of offsets such that item ``i`` of the list spans the range
+``offsets[i]:offsets[i+1]`` in the array of values.
+"""
+
+FlatRealArrayList = tuple[RealArray, IntArray]
+"""Type alias for a list of real arrays in flat form. See `FlatIntArrayList`
+for more details.
+"""
+
 MatrixLike = Sequence[Sequence[float]] | npt.NDArray
 """Type alias for Python types that can be converted to an igraph matrix."""
 
 MatrixIntLike = Sequence[Sequence[int]] | npt.NDArray
 """Type alias for Python types that can be converted to an igraph integer matrix."""
 
+SparseMatrix = Any
+"""Type alias for SciPy sparse matrices and arrays. SciPy is an optional
+dependency so the alias is not more specific than this.
+"""
+
 VertexLike = int
 """Type alias for Python types that can be converted to an igraph vertex ID"""
 
@@ -649,6 +714,19 @@ FileLike = int | bytes | str | PathLike[bytes] | PathLike[str] | IOBase
 expects a FILE* pointer.
 """
 
+AttributeCombinationFunction = Callable[[np.ndarray, IntArray], Iterable[Any]]
+"""Type specification for functions that merge the values of a vertex or edge
+attribute during an operation that contracts multiple vertices or edges into a
+single one.
+
+The function is called once per attribute with all the values to be merged,
+reordered such that the values merged into the same new vertex or edge are
+next to each other, and an array of offsets where each group of values starts,
+followed by the total number of values. Group ``i`` spans the range
+``offsets[i]:offsets[i+1]`` of the values and it may be empty. The function
+must return one merged value for each group.
+"""
+
 AttributeCombinationSpecificationEntry = (
     Literal[
         "default",
@@ -664,7 +742,7 @@ AttributeCombinationSpecificationEntry = (
         "median",
         "concat",
     ]
-    | Callable[[Sequence[Any]], Any]
+    | AttributeCombinationFunction
 )
 """Type alias for values that can be accepted in an AttributeCombinationSpecification_
 mapping.
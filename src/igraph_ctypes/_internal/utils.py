@@ -1,13 +1,20 @@
+import sys
+
 from ctypes import byref, cast, c_char_p, c_ubyte, POINTER, sizeof
 from functools import wraps
+from importlib import import_module
+from importlib.util import find_spec
+from threading import RLock
 from traceback import print_exc
-from typing import Callable, Union, TypeVar
+from types import ModuleType
+from typing import Callable, Optional, Union, TypeVar
 
 from .errors import python_exception_to_igraph_error_t
 
 __all__ = (
     "bytes_to_str",
     "get_raw_memory_view",
+    "lazy_import",
     "nop",
     "protect",
     "protect_with",
@@ -34,6 +41,55 @@ def get_raw_memory_view(obj):
     return cast(byref(obj), POINTER(c_ubyte * sizeof(obj))).contents
 
 
+class _LazyModule(ModuleType):
+    """Placeholder for a module that is imported when one of its attributes is
+    accessed for the first time.
+
+    The import is a regular `importlib.import_module()` call, guarded by a lock
+    so that threads racing for the first attribute access all wait until the
+    module is fully executed. ``importlib.util.LazyLoader`` cannot be used here
+    because it is not thread-safe before Python 3.12. Once the module has been
+    imported, its namespace is copied into the placeholder so subsequent
+    attribute lookups do not go through `__getattr__()` any more.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__lock = RLock()
+        self.__module: ModuleType | None = None
+
+    def __getattr__(self, attr: str):
+        with self.__lock:
+            if self.__module is None:
+                self.__module = import_module(self.__name__)
+                self.__dict__.update(vars(self.__module))
+
+        return getattr(self.__module, attr)
+
+
+_lazy_modules: dict[str, ModuleType] = {}
+"""Placeholders created by `lazy_import()`, keyed by module name."""
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Imports the module with the given fully qualified name lazily.
+
+    The returned object stands in for the module until one of its attributes
+    is accessed for the first time; the module itself is imported only at that
+    point. This is used for modules that are expensive to import and that are
+    not needed by all the users of the library.
+    """
+    module = sys.modules.get(name) or _lazy_modules.get(name)
+    if module is not None:
+        return module
+
+    spec = find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+
+    return _lazy_modules.setdefault(name, _LazyModule(name))
+
+
 def nop(*args, **kwds) -> None:
     """Function placeholder that does nothing."""
     pass
@@ -61,19 +117,22 @@ def protect(func: Callable[..., None]) -> Callable[..., int]:
 
 def protect_with(
     handler: Callable[[int], int],
-) -> Callable[[Callable[..., None]], Callable[..., int]]:
+) -> Callable[[Callable[..., Optional[int]]], Callable[..., int]]:
     """Decorator factory that creates a decorator that takes a function that
     can potentially throw a Python exception, and turns it into another function
     that returns an igraph-compatible `igraph_error_t` error code instead,
     piping it through the given handler function.
+
+    The wrapped function may also return an igraph error code on its own
+    (e.g., the one returned by `_interrupt_with()`); this code is returned to
+    igraph as is.
     """
 
-    def decorator(func: Callable[..., None]) -> Callable[..., int]:
+    def decorator(func: Callable[..., Optional[int]]) -> Callable[..., int]:
         @wraps(func)
         def wrapped(*args, **kwds) -> int:
             try:
-                func(*args, **kwds)
-                return 0
+                return func(*args, **kwds) or 0
             except Exception as ex:
                 print("Exception in callback invoked from igraph's C core:")
                 print_exc()
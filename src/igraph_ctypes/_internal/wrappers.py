@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ctypes import byref
 from typing import TYPE_CHECKING, TypeVar
 
 from .lib import (
@@ -7,12 +8,18 @@ from .lib import (
     igraph_attribute_combination_destroy,
     igraph_destroy,
     igraph_es_destroy,
+    igraph_graph_list_destroy,
+    igraph_graph_list_init,
     igraph_matrix_destroy,
     igraph_matrix_init,
     igraph_matrix_int_destroy,
     igraph_matrix_int_init,
     igraph_rng_init,
     igraph_rng_destroy,
+    igraph_sparsemat_destroy,
+    igraph_sparsemat_init,
+    igraph_strvector_destroy,
+    igraph_strvector_init,
     igraph_vector_destroy,
     igraph_vector_init,
     igraph_vector_bool_destroy,
@@ -34,9 +41,12 @@ from .types import (
     igraph_t,
     igraph_attribute_combination_t,
     igraph_es_t,
+    igraph_graph_list_t,
     igraph_matrix_t,
     igraph_matrix_int_t,
     igraph_rng_t,
+    igraph_sparsemat_t,
+    igraph_strvector_t,
     igraph_vector_t,
     igraph_vector_bool_t,
     igraph_vector_int_t,
@@ -53,9 +63,13 @@ __all__ = (
     "_AttributeCombination",
     "_EdgeSelector",
     "_Graph",
+    "_GraphList",
     "_Matrix",
     "_MatrixInt",
     "_RNG",
+    "_SharedGraph",
+    "_SparseMat",
+    "_StrVector",
     "_Vector",
     "_VectorBool",
     "_VectorInt",
@@ -73,6 +87,37 @@ T = TypeVar("T")
 class _Graph(Boxed[igraph_t]):
     boxed_config = {"ctype": igraph_t, "destructor": igraph_destroy}
 
+    read_only = False
+    """Whether igraph functions must be prevented from modifying the graph."""
+
+
+class _GraphList(Boxed[igraph_graph_list_t]):
+    boxed_config = {
+        "ctype": igraph_graph_list_t,
+        "constructor": igraph_graph_list_init,
+        "destructor": igraph_graph_list_destroy,
+    }
+
+
+def _destroy_shared_graph(graph) -> None:
+    """Destructor for graphs whose edge and index vectors are views into
+    memory owned by someone else.
+
+    The views are replaced with empty vectors first so ``igraph_destroy()``
+    does not attempt to free memory that it does not own.
+    """
+    instance = graph._obj
+    for name in ("from_", "to", "oi", "ii", "os", "is_"):
+        igraph_vector_int_init(byref(getattr(instance, name)), 0)
+    igraph_destroy(graph)
+
+
+class _SharedGraph(Boxed[igraph_t]):
+    boxed_config = {"ctype": igraph_t, "destructor": _destroy_shared_graph}
+
+    read_only = True
+    """Whether igraph functions must be prevented from modifying the graph."""
+
 
 class _Matrix(Boxed[igraph_matrix_t]):
     boxed_config = {
@@ -90,6 +135,22 @@ class _MatrixInt(Boxed[igraph_matrix_t]):
     }
 
 
+class _SparseMat(Boxed[igraph_sparsemat_t]):
+    boxed_config = {
+        "ctype": igraph_sparsemat_t,
+        "constructor": igraph_sparsemat_init,
+        "destructor": igraph_sparsemat_destroy,
+    }
+
+
+class _StrVector(Boxed[igraph_strvector_t]):
+    boxed_config = {
+        "ctype": igraph_strvector_t,
+        "constructor": igraph_strvector_init,
+        "destructor": igraph_strvector_destroy,
+    }
+
+
 class _Vector(Boxed[igraph_vector_t]):
     boxed_config = {
         "ctype": igraph_vector_t,
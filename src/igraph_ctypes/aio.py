@@ -0,0 +1,182 @@
+"""Asynchronous variants of long-running igraph functions for use with
+``asyncio``.
+
+The functions in this module run the corresponding igraph functions in an
+executor so they do not block the event loop. Cancelling the task that awaits
+the result interrupts the computation in the C core of igraph at its next
+interruption point, which frees up the worker thread quickly.
+"""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, get_running_loop
+from concurrent.futures import Executor
+from functools import partial
+from threading import Event
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from .enums import NeighborMode
+from .graph import Graph
+from .paths import distances as _distances
+from .types import IntArray, RealArray, VertexSelector
+
+from ._internal.functions import (
+    betweenness as _betweenness,
+    community_leiden as _community_leiden,
+)
+from ._internal.setup import interruption_check
+
+__all__ = ("betweenness", "community_leiden", "distances", "run")
+
+R = TypeVar("R")
+
+
+async def run(
+    func: Callable[..., R], /, *args, executor: Optional[Executor] = None, **kwds
+) -> R:
+    """Runs a function that calls igraph in an executor and returns its
+    result, interrupting the igraph computation when the awaiting task is
+    cancelled.
+
+    Args:
+        func: the function to run
+        args: the positional arguments to pass to the function
+        executor: the executor to run the function in; ``None`` means the
+            default executor of the event loop
+        kwds: the keyword arguments to pass to the function
+
+    Returns:
+        the return value of the function
+    """
+    loop = get_running_loop()
+    cancelled = Event()
+    job = partial(_run_interruptibly, cancelled, func, args, kwds)
+    try:
+        return await loop.run_in_executor(executor, job)
+    except CancelledError:
+        cancelled.set()
+        raise
+
+
+async def betweenness(
+    graph: Graph,
+    weights: Optional[Iterable[float]] = None,
+    vids: VertexSelector = "all",
+    directed: bool = True,
+    normalized: bool = False,
+    *,
+    executor: Optional[Executor] = None,
+) -> RealArray:
+    """Calculates the betweenness centrality of some vertices in a graph
+    without blocking the event loop.
+
+    Args:
+        graph: the graph
+        weights: the weights of the edges, or ``None`` for unweighted
+            shortest paths
+        vids: the vertices whose betweenness scores are to be returned
+        directed: whether to consider directed paths in directed graphs
+        normalized: whether to normalize the betweenness scores
+        executor: the executor to run the calculation in; ``None`` means the
+            default executor of the event loop
+
+    Returns:
+        the betweenness scores of the vertices in ``vids``
+    """
+    return await run(
+        _betweenness, graph, weights, vids, directed, normalized, executor=executor
+    )
+
+
+async def community_leiden(
+    graph: Graph,
+    resolution: float,
+    weights: Optional[Iterable[float]] = None,
+    beta: float = 0.01,
+    n_iterations: int = 2,
+    membership: Optional[Iterable[int]] = None,
+    *,
+    executor: Optional[Executor] = None,
+) -> tuple[IntArray, float]:
+    """Finds the communities of a graph with the Leiden algorithm without
+    blocking the event loop.
+
+    Args:
+        graph: the graph
+        resolution: the resolution parameter of the quality function
+        weights: the weights of the edges, or ``None`` if all edges have unit
+            weight
+        beta: the randomness used in the refinement step of the algorithm
+        n_iterations: the number of iterations of the algorithm; negative
+            numbers mean to iterate until the membership vector does not
+            change any more
+        membership: the partition to start from; ``None`` means to start from
+            the partition where each vertex is in its own community
+        executor: the executor to run the calculation in; ``None`` means the
+            default executor of the event loop
+
+    Returns:
+        the membership vector of the partition found and its quality
+    """
+    result, _, quality = await run(
+        _community_leiden,
+        graph,
+        resolution,
+        weights,
+        beta=beta,
+        start=membership is not None,
+        n_iterations=n_iterations,
+        membership=membership,
+        executor=executor,
+    )
+    return result, quality
+
+
+async def distances(
+    graph: Graph,
+    source: VertexSelector = "all",
+    target: VertexSelector = "all",
+    mode: NeighborMode = NeighborMode.OUT,
+    weights: Optional[Iterable[float]] = None,
+    *,
+    executor: Optional[Executor] = None,
+) -> RealArray:
+    """Calculates the lengths of the shortest paths between a set of source
+    and a set of target vertices in a graph without blocking the event loop.
+
+    Args:
+        graph: the graph
+        source: the source vertices
+        target: the target vertices
+        mode: whether to follow outbound edges (``OUT``), inbound edges (``IN``)
+            or both (``ALL``). Ignored for undirected graphs.
+        weights: the weights of the edges, or ``None`` for unweighted
+            shortest paths
+        executor: the executor to run the calculation in; ``None`` means the
+            default executor of the event loop
+
+    Returns:
+        the matrix of shortest path lengths, where row ``i`` corresponds to the
+        ``i``-th source vertex and column ``j`` corresponds to the ``j``-th
+        target vertex
+    """
+    return await run(
+        _distances, graph, source, target, mode, weights, executor=executor
+    )
+
+
+def _run_interruptibly(
+    cancelled: Event,
+    func: Callable[..., R],
+    args: tuple[Any, ...],
+    kwds: dict[str, Any],
+) -> R:
+    """Runs the given function, interrupting igraph with a `CancelledError`
+    when the given event is set.
+    """
+
+    def check() -> Optional[BaseException]:
+        return CancelledError() if cancelled.is_set() else None
+
+    with interruption_check(check):
+        return func(*args, **kwds)
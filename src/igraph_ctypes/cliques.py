@@ -0,0 +1,254 @@
+"""Functions that enumerate the cliques of a graph without holding all of them
+in memory.
+
+The functions in this module are generators that yield the cliques found by
+igraph in batches, in the flat representation described by
+`FlatIntArrayList`. The clique search runs in a background thread that is
+paused while the consumer is processing a batch, so the memory usage is
+bounded by a few batches regardless of the number of cliques in the graph.
+The search is stopped when the generator is closed, e.g. when the consumer
+breaks out of the loop iterating over the batches or when an exception is
+raised while the consumer is waiting for the next batch. The deadlines and
+other interruption checks that are active in the thread of the consumer apply
+to the background thread as well.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ctypes import c_void_p, cast, memmove
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import Any, Callable, Iterator, Optional, Union
+
+from .graph import Graph
+from .types import FlatIntArrayList
+
+from ._internal.enums import ErrorCode
+from ._internal.lib import igraph_cliques_callback, igraph_maximal_cliques_callback
+from ._internal.setup import (
+    _get_interruption_checks,
+    ensure_thread_is_set_up,
+    interruption_check,
+)
+from ._internal.types import igraph_clique_handler_t, np_type_of_igraph_int_t
+
+__all__ = ("iter_cliques", "iter_maximal_cliques")
+
+
+def iter_cliques(
+    graph: Graph, min_size: int = 0, max_size: int = 0, *, batch_size: int = 4096
+) -> Iterator[FlatIntArrayList]:
+    """Enumerates the complete subgraphs (cliques) of a graph in batches.
+
+    The search algorithm used by igraph checks for interruptions only when it
+    finds a clique, so stopping the search or reaching a deadline takes
+    effect at the next clique found, which may take a long time if the graph
+    has few cliques in the requested size range.
+
+    Args:
+        graph: the graph
+        min_size: the minimum size of the cliques to find; zero or negative
+            numbers mean no lower bound
+        max_size: the maximum size of the cliques to find; zero or negative
+            numbers mean no upper bound
+        batch_size: the maximum number of cliques in a batch
+
+    Yields:
+        batches of cliques in flat representation, i.e. pairs consisting of
+        an array with the concatenated vertex IDs of the cliques in the batch
+        and an array of offsets where the cliques start
+    """
+    return _iter_clique_batches(
+        igraph_cliques_callback, graph, min_size, max_size, batch_size
+    )
+
+
+def iter_maximal_cliques(
+    graph: Graph, min_size: int = 0, max_size: int = 0, *, batch_size: int = 4096
+) -> Iterator[FlatIntArrayList]:
+    """Enumerates the maximal cliques of a graph in batches.
+
+    A clique is maximal if it cannot be extended by adding another vertex of
+    the graph to it.
+
+    Args:
+        graph: the graph
+        min_size: the minimum size of the cliques to find; zero or negative
+            numbers mean no lower bound
+        max_size: the maximum size of the cliques to find; zero or negative
+            numbers mean no upper bound
+        batch_size: the maximum number of cliques in a batch
+
+    Yields:
+        batches of cliques in flat representation, i.e. pairs consisting of
+        an array with the concatenated vertex IDs of the cliques in the batch
+        and an array of offsets where the cliques start
+    """
+    return _iter_clique_batches(
+        igraph_maximal_cliques_callback, graph, min_size, max_size, batch_size
+    )
+
+
+_DONE = object()
+"""Marker object that the background thread puts in the queue when the search
+has finished.
+"""
+
+
+class _SearchStopped(Exception):
+    """Exception used to interrupt the clique search in the background thread
+    when the consumer does not need more batches.
+    """
+
+    pass
+
+
+class _CliqueBatcher:
+    """Object that receives the cliques found by igraph one by one and
+    collects them into batches in flat representation.
+    """
+
+    _batch_size: int
+    _emit: Callable[[FlatIntArrayList], None]
+    _stop: Event
+
+    _values: np.ndarray
+    _offsets: np.ndarray
+    _count: int
+
+    handler: Any
+    """The ctypes callback that must be passed to igraph."""
+
+    def __init__(
+        self,
+        batch_size: int,
+        emit: Callable[[FlatIntArrayList], None],
+        stop: Event,
+    ):
+        self._batch_size = batch_size
+        self._emit = emit
+        self._stop = stop
+        self._reset()
+        self.handler = igraph_clique_handler_t(self._handle)
+
+    def flush(self) -> None:
+        """Emits the cliques collected so far as a batch, if there are any."""
+        if self._count > 0:
+            count = self._count
+            self._emit(
+                (self._values[: self._offsets[count]], self._offsets[: count + 1])
+            )
+            self._reset()
+
+    def _handle(self, clique, arg) -> int:
+        if self._stop.is_set():
+            return ErrorCode.STOP
+
+        vec = clique.contents
+        start = cast(vec.stor_begin, c_void_p).value or 0
+        end = cast(vec.end, c_void_p).value or 0
+        size = (end - start) // self._values.itemsize
+
+        offset = int(self._offsets[self._count])
+        values = self._values
+        if offset + size > len(values):
+            # No views of this array exist yet; they are created in flush()
+            values.resize(max(2 * len(values), offset + size), refcheck=False)
+        if size > 0:
+            memmove(values.ctypes.data + offset * values.itemsize, start, end - start)
+
+        self._count += 1
+        self._offsets[self._count] = offset + size
+        if self._count == self._batch_size:
+            self.flush()
+
+        return 0
+
+    def _reset(self) -> None:
+        # New arrays for every batch because the old ones are passed on to
+        # the consumer
+        self._values = np.empty(self._batch_size * 4, dtype=np_type_of_igraph_int_t)
+        self._offsets = np.zeros(self._batch_size + 1, dtype=np_type_of_igraph_int_t)
+        self._count = 0
+
+
+def _create_search_check(stop: Event) -> Callable[[], Optional[BaseException]]:
+    """Creates the interruption check of the background thread of a clique
+    search.
+
+    The maximal clique search of igraph calls interruption checks
+    periodically even when it does not find any cliques for a long time,
+    unlike the clique handler. The check stops
+    the search when the given event is set, and it also consults the
+    interruption checks of the current thread, i.e. the thread of the
+    consumer, so deadlines and cancellations apply to the search as well.
+    """
+    caller_checks = _get_interruption_checks()
+
+    def check() -> Optional[BaseException]:
+        if stop.is_set():
+            return _SearchStopped()
+        for caller_check in tuple(caller_checks):
+            exc = caller_check()
+            if exc is not None:
+                return exc
+        return None
+
+    return check
+
+
+def _iter_clique_batches(
+    func: Callable[..., None],
+    graph: Graph,
+    min_size: int,
+    max_size: int,
+    batch_size: int,
+) -> Iterator[FlatIntArrayList]:
+    """Runs the given callback-based clique search function of igraph in a
+    background thread and yields the cliques it finds in batches.
+    """
+    if batch_size < 1:
+        raise ValueError("batch size must be positive")
+
+    # Holds at most one batch so the search is paused while the consumer is
+    # busy with the previous one
+    results: Queue[Union[FlatIntArrayList, BaseException, object]] = Queue(maxsize=1)
+    stop = Event()
+    check = _create_search_check(stop)
+
+    def search() -> None:
+        ensure_thread_is_set_up()
+        batcher = _CliqueBatcher(batch_size, results.put, stop)
+        try:
+            with interruption_check(check):
+                func(graph, min_size, max_size, batcher.handler, None)
+            batcher.flush()
+        except BaseException as ex:
+            results.put(ex)
+        else:
+            results.put(_DONE)
+
+    thread = Thread(target=search, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item  # type: ignore
+    finally:
+        # Ask the search to stop and keep on draining the queue until it
+        # does so the background thread is not blocked forever
+        stop.set()
+        while thread.is_alive():
+            try:
+                results.get(timeout=0.1)
+            except Empty:
+                pass
+        thread.join()
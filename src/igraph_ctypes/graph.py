@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
+
 from collections.abc import MutableMapping
-from typing import Any, Iterable, Literal, Optional, TypeVar
+from ctypes import pointer
+from typing import Any, Iterable, Literal, Optional, SupportsIndex, TypeVar
 
 from .enums import NeighborMode, ToDirected, ToUndirected
 from .types import (
@@ -13,25 +16,13 @@ from .types import (
     VertexSelector,
 )
 
-from ._internal.attributes import AttributeMap, AttributeStorage
-from ._internal.functions import (
-    add_edges,
-    add_vertices,
-    copy,
-    delete_edges,
-    delete_vertices,
-    ecount,
-    edge,
-    empty,
-    get_eid,
-    incident,
-    is_directed,
-    neighbors,
-    to_directed,
-    to_undirected,
-    vcount,
-)
-from ._internal.wrappers import _Graph
+from ._internal.attributes import AttributeMap, AttributeStorage, AttributeValueList
+from ._internal.attributes.enums import AttributeType
+from ._internal.attributes.storage import DictAttributeStorage, assign_storage_to_graph
+from ._internal.utils import lazy_import
+from ._internal.wrappers import _Graph, _SharedGraph
+
+_functions = lazy_import("igraph_ctypes._internal.functions")
 
 
 C = TypeVar("C", bound="Graph")
@@ -40,10 +31,12 @@ C = TypeVar("C", bound="Graph")
 class Graph:
     """A graph object."""
 
-    _instance: _Graph
+    _instance: _Graph | _SharedGraph
     """The low-level ctypes wrapper object of the graph."""
 
-    def __init__(self, *args, _wrap: Optional[_Graph] = None, **kwds):
+    def __init__(
+        self, *args, _wrap: Optional[_Graph | _SharedGraph] = None, **kwds
+    ):
         """Constructor.
 
         Creates an empty graph. All positional and keyword arguments are
@@ -51,10 +44,31 @@ class Graph:
         to let the graph take the ownership of a low-level ctypes wrapper object
         for an igraph graph. Typically you will not need to use `_wrap`.
         """
-        self._instance = _wrap or empty(*args, **kwds)._instance
+        self._instance = _wrap or _functions.empty(*args, **kwds)._instance
+
+    def __reduce_ex__(self, protocol: SupportsIndex):
+        """Support for pickling graphs.
+
+        The edge list of the graph and the values of the vertex and edge
+        attributes are pickled as NumPy arrays, which NumPy serializes as
+        out-of-band buffers with pickle protocol 5 and above. The graph is
+        re-created with a single call to ``igraph_create()`` when unpickling.
+        """
+        storage = self._get_attribute_storage()
+        return (
+            _unpickle_graph,
+            (
+                _functions.get_edgelist(self),
+                self.vcount(),
+                self.is_directed(),
+                dict(storage.get_graph_attribute_map()),
+                _attribute_map_to_columns(storage.get_vertex_attribute_map()),
+                _attribute_map_to_columns(storage.get_edge_attribute_map()),
+            ),
+        )
 
     def add_edges(self: C, edges: Iterable[VertexPair]) -> C:
-        add_edges(self, edges)
+        _functions.add_edges(self, edges)
         return self
 
     def add_vertices(self: C, n: int) -> C:
@@ -66,7 +80,7 @@ class Graph:
         Returns:
             the graph itself
         """
-        add_vertices(self, n)
+        _functions.add_vertices(self, n)
         return self
 
     def convert_to_directed(
@@ -85,7 +99,7 @@ class Graph:
         Returns:
             the graph itself
         """
-        to_directed(self, ToDirected.from_(mode))
+        _functions.to_directed(self, ToDirected.from_(mode))
         return self
 
     def convert_to_undirected(
@@ -110,7 +124,28 @@ class Graph:
         Returns:
             the graph itself
         """
-        to_undirected(self, ToUndirected.from_(mode), edge_attr_comb)
+        _functions.to_undirected(self, ToUndirected.from_(mode), edge_attr_comb)
+        return self
+
+    def contract_vertices(
+        self: C,
+        mapping: Iterable[int],
+        vertex_attr_comb: Optional[AttributeCombinationSpecification] = None,
+    ) -> C:
+        """Contracts groups of vertices of the graph in-place into single
+        vertices.
+
+        Args:
+            mapping: the ID of the new vertex for each vertex in the graph.
+                Vertices mapped to the same ID are merged into a single vertex.
+            vertex_attr_comb: specifies what to do with the attributes of
+                vertices when multiple vertices are merged into a single
+                vertex
+
+        Returns:
+            the graph itself
+        """
+        _functions.contract_vertices(self, mapping, vertex_attr_comb)
         return self
 
     def copy(self) -> Graph:
@@ -121,25 +156,25 @@ class Graph:
         shallow manner, i.e. the attribute mapping itself is copied but the
         values will point to the same objects.
         """
-        return copy(self)
+        return _functions.copy(self)
 
     def delete_edges(self: C, edges: EdgeSelector) -> C:
-        delete_edges(self, edges)
+        _functions.delete_edges(self, edges)
         return self
 
     def delete_vertices(self: C, vertices: VertexSelector) -> C:
-        delete_vertices(self, vertices)
+        _functions.delete_vertices(self, vertices)
         return self
 
     def ecount(self) -> int:
         """Returns the number of edges in the graph."""
-        return ecount(self)
+        return _functions.ecount(self)
 
     def edge(self, eid: int) -> VertexPair:
         """Returns the endpoints of the edge with the given index from the
         graph.
         """
-        return edge(self, eid)
+        return _functions.edge(self, eid)
 
     def get_edge_id(
         self,
@@ -152,26 +187,26 @@ class Graph:
         """Returns the ID of an arbitrary edge between the given source and
         target vertices.
         """
-        return get_eid(self, from_, to, directed, error)
+        return _functions.get_eid(self, from_, to, directed, error)
 
     def incident(
         self, vid: VertexLike, mode: NeighborMode = NeighborMode.ALL
     ) -> IntArray:
-        return incident(self, vid, mode)
+        return _functions.incident(self, vid, mode)
 
     def is_directed(self) -> bool:
         """Returns whether the graph is directed."""
-        return is_directed(self)
+        return _functions.is_directed(self)
 
     def neighbors(
         self, vid: VertexLike, mode: NeighborMode = NeighborMode.ALL
     ) -> IntArray:
         """Returns the list of neighbors of a vertex."""
-        return neighbors(self, vid, mode)
+        return _functions.neighbors(self, vid, mode)
 
     def vcount(self) -> int:
         """Returns the number of vertices in the graph."""
-        return vcount(self)
+        return _functions.vcount(self)
 
     @property
     def attrs(self) -> MutableMapping[str, Any]:
@@ -197,7 +232,7 @@ class Graph:
         return self._get_attribute_storage().get_edge_attribute_map()
 
     @property
-    def _as_parameter_(self) -> _Graph:
+    def _as_parameter_(self) -> _Graph | _SharedGraph:
         """ctypes hook function that extracts the low-level ctypes wrapper
         object from the graph.
         """
@@ -208,3 +243,53 @@ class Graph:
         attributes of the graph, its vertices and edges.
         """
         return self._instance.unwrap().attr
+
+
+_AttributeColumns = dict[str, tuple[AttributeType, np.ndarray]]
+"""Type alias for the pickled representation of the vertex or edge attributes
+of a graph.
+"""
+
+
+def _attribute_map_to_columns(attrs: AttributeMap) -> _AttributeColumns:
+    """Converts the vertex or edge attributes of a graph to a dictionary
+    mapping attribute names to their types and the NumPy arrays holding
+    their values, for the purposes of pickling.
+    """
+    return {name: (values.type, np.asarray(values)) for name, values in attrs.items()}
+
+
+def _columns_to_attribute_map(columns: _AttributeColumns, length: int) -> AttributeMap:
+    """Converts the pickled representation of the vertex or edge attributes
+    of a graph back to an attribute map, taking ownership of the arrays if
+    possible.
+    """
+    items = {}
+    for name, (type, array) in columns.items():
+        if not array.flags.writeable:
+            array = array.copy()
+        items[name] = AttributeValueList(
+            array, type=type, fixed_length=True, _wrap=True
+        )
+    return AttributeMap(items, length)
+
+
+def _unpickle_graph(
+    edges: IntArray,
+    n: int,
+    directed: bool,
+    graph_attrs: dict[str, Any],
+    vertex_attrs: _AttributeColumns,
+    edge_attrs: _AttributeColumns,
+) -> Graph:
+    """Re-creates a graph from the representation returned by
+    `Graph.__reduce_ex__()`.
+    """
+    graph = _functions.create(edges, n, directed)
+    storage = DictAttributeStorage(
+        graph_attrs,
+        _columns_to_attribute_map(vertex_attrs, n),
+        _columns_to_attribute_map(edge_attrs, len(edges) // 2),
+    )
+    assign_storage_to_graph(pointer(graph._instance.unwrap()), storage)
+    return graph
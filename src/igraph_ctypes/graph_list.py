@@ -0,0 +1,156 @@
+"""Lazy sequence of graphs returned by igraph functions that produce multiple
+graphs at once, e.g. the connected components of a graph.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from collections.abc import Sequence
+from ctypes import byref, c_char, c_void_p, cast, sizeof
+from typing import overload
+
+from .graph import Graph
+from .types import BoolArray, IntArray
+
+from ._internal.lib import igraph_graph_list_replace, igraph_graph_list_size
+from ._internal.types import (
+    igraph_t,
+    igraph_vector_int_t,
+    np_type_of_igraph_bool_t,
+    np_type_of_igraph_int_t,
+)
+from ._internal.wrappers import _Graph, _GraphList, _create_graph_from_boxed
+
+__all__ = ("GraphList",)
+
+
+class GraphList(Sequence[Graph]):
+    """Read-only sequence of graphs that keeps the graphs in igraph's own list
+    until they are accessed.
+
+    A `Graph` object is created for a graph only when it is retrieved from the
+    sequence for the first time; subsequent retrievals return the same object.
+    Aggregate queries like `vcounts()` and `ecounts()` are answered directly
+    from the low-level list without creating `Graph` objects.
+    """
+
+    _list: _GraphList
+    """The low-level list that holds the graphs that were not retrieved yet."""
+
+    _graphs: dict[int, Graph]
+    """The graphs that were already retrieved, keyed by their indices. These
+    graphs were moved out of the low-level list and their slots hold empty
+    placeholder graphs.
+    """
+
+    def __init__(self, graphs: _GraphList):
+        """Constructor.
+
+        Creates a sequence that takes over the ownership of the given
+        low-level graph list. Typically you will not need to call this
+        directly; igraph functions that return multiple graphs create
+        instances of this class.
+        """
+        self._list = graphs
+        self._graphs = {}
+
+    @overload
+    def __getitem__(self, index: int) -> Graph: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Graph]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("graph list index out of range")
+
+        graph = self._graphs.get(index)
+        if graph is None:
+            # Swap the graph in the list with an all-zero placeholder that is
+            # safe to destroy and let a new Graph take over the original
+            instance = igraph_t()
+            igraph_graph_list_replace(self._list, index, byref(instance))
+            graph = _create_graph_from_boxed(_Graph(instance))
+            self._graphs[index] = graph
+
+        return graph
+
+    def __len__(self) -> int:
+        return igraph_graph_list_size(self._list)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self)} graphs>"
+
+    def ecounts(self) -> IntArray:
+        """Returns the number of edges of each graph in the list."""
+        return self._get_sizes()[1]
+
+    def is_directed(self) -> BoolArray:
+        """Returns whether each graph in the list is directed."""
+        return self._get_sizes()[2]
+
+    def vcounts(self) -> IntArray:
+        """Returns the number of vertices of each graph in the list."""
+        return self._get_sizes()[0]
+
+    def _get_sizes(self) -> tuple[IntArray, IntArray, BoolArray]:
+        """Returns the number of vertices, the number of edges and the
+        directedness of each graph in the list.
+
+        The values are read from the ``igraph_t`` structs in the storage of
+        the low-level list in one go through a structured NumPy array.
+        """
+        size = len(self)
+        vcounts = np.zeros(size, dtype=np_type_of_igraph_int_t)
+        ecounts = np.zeros(size, dtype=np_type_of_igraph_int_t)
+        directed = np.zeros(size, dtype=np_type_of_igraph_bool_t)
+        if size == 0:
+            return vcounts, ecounts, directed
+
+        edges_at = igraph_t.from_.offset
+        structs = np.frombuffer(
+            memoryview(
+                (c_char * (size * sizeof(igraph_t))).from_address(
+                    cast(self._list.unwrap().stor_begin, c_void_p).value or 0
+                )
+            ),
+            dtype=np.dtype(
+                {
+                    "names": ["n", "directed", "edges_begin", "edges_end"],
+                    "formats": [
+                        np_type_of_igraph_int_t,
+                        np_type_of_igraph_bool_t,
+                        np.uintp,
+                        np.uintp,
+                    ],
+                    "offsets": [
+                        igraph_t.n.offset,
+                        igraph_t.directed.offset,
+                        edges_at + igraph_vector_int_t.stor_begin.offset,
+                        edges_at + igraph_vector_int_t.end.offset,
+                    ],
+                    "itemsize": sizeof(igraph_t),
+                }
+            ),
+        )
+
+        vcounts[:] = structs["n"]
+        ecounts[:] = (structs["edges_end"] - structs["edges_begin"]) // np.dtype(
+            np_type_of_igraph_int_t
+        ).itemsize
+        directed[:] = structs["directed"]
+
+        # Graphs that were moved out of the list are not in the structs any more
+        for index, graph in self._graphs.items():
+            vcounts[index] = graph.vcount()
+            ecounts[index] = graph.ecount()
+            directed[index] = graph.is_directed()
+
+        return vcounts, ecounts, directed
@@ -1,4 +1,11 @@
 from ._internal.functions import (
+    read_graph_dimacs_flow,
+    read_graph_edgelist,
+    read_graph_gml,
+    read_graph_graphml,
+    read_graph_lgl,
+    read_graph_ncol,
+    read_graph_pajek,
     write_graph_edgelist,
     write_graph_graphml,
     write_graph_lgl,
@@ -6,6 +13,13 @@ from ._internal.functions import (
 )
 
 __all__ = (
+    "read_graph_dimacs_flow",
+    "read_graph_edgelist",
+    "read_graph_gml",
+    "read_graph_graphml",
+    "read_graph_lgl",
+    "read_graph_ncol",
+    "read_graph_pajek",
     "write_graph_edgelist",
     "write_graph_graphml",
     "write_graph_lgl",
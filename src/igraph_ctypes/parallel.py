@@ -0,0 +1,298 @@
+"""Functions that split independent graph computations into smaller jobs and
+execute them concurrently on a thread pool.
+
+igraph releases the global interpreter lock while it is running, so these
+functions can make use of multiple CPU cores. All functions accept an optional
+``executor`` that the jobs are submitted to; when it is omitted, a new
+``ThreadPoolExecutor`` is created for the duration of the call with at most
+``max_workers`` threads. See the notes about thread safety in the documentation
+for what can be run concurrently.
+"""
+
+import numpy as np
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from numpy.random import default_rng
+from os import cpu_count
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TypeVar
+
+from .enums import NeighborMode
+from .graph import Graph
+from .paths import distances as _distances
+from .types import IntArray, RealArray, VertexSelector
+
+from ._internal.conversion import (
+    igraph_vector_int_t_to_numpy_array_transfer,
+    vertex_selector_to_igraph_vs_t,
+)
+from ._internal.functions import (
+    betweenness_subset as _betweenness_subset,
+    community_leiden as _community_leiden,
+)
+from ._internal.lib import igraph_vs_as_vector
+from ._internal.rng import NumPyRNG
+from ._internal.setup import ensure_thread_is_set_up
+from ._internal.types import np_type_of_igraph_int_t, np_type_of_igraph_real_t
+from ._internal.wrappers import _VectorInt
+
+__all__ = ("betweenness_subset", "community_leiden", "distances")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def distances(
+    graph: Graph,
+    source: VertexSelector = "all",
+    target: VertexSelector = "all",
+    mode: NeighborMode = NeighborMode.OUT,
+    weights: Optional[Iterable[float]] = None,
+    *,
+    num_blocks: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> RealArray:
+    """Calculates the lengths of the shortest paths between the given source
+    and target vertices, splitting the source vertices into blocks that are
+    processed concurrently.
+
+    Args:
+        graph: the graph
+        source: the source vertices
+        target: the target vertices
+        mode: whether to follow outbound edges (``OUT``), inbound edges (``IN``)
+            or both (``ALL``). Ignored for undirected graphs.
+        weights: the weights of the edges, or ``None`` for unweighted
+            shortest paths
+        num_blocks: the number of blocks to split the source vertices into;
+            ``None`` means one block per worker thread
+        executor: the executor to submit the jobs to; ``None`` means to
+            create a new thread pool for the duration of the call
+        max_workers: the maximum number of worker threads when a new thread
+            pool is created
+
+    Returns:
+        the matrix of shortest path lengths, where row ``i`` corresponds to the
+        ``i``-th source vertex and column ``j`` corresponds to the ``j``-th
+        target vertex
+    """
+    sources = _vertex_selector_to_numpy_array(graph, source)
+    num_targets = len(_vertex_selector_to_numpy_array(graph, target))
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np_type_of_igraph_real_t)
+
+    result = np.empty((len(sources), num_targets), dtype=np_type_of_igraph_real_t)
+
+    def job(block: slice) -> None:
+        # Not using out=... here; it would make igraph search from the targets
+        result[block] = _distances(graph, sources[block], target, mode, weights)
+
+    with _executor_for(executor, max_workers) as pool:
+        blocks = _split_into_blocks(len(sources), num_blocks, max_workers)
+        _run_jobs(pool, job, blocks)
+
+    return result
+
+
+def community_leiden(
+    graph: Graph,
+    resolution: float,
+    seeds: Sequence[int],
+    weights: Optional[Iterable[float]] = None,
+    beta: float = 0.01,
+    n_iterations: int = 2,
+    membership: Optional[Iterable[int]] = None,
+    *,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> tuple[IntArray, RealArray]:
+    """Runs the Leiden community detection algorithm multiple times with
+    different random seeds concurrently.
+
+    Args:
+        graph: the graph
+        resolution: the resolution parameter of the quality function
+        seeds: the seeds of the random number generator to use; the algorithm
+            is run once for each seed
+        weights: the weights of the edges, or ``None`` if all edges have unit
+            weight
+        beta: the randomness used in the refinement step of the algorithm
+        n_iterations: the number of iterations of the algorithm; negative
+            numbers mean to iterate until the membership vector does not
+            change any more
+        membership: the partition that every run starts from; ``None`` means
+            to start from the partition where each vertex is in its own
+            community
+        executor: the executor to submit the jobs to; ``None`` means to
+            create a new thread pool for the duration of the call
+        max_workers: the maximum number of worker threads when a new thread
+            pool is created
+
+    Returns:
+        the membership vectors of the runs, one row per seed, and the qualities
+        of the partitions found by the runs
+    """
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np_type_of_igraph_real_t)
+    if membership is not None:
+        membership = np.asarray(membership, dtype=np_type_of_igraph_int_t)
+
+    memberships = np.empty((len(seeds), graph.vcount()), dtype=np_type_of_igraph_int_t)
+    qualities = np.empty(len(seeds), dtype=np_type_of_igraph_real_t)
+
+    def job(index: int) -> None:
+        with _seeded_rng(seeds[index]):
+            result, _, quality = _community_leiden(
+                graph,
+                resolution,
+                weights,
+                beta=beta,
+                start=membership is not None,
+                n_iterations=n_iterations,
+                membership=membership,
+            )
+        memberships[index] = result
+        qualities[index] = quality
+
+    with _executor_for(executor, max_workers) as pool:
+        _run_jobs(pool, job, range(len(seeds)))
+
+    return memberships, qualities
+
+
+def betweenness_subset(
+    graph: Graph,
+    weights: Optional[Iterable[float]] = None,
+    sources: VertexSelector = "all",
+    targets: VertexSelector = "all",
+    vids: VertexSelector = "all",
+    directed: bool = True,
+    *,
+    num_blocks: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> RealArray:
+    """Calculates the betweenness centrality of vertices with respect to the
+    shortest paths between the given source and target vertices, splitting
+    the source vertices into blocks that are processed concurrently.
+
+    The betweenness scores are additive over disjoint sets of source vertices
+    so the scores of the blocks are simply summed up.
+
+    Args:
+        graph: the graph
+        weights: the weights of the edges, or ``None`` for unweighted
+            shortest paths
+        sources: the source vertices of the shortest paths to consider
+        targets: the target vertices of the shortest paths to consider
+        vids: the vertices whose betweenness scores are to be returned
+        directed: whether to consider directed paths in directed graphs
+        num_blocks: the number of blocks to split the source vertices into;
+            ``None`` means one block per worker thread
+        executor: the executor to submit the jobs to; ``None`` means to
+            create a new thread pool for the duration of the call
+        max_workers: the maximum number of worker threads when a new thread
+            pool is created
+
+    Returns:
+        the betweenness scores of the vertices in ``vids``
+    """
+    source_array = _vertex_selector_to_numpy_array(graph, sources)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np_type_of_igraph_real_t)
+
+    def job(block: slice) -> RealArray:
+        return _betweenness_subset(
+            graph, weights, source_array[block], targets, vids, directed
+        )
+
+    with _executor_for(executor, max_workers) as pool:
+        blocks = _split_into_blocks(len(source_array), num_blocks, max_workers)
+        results = _run_jobs(pool, job, blocks)
+
+    if results:
+        return np.sum(results, axis=0)
+    else:
+        num_vids = len(_vertex_selector_to_numpy_array(graph, vids))
+        return np.zeros(num_vids, dtype=np_type_of_igraph_real_t)
+
+
+@contextmanager
+def _executor_for(
+    executor: Optional[Executor], max_workers: Optional[int]
+) -> Iterator[Executor]:
+    """Context manager that yields the given executor, or a new thread pool
+    with the given number of workers that is shut down when the context exits.
+    """
+    if executor is not None:
+        yield executor
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield pool
+
+
+def _run_jobs(
+    executor: Executor, func: Callable[[T], R], items: Iterable[T]
+) -> list[R]:
+    """Submits a job for each item to the given executor and waits for all of
+    them to finish, re-raising the first exception that happened in a job.
+    """
+    futures = [executor.submit(func, item) for item in items]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+@contextmanager
+def _seeded_rng(seed: int) -> Iterator[None]:
+    """Context manager that makes igraph use a NumPy random number generator
+    with the given seed in the current thread while the context is active.
+    """
+    # Set up the thread first so the wrappers do not replace our RNG later
+    ensure_thread_is_set_up()
+    restore = NumPyRNG(default_rng(seed)).attach()
+    try:
+        yield
+    finally:
+        restore()
+
+
+def _split_into_blocks(
+    n: int, num_blocks: Optional[int], max_workers: Optional[int]
+) -> list[slice]:
+    """Splits the range from zero to ``n`` into at most the given number of
+    consecutive blocks of nearly equal size.
+
+    When the number of blocks is not given, it defaults to the maximum number
+    of workers if it is known, or to the number of CPU cores.
+    """
+    if num_blocks is None:
+        num_blocks = max_workers or cpu_count() or 1
+    if num_blocks < 1:
+        raise ValueError("number of blocks must be positive")
+
+    num_blocks = min(num_blocks, n)
+    if num_blocks == 0:
+        return []
+
+    bounds = [(n * i) // num_blocks for i in range(num_blocks + 1)]
+    return [
+        slice(start, end)
+        for start, end in zip(bounds[:-1], bounds[1:], strict=True)
+    ]
+
+
+def _vertex_selector_to_numpy_array(
+    graph: Graph, selector: VertexSelector
+) -> IntArray:
+    """Resolves a vertex selector into the array of the selected vertex
+    indices.
+    """
+    ensure_thread_is_set_up()
+    vs = vertex_selector_to_igraph_vs_t(selector, graph)
+    indices = _VectorInt.create(0)
+    igraph_vs_as_vector(graph, vs.unwrap(), indices)
+    return igraph_vector_int_t_to_numpy_array_transfer(indices)
@@ -1,19 +1,61 @@
 """Functions related to shortest or widest paths in a graph."""
 
-from typing import Iterable, Literal, Optional
+import numpy as np
+
+from ctypes import c_int
+from typing import Callable, Iterable, Literal, Optional
 
 from .enums import Connectedness, NeighborMode
 from .graph import Graph
-from .types import IntArray, VertexLike
+from .types import IntArray, RealArray, VertexLike, VertexSelector
 
+from ._internal.conversion import (
+    edge_weights_to_igraph_vector_t_view,
+    igraph_vector_int_t_to_numpy_array_transfer,
+    igraph_vector_t_to_numpy_array_view,
+    numpy_array_to_igraph_matrix_t_view,
+    vertex_selector_to_igraph_vs_t,
+    vertexlike_to_igraph_int_t,
+)
 from ._internal.functions import (
     connected_components,
+    distances as _distances,
+    distances_bellman_ford as _distances_bellman_ford,
+    distances_dijkstra as _distances_dijkstra,
     get_shortest_path,
     get_shortest_path_bellman_ford,
     get_shortest_path_dijkstra,
 )
+from ._internal.lib import (
+    igraph_distances_bellman_ford,
+    igraph_distances_dijkstra,
+    igraph_get_shortest_path_astar,
+    igraph_vs_size,
+)
+from ._internal.setup import _interrupt_with, ensure_thread_is_set_up
+from ._internal.types import (
+    igraph_astar_heuristic_func_t,
+    igraph_int_t,
+    np_type_of_igraph_real_t,
+)
+from ._internal.wrappers import _VectorInt
+
+__all__ = (
+    "AStarHeuristic",
+    "components",
+    "distances",
+    "shortest_path",
+    "shortest_path_astar",
+)
 
-__all__ = ("components", "shortest_path")
+
+AStarHeuristic = Callable[[int, int], float]
+"""Type specification for heuristic functions of the A* algorithm. The
+function is called with the ID of a vertex and the ID of the target vertex,
+and it must return an estimate of the length of the shortest path between
+them. The estimate must not be larger than the real length for the algorithm
+to find a shortest path.
+"""
 
 
 def components(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> IntArray:
@@ -28,6 +70,145 @@ def components(graph: Graph, mode: Connectedness = Connectedness.WEAK) -> IntArr
     return membership
 
 
+def distances(
+    graph: Graph,
+    source: VertexSelector = "all",
+    target: VertexSelector = "all",
+    mode: NeighborMode = NeighborMode.OUT,
+    weights: Optional[Iterable[float]] = None,
+    method: Literal["auto", "dijkstra", "bellman_ford"] = "auto",
+    out: Optional[RealArray] = None,
+) -> RealArray:
+    """Calculates the lengths of the shortest paths between a set of source
+    and a set of target vertices in a graph.
+
+    Args:
+        graph: the graph
+        source: the source vertices
+        target: the target vertices
+        mode: whether to follow edges along their natural direction (`OUT`),
+            in the opposite direction (`IN`) or to ignore edge directions
+            (`ALL`). Ignored for undirected graphs.
+        weights: list of weights for each edge in the graph, or ``None`` to treat
+            the edges as unweighted
+        method: the method to use for finding shortest paths when the graph is
+            weighted. May be one of `"auto"` (pick the best method), `"dijkstra"`
+            (Dijkstra's algorithm) or `"bellman_ford"` (Bellman-Ford algorithm).
+        out: optional two-dimensional NumPy array of floats to write the result
+            into. The array must have one row for each source vertex and one
+            column for each target vertex, and it must be C- or
+            Fortran-contiguous. igraph writes the result directly into the
+            memory area of the array so this can also be a memory-mapped array
+            created with `np.memmap` to keep large distance matrices on disk.
+
+    Returns:
+        the matrix of shortest path lengths, where row ``i`` corresponds to the
+        ``i``-th source vertex and column ``j`` corresponds to the ``j``-th
+        target vertex. Returns ``out`` itself if it was given.
+    """
+    if method not in ("auto", "dijkstra", "bellman_ford", "bellman-ford"):
+        raise ValueError(f"unknown method: {method!r}")
+
+    if out is None:
+        if method == "auto":
+            return _distances(graph, weights, source, target, mode)
+        elif method == "dijkstra":
+            return _distances_dijkstra(graph, source, target, weights, mode)
+        else:
+            return _distances_bellman_ford(graph, source, target, weights, mode)
+
+    return _distances_into(out, graph, source, target, mode, weights, method)
+
+
+def _distances_into(
+    out: RealArray,
+    graph: Graph,
+    source: VertexSelector,
+    target: VertexSelector,
+    mode: NeighborMode,
+    weights: Optional[Iterable[float]],
+    method: str,
+) -> RealArray:
+    """Implementation of `distances()` that writes the result into a
+    preallocated array.
+    """
+    ensure_thread_is_set_up()
+
+    c_weights = (
+        edge_weights_to_igraph_vector_t_view(weights, graph)
+        if weights is not None
+        else None
+    )
+    if method == "auto":
+        # igraph_distances() may use algorithms that replace the storage of
+        # the result matrix so we cannot use it with a preallocated matrix.
+        # Pick between Dijkstra and Bellman-Ford ourselves instead. The
+        # converted weights are checked as the iterable may be consumed.
+        has_negative_weights = c_weights is not None and bool(
+            np.any(igraph_vector_t_to_numpy_array_view(c_weights) < 0)
+        )
+        method = "bellman_ford" if has_negative_weights else "dijkstra"
+
+    res = _column_major_view(out)
+    if res is not out:
+        # We are filling the transpose of the array so we swap the sources
+        # and the targets and reverse the direction of the traversal
+        source, target = target, source
+        if mode == NeighborMode.OUT:
+            mode = NeighborMode.IN
+        elif mode == NeighborMode.IN:
+            mode = NeighborMode.OUT
+
+    c_from = vertex_selector_to_igraph_vs_t(source, graph)
+    c_to = vertex_selector_to_igraph_vs_t(target, graph)
+
+    # igraph resizes the result matrix to the expected size. This is a no-op
+    # when the size is right, but it would reallocate the memory area of the
+    # array otherwise, which we must avoid at all costs
+    shape = _vertex_selector_size(graph, c_from), _vertex_selector_size(graph, c_to)
+    if res.shape != shape:
+        expected_shape = shape if res is out else shape[::-1]
+        raise ValueError(f"out must have shape {expected_shape}, got {out.shape}")
+
+    c_res = numpy_array_to_igraph_matrix_t_view(res)
+    if method == "dijkstra":
+        func = igraph_distances_dijkstra
+    else:
+        func = igraph_distances_bellman_ford
+    func(graph, c_res, c_from.unwrap(), c_to.unwrap(), c_weights, c_int(mode))
+
+    return out
+
+
+def _column_major_view(out: RealArray) -> RealArray:
+    """Checks whether the given array can be used to store a distance matrix
+    calculated by igraph, and returns a Fortran-contiguous view of it.
+
+    The transpose of a C-contiguous array is Fortran-contiguous, so the
+    returned view is the transpose of the array in this case.
+    """
+    if not isinstance(out, np.ndarray) or out.ndim != 2:
+        raise TypeError("out must be a two-dimensional NumPy array")
+    if out.dtype != np_type_of_igraph_real_t:
+        raise TypeError(f"out must be an array of {np.dtype(np_type_of_igraph_real_t)}")
+    if not out.flags.writeable:
+        raise ValueError("out must be writable")
+
+    if out.flags.f_contiguous:
+        return out
+    elif out.flags.c_contiguous:
+        return out.T
+    else:
+        raise ValueError("out must be C- or Fortran-contiguous")
+
+
+def _vertex_selector_size(graph: Graph, vs) -> int:
+    """Returns the number of vertices in a low-level igraph vertex selector."""
+    result = igraph_int_t()
+    igraph_vs_size(graph, vs, result)
+    return result.value
+
+
 def shortest_path(
     graph: Graph,
     source: VertexLike,
@@ -62,3 +243,133 @@ def shortest_path(
     else:
         raise ValueError(f"unknown method: {method!r}")
     return vpath
+
+
+def shortest_path_astar(
+    graph: Graph,
+    source: VertexLike,
+    target: VertexLike,
+    heuristic: Optional[AStarHeuristic] = None,
+    mode: NeighborMode = NeighborMode.OUT,
+    weights: Optional[Iterable[float]] = None,
+    *,
+    coords: Optional[np.ndarray] = None,
+    metric: Literal["euclidean", "manhattan", "chebyshev"] = "euclidean",
+) -> IntArray:
+    """Finds a single shortest path between two vertices in a graph with the
+    A* algorithm.
+
+    The heuristic of the algorithm can be given either as a Python function or
+    as a matrix of vertex coordinates, in which case the heuristic is the
+    distance of a vertex from the target according to the given metric. The
+    latter is faster as the distances are calculated for all vertices in one
+    go before the search starts instead of calling a Python function for each
+    vertex that the search reaches.
+
+    Args:
+        graph: the graph
+        source: the source vertex
+        target: the target vertex
+        heuristic: a function that estimates the length of the shortest path
+            from a vertex to the target; see `AStarHeuristic` for its
+            signature. Exceptions raised by the function interrupt the search.
+            Must be ``None`` if ``coords`` is given.
+        mode: whether to follow edges along their natural direction (`OUT`),
+            in the opposite direction (`IN`) or to ignore edge directions
+            (`ALL`). Ignored for undirected graphs.
+        weights: list of weights for each edge in the graph, or ``None`` to treat
+            the edges as unweighted
+        coords: a matrix with one row for each vertex of the graph, containing
+            the coordinates of the vertices
+        metric: the metric to use for calculating the distances between the
+            vertices from their coordinates. May be one of `"euclidean"`,
+            `"manhattan"` or `"chebyshev"`. The distance between the endpoints
+            of an edge must not be larger than the weight of the edge for the
+            algorithm to find a shortest path.
+
+    Returns:
+        the IDs of the vertices along the shortest path
+    """
+    ensure_thread_is_set_up()
+
+    c_from = vertexlike_to_igraph_int_t(source)
+    c_to = vertexlike_to_igraph_int_t(target)
+    c_weights = (
+        edge_weights_to_igraph_vector_t_view(weights, graph)
+        if weights is not None
+        else None
+    )
+    c_vertices = _VectorInt.create(0)
+    c_edges = _VectorInt.create(0)
+
+    if coords is not None:
+        if heuristic is not None:
+            raise ValueError("heuristic and coords must not be given together")
+
+        estimates = _distances_from_coordinates(graph, coords, c_to.value, metric)
+
+        # Look up the precomputed estimates in a list, which is faster than
+        # indexing a NumPy array with Python integers
+        heuristic = _lookup_heuristic(estimates.tolist())
+
+    if heuristic is not None:
+        func = heuristic
+
+        def handle(result, from_: int, to: int, extra) -> int:
+            try:
+                result[0] = func(from_, to)
+            except BaseException as ex:
+                return _interrupt_with(ex)
+            return 0
+
+        c_heuristic = igraph_astar_heuristic_func_t(handle)
+    else:
+        c_heuristic = igraph_astar_heuristic_func_t()
+
+    igraph_get_shortest_path_astar(
+        graph,
+        c_vertices,
+        c_edges,
+        c_from,
+        c_to,
+        c_weights,
+        c_int(mode),
+        c_heuristic,
+        None,
+    )
+
+    return igraph_vector_int_t_to_numpy_array_transfer(c_vertices)
+
+
+def _distances_from_coordinates(
+    graph: Graph, coords: np.ndarray, target: int, metric: str
+) -> RealArray:
+    """Calculates the distances of all the vertices of a graph from a target
+    vertex, based on a coordinate matrix and a metric.
+    """
+    coords = np.asarray(coords, dtype=np_type_of_igraph_real_t)
+    if coords.ndim == 1:
+        coords = coords[:, np.newaxis]
+    if coords.ndim != 2 or coords.shape[0] != graph.vcount():
+        raise ValueError("coords must be a matrix with one row for each vertex")
+
+    diffs = np.abs(coords - coords[target])
+    if metric == "euclidean":
+        return np.sqrt((diffs * diffs).sum(axis=1))
+    elif metric == "manhattan":
+        return diffs.sum(axis=1)
+    elif metric == "chebyshev":
+        return diffs.max(axis=1, initial=0.0)
+    else:
+        raise ValueError(f"unknown metric: {metric!r}")
+
+
+def _lookup_heuristic(estimates: list[float]) -> AStarHeuristic:
+    """Creates an A* heuristic function that returns precomputed estimates
+    from a list, ignoring the target vertex.
+    """
+
+    def heuristic(from_: int, to: int) -> float:
+        return estimates[from_]
+
+    return heuristic
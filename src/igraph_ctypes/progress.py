@@ -0,0 +1,108 @@
+"""Functions that report the progress of long-running igraph computations.
+
+Some functions of igraph's C core (e.g., betweenness calculations, layout
+algorithms and community detection methods) report their progress
+periodically. The context manager in this module forwards these reports to a
+Python callback or to a ``tqdm``-style progress bar in the current thread.
+"""
+
+from contextlib import contextmanager
+from math import inf
+from time import monotonic
+from typing import Any, Callable, Iterator, Protocol, Union, runtime_checkable
+
+from ._internal.setup import progress_callback
+
+__all__ = ("ProgressBar", "ProgressCallback", "progress_handler")
+
+
+ProgressCallback = Callable[[str, float], Any]
+"""Type specification for functions that receive the progress reports of igraph
+functions. The function is called with the progress message and the
+percentage of the calculation that was completed so far.
+"""
+
+
+@runtime_checkable
+class ProgressBar(Protocol):
+    """Interface specification for ``tqdm``-style progress bars that can
+    receive the progress reports of igraph functions.
+
+    The total of the progress bar should be 100.
+    """
+
+    n: float
+
+    def update(self, n: float = 1) -> Any: ...
+
+
+@contextmanager
+def progress_handler(
+    reporter: Union[ProgressCallback, ProgressBar], *, min_interval: float = 0.1
+) -> Iterator[None]:
+    """Context manager that forwards the progress reports of igraph functions
+    called in the current thread while the context is active to the given
+    callback or progress bar.
+
+    Reports are throttled such that the reporter is called at most once in
+    every ``min_interval`` seconds, except for reports signalling that a
+    calculation has finished, which are always forwarded.
+
+    Args:
+        reporter: a function that is called with the progress message and the
+            percentage of the calculation that was completed so far, or a
+            ``tqdm``-style progress bar with a total of 100. Exceptions raised
+            by the reporter interrupt the calculation.
+        min_interval: the minimum time between consecutive reports, in seconds
+    """
+    if isinstance(reporter, ProgressBar):
+        reporter = _ProgressBarAdapter(reporter)
+
+    with progress_callback(_ThrottledCallback(reporter, min_interval)):
+        yield
+
+
+class _ProgressBarAdapter:
+    """Adapter that forwards progress reports to a ``tqdm``-style progress
+    bar.
+    """
+
+    _bar: ProgressBar
+
+    def __init__(self, bar: ProgressBar):
+        self._bar = bar
+
+    def __call__(self, message: str, percent: float) -> None:
+        bar = self._bar
+
+        if message and hasattr(bar, "set_description"):
+            bar.set_description(message, refresh=False)
+
+        delta = percent - bar.n
+        if delta < 0 and hasattr(bar, "reset"):
+            # A new calculation has started
+            bar.reset()
+            delta = percent
+
+        bar.update(delta)
+
+
+class _ThrottledCallback:
+    """Callable that forwards progress reports to a callback, dropping the
+    ones that arrive too soon after the previous one.
+    """
+
+    _callback: ProgressCallback
+    _min_interval: float
+    _last_called_at: float
+
+    def __init__(self, callback: ProgressCallback, min_interval: float):
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_called_at = -inf
+
+    def __call__(self, message: str, percent: float) -> None:
+        now = monotonic()
+        if percent >= 100 or now - self._last_called_at >= self._min_interval:
+            self._last_called_at = now
+            self._callback(message.rstrip(": "), percent)
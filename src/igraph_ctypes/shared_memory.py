@@ -0,0 +1,364 @@
+"""Functions and classes that allow graphs to be shared between processes
+without copying, using the shared memory facilities of the ``multiprocessing``
+module.
+
+A graph is first *published* to shared memory with `SharedGraph.publish()`.
+This copies the edge list and the indices of the graph, as well as all the
+numeric and Boolean vertex and edge attributes, into shared memory segments,
+and returns a lightweight `SharedGraph` handle that can be sent to other
+processes, e.g. as an argument of a job submitted to a
+``ProcessPoolExecutor``. The processes can then call `SharedGraph.attach()`
+to obtain a read-only `Graph` that uses the shared memory segments directly,
+without rebuilding the indices of the graph.
+
+The process that published the graph owns the shared memory segments and is
+responsible for releasing them with `SharedGraph.unlink()` when they are not
+needed any more. Note that on Python versions before 3.13, the shared memory
+segments are tracked by the resource tracker of ``multiprocessing``; this
+is okay if the processes that attach to the graph are started by
+``multiprocessing`` from the publishing process, but other processes may
+unlink the segments prematurely when they exit.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ctypes import addressof, byref, c_char, pointer, POINTER
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from numpy.typing import NDArray
+from sys import version_info
+from typing import Any
+
+from .graph import Graph
+
+from ._internal.attributes import AttributeMap, AttributeValueList
+from ._internal.attributes.enums import AttributeType
+from ._internal.attributes.storage import (
+    DictAttributeStorage,
+    assign_storage_to_graph,
+)
+from ._internal.conversion import _attach_view_source
+from ._internal.lib import (
+    igraph_empty,
+    igraph_invalidate_cache,
+    igraph_vector_int_destroy,
+    igraph_vector_int_size,
+    igraph_vector_int_view,
+)
+from ._internal.setup import ensure_thread_is_set_up
+from ._internal.types import igraph_int_t, np_type_of_igraph_int_t
+from ._internal.wrappers import _SharedGraph
+
+__all__ = ("SharedGraph",)
+
+
+_STRUCTURE_FIELDS = ("from_", "to", "oi", "ii", "os", "is_")
+"""Names of the vectors in ``igraph_t`` that are placed in shared memory, in
+the order they are laid out in the shared memory segment.
+"""
+
+_SHAREABLE_ATTRIBUTE_TYPES = (AttributeType.NUMERIC, AttributeType.BOOLEAN)
+"""Attribute types whose values are placed in shared memory. Attributes of
+other types are pickled together with the handle of the graph.
+"""
+
+
+@dataclass(frozen=True)
+class _SharedArray:
+    """Description of a NumPy array stored in a shared memory segment."""
+
+    name: str
+    """The name of the shared memory segment."""
+
+    shape: tuple[int, ...]
+    """The shape of the array."""
+
+    dtype: str
+    """The NumPy type of the items in the array."""
+
+    def attach(self) -> NDArray:
+        """Attaches to the shared memory segment and returns a read-only
+        NumPy array that refers to it.
+
+        The shared memory segment is closed when the returned array and all
+        the views derived from it are garbage-collected.
+        """
+        array = np.asarray(_SharedMemoryOwner(self.name, self.shape, self.dtype))
+        array.flags.writeable = False
+        return array
+
+
+@dataclass(frozen=True)
+class _AttributeColumn:
+    """Description of the values of a vertex or edge attribute."""
+
+    type: AttributeType
+    """The igraph attribute type of the attribute."""
+
+    values: _SharedArray | NDArray
+    """The values of the attribute if they are not in shared memory, or the
+    description of the shared array holding the values otherwise.
+    """
+
+    def to_value_list(self) -> AttributeValueList:
+        """Creates an attribute value list from the column."""
+        if isinstance(self.values, _SharedArray):
+            array = self.values.attach()
+        else:
+            array = self.values
+        return AttributeValueList(array, type=self.type, fixed_length=True, _wrap=True)
+
+
+class _SharedMemoryOwner:
+    """Object that attaches to a shared memory segment and exposes it to NumPy
+    via the array interface protocol.
+
+    NumPy arrays created from this object keep a reference to it in their
+    ``base`` attribute. The shared memory segment is closed (but not unlinked)
+    when the last array referring to it is garbage-collected.
+    """
+
+    _segment: SharedMemory
+    """The shared memory segment."""
+
+    __array_interface__: dict[str, Any]
+    """The NumPy array interface description of the shared memory segment."""
+
+    def __init__(self, name: str, shape: tuple[int, ...], np_type):
+        """Constructor.
+
+        Args:
+            name: the name of the shared memory segment
+            shape: the shape of the array stored in the segment
+            np_type: the NumPy type of the items in the segment
+        """
+        if version_info >= (3, 13):
+            self._segment = SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+        else:
+            self._segment = SharedMemory(name=name)
+
+        buf = self._segment.buf
+        if buf is None:
+            raise RuntimeError(f"shared memory segment {name!r} is closed")
+
+        # Not keeping a reference to the buffer so the segment can be closed
+        # without the "cannot close exported pointers" error later
+        address = addressof(c_char.from_buffer(buf))
+
+        self.__array_interface__ = {
+            "data": (address, False),
+            "shape": shape,
+            "typestr": np.dtype(np_type).str,
+            "version": 3,
+        }
+
+    def __del__(self):
+        self._segment.close()
+
+
+class SharedGraph:
+    """Handle of a graph whose edge list, indices and numeric or Boolean
+    attributes were published to shared memory.
+
+    Handles are lightweight and picklable so they can be sent to other
+    processes that then use `attach()` to access the graph. Do not create
+    instances of this class directly; use `SharedGraph.publish()` instead.
+    """
+
+    vcount: int
+    """The number of vertices of the graph."""
+
+    ecount: int
+    """The number of edges of the graph."""
+
+    directed: bool
+    """Whether the graph is directed."""
+
+    _structure: _SharedArray
+    """The shared array holding the edge list and the indices of the graph."""
+
+    _graph_attributes: dict[str, Any]
+    """The graph attributes of the graph."""
+
+    _vertex_attributes: dict[str, _AttributeColumn]
+    """The vertex attributes of the graph."""
+
+    _edge_attributes: dict[str, _AttributeColumn]
+    """The edge attributes of the graph."""
+
+    _segments: list[SharedMemory]
+    """The shared memory segments created by `publish()`; empty in handles
+    that were unpickled in another process.
+    """
+
+    @classmethod
+    def publish(cls, graph: Graph) -> SharedGraph:
+        """Copies the edge list, the indices and the numeric or Boolean vertex
+        and edge attributes of the given graph to shared memory.
+
+        Attributes of other types and graph attributes are stored in the
+        returned handle and they are copied to the other processes when the
+        handle is pickled.
+
+        Args:
+            graph: the graph to publish
+
+        Returns:
+            the handle of the published graph. The handle may be used as a
+            context manager that unlinks the shared memory segments upon
+            exiting the context.
+        """
+        ensure_thread_is_set_up()
+
+        instance = graph._as_parameter_.unwrap()
+        vectors = [
+            _igraph_vector_int_t_to_numpy_array_view(getattr(instance, name))
+            for name in _STRUCTURE_FIELDS
+        ]
+        storage = graph._get_attribute_storage()
+
+        result = cls.__new__(cls)
+        result.vcount = graph.vcount()
+        result.ecount = graph.ecount()
+        result.directed = graph.is_directed()
+        result._segments = []
+
+        try:
+            result._structure = result._share(np.concatenate(vectors))
+            result._graph_attributes = dict(storage.get_graph_attribute_map())
+            result._vertex_attributes = result._share_attributes(
+                storage.get_vertex_attribute_map()
+            )
+            result._edge_attributes = result._share_attributes(
+                storage.get_edge_attribute_map()
+            )
+        except BaseException:
+            result.unlink()
+            raise
+
+        return result
+
+    def attach(self) -> Graph:
+        """Returns a read-only graph that uses the shared memory segments of
+        this handle.
+
+        igraph functions that would modify the returned graph raise a
+        `ValueError`, and so do attempts to modify the values of attributes
+        that are in shared memory. Use `Graph.copy()` to obtain a graph that
+        can be modified.
+        """
+        ensure_thread_is_set_up()
+
+        n, m = self.vcount, self.ecount
+        structure = self._structure.attach()
+        instance = _SharedGraph.create_with(igraph_empty, 0, self.directed)
+
+        c_graph = instance.unwrap()
+        sizes = (m, m, m, m, n + 1, n + 1)
+        offset = 0
+        for name, size in zip(_STRUCTURE_FIELDS, sizes, strict=True):
+            vector = getattr(c_graph, name)
+            data = structure[offset:].ctypes.data_as(POINTER(igraph_int_t))
+            igraph_vector_int_destroy(byref(vector))
+            setattr(c_graph, name, igraph_vector_int_view(data, size))
+            offset += size
+
+        c_graph.n = n
+        igraph_invalidate_cache(byref(c_graph))
+        _attach_view_source(instance, structure)
+
+        storage = DictAttributeStorage(
+            dict(self._graph_attributes),
+            _attribute_columns_to_map(self._vertex_attributes, n),
+            _attribute_columns_to_map(self._edge_attributes, m),
+        )
+        assign_storage_to_graph(pointer(c_graph), storage)
+
+        return Graph(_wrap=instance)
+
+    def close(self) -> None:
+        """Closes the shared memory segments in the publishing process without
+        unlinking them.
+
+        Graphs that are already attached to the segments are not affected.
+        """
+        for segment in self._segments:
+            segment.close()
+
+    def unlink(self) -> None:
+        """Closes and unlinks the shared memory segments in the publishing
+        process.
+
+        Graphs that are already attached to the segments remain usable, but
+        no new graphs can be attached to them. Does nothing in processes
+        other than the publishing process.
+        """
+        self.close()
+        while self._segments:
+            self._segments.pop().unlink()
+
+    def __enter__(self) -> SharedGraph:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.unlink()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_segments"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._segments = []
+
+    def _share(self, array: NDArray) -> _SharedArray:
+        """Copies the given NumPy array into a new shared memory segment that
+        is owned by this handle.
+        """
+        segment = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._segments.append(segment)
+
+        view: NDArray = np.ndarray(array.shape, array.dtype, buffer=segment.buf)
+        view[...] = array
+        del view
+
+        return _SharedArray(segment.name, array.shape, array.dtype.str)
+
+    def _share_attributes(self, attrs: AttributeMap) -> dict[str, _AttributeColumn]:
+        """Copies the values of the given vertex or edge attributes into new
+        shared memory segments if their type allows it.
+        """
+        result: dict[str, _AttributeColumn] = {}
+        for name, values in attrs.items():
+            array = np.asarray(values)
+            if values.type in _SHAREABLE_ATTRIBUTE_TYPES:
+                result[name] = _AttributeColumn(values.type, self._share(array))
+            else:
+                result[name] = _AttributeColumn(values.type, array.copy())
+        return result
+
+
+def _attribute_columns_to_map(
+    columns: dict[str, _AttributeColumn], length: int
+) -> AttributeMap:
+    """Creates an attribute map from the descriptions of vertex or edge
+    attribute columns.
+    """
+    return AttributeMap(
+        {name: column.to_value_list() for name, column in columns.items()}, length
+    )
+
+
+def _igraph_vector_int_t_to_numpy_array_view(vector: Any) -> NDArray:
+    """Returns a NumPy array that refers to the items of an igraph integer
+    vector embedded in another igraph structure, without copying.
+
+    The array must not be used after the vector is modified or destroyed.
+    """
+    size = igraph_vector_int_size(byref(vector))
+    if size == 0:
+        return np.empty(0, dtype=np_type_of_igraph_int_t)
+    return np.ctypeslib.as_array(vector.stor_begin, shape=(size,))
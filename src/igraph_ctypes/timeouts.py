@@ -0,0 +1,58 @@
+"""Functions that bound the running time of igraph computations.
+
+igraph's C core periodically checks whether the computation it is running
+should be interrupted. The context managers in this module register a
+deadline that is consulted during these checks in the current thread;
+when the deadline passes, the igraph function that is running is interrupted
+and raises a `TimeoutError`. Functions that never check for interruptions
+are not affected.
+"""
+
+from contextlib import contextmanager
+from time import monotonic
+from typing import Iterator, Optional
+
+from ._internal.setup import interruption_check
+
+__all__ = ("deadline", "time_limit")
+
+
+@contextmanager
+def deadline(when: float) -> Iterator[None]:
+    """Context manager that interrupts igraph functions called in the current
+    thread while the context is active if they are still running at the
+    given time.
+
+    Args:
+        when: the deadline, as a value of the ``time.monotonic()`` clock
+
+    Raises:
+        TimeoutError: from the igraph function that was interrupted
+    """
+
+    def check() -> Optional[BaseException]:
+        if monotonic() >= when:
+            return TimeoutError("igraph computation did not finish before deadline")
+        return None
+
+    with interruption_check(check):
+        yield
+
+
+@contextmanager
+def time_limit(seconds: float) -> Iterator[None]:
+    """Context manager that interrupts igraph functions called in the current
+    thread while the context is active if the given number of seconds have
+    passed since entering the context.
+
+    The limit applies to the total time spent in the context, not to the
+    individual igraph functions called in it.
+
+    Args:
+        seconds: the time limit, in seconds
+
+    Raises:
+        TimeoutError: from the igraph function that was interrupted
+    """
+    with deadline(monotonic() + seconds):
+        yield
@@ -0,0 +1,322 @@
+"""Breadth-first and depth-first traversals of a graph.
+
+The functions in this module return the complete result of a traversal as
+NumPy arrays. Optionally, they also report the vertices they visit to a Python
+callback. The traversal itself runs in the C core without calling back into
+Python; the callback is invoked afterwards with consecutive batches of the
+visited vertices, sliced from the result arrays, so its overhead is one
+Python call per batch instead of one per vertex. The callback can stop the
+traversal by returning ``True``, in which case the results are trimmed as if
+the traversal had stopped at the last vertex of that batch. Note that this
+does not save the time spent on the traversal in the C core.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ctypes import c_int
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from .enums import NeighborMode
+from .graph import Graph
+from .types import IntArray, VertexLike
+
+from ._internal.conversion import (
+    igraph_vector_int_t_to_numpy_array_transfer,
+    iterable_vertex_indices_to_igraph_vector_int_t,
+    vertexlike_to_igraph_int_t,
+)
+from ._internal.lib import igraph_bfs, igraph_dfs
+from ._internal.setup import ensure_thread_is_set_up
+from ._internal.types import (
+    igraph_bfshandler_t,
+    igraph_dfshandler_t,
+)
+from ._internal.wrappers import _VectorInt
+
+__all__ = ("BFSVisitor", "DFSVisitor", "bfs", "dfs")
+
+
+BFSVisitor = Callable[[IntArray, IntArray, IntArray, IntArray], Any]
+"""Type specification for functions that receive the vertices visited by a
+breadth-first search. The function is called with the IDs of the vertices
+visited in the batch, their predecessors and successors in the visiting order
+(-1 if there is no such vertex in the same search tree) and their distances
+from the root of their search trees. The traversal stops if the function
+returns ``True``.
+"""
+
+DFSVisitor = Callable[[IntArray, IntArray], Any]
+"""Type specification for functions that receive the vertices discovered by a
+depth-first search. The function is called with the IDs of the vertices
+discovered in the batch and their distances from the root of their search
+trees. The traversal stops if the function returns ``True``.
+"""
+
+
+def bfs(
+    graph: Graph,
+    root: VertexLike,
+    mode: NeighborMode = NeighborMode.OUT,
+    *,
+    roots: Optional[Iterable[VertexLike]] = None,
+    unreachable: bool = True,
+    restricted: Optional[Iterable[VertexLike]] = None,
+    visitor: Optional[BFSVisitor] = None,
+    batch_size: int = 1024,
+) -> tuple[IntArray, IntArray, IntArray, IntArray, IntArray, IntArray]:
+    """Conducts a breadth-first search on a graph.
+
+    Vertices that were not visited, either because they are unreachable or
+    because the traversal was stopped early, have negative values in all the
+    returned arrays.
+
+    Args:
+        graph: the graph
+        root: the vertex to start the search from; ignored if ``roots`` is
+            given
+        mode: whether to follow outbound edges (``OUT``), inbound edges (``IN``)
+            or both (``ALL``). Ignored for undirected graphs.
+        roots: the vertices to start the search from, in this order. A new
+            search tree is started from every vertex in the list that was not
+            visited yet.
+        unreachable: whether to visit the vertices that are not reachable
+            from the root(s) as well, starting new search trees from them
+        restricted: when given, the search is restricted to the subgraph
+            induced by these vertices
+        visitor: an optional function that is called with batches of the
+            vertices visited by the search after the search has finished; see
+            `BFSVisitor` for its signature. Exceptions raised by the visitor
+            are propagated to the caller.
+        batch_size: the maximum number of vertices passed to the visitor in
+            a single call
+
+    Returns:
+        the vertex IDs in the order they were visited, the rank of each vertex
+        in the visiting order, the parent of each vertex in its search tree,
+        the predecessor and successor of each vertex in the visiting order
+        and the distance of each vertex from the root of its search tree
+    """
+    ensure_thread_is_set_up()
+
+    c_root = vertexlike_to_igraph_int_t(root) if roots is None else 0
+    c_roots = (
+        iterable_vertex_indices_to_igraph_vector_int_t(roots)
+        if roots is not None
+        else None
+    )
+    c_restricted = (
+        iterable_vertex_indices_to_igraph_vector_int_t(restricted)
+        if restricted is not None
+        else None
+    )
+    c_order = _VectorInt.create(0)
+    c_rank = _VectorInt.create(0)
+    c_parents = _VectorInt.create(0)
+    c_pred = _VectorInt.create(0)
+    c_succ = _VectorInt.create(0)
+    c_dist = _VectorInt.create(0)
+
+    if visitor:
+        _check_batch_size(batch_size)
+
+    igraph_bfs(
+        graph,
+        c_root,
+        c_roots,
+        c_int(mode),
+        unreachable,
+        c_restricted,
+        c_order,
+        c_rank,
+        c_parents,
+        c_pred,
+        c_succ,
+        c_dist,
+        igraph_bfshandler_t(),
+        None,
+    )
+
+    order = igraph_vector_int_t_to_numpy_array_transfer(c_order)
+    rank = igraph_vector_int_t_to_numpy_array_transfer(c_rank)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
+    pred = igraph_vector_int_t_to_numpy_array_transfer(c_pred)
+    succ = igraph_vector_int_t_to_numpy_array_transfer(c_succ)
+    dist = igraph_vector_int_t_to_numpy_array_transfer(c_dist)
+
+    if visitor:
+        stopped_at = _visit_in_batches(visitor, batch_size, order, (pred, succ, dist))
+        if stopped_at is not None:
+            _trim_bfs_results(stopped_at, order, rank, parents, pred, succ, dist)
+
+    return order, rank, parents, pred, succ, dist
+
+
+def dfs(
+    graph: Graph,
+    root: VertexLike,
+    mode: NeighborMode = NeighborMode.OUT,
+    *,
+    unreachable: bool = True,
+    visitor: Optional[DFSVisitor] = None,
+    batch_size: int = 1024,
+) -> tuple[IntArray, IntArray, IntArray, IntArray]:
+    """Conducts a depth-first search on a graph.
+
+    Vertices that were not visited, either because they are unreachable or
+    because the traversal was stopped early, have negative values in all the
+    returned arrays.
+
+    Args:
+        graph: the graph
+        root: the vertex to start the search from
+        mode: whether to follow outbound edges (``OUT``), inbound edges (``IN``)
+            or both (``ALL``). Ignored for undirected graphs.
+        unreachable: whether to visit the vertices that are not reachable
+            from the root as well, starting new search trees from them
+        visitor: an optional function that is called with batches of the
+            vertices discovered by the search after the search has finished;
+            see `DFSVisitor` for its signature. Exceptions raised by the
+            visitor are propagated to the caller.
+        batch_size: the maximum number of vertices passed to the visitor in
+            a single call
+
+    Returns:
+        the vertex IDs in the order they were discovered, the vertex IDs in
+        the order their subtrees were completed, the parent of each vertex in
+        its search tree and the distance of each vertex from the root of its
+        search tree
+    """
+    ensure_thread_is_set_up()
+
+    c_root = vertexlike_to_igraph_int_t(root)
+    c_order = _VectorInt.create(0)
+    c_order_out = _VectorInt.create(0)
+    c_parents = _VectorInt.create(0)
+    c_dist = _VectorInt.create(0)
+
+    if visitor:
+        _check_batch_size(batch_size)
+
+    igraph_dfs(
+        graph,
+        c_root,
+        c_int(mode),
+        unreachable,
+        c_order,
+        c_order_out,
+        c_parents,
+        c_dist,
+        igraph_dfshandler_t(),
+        igraph_dfshandler_t(),
+        None,
+    )
+
+    order = igraph_vector_int_t_to_numpy_array_transfer(c_order)
+    order_out = igraph_vector_int_t_to_numpy_array_transfer(c_order_out)
+    parents = igraph_vector_int_t_to_numpy_array_transfer(c_parents)
+    dist = igraph_vector_int_t_to_numpy_array_transfer(c_dist)
+
+    if visitor:
+        stopped_at = _visit_in_batches(visitor, batch_size, order, (dist,))
+        if stopped_at is not None:
+            _trim_dfs_results(stopped_at, order, order_out, parents, dist)
+
+    return order, order_out, parents, dist
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("batch size must be positive")
+
+
+def _visit_in_batches(
+    visitor: Callable[..., Any],
+    batch_size: int,
+    order: IntArray,
+    fields: Sequence[IntArray],
+) -> Optional[int]:
+    """Forwards the vertices visited by a traversal to a visitor function in
+    batches, in the order they were visited.
+
+    Args:
+        visitor: the visitor function
+        batch_size: the maximum number of vertices in a batch
+        order: the IDs of the vertices in the order they were visited,
+            followed by negative numbers for the vertices that were not
+        fields: arrays indexed by vertex IDs that hold the additional
+            information passed to the visitor for each vertex
+
+    Returns:
+        the number of vertices visited up to and including the batch where
+        the visitor requested the traversal to stop, or ``None`` if it did not
+        or if it did so after the last batch, when there was nothing left to
+        visit anyway
+    """
+    count = int(np.count_nonzero(order >= 0))
+    for start in range(0, count, batch_size):
+        end = min(start + batch_size, count)
+        vids = order[start:end].copy()
+        if visitor(vids, *(field[vids] for field in fields)) and end < count:
+            return end
+    return None
+
+
+def _trim_bfs_results(
+    count: int,
+    order: IntArray,
+    rank: IntArray,
+    parents: IntArray,
+    pred: IntArray,
+    succ: IntArray,
+    dist: IntArray,
+) -> None:
+    """Modifies the results of a breadth-first search in place such that they
+    look like the results of a search that was stopped by the visitor of
+    igraph after visiting the given number of vertices.
+    """
+    visited = (rank >= 0) & (rank < count)
+    has_parent = parents >= 0
+    enqueued = visited.copy()
+    enqueued[has_parent] = visited[parents[has_parent]]
+
+    # igraph sets the successor of a vertex after calling the visitor so the
+    # last vertex does not have one
+    succ[~visited | (rank == count - 1)] = -2
+
+    order[count:] = -1
+    rank[~visited] = -1
+    parents[~enqueued] = -2
+    pred[~visited] = -2
+    dist[~visited] = -1
+
+
+def _trim_dfs_results(
+    count: int,
+    order: IntArray,
+    order_out: IntArray,
+    parents: IntArray,
+    dist: IntArray,
+) -> None:
+    """Modifies the results of a depth-first search in place such that they
+    look like the results of a search that was stopped by the visitor of
+    igraph after discovering the given number of vertices.
+    """
+    # The subtree of a vertex u is completed after pre(u) + size(u) vertices
+    # have been discovered, where pre(u) is the discovery rank of u. This is
+    # equal to post(u) + 1 + dist(u) where post(u) is the completion rank of
+    # u because the vertices discovered but not completed at that point are
+    # exactly the ancestors of u. The subtrees completed before the search
+    # was stopped are those completed before the last discovery.
+    completed = order_out[order_out >= 0]
+    discoveries = np.arange(1, len(completed) + 1) + dist[completed]
+    num_completed = int(np.count_nonzero(discoveries < count))
+
+    discovered = np.zeros(len(order), dtype=bool)
+    discovered[order[:count]] = True
+
+    order[count:] = -1
+    order_out[num_completed:] = -1
+    parents[~discovered] = -2
+    dist[~discovered] = -1
@@ -5,28 +5,36 @@
 #
 # The rest of this file is generated
 from ._internal.types import (
+    AttributeCombinationFunction,
     AttributeCombinationSpecification,
     AttributeCombinationSpecificationEntry,
     BoolArray,
     EdgeLike,
     EdgeSelector,
     FileLike,
+    FlatIntArrayList,
+    FlatRealArrayList,
     IntArray,
     RealArray,
+    SparseMatrix,
     VertexLike,
     VertexPair,
     VertexSelector,
 )
 
 __all__ = (
+    "AttributeCombinationFunction",
     "AttributeCombinationSpecification",
     "AttributeCombinationSpecificationEntry",
     "BoolArray",
     "EdgeLike",
     "EdgeSelector",
     "FileLike",
+    "FlatIntArrayList",
+    "FlatRealArrayList",
     "IntArray",
     "RealArray",
+    "SparseMatrix",
     "VertexLike",
     "VertexPair",
     "VertexSelector",
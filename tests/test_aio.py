@@ -0,0 +1,62 @@
+from asyncio import CancelledError, create_task, run, sleep, to_thread
+from concurrent.futures import ThreadPoolExecutor
+from numpy.testing import assert_allclose, assert_array_equal
+from pytest import raises
+from threading import Event
+
+from igraph_ctypes import aio
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.paths import distances
+
+from igraph_ctypes._internal.functions import betweenness
+
+
+def test_functions():
+    g = create_square_lattice([10, 8])
+
+    async def main():
+        return (
+            await aio.distances(g, [0, 5], weights=[2] * g.ecount()),
+            await aio.betweenness(g),
+            await aio.community_leiden(g, 0.05, n_iterations=-1),
+        )
+
+    dist, btw, (membership, quality) = run(main())
+    assert_array_equal(dist, distances(g, [0, 5]) * 2)
+    assert_allclose(btw, betweenness(g))
+    assert membership.shape == (g.vcount(),) and quality > 0
+
+    # The starting partition is returned as is when no iterations are run
+    rows = [i // 10 for i in range(g.vcount())]
+    start, _ = run(aio.community_leiden(g, 0.05, n_iterations=0, membership=rows))
+    assert_array_equal(start, rows)
+
+
+def test_cancellation_interrupts_computation():
+    g = create_square_lattice([150, 150])
+    started = Event()
+    outcome: list[type] = []
+
+    def job():
+        started.set()
+        try:
+            return betweenness(g)
+        except BaseException as ex:
+            outcome.append(type(ex))
+            raise
+
+    async def main(executor):
+        task = create_task(aio.run(job, executor=executor))
+        await to_thread(started.wait)
+        await sleep(0.1)
+        task.cancel()
+        with raises(CancelledError):
+            await task
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        run(main(executor))
+
+        # The worker thread must remain usable afterwards
+        assert executor.submit(betweenness, create_square_lattice([3])).result()[1] == 1
+
+    assert outcome == [CancelledError]
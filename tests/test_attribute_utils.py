@@ -1,4 +1,5 @@
 from numpy import inf, nan, bool_, int_, object_
+from numpy.dtypes import StringDType
 
 from igraph_ctypes._internal.enums import AttributeType
 from igraph_ctypes._internal.types import (
@@ -59,7 +60,7 @@ def test_python_type_to_igraph_attribute_type(input, expected):
         ((False, True), np_type_of_igraph_bool_t),
         ((False, 123, True), np_type_of_igraph_real_t),
         ((123, False, True), np_type_of_igraph_real_t),
-        (("spam", "ham", "bacon"), object_),
+        (("spam", "ham", "bacon"), StringDType()),
         (("spam", 123), object_),
         ((123, "spam"), object_),
         ((None,), object_),
@@ -6,6 +6,7 @@ from igraph_ctypes._internal.attributes.value_list import (
 
 from itertools import count, islice
 from numpy import array, ndarray, bool_
+from numpy.dtypes import StringDType
 from numpy.testing import assert_array_equal
 from pytest import fixture, mark, raises
 
@@ -440,3 +441,21 @@ def test_casting():
 
     assert items.type == AttributeType.OBJECT
     assert list(items) == ["False", "True", "True", "False", "True"]
+
+
+def test_string_storage():
+    items = AVL(["foo", "", "árvíztűrő"])
+    assert items.dtype == StringDType()
+    assert array(items).dtype == StringDType()
+
+    items._extend_length_by(2)
+    items[3] = "bar"
+    assert list(items) == ["foo", "", "árvíztűrő", "bar", ""]
+    assert all(type(item) is str for item in items)
+
+    del items[1]
+    assert list(items) == ["foo", "árvíztűrő", "bar", ""]
+
+    items.cast(object)
+    assert array(items).dtype == object
+    assert list(items) == ["foo", "árvíztűrő", "bar", ""]
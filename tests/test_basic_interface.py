@@ -1,7 +1,10 @@
 from numpy import array
+from numpy.testing import assert_array_equal
+from pickle import dumps, loads
 from pytest import raises
 
 from igraph_ctypes._internal.enums import NeighborMode
+from igraph_ctypes._internal.functions import get_edgelist
 from igraph_ctypes.constructors import create_empty_graph
 from igraph_ctypes.errors import IgraphError
 from igraph_ctypes.graph import Graph
@@ -186,3 +189,46 @@ def test_incident_directed():
                 (i - 1) % n,
             ]
         )
+
+
+def test_pickle():
+    g = create_mutual_ring(6)
+    g.attrs["name"] = "ring"
+    g.vattrs.set("label", [f"v{i}" for i in range(6)])
+    g.vattrs.set("visited", [i % 2 == 0 for i in range(6)])
+    g.eattrs.set("weight", [i * 0.5 for i in range(12)])
+
+    for protocol in (2, 5):
+        g2 = loads(dumps(g, protocol=protocol))
+        assert g2.vcount() == 6 and g2.is_directed()
+        assert_array_equal(get_edgelist(g2), get_edgelist(g))
+        assert g2.attrs == {"name": "ring"}
+        assert g2.vattrs["label"] == g.vattrs["label"]
+        assert g2.vattrs["visited"] == g.vattrs["visited"]
+        assert g2.eattrs["weight"] == g.eattrs["weight"]
+
+    assert_array_equal(get_edgelist(loads(dumps(Graph()))), [])
+
+
+def test_pickle_out_of_band_buffers():
+    g = create_ring(5, directed=True)
+    g.eattrs.set("weight", [1.0, 2.0, 3.0, 4.0, 5.0])
+    g.eattrs.set("label", list("abcde"))
+
+    buffers = []
+    data = dumps(g, protocol=5, buffer_callback=buffers.append)
+
+    # Edge list and numeric attribute are out-of-band; strings are not
+    assert len(buffers) == 2
+
+    g2 = loads(data, buffers=[bytearray(buf) for buf in buffers])
+    assert_array_equal(get_edgelist(g2), get_edgelist(g))
+    assert g2.eattrs["weight"] == g.eattrs["weight"]
+    assert g2.eattrs["label"] == g.eattrs["label"]
+
+    # The unpickled graph must be modifiable, even with read-only buffers
+    g3 = loads(data, buffers=buffers)
+    for graph in (g2, g3):
+        graph.add_edges([(0, 2), (1, 3)])
+        graph.eattrs["weight"][0] = 10
+        assert list(graph.eattrs["weight"]) == [10.0, 2.0, 3.0, 4.0, 5.0, 0.0, 0.0]
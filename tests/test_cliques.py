@@ -0,0 +1,104 @@
+import signal
+
+from pytest import raises
+from time import monotonic
+
+from igraph_ctypes.cliques import iter_cliques, iter_maximal_cliques
+from igraph_ctypes.constructors import (
+    create_geometric_random_graph,
+    create_square_lattice,
+)
+from igraph_ctypes.timeouts import time_limit
+
+from igraph_ctypes._internal.functions import cliques, full, maximal_cliques
+
+
+def flatten(batches):
+    result = []
+    for values, offsets in batches:
+        assert offsets[0] == 0 and offsets[-1] == len(values)
+        result.extend(
+            tuple(sorted(values[start:end]))
+            for start, end in zip(offsets[:-1], offsets[1:], strict=True)
+        )
+    return sorted(result)
+
+
+def as_sorted_tuples(items):
+    return sorted(tuple(sorted(item)) for item in items)
+
+
+def test_iter_maximal_cliques():
+    g = create_geometric_random_graph(300, 0.1)
+    expected = as_sorted_tuples(maximal_cliques(g))
+
+    for batch_size in (1, 7, 4096):
+        batches = list(iter_maximal_cliques(g, batch_size=batch_size))
+        assert all(len(offsets) <= batch_size + 1 for _, offsets in batches)
+        assert flatten(batches) == expected
+
+    expected = as_sorted_tuples(maximal_cliques(g, min_size=4, max_size=5))
+    assert flatten(iter_maximal_cliques(g, 4, 5, batch_size=10)) == expected
+
+
+def test_iter_cliques():
+    g = full(6)
+    expected = as_sorted_tuples(cliques(g, min_size=2, max_size=4))
+    assert flatten(iter_cliques(g, 2, 4, batch_size=8)) == expected
+
+
+def test_stop_iteration_early():
+    # A full graph on 25 vertices has more than 33 million cliques
+    g = full(25)
+
+    batches = iter_cliques(g, batch_size=100)
+    values, offsets = next(batches)
+    assert len(offsets) == 101
+    batches.close()
+
+    count = 0
+    for _ in iter_maximal_cliques(g, batch_size=1):
+        count += 1
+    assert count == 1
+
+    for count, _ in enumerate(iter_cliques(g, batch_size=10)):
+        if count == 3:
+            break
+
+
+def test_invalid_batch_size():
+    with raises(ValueError, match="batch size"):
+        next(iter_cliques(full(3), batch_size=0))
+
+
+def _slow_search():
+    # Takes several seconds without finding any cliques of this size
+    return iter_maximal_cliques(create_square_lattice([400, 400]), min_size=3)
+
+
+def test_iter_maximal_cliques_respects_deadline_of_consumer():
+    start = monotonic()
+    with raises(TimeoutError), time_limit(0.1):
+        list(_slow_search())
+    assert monotonic() - start < 2
+
+
+def test_iter_maximal_cliques_stops_when_consumer_is_interrupted():
+    class Interrupted(Exception):
+        pass
+
+    def handler(signum, frame):
+        raise Interrupted()
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    start = monotonic()
+    try:
+        signal.setitimer(signal.ITIMER_REAL, 0.1)
+        with raises(Interrupted):
+            next(_slow_search())
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    # The generator must not wait until the search finds the next clique
+    assert monotonic() - start < 2
@@ -1,6 +1,8 @@
 import pytest
 
-from numpy import array
+from ctypes import c_void_p, cast
+from numpy import arange, array, asfortranarray, int32, memmap, zeros
+from numpy.dtypes import StringDType
 
 from igraph_ctypes.constructors import create_empty_graph
 from igraph_ctypes.enums import EdgeSequenceType, VertexSequenceType
@@ -9,32 +11,50 @@ from igraph_ctypes._internal.conversion import (
     edgelike_to_igraph_int_t,
     edge_selector_to_igraph_es_t,
     igraph_matrix_t_to_numpy_array,
+    igraph_matrix_t_to_numpy_array_in_place,
+    igraph_matrix_t_to_numpy_array_transfer,
     igraph_matrix_int_t_to_numpy_array,
+    igraph_matrix_int_t_to_numpy_array_transfer,
+    igraph_strvector_t_to_list,
+    igraph_strvector_t_to_numpy_array,
     igraph_vector_t_to_list,
     igraph_vector_t_to_numpy_array,
+    igraph_vector_t_to_numpy_array_transfer,
     igraph_vector_t_to_numpy_array_view,
     igraph_vector_bool_t_to_list,
     igraph_vector_bool_t_to_numpy_array,
     igraph_vector_bool_t_to_numpy_array_view,
     igraph_vector_int_t_to_list,
     igraph_vector_int_t_to_numpy_array,
+    igraph_vector_int_t_to_numpy_array_transfer,
     igraph_vector_int_t_to_numpy_array_view,
+    igraph_vector_int_list_t_to_flat_numpy_arrays,
     igraph_vector_int_list_t_to_list_of_numpy_array,
+    igraph_vector_list_t_to_flat_numpy_arrays,
     igraph_vector_list_t_to_list_of_numpy_array,
     iterable_of_iterable_to_igraph_vector_list_t,
     iterable_of_iterable_to_igraph_vector_int_list_t,
+    iterable_to_igraph_strvector_t_view,
     iterable_to_igraph_vector_bool_t,
     iterable_to_igraph_vector_int_t,
     iterable_to_igraph_vector_t,
+    iterable_to_igraph_vector_t_view,
+    iterable_vertex_indices_to_igraph_vector_int_t,
     sequence_to_igraph_matrix_t,
+    sequence_to_igraph_matrix_t_view,
     sequence_to_igraph_matrix_int_t,
+    sequence_to_igraph_matrix_int_t_view,
     vertexlike_to_igraph_int_t,
+    vertex_pairs_to_igraph_vector_int_t,
     vertex_selector_to_igraph_vs_t,
+    _encode_variable_width_strings,
 )
+from igraph_ctypes._internal.lib import igraph_strvector_update
 from igraph_ctypes._internal.types import igraph_bool_t, igraph_int_t
 from igraph_ctypes._internal.wrappers import (
     _Matrix,
     _MatrixInt,
+    _StrVector,
     _Vector,
     _VectorBool,
     _VectorInt,
@@ -187,6 +207,55 @@ def test_real_vector_view_roundtrip():
     assert restored.data == another_restored.data
 
 
+def test_vector_conversion_from_generators():
+    converted = iterable_to_igraph_vector_int_t(x * 2 for x in range(5))
+    assert igraph_vector_int_t_to_list(converted) == [0, 2, 4, 6, 8]
+
+    converted = iterable_to_igraph_vector_t(x / 2 for x in range(5))
+    assert igraph_vector_t_to_list(converted) == [0, 0.5, 1, 1.5, 2]
+
+    converted = iterable_to_igraph_vector_bool_t(x % 2 for x in range(5))
+    assert igraph_vector_bool_t_to_list(converted) == [False, True] * 2 + [False]
+
+    converted = iterable_to_igraph_vector_int_t(iter([]))
+    assert igraph_vector_int_t_to_list(converted) == []
+
+    with pytest.raises(TypeError):
+        iterable_to_igraph_vector_int_t([1, 2.5, 3])
+
+
+def test_vertex_indices_conversion():
+    converted = iterable_vertex_indices_to_igraph_vector_int_t(range(3, 7))
+    assert igraph_vector_int_t_to_list(converted) == [3, 4, 5, 6]
+
+    converted = iterable_vertex_indices_to_igraph_vector_int_t([])
+    assert igraph_vector_int_t_to_list(converted) == []
+
+    with pytest.raises(ValueError, match="-2 cannot be converted"):
+        iterable_vertex_indices_to_igraph_vector_int_t([1, -2, 3])
+
+    with pytest.raises(ValueError, match="2.5 cannot be converted"):
+        iterable_vertex_indices_to_igraph_vector_int_t(iter([1, 2.5, 3]))
+
+
+def test_vertex_pairs_conversion():
+    pairs = [(0, 1), (1, 2), (2, 0)]
+    converted = vertex_pairs_to_igraph_vector_int_t(pairs)
+    assert igraph_vector_int_t_to_list(converted) == [0, 1, 1, 2, 2, 0]
+
+    converted = vertex_pairs_to_igraph_vector_int_t(iter(pairs))
+    assert igraph_vector_int_t_to_list(converted) == [0, 1, 1, 2, 2, 0]
+
+    converted = vertex_pairs_to_igraph_vector_int_t([])
+    assert igraph_vector_int_t_to_list(converted) == []
+
+    with pytest.raises(ValueError, match="-1 cannot be converted"):
+        vertex_pairs_to_igraph_vector_int_t([(0, 1), (2, -1)])
+
+    with pytest.raises(ValueError):
+        vertex_pairs_to_igraph_vector_int_t([(0, 1, 2), (2, 3, 4)])
+
+
 def test_int_matrix_roundtrip():
     input = [
         [0, 1, 2, 3, 4],
@@ -233,6 +302,151 @@ def test_real_matrix_roundtrip():
     assert (restored_array == expected_array).all()
 
 
+def test_matrix_view():
+    expected = asfortranarray(arange(12.0).reshape(4, 3))
+
+    converted = sequence_to_igraph_matrix_t_view(expected)
+    assert isinstance(converted, _Matrix)
+    assert not converted.initialized
+
+    restored_array = igraph_matrix_t_to_numpy_array(converted)
+    assert (restored_array == expected).all()
+
+    # Modifying the source array must be visible through the view
+    expected[2, 1] = 42
+    restored_array = igraph_matrix_t_to_numpy_array(converted)
+    assert restored_array[2, 1] == 42
+
+    # Arrays with the wrong layout or data type are copied first
+    expected = arange(12, dtype=int32).reshape(4, 3)
+    converted = sequence_to_igraph_matrix_int_t_view(expected)
+    assert isinstance(converted, _MatrixInt)
+    restored_array = igraph_matrix_int_t_to_numpy_array(converted)
+    assert (restored_array == expected).all()
+
+    expected = array([[1, 2, 3], [4, 5, 6]])
+    converted = sequence_to_igraph_matrix_t_view(expected)
+    restored_array = igraph_matrix_t_to_numpy_array(converted)
+    assert (restored_array == expected).all()
+
+
+def test_memmap_views(tmp_path):
+    filename = tmp_path / "data.bin"
+    data = memmap(filename, dtype=float, mode="w+", shape=(12,))
+    data[:] = arange(12)
+    data.flush()
+
+    # Read-only memory maps must be wrapped without copying them
+    data = memmap(filename, dtype=float, mode="r", shape=(12,))
+    converted = iterable_to_igraph_vector_t_view(data)
+    assert cast(converted.unwrap().stor_begin, c_void_p).value == data.ctypes.data
+    assert igraph_vector_t_to_list(converted) == list(range(12))
+
+    data = memmap(filename, dtype=float, mode="r", shape=(4, 3), order="F")
+    converted = sequence_to_igraph_matrix_t_view(data)
+    assert cast(converted.unwrap().data.stor_begin, c_void_p).value == data.ctypes.data
+    assert (igraph_matrix_t_to_numpy_array(converted) == data).all()
+
+
+def test_matrix_in_place_conversion():
+    target = zeros((2, 3))
+    converted = sequence_to_igraph_matrix_t([[1, 2, 3], [4, 5, 6]])
+    result = igraph_matrix_t_to_numpy_array_in_place(converted, target)
+    assert result is target
+    assert target.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+    # Targets with a different shape or data type are left intact
+    target = zeros((3, 2))
+    converted = sequence_to_igraph_matrix_t([[1, 2, 3], [4, 5, 6]])
+    result = igraph_matrix_t_to_numpy_array_in_place(converted, target)
+    assert result is not target
+    assert result.tolist() == [[1, 2, 3], [4, 5, 6]]
+    assert (target == 0).all()
+
+    target = zeros((2, 3), dtype=int)
+    converted = sequence_to_igraph_matrix_t([[1, 2, 3], [4, 5, 6]])
+    result = igraph_matrix_t_to_numpy_array_in_place(converted, target)
+    assert result is not target
+    assert (target == 0).all()
+
+
+def test_vector_transfer():
+    expected = arange(100000)
+
+    converted = iterable_to_igraph_vector_int_t(expected)
+    restored_array = igraph_vector_int_t_to_numpy_array_transfer(converted)
+    assert (restored_array == expected).all()
+    assert restored_array.base is not None
+    assert igraph_vector_int_t_to_list(converted) == []
+
+    converted = iterable_to_igraph_vector_t(expected)
+    restored_array = igraph_vector_t_to_numpy_array_transfer(converted)
+    assert (restored_array == expected).all()
+    assert restored_array.base is not None
+    assert igraph_vector_t_to_list(converted) == []
+
+    # Slices of the transferred array must remain valid after the array itself
+    # is gone
+    restored_array = restored_array[-5:]
+    assert list(restored_array) == [99995, 99996, 99997, 99998, 99999]
+
+    # Small vectors are copied
+    converted = iterable_to_igraph_vector_int_t([1, 2, 3])
+    restored_array = igraph_vector_int_t_to_numpy_array_transfer(converted)
+    assert list(restored_array) == [1, 2, 3]
+    assert restored_array.base is None
+    assert igraph_vector_int_t_to_list(converted) == [1, 2, 3]
+
+
+def test_matrix_transfer():
+    expected = arange(100000).reshape(400, 250)
+
+    converted = sequence_to_igraph_matrix_int_t(expected)
+    restored_array = igraph_matrix_int_t_to_numpy_array_transfer(converted)
+    assert restored_array.shape == (400, 250)
+    assert (restored_array == expected).all()
+    assert restored_array.base is not None
+
+    converted = sequence_to_igraph_matrix_t(expected)
+    restored_array = igraph_matrix_t_to_numpy_array_transfer(converted)
+    assert restored_array.shape == (400, 250)
+    assert (restored_array == expected).all()
+    assert restored_array.base is not None
+
+
+@pytest.mark.parametrize(
+    "test_input,expected_output",
+    [
+        (["foo", "", "árvíztűrő", "bar"], ["foo", "", "árvíztűrő", "bar"]),
+        ([1, None, 2.5, "x\0y"], ["1", "None", "2.5", "x"]),
+        (array(["foo", "", "tükörfúró"]), ["foo", "", "tükörfúró"]),
+        (array([b"foo", b"", b"ba"]), ["foo", "", "ba"]),
+        (array(["a", "b", "c", "d"]).reshape(2, 2), ["a", "b", "c", "d"]),
+        (
+            array(["foo", "", "tükörfúró", "x" * 1000], dtype=StringDType()),
+            ["foo", "", "tükörfúró", "x" * 1000],
+        ),
+        ((str(i) for i in range(5)), ["0", "1", "2", "3", "4"]),
+        ([], []),
+    ],
+)
+def test_str_vector_roundtrip(test_input, expected_output):
+    converted = iterable_to_igraph_strvector_t_view(test_input)
+    assert isinstance(converted, _StrVector)
+
+    # Views must not be passed on to functions that modify them, so copy
+    # the view into a string vector owned by igraph first
+    copied = _StrVector.create(0)
+    igraph_strvector_update(copied, converted)
+
+    assert igraph_strvector_t_to_list(copied) == expected_output
+    assert igraph_strvector_t_to_list(converted) == expected_output
+
+    restored = igraph_strvector_t_to_numpy_array(copied)
+    assert restored.dtype == StringDType()
+    assert restored.tolist() == expected_output
+
+
 def test_int_vector_list_roundtrip():
     input = [
         [0, 1, 2, 3, 4],
@@ -269,6 +483,29 @@ def test_vector_list_roundtrip():
         assert (array(original_item) == restored_item).all()
 
 
+def test_int_vector_list_to_flat_arrays():
+    input = [[0, 1, 2, 3, 4], [], [10, 11, 12, 13], [20]]
+
+    converted = iterable_of_iterable_to_igraph_vector_int_list_t(input)
+    values, offsets = igraph_vector_int_list_t_to_flat_numpy_arrays(converted)
+    assert values.tolist() == [0, 1, 2, 3, 4, 10, 11, 12, 13, 20]
+    assert offsets.tolist() == [0, 5, 5, 9, 10]
+
+    converted = iterable_of_iterable_to_igraph_vector_int_list_t([])
+    values, offsets = igraph_vector_int_list_t_to_flat_numpy_arrays(converted)
+    assert values.tolist() == []
+    assert offsets.tolist() == [0]
+
+
+def test_vector_list_to_flat_arrays():
+    input = [[0.123, 1.456], [10, 11, 12, 13.234], []]
+
+    converted = iterable_of_iterable_to_igraph_vector_list_t(input)
+    values, offsets = igraph_vector_list_t_to_flat_numpy_arrays(converted)
+    assert values.tolist() == [0.123, 1.456, 10, 11, 12, 13.234]
+    assert offsets.tolist() == [0, 2, 6, 6]
+
+
 def test_vertex_selector():
     g = create_empty_graph(5)
 
@@ -318,3 +555,23 @@ def test_edge_selector():
 
     with pytest.raises(ValueError):
         edge_selector_to_igraph_es_t(..., g)  # type: ignore
+
+
+def test_str_vector_conversion_in_chunks():
+    items = array([f"item{i}" for i in range(10)] + ["é" * 300], dtype=StringDType())
+    buffer, offsets = _encode_variable_width_strings(items, chunk_size=4)
+
+    strings = [bytes(buffer[offset:]).partition(b"\0")[0] for offset in offsets]
+    assert [s.decode("utf-8") for s in strings] == items.tolist()
+
+
+def test_str_vector_conversion_with_mixed_lengths():
+    items = array([f"v{i % 1000}" for i in range(5000)], dtype=StringDType())
+    items[1234] = "x" * 20000
+    buffer, offsets = _encode_variable_width_strings(items)
+
+    # Short strings must not be padded to the length of the longest one
+    assert len(buffer) < 2 * (sum(map(len, items.tolist())) + len(items))
+
+    strings = [bytes(buffer[offset:]).partition(b"\0")[0] for offset in offsets]
+    assert [s.decode("utf-8") for s in strings] == items.tolist()
@@ -0,0 +1,72 @@
+import gc
+
+from numpy.testing import assert_array_equal
+from pytest import raises
+
+from igraph_ctypes.constructors import create_graph_from_edge_list
+from igraph_ctypes.graph_list import GraphList
+
+from igraph_ctypes._internal.functions import (
+    decompose,
+    disjoint_union_many,
+    neighborhood_graphs,
+)
+
+
+def test_decompose():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 3, 4, 5, 5], directed=False)
+    parts = decompose(g)
+
+    assert isinstance(parts, GraphList)
+    assert len(parts) == 3
+    assert_array_equal(parts.vcounts(), [3, 2, 1])
+    assert_array_equal(parts.ecounts(), [2, 1, 1])
+    assert_array_equal(parts.is_directed(), [False, False, False])
+
+    parts = decompose(g, minelements=2)
+    assert_array_equal(parts.vcounts(), [3, 2])
+
+
+def test_lazy_wrapping():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 3, 4, 5, 5])
+    g.vattrs["name"] = ["a", "b", "c", "d", "e", "f"]
+    parts = decompose(g)
+
+    part = parts[1]
+    assert parts[1] is part
+    assert parts[-2] is part
+    assert part.vcount() == 2 and part.ecount() == 1 and part.is_directed()
+    assert list(part.vattrs["name"]) == ["d", "e"]
+
+    # Sizes of graphs that were moved out of the list are still reported
+    assert_array_equal(parts.vcounts(), [3, 2, 1])
+    assert_array_equal(parts.ecounts(), [2, 1, 1])
+
+    assert [p.vcount() for p in parts[::2]] == [3, 1]
+    assert [p.vcount() for p in parts] == [3, 2, 1]
+
+    with raises(IndexError):
+        parts[3]
+    with raises(IndexError):
+        parts[-4]
+
+    # Retrieved graphs outlive the list
+    del parts
+    gc.collect()
+    assert part.ecount() == 1
+
+
+def test_neighborhood_graphs():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3, 3, 4], directed=False)
+    parts = neighborhood_graphs(g, [0, 2], 1)
+    assert_array_equal(parts.vcounts(), [2, 3])
+    assert_array_equal(parts.ecounts(), [1, 2])
+
+
+def test_disjoint_union_many():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 3, 4, 5, 5])
+    union = disjoint_union_many(decompose(g))
+    assert union.vcount() == 6 and union.ecount() == 4
+
+    union = disjoint_union_many([g, g])
+    assert union.vcount() == 12 and union.ecount() == 8
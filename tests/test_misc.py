@@ -1,6 +1,58 @@
+import subprocess
+import sys
+
+from pytest import raises
+
+from igraph_ctypes._internal import lib
 from igraph_ctypes._internal.functions import strerror, version
 
 
+def test_lazy_library_functions():
+    name = "igraph_is_tree"
+    assert name in dir(lib)
+
+    func = getattr(lib, name)
+    assert vars(lib)[name] is func
+    assert func.argtypes and func.restype is not None
+
+    with raises(AttributeError):
+        lib.igraph_no_such_function  # noqa: B018
+
+
+def test_lazy_import():
+    # Needs a fresh interpreter as the modules are already imported here
+    code = "\n".join(
+        [
+            "import sys, igraph_ctypes",
+            "from igraph_ctypes._internal import lib",
+            "assert 'igraph_ctypes._internal.functions' not in sys.modules",
+            "assert 'igraph_is_tree' not in vars(lib)",
+            "assert igraph_ctypes.Graph(3).vcount() == 3",
+            "assert 'igraph_ctypes._internal.functions' in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_import_from_multiple_threads():
+    # Needs a fresh interpreter as the modules are already imported here
+    code = "\n".join(
+        [
+            "from concurrent.futures import ThreadPoolExecutor",
+            "from threading import Barrier",
+            "from igraph_ctypes._internal.utils import lazy_import",
+            "functions = lazy_import('igraph_ctypes._internal.functions')",
+            "barrier = Barrier(8)",
+            "def access(_):",
+            "    barrier.wait()",
+            "    return functions.is_tree",
+            "with ThreadPoolExecutor(8) as executor:",
+            "    assert len(set(executor.map(access, range(8)))) == 1",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_strerror():
     assert strerror(0) == "No error"
     assert strerror(1) == "Failed"
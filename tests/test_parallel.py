@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+from numpy import arange
+from numpy.testing import assert_allclose, assert_array_equal
+from pytest import fixture
+
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.enums import NeighborMode
+from igraph_ctypes.parallel import betweenness_subset, community_leiden, distances
+from igraph_ctypes.paths import distances as sequential_distances
+
+from igraph_ctypes._internal.functions import (
+    betweenness,
+    betweenness_subset as sequential_betweenness_subset,
+)
+
+
+@fixture
+def lattice():
+    return create_square_lattice([12, 10], directed=False, periodic=False)
+
+
+def test_distances(lattice):
+    assert_array_equal(distances(lattice, max_workers=3), sequential_distances(lattice))
+
+    sources, targets = list(range(3, 100, 7)), [0, 5, 119]
+    weights = arange(lattice.ecount()) % 4 + 1
+    expected = sequential_distances(lattice, sources, targets, weights=weights)
+    for num_blocks in (1, 4, 100):
+        result = distances(
+            lattice,
+            sources,
+            targets,
+            NeighborMode.ALL,
+            weights,
+            num_blocks=num_blocks,
+            max_workers=2,
+        )
+        assert_array_equal(result, expected)
+
+    assert distances(lattice, [], max_workers=2).shape == (0, 120)
+
+
+def test_betweenness_subset(lattice):
+    assert_allclose(betweenness_subset(lattice, max_workers=3), betweenness(lattice))
+
+    sources, targets = range(0, 120, 3), [0, 119, 60]
+    expected = sequential_betweenness_subset(lattice, None, list(sources), targets)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = betweenness_subset(
+            lattice, None, sources, targets, num_blocks=5, executor=executor
+        )
+    assert_allclose(result, expected)
+
+    assert_array_equal(betweenness_subset(lattice, sources=[], vids=[1, 2]), [0, 0])
+
+
+def test_community_leiden(lattice):
+    seeds = [1, 2, 3, 1]
+    memberships, qualities = community_leiden(
+        lattice, 0.05, seeds, n_iterations=-1, max_workers=2
+    )
+
+    assert memberships.shape == (4, lattice.vcount())
+    assert qualities.shape == (4,)
+    assert (memberships >= 0).all()
+
+    # Runs with the same seed must yield the same results
+    assert_array_equal(memberships[0], memberships[3])
+    assert qualities[0] == qualities[3]
+
+    again, _ = community_leiden(lattice, 0.05, [2], n_iterations=-1)
+    assert_array_equal(again[0], memberships[1])
+
+
+def test_community_leiden_from_initial_partition(lattice):
+    memberships, qualities = community_leiden(lattice, 0.05, [1], n_iterations=-1)
+
+    # A converged partition does not change any more
+    again, again_qualities = community_leiden(
+        lattice, 0.05, [2, 3], n_iterations=1, membership=memberships[0]
+    )
+    assert_array_equal(again, [memberships[0]] * 2)
+    assert_allclose(again_qualities, qualities[0])
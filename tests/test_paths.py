@@ -1,8 +1,13 @@
-from numpy import array
+from numpy import array, concatenate, isinf, memmap, zeros
 from numpy.testing import assert_array_equal
 from pytest import raises
 
-from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.constructors import (
+    create_graph_from_edge_list,
+    create_square_lattice,
+)
+from igraph_ctypes._internal.functions import distances, get_shortest_paths
+from igraph_ctypes import paths
 from igraph_ctypes.paths import shortest_path
 
 
@@ -28,3 +33,88 @@ def test_shortest_path():
 
     with raises(ValueError, match="unknown method"):
         shortest_path(g, 0, 11, weights=weights, method="spam")
+
+
+def test_distances_matrix_orientation():
+    g = create_graph_from_edge_list([0, 1, 1, 2], directed=True)
+
+    dist = distances(g)
+    assert dist[0, 2] == 2
+    assert isinf(dist[2, 0])
+
+
+def test_get_shortest_paths_flat():
+    g = create_square_lattice([4, 3])
+
+    vertices, edges, _, _ = get_shortest_paths(g, 0, to=[3, 11])
+    flat_vertices, vertex_offsets = get_shortest_paths(g, 0, to=[3, 11], flat=True)[0]
+    assert_array_equal(vertex_offsets, array([0, 4, 10]))
+    assert_array_equal(flat_vertices, concatenate(vertices))
+
+
+def test_distances_with_output_array(tmp_path):
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3], directed=True)
+    expected = paths.distances(g, [0, 2], [1, 2, 3])
+
+    out = zeros((2, 3))
+    assert paths.distances(g, [0, 2], [1, 2, 3], out=out) is out
+    assert_array_equal(out, expected)
+
+    out = zeros((2, 3), order="F")
+    assert paths.distances(g, [0, 2], [1, 2, 3], out=out) is out
+    assert_array_equal(out, expected)
+
+    out = memmap(tmp_path / "dist.bin", dtype=float, mode="w+", shape=(4, 4))
+    paths.distances(g, weights=[1, 2, 3], out=out)
+    out.flush()
+    out = memmap(tmp_path / "dist.bin", dtype=float, mode="r", shape=(4, 4))
+    assert_array_equal(out, paths.distances(g, weights=[1, 2, 3]))
+
+    with raises(ValueError, match="must have shape"):
+        paths.distances(g, [0, 2], out=zeros((2, 3)))
+    with raises(TypeError, match="must be an array of"):
+        paths.distances(g, out=zeros((4, 4), dtype=int))
+
+    # Weights may be given as any iterable, and negative ones must be noticed
+    out = zeros((4, 4))
+    paths.distances(g, weights=(w for w in [1, -2, 3]), out=out)
+    assert_array_equal(out, paths.distances(g, weights=[1, -2, 3]))
+
+
+def test_shortest_path_astar():
+    g = create_square_lattice([4, 3])
+    coords = array([(i % 4, i // 4) for i in range(g.vcount())])
+
+    weights = [2] * g.ecount()
+    expected_path = [0, 4, 5, 6, 7, 11]
+    for u, v in zip(expected_path, expected_path[1:], strict=False):
+        weights[g.get_edge_id(u, v)] = 1
+
+    for metric in ("euclidean", "manhattan", "chebyshev"):
+        path = paths.shortest_path_astar(
+            g, 0, 11, weights=weights, coords=coords, metric=metric
+        )
+        assert_array_equal(path, array(expected_path))
+
+    calls = []
+
+    def heuristic(u, v):
+        calls.append((u, v))
+        return abs(coords[u] - coords[v]).sum()
+
+    path = paths.shortest_path_astar(g, 0, 11, heuristic, weights=weights)
+    assert_array_equal(path, array(expected_path))
+    assert calls and all(v == 11 for _, v in calls)
+
+    path = paths.shortest_path_astar(g, 0, 11)
+    assert len(path) == 6 and path[0] == 0 and path[-1] == 11
+
+    def failing_heuristic(u, v):
+        raise ZeroDivisionError
+
+    with raises(ZeroDivisionError):
+        paths.shortest_path_astar(g, 0, 11, failing_heuristic)
+    with raises(ValueError, match="unknown metric"):
+        paths.shortest_path_astar(g, 0, 11, coords=coords, metric="spam")
+    with raises(ValueError, match="one row for each vertex"):
+        paths.shortest_path_astar(g, 0, 11, coords=coords[:5])
@@ -0,0 +1,77 @@
+from pytest import raises
+
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.progress import progress_handler
+
+from igraph_ctypes._internal.functions import betweenness
+
+
+class FakeProgressBar:
+    def __init__(self):
+        self.n = 0
+        self.description = ""
+        self.resets = 0
+
+    def update(self, n=1):
+        self.n += n
+
+    def reset(self):
+        self.n = 0
+        self.resets += 1
+
+    def set_description(self, desc, refresh=True):
+        self.description = desc
+
+
+def test_progress_handler():
+    g = create_square_lattice([10, 10])
+    reports = []
+
+    with progress_handler(lambda *args: reports.append(args), min_interval=0):
+        betweenness(g)
+
+    assert len(reports) > 10
+    assert all(message == "Betweenness centrality" for message, _ in reports)
+    percentages = [percent for _, percent in reports]
+    assert percentages == sorted(percentages)
+    assert percentages[-1] == 100
+
+    # No reports outside the context
+    num_reports = len(reports)
+    betweenness(g)
+    assert len(reports) == num_reports
+
+
+def test_progress_handler_throttling():
+    g = create_square_lattice([10, 10])
+    reports = []
+
+    with progress_handler(lambda *args: reports.append(args), min_interval=3600):
+        betweenness(g)
+
+    # First report and the one signalling completion
+    assert [percent for _, percent in reports] == [0, 100]
+
+
+def test_progress_bar():
+    g = create_square_lattice([10, 10])
+    bar = FakeProgressBar()
+
+    with progress_handler(bar, min_interval=0):
+        betweenness(g)
+        assert bar.n == 100 and bar.description == "Betweenness centrality"
+        betweenness(g)
+        assert bar.n == 100 and bar.resets == 1
+
+
+def test_exception_in_progress_handler():
+    def reporter(message, percent):
+        if percent > 50:
+            raise ValueError("enough")
+
+    g = create_square_lattice([10, 10])
+    with raises(ValueError, match="enough"):
+        with progress_handler(reporter, min_interval=0):
+            betweenness(g)
+
+    assert len(betweenness(g)) == 100
@@ -0,0 +1,121 @@
+from numpy.testing import assert_array_equal
+from pytest import warns
+
+from igraph_ctypes.enums import AddWeights, AttributeType
+from igraph_ctypes.errors import IgraphWarning
+from igraph_ctypes.io import (
+    read_graph_dimacs_flow,
+    read_graph_gml,
+    read_graph_graphml,
+    read_graph_lgl,
+    read_graph_ncol,
+    read_graph_pajek,
+)
+
+from igraph_ctypes._internal.functions import get_edgelist
+
+
+def test_read_graph_ncol(datadir):
+    g = read_graph_ncol(
+        datadir / "simple_graph.ncol",
+        names=False,
+        weights=AddWeights.NO,
+        directed=False,
+    )
+    assert g.vcount() == 4
+    assert not g.is_directed()
+    assert_array_equal(get_edgelist(g), [0, 1, 1, 2, 2, 3, 1, 3])
+
+
+def test_read_graph_lgl(datadir):
+    g = read_graph_lgl(
+        datadir / "simple_graph.lgl", names=False, weights=AddWeights.NO
+    )
+    assert g.vcount() == 4
+    assert_array_equal(get_edgelist(g), [0, 1, 1, 2, 1, 3, 2, 3])
+
+
+def test_read_graph_dimacs_flow(datadir):
+    g, problem, labels, source, target, capacity = read_graph_dimacs_flow(
+        datadir / "flow.dimacs"
+    )
+    assert g.vcount() == 4 and g.ecount() == 5
+    assert g.is_directed()
+    assert problem == ["max"]
+    assert len(labels) == 0
+    assert (source, target) == (0, 3)
+    assert_array_equal(capacity, [3, 2, 1, 2, 3])
+
+
+def test_read_graph_ncol_with_attributes(datadir):
+    g = read_graph_ncol(datadir / "graph_with_attributes.ncol", directed=False)
+    assert g.vcount() == 7 and g.ecount() == 9
+    assert list(g.vattrs["name"][:3]) == ["Alice", "Bob", "Claire"]
+    assert g.eattrs["weight"].type == AttributeType.NUMERIC
+    assert list(g.eattrs["weight"][:3]) == [4, 2, 5]
+
+    with warns(IgraphWarning, match="predefined names extended"):
+        g = read_graph_ncol(
+            datadir / "graph_with_attributes.ncol",
+            predefnames=["George", "Frank"],
+            weights=AddWeights.NO,
+        )
+    assert list(g.vattrs["name"][:3]) == ["George", "Frank", "Alice"]
+    assert "weight" not in g.eattrs
+
+
+def test_read_graph_lgl_with_attributes(datadir):
+    g = read_graph_lgl(datadir / "graph_with_attributes.lgl", directed=False)
+    assert g.vcount() == 7 and g.ecount() == 9
+    assert sorted(g.vattrs["name"]) == [
+        "Alice",
+        "Bob",
+        "Claire",
+        "Dennis",
+        "Esther",
+        "Frank",
+        "George",
+    ]
+    assert sorted(g.eattrs["weight"]) == [1, 2, 3, 4, 5, 7, 8, 10, 55]
+
+
+def test_read_graph_graphml(datadir):
+    g = read_graph_graphml(datadir / "graph_with_attributes.graphml")
+    assert g.vcount() == 7 and g.ecount() == 9
+
+    assert g.attrs["date"] == "2009-01-10"
+    assert g.attrs["vcount"] == 7
+    assert g.attrs["is_test"] is True
+
+    assert g.vattrs["name"].type == AttributeType.STRING
+    assert list(g.vattrs["name"]) == [
+        "Alice",
+        "Bob",
+        "Claire",
+        "Dennis",
+        "Esther",
+        "Frank",
+        "George",
+    ]
+    assert_array_equal(g.vattrs["age"], [25, 31, 18, 47, 22, 23, 50])
+    assert g.vattrs["visited"].type == AttributeType.BOOLEAN
+    assert_array_equal(g.vattrs["visited"], [1, 1, 0, 0, 0, 0, 0])
+
+    assert_array_equal(g.eattrs["weight"], [4, 2, 5, 7, 8, 10, 1, 55, 3])
+    assert list(g.eattrs["marker"]) == list("ABCDEFGHI")
+
+
+def test_read_graph_gml(datadir):
+    g = read_graph_gml(datadir / "graph_with_attributes.gml")
+    assert g.vcount() == 3 and g.ecount() == 2
+    assert g.attrs["name"] == "test"
+    assert list(g.vattrs["label"]) == ["Alice", "Bob", "Claire"]
+    assert_array_equal(g.vattrs["age"], [25, 31, 18.5])
+    assert_array_equal(g.eattrs["weight"], [4, 2])
+
+
+def test_read_graph_pajek(datadir):
+    g = read_graph_pajek(datadir / "graph_with_attributes.net")
+    assert g.vcount() == 3 and g.ecount() == 2
+    assert list(g.vattrs["name"]) == ["a", "b", "c"]
+    assert_array_equal(g.eattrs["weight"], [0.5, 2])
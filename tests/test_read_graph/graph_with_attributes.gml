@@ -0,0 +1,10 @@
+graph
+[
+  directed 0
+  name "test"
+  node [ id 0 label "Alice" age 25 ]
+  node [ id 1 label "Bob" age 31 ]
+  node [ id 2 label "Claire" age 18.5 ]
+  edge [ source 0 target 1 weight 4 ]
+  edge [ source 1 target 2 weight 2 ]
+]
@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor
+from numpy.testing import assert_array_equal
+from pickle import dumps, loads
+from pytest import fixture, raises
+
+from igraph_ctypes.constructors import create_empty_graph, create_square_lattice
+from igraph_ctypes.enums import NeighborMode
+from igraph_ctypes.paths import distances
+from igraph_ctypes.shared_memory import SharedGraph
+
+from igraph_ctypes._internal.functions import get_edgelist
+
+
+@fixture
+def graph():
+    g = create_square_lattice([4, 3], directed=True)
+    g.vattrs.set("name", [f"v{i}" for i in range(g.vcount())])
+    g.vattrs.set("visited", [i % 2 == 0 for i in range(g.vcount())])
+    g.eattrs.set("weight", [i * 1.5 for i in range(g.ecount())])
+    return g
+
+
+def weighted_distances(handle: SharedGraph):
+    g = handle.attach()
+    return distances(g, weights=g.eattrs["weight"])
+
+
+def test_attach(graph):
+    with SharedGraph.publish(graph) as handle:
+        shared = loads(dumps(handle)).attach()
+
+    assert shared.vcount() == graph.vcount()
+    assert shared.ecount() == graph.ecount()
+    assert shared.is_directed()
+    assert_array_equal(get_edgelist(shared), get_edgelist(graph))
+    assert_array_equal(
+        distances(shared, mode=NeighborMode.ALL),
+        distances(graph, mode=NeighborMode.ALL),
+    )
+
+    assert shared.vattrs["name"] == graph.vattrs["name"]
+    assert shared.vattrs["visited"] == graph.vattrs["visited"]
+    assert shared.eattrs["weight"] == graph.eattrs["weight"]
+
+
+def test_attached_graph_is_read_only(graph):
+    with SharedGraph.publish(graph) as handle:
+        shared = handle.attach()
+
+    with raises(ValueError, match="read-only"):
+        shared.add_vertices(1)
+    with raises(ValueError, match="read-only"):
+        shared.convert_to_undirected()
+    with raises(ValueError, match="read-only"):
+        shared.eattrs["weight"][0] = 42
+
+    copy = shared.copy()
+    copy.add_vertices(1)
+    copy.eattrs["weight"][0] = 42
+    assert copy.vcount() == graph.vcount() + 1
+    assert graph.eattrs["weight"][0] == 0
+
+
+def test_attach_empty_graph():
+    with SharedGraph.publish(create_empty_graph(0)) as handle:
+        shared = handle.attach()
+    assert shared.vcount() == 0 and shared.ecount() == 0
+
+
+def test_attach_in_worker_process(graph):
+    expected = distances(graph, weights=graph.eattrs["weight"])
+    with SharedGraph.publish(graph) as handle:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(weighted_distances, [handle] * 3))
+
+    for result in results:
+        assert_array_equal(result, expected)
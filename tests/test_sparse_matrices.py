@@ -0,0 +1,77 @@
+from numpy import array, shares_memory
+from numpy.testing import assert_allclose, assert_array_equal
+from pytest import importorskip
+
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.enums import AdjacencyMode, LaplacianNormalization
+
+from igraph_ctypes._internal.conversion import (
+    sparse_matrix_to_igraph_sparsemat_t_view,
+)
+from igraph_ctypes._internal.functions import (
+    get_adjacency,
+    get_adjacency_sparse,
+    get_edgelist,
+    get_laplacian,
+    get_laplacian_sparse,
+    get_stochastic,
+    get_stochastic_sparse,
+    sparse_adjacency,
+    sparse_weighted_adjacency,
+)
+
+sparse = importorskip("scipy.sparse")
+
+
+def test_graph_to_sparse_matrix():
+    g = create_square_lattice([4, 3])
+    weights = list(range(1, g.ecount() + 1))
+
+    adj = get_adjacency_sparse(g, weights=weights)
+    assert isinstance(adj, sparse.sparray)
+    assert_array_equal(adj.toarray(), get_adjacency(g, weights=weights))
+
+    for normalization in LaplacianNormalization:
+        assert_allclose(
+            get_laplacian_sparse(g, normalization=normalization).toarray(),
+            get_laplacian(g, normalization=normalization),
+        )
+
+    assert_allclose(get_stochastic_sparse(g).toarray(), get_stochastic(g))
+
+
+def test_large_sparse_matrix_is_not_copied():
+    g = create_square_lattice([100, 100])
+    adj = get_adjacency_sparse(g)
+    assert adj.nnz == 2 * g.ecount()
+    assert adj.data.base is not None
+    assert (adj.data == 1).all()
+
+
+def test_sparse_matrix_to_graph():
+    g = create_square_lattice([4, 3])
+    adj = get_adjacency_sparse(g)
+
+    for matrix in (adj, adj.tocsc(), adj.tocsr(), sparse.csc_matrix(adj)):
+        graph = sparse_adjacency(matrix, AdjacencyMode.UPPER)
+        assert graph.vcount() == g.vcount()
+        assert graph.ecount() == g.ecount()
+        assert not graph.is_directed()
+
+    weighted = sparse.csc_array(array([[0, 2.5, 0], [0, 0, 1.5], [0, 0, 0]]))
+    graph, weights = sparse_weighted_adjacency(weighted)
+    assert graph.is_directed()
+    assert_array_equal(get_edgelist(graph), [0, 1, 1, 2])
+    assert_array_equal(weights, [2.5, 1.5])
+
+
+def test_csc_matrix_is_not_copied():
+    matrix = get_adjacency_sparse(create_square_lattice([4, 3])).tocsc()
+    matrix.indptr = matrix.indptr.astype("int64")
+    matrix.indices = matrix.indices.astype("int64")
+
+    view = sparse_matrix_to_igraph_sparsemat_t_view(matrix)
+    _, indptr, indices, data = view._view_source
+    assert shares_memory(indptr, matrix.indptr)
+    assert shares_memory(indices, matrix.indices)
+    assert shares_memory(data, matrix.data)
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from numpy.testing import assert_array_equal
+from pytest import raises
+from threading import Barrier, Thread
+
+from igraph_ctypes._internal.errors import IgraphError
+from igraph_ctypes._internal.functions import get_eid, neighbors
+from igraph_ctypes.constructors import create_square_lattice
+from igraph_ctypes.io import write_graph_graphml, write_graph_ncol
+from igraph_ctypes.paths import distances
+
+
+def test_error_in_worker_thread():
+    g = create_square_lattice([3, 3])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(get_eid, g, 0, 8)
+        with raises(IgraphError, match="no such edge"):
+            future.result()
+
+        # The thread must remain usable after an error
+        assert executor.submit(get_eid, g, 0, 1).result() == 0
+
+
+def test_concurrent_errors_are_isolated():
+    g = create_square_lattice([3, 3])
+    num_threads, num_rounds = 4, 50
+    barrier = Barrier(num_threads)
+    messages: list[list[str]] = [[] for _ in range(num_threads)]
+
+    def worker(index: int) -> None:
+        for _ in range(num_rounds):
+            barrier.wait()
+            try:
+                if index % 2:
+                    get_eid(g, 0, 8)
+                else:
+                    neighbors(g, 100 + index)
+            except IgraphError as ex:
+                messages[index].append(str(ex))
+
+    threads = [Thread(target=worker, args=(index,)) for index in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index, items in enumerate(messages):
+        assert len(items) == num_rounds
+        expected = "no such edge" if index % 2 else f"Vertex {100 + index} is not"
+        assert all(expected in item for item in items)
+
+
+def test_independent_analyses_in_thread_pool():
+    graphs = [create_square_lattice([10 + i, 10]) for i in range(8)]
+    expected = [distances(g) for g in graphs]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(distances, graphs))
+
+    for result, expected_result in zip(results, expected, strict=True):
+        assert_array_equal(result, expected_result)
+
+
+def test_concurrent_attribute_access(tmp_path):
+    num_graphs, num_rounds = 8, 10
+
+    graphs = []
+    for i in range(num_graphs):
+        g = create_square_lattice([5 + i, 5])
+        g.vattrs.set("name", [f"g{i}v{j}" for j in range(g.vcount())])
+        g.vattrs.set("visited", [j % 2 == 0 for j in range(g.vcount())])
+        g.eattrs.set("weight", [i * 1000 + j for j in range(g.ecount())])
+        graphs.append(g)
+
+    def write_graph(index: int, round: int) -> tuple[str, str]:
+        g = graphs[index]
+        ncol_path = tmp_path / f"graph_{index}_{round}.ncol"
+        graphml_path = tmp_path / f"graph_{index}_{round}.graphml"
+        write_graph_ncol(g, ncol_path)
+        write_graph_graphml(g, graphml_path)
+        return ncol_path.read_text(), graphml_path.read_text()
+
+    expected = [write_graph(index, -1) for index in range(num_graphs)]
+
+    with ThreadPoolExecutor(max_workers=num_graphs) as executor:
+        futures = [
+            (index, executor.submit(write_graph, index, round))
+            for round in range(num_rounds)
+            for index in range(num_graphs)
+        ]
+        for index, future in futures:
+            assert future.result() == expected[index]
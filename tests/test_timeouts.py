@@ -0,0 +1,30 @@
+from pytest import raises
+from time import monotonic
+
+from igraph_ctypes.timeouts import deadline, time_limit
+
+from igraph_ctypes._internal.functions import full, get_all_simple_paths
+
+
+def test_time_limit():
+    g = full(13)
+
+    start = monotonic()
+    with raises(TimeoutError):
+        with time_limit(0.1):
+            get_all_simple_paths(g, 0, 12)
+    assert monotonic() - start < 5
+
+    # The graph and the thread must remain usable afterwards
+    assert len(get_all_simple_paths(full(5), 0, 4)) == 16
+
+
+def test_time_limit_not_reached():
+    with time_limit(60):
+        assert len(get_all_simple_paths(full(6), 0, 5)) == 65
+
+
+def test_deadline_in_the_past():
+    with raises(TimeoutError):
+        with deadline(monotonic() - 1):
+            get_all_simple_paths(full(13), 0, 12)
@@ -0,0 +1,112 @@
+from numpy.testing import assert_array_equal
+from pytest import raises
+
+from igraph_ctypes.constructors import (
+    create_graph_from_edge_list,
+    create_square_lattice,
+)
+from igraph_ctypes.traversal import bfs, dfs
+
+from igraph_ctypes._internal.functions import bfs_simple
+
+
+def test_bfs():
+    g = create_square_lattice([5, 4])
+    order, rank, parents, pred, succ, dist = bfs(g, 0)
+
+    expected_order, _, expected_parents = bfs_simple(g, 0)
+    assert_array_equal(order, expected_order)
+    assert_array_equal(parents, expected_parents)
+    assert_array_equal(rank[order], range(g.vcount()))
+    assert_array_equal(pred[order[1:]], order[:-1])
+    assert_array_equal(succ[order[:-1]], order[1:])
+    assert dist[0] == 0 and dist[19] == 7
+
+    order, *_ = bfs(g, 0, restricted=[0, 1, 2, 5], unreachable=False)
+    assert_array_equal(order[:4], [0, 1, 5, 2])
+
+
+def test_bfs_visitor():
+    g = create_square_lattice([5, 4])
+    batches = []
+
+    def visitor(vids, pred, succ, dist):
+        batches.append((vids, dist))
+
+    order, *_, dist = bfs(g, 0, visitor=visitor, batch_size=8)
+    assert [len(vids) for vids, _ in batches] == [8, 8, 4]
+    assert_array_equal([v for vids, _ in batches for v in vids], order)
+    assert_array_equal([d for _, ds in batches for d in ds], dist[order])
+
+    batches.clear()
+    order, rank, *_ = bfs(g, 0, visitor=lambda *args: batches.append(args) or True)
+    assert len(batches) == 1
+
+    order, rank, parents, pred, succ, dist = bfs(
+        g, 0, visitor=lambda *args: True, batch_size=3
+    )
+    assert_array_equal(order[:3], [0, 1, 5])
+    assert (order[3:] < 0).all()
+    assert (rank[[3, 7, 19]] < 0).all()
+    assert (dist[order[:3]] >= 0).all() and (dist[[2, 6, 10]] < 0).all()
+    assert_array_equal(succ[[0, 1, 5]], [1, 5, -2])
+
+    # Vertices queued by the visited ones already have their parents set
+    assert_array_equal(parents[[0, 1, 5, 2, 6, 10, 3]], [-1, 0, 0, 1, 1, 5, -2])
+
+    # Stopping after the last batch does not change the results
+    full = bfs(g, 0)
+    stopped = bfs(g, 0, visitor=lambda *args: True, batch_size=g.vcount())
+    for expected, actual in zip(full, stopped, strict=True):
+        assert_array_equal(expected, actual)
+
+
+def test_dfs():
+    g = create_square_lattice([5, 4])
+    order, order_out, parents, dist = dfs(g, 0)
+
+    assert_array_equal(order[:5], [0, 1, 2, 3, 4])
+    assert order_out[-1] == 0
+    assert sorted(order_out) == list(range(g.vcount()))
+    assert parents[0] < 0 and parents[1] == 0
+    assert_array_equal(dist[order[:5]], range(5))
+
+
+def test_dfs_visitor():
+    g = create_square_lattice([5, 4])
+    seen = []
+
+    def visitor(vids, dist):
+        seen.extend(vids)
+        return len(seen) >= 4
+
+    order, order_out, parents, dist = dfs(g, 0, visitor=visitor, batch_size=2)
+    assert seen == [0, 1, 2, 3]
+    assert (order[4:] < 0).all()
+    assert (order_out < 0).all()
+    assert_array_equal(parents[[0, 1, 2, 3, 4]], [-1, 0, 1, 2, -2])
+    assert_array_equal(dist[[0, 1, 2, 3, 4]], [0, 1, 2, 3, -1])
+
+    # Subtrees completed before the search was stopped are reported
+    g = create_graph_from_edge_list([0, 1, 1, 4, 0, 2, 2, 3], directed=False)
+    order, order_out, *_ = dfs(g, 0, visitor=lambda *args: True, batch_size=4)
+    assert_array_equal(order, [0, 1, 4, 2, -1])
+    assert_array_equal(order_out, [4, 1, -1, -1, -1])
+
+
+def test_visitor_error():
+    g = create_square_lattice([5, 4])
+
+    def visitor(*args):
+        raise ValueError("stop here")
+
+    with raises(ValueError, match="stop here"):
+        bfs(g, 0, visitor=visitor, batch_size=2)
+    with raises(ValueError, match="stop here"):
+        dfs(g, 0, visitor=visitor, batch_size=2)
+
+    # The thread must remain usable afterwards
+    assert_array_equal(dfs(g, 0)[0][:3], [0, 1, 2])
+
+    with raises(ValueError, match="batch size"):
+        bfs(g, 0, visitor=visitor, batch_size=0)
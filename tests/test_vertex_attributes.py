@@ -1,8 +1,18 @@
-from collections.abc import MutableMapping
+import numpy as np
 
+from collections.abc import MutableMapping
+from math import nan
+from numpy.random import default_rng
+from numpy.testing import assert_array_equal
 from pytest import raises
 
-from igraph_ctypes.constructors import create_empty_graph, create_famous_graph
+from igraph_ctypes.constructors import (
+    create_empty_graph,
+    create_famous_graph,
+    create_graph_from_edge_list,
+)
+from igraph_ctypes.types import AttributeCombinationSpecification
+from igraph_ctypes._internal.rng import NumPyRNG
 
 
 def test_new_graph_has_no_vertex_attributes():
@@ -86,3 +96,130 @@ def test_attempt_to_change_attribute_type():
 
     with raises(ValueError, match="could not convert"):
         g.vattrs["age"][2] = "test"
+
+
+def test_vertex_attribute_combination():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3, 3, 4, 4, 5], directed=False)
+    g.vattrs.set("weight", [1, 2, 3, 4, 5, 6])
+    g.vattrs.set("name", [f"V{i}" for i in range(1, g.vcount() + 1)])
+    g.vattrs.set("size", [6, 5, 4, 3, 2, 1])
+    g.vattrs.set("to_remove", [1, 2, 3, 4, 5, 6])
+    g.vattrs.set("visited", [False, True, True, False, True, False])
+
+    combinations: AttributeCombinationSpecification = {
+        "weight": "sum",
+        "name": "concat",
+        "size": "min",
+        "to_remove": "ignore",
+        None: "last",
+    }
+
+    g.contract_vertices([0, 1, 0, 2, 1, 2], combinations)
+
+    assert g.vcount() == 3
+    assert "to_remove" not in g.vattrs
+    assert list(g.vattrs["weight"]) == [1 + 3, 2 + 5, 4 + 6]
+    assert list(g.vattrs["name"]) == ["V1V3", "V2V5", "V4V6"]
+    assert list(g.vattrs["size"]) == [4, 2, 1]
+    assert list(g.vattrs["visited"]) == [True, True, False]
+
+
+def test_vertex_attribute_combination_with_empty_groups():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3], directed=False)
+    g.vattrs.set("name", ["A", "B", "C", "D"])
+    g.vattrs.set("weight", [1, 2, 3, 4])
+
+    # Vertex 1 of the contracted graph has no vertices mapped to it
+    g.contract_vertices([0, 0, 2, 2])
+
+    assert g.vcount() == 3
+    assert list(g.vattrs["name"]) == ["A", "", "C"]
+    assert list(g.vattrs["weight"]) == [1, 0, 3]
+
+
+def test_vertex_attribute_reductions():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3, 3, 4], directed=False)
+    for name in ("max", "prod", "mean", "median", "first"):
+        g.vattrs.set(name, [3, 1, 2, 8, 4])
+    g.vattrs.set("visited", [True, False, True, False, False])
+
+    combinations: AttributeCombinationSpecification = {
+        "max": "max",
+        "prod": "prod",
+        "mean": "mean",
+        "median": "median",
+        "first": "first",
+        "visited": "max",
+    }
+
+    # Vertex 1 of the contracted graph has no vertices mapped to it
+    g.contract_vertices([0, 2, 0, 2, 0], combinations)
+
+    assert_array_equal(g.vattrs["max"], [4, nan, 8])
+    assert_array_equal(g.vattrs["prod"], [24, 1, 8])
+    assert_array_equal(g.vattrs["mean"], [3, nan, 4.5])
+    assert_array_equal(g.vattrs["median"], [3, nan, 4.5])
+    assert_array_equal(g.vattrs["first"], [3, 0, 1])
+    assert_array_equal(g.vattrs["visited"], [True, False, False])
+
+
+def test_vertex_attribute_combination_with_function():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3, 3, 4], directed=False)
+    g.vattrs.set("weight", [3, 1, 2, 8, 4])
+    g.vattrs.set("name", ["A", "B", "C", "D", "E"])
+
+    calls = []
+
+    def spread(values, offsets):
+        calls.append(len(offsets) - 1)
+        starts = offsets[:-1]
+        return np.maximum.reduceat(values, starts) - np.minimum.reduceat(
+            values, starts
+        )
+
+    def count(values, offsets):
+        return (f"{n} items" for n in np.diff(offsets))
+
+    g.contract_vertices([0, 1, 0, 1, 0], {"weight": spread, "name": count})
+
+    assert calls == [2]
+    assert_array_equal(g.vattrs["weight"], [2, 7])
+    assert list(g.vattrs["name"]) == ["3 items", "2 items"]
+
+
+def test_vertex_attribute_combination_with_invalid_function():
+    g = create_graph_from_edge_list([0, 1, 1, 2, 2, 3], directed=False)
+    g.vattrs.set("weight", [1, 2, 3, 4])
+
+    with raises(ValueError, match="returned 1 values, expected 2"):
+        g.contract_vertices([0, 1, 0, 1], {"weight": lambda values, offsets: [0]})
+
+    # Exceptions raised by the function are propagated to the caller as is
+    def fail(values, offsets):
+        raise ZeroDivisionError("no luck")
+
+    with raises(ZeroDivisionError, match="no luck"):
+        g.contract_vertices([0, 1, 0, 1], {"weight": fail})
+
+    # The graph is left intact
+    assert g.vcount() == 4
+    assert_array_equal(g.vattrs["weight"], [1, 2, 3, 4])
+
+
+def test_vertex_attribute_combination_random():
+    g = create_graph_from_edge_list([], n=1000, directed=False)
+    g.vattrs.set("id", range(1000))
+    mapping = [i % 10 for i in range(1000)]
+
+    results = []
+    for _ in range(2):
+        restore = NumPyRNG(default_rng(42)).attach()
+        try:
+            h = g.copy()
+            h.contract_vertices(mapping, "random")
+            results.append(list(h.vattrs["id"]))
+        finally:
+            restore()
+
+    assert results[0] == results[1]
+    assert [value % 10 for value in results[0]] == list(range(10))